@@ -0,0 +1,77 @@
+import time
+import argparse
+import numpy as np
+from scipy.spatial.distance import cdist
+
+import foxes
+
+
+def legacy_points_distance(poly, points):
+    """The distances by looping over all polygon edges"""
+    dists = np.min(cdist(points, poly.points[:-1]), axis=1)
+    for pi in range(len(poly.points) - 1):
+        pA = poly.points[pi]
+        n = poly.points[pi + 1] - pA
+        d = np.linalg.norm(n)
+        if d > 0:
+            n /= d
+            q = points - pA[None, :]
+            x = np.einsum("pd,d->p", q, n)
+            sel = (x > 0) & (x < d)
+            if np.any(sel):
+                y2 = np.maximum(np.linalg.norm(q[sel], axis=1) ** 2 - x[sel] ** 2, 0)
+                dists[sel] = np.minimum(dists[sel], np.sqrt(y2))
+    return dists
+
+
+def lease_area(n_vertices, radius, rng):
+    """Creates a star shaped polygon with many vertices"""
+    a = np.sort(rng.uniform(0.0, 2 * np.pi, n_vertices))
+    r = radius * (1 + 0.3 * np.sin(5 * a) + 0.02 * rng.random(n_vertices))
+    return np.stack([r * np.cos(a), r * np.sin(a)], axis=-1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_vertices",
+        help="The numbers of polygon vertices",
+        type=int,
+        default=[10, 100, 1000, 5000],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-t", "--n_turbines", help="The number of turbines", type=int, default=100
+    )
+    parser.add_argument(
+        "-P", "--n_pop", help="The population size", type=int, default=50
+    )
+    parser.add_argument(
+        "-r", "--radius", help="The mean area radius in m", type=float, default=5000.0
+    )
+    parser.add_argument("--seed", help="The random seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    R = args.radius
+    points = rng.uniform(-1.3 * R, 1.3 * R, (args.n_pop * args.n_turbines, 2))
+
+    for N in args.n_vertices:
+        boundary = foxes.utils.geom2d.ClosedPolygon(lease_area(N, R, rng))
+        print(f"\n{N} vertices, {len(points)} points")
+
+        time0 = time.time()
+        dists = boundary.points_distance(points)
+        dists[boundary.points_inside(points)] *= -1
+        time1 = time.time()
+        dists0 = legacy_points_distance(boundary, points)
+        dists0[boundary.poly.contains_points(points)] *= -1
+        time2 = time.time()
+
+        delta = np.max(np.abs(dists - dists0))
+        print(f"  kernel: {time1 - time0:.4f} s, legacy: {time2 - time1:.4f} s")
+        print(
+            f"  speed-up {(time2 - time1)/(time1 - time0):.1f}, "
+            + f"max delta = {delta:.3e} m"
+        )
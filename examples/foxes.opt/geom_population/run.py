@@ -0,0 +1,94 @@
+import time
+import argparse
+import numpy as np
+from scipy.spatial.distance import cdist
+
+import foxes
+import foxes.opt.problems.layout.geom_layouts as grg
+
+
+def legacy_max_density(probes, xy, valid):
+    """The density values by looping over individuals"""
+    out = np.full(len(xy), 1e20)
+    for pi in range(len(xy)):
+        if np.any(valid[pi]):
+            dists = cdist(probes, xy[pi][valid[pi]])
+            out[pi] = np.nanmax(np.nanmin(dists, axis=1))
+    return out[:, None]
+
+
+def legacy_memima(obj, xy):
+    """The mean-min-max values by looping over individuals"""
+    n_pop, n_xy = xy.shape[:2]
+    out = np.zeros((n_pop, 1))
+    for pi in range(n_pop):
+        dists = cdist(xy[pi], xy[pi])
+        np.fill_diagonal(dists, np.inf)
+        dists = np.min(dists, axis=1) / obj.scale / n_xy
+        mean = np.average(dists)
+        mi = np.min(dists)
+        ma = np.max(dists)
+        out[pi, 0] = (
+            obj.c1 * mean**2 - obj.c2 * (mean - mi) ** 2 - obj.c3 * (mean - ma) ** 2
+        )
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-P",
+        "--n_pop",
+        help="The population sizes",
+        type=int,
+        default=[10, 100, 500],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-n", "--n_turbines", help="The number of turbines", type=int, default=100
+    )
+    parser.add_argument(
+        "-d", "--min_dist", help="The minimal distance in m", type=float, default=500.0
+    )
+    parser.add_argument(
+        "-f", "--dfactor", help="The probe grid delta factor", type=float, default=4
+    )
+    parser.add_argument("--seed", help="The random seed", type=int, default=42)
+    args = parser.parse_args()
+
+    L = np.sqrt(args.n_turbines) * args.min_dist * 1.5
+    boundary = foxes.utils.geom2d.ClosedPolygon(
+        np.array([[0.0, 0.0], [L, 0.0], [L, L], [0.0, L]], dtype=np.float64)
+    )
+
+    problem = grg.GeomLayout(boundary, args.n_turbines, min_dist=args.min_dist)
+    dens = grg.MaxDensity(problem, dfactor=args.dfactor)
+    memima = grg.MeMiMaDist(problem)
+    problem.add_objective(dens)
+    problem.add_objective(memima)
+    problem.initialize(verbosity=0)
+    print(f"{args.n_turbines} turbines, {len(dens._probes)} probe points")
+
+    rng = np.random.default_rng(args.seed)
+    for n_pop in args.n_pop:
+        vars_float = rng.uniform(-0.1 * L, 1.1 * L, (n_pop, 2 * args.n_turbines))
+        vars_int = np.zeros((n_pop, 0), dtype=np.int32)
+        results = problem.apply_population(vars_int, vars_float)
+        xy, valid = results
+        print(f"\nPopulation size {n_pop}")
+
+        for name, obj, legacy in [
+            ("MaxDensity", dens, lambda: legacy_max_density(dens._probes, xy, valid)),
+            ("MeMiMaDist", memima, lambda: legacy_memima(memima, xy)),
+        ]:
+            time0 = time.time()
+            vals = obj.calc_population(vars_int, vars_float, results)
+            time1 = time.time()
+            vals0 = legacy()
+            time2 = time.time()
+
+            delta = np.max(np.abs(vals - vals0))
+            print(
+                f"  {name}: batched {time1 - time0:.3f} s, loop {time2 - time1:.3f} s, "
+                + f"speed-up {(time2 - time1)/(time1 - time0):.1f}, max delta {delta:.2e}"
+            )
@@ -0,0 +1,95 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+import foxes.opt.problems.layout.geom_layouts as grg
+
+
+def run(args, n_turbines, n_worst):
+    """Sets up the problem and evaluates a random population"""
+
+    L = np.sqrt(n_turbines) * args.min_dist * args.spacing
+    boundary = foxes.utils.geom2d.ClosedPolygon(
+        np.array([[0.0, 0.0], [L, 0.0], [L, L], [0.0, L]], dtype=np.float64)
+    )
+
+    problem = grg.GeomLayout(
+        boundary, n_turbines, min_dist=args.min_dist, calc_valid=False
+    )
+    constr = grg.MinDist(problem, n_worst=n_worst)
+    problem.add_objective(grg.OMinN(problem))
+    problem.add_constraint(constr)
+
+    time0 = time.time()
+    problem.initialize(verbosity=0)
+    time1 = time.time()
+
+    rng = np.random.default_rng(args.seed)
+    vars_float = rng.uniform(0.0, L, (args.n_pop, 2 * n_turbines))
+    vars_int = np.zeros((args.n_pop, 0), dtype=np.int32)
+    results = problem.apply_population(vars_int, vars_float)
+    values = constr.calc_population(vars_int, vars_float, results)
+    time2 = time.time()
+
+    return time1 - time0, time2 - time1, constr.n_components(), values
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_turbines",
+        help="The numbers of turbines",
+        type=int,
+        default=[100, 500, 1000, 2000],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-k", "--n_worst", help="The number of worst violations", type=int, default=10
+    )
+    parser.add_argument(
+        "-d", "--min_dist", help="The minimal distance in m", type=float, default=500.0
+    )
+    parser.add_argument(
+        "-s",
+        "--spacing",
+        help="The mean turbine spacing in units of min_dist",
+        type=float,
+        default=1.5,
+    )
+    parser.add_argument(
+        "-P", "--n_pop", help="The population size", type=int, default=20
+    )
+    parser.add_argument(
+        "-l",
+        "--n_legacy_max",
+        help="The maximal number of turbines for the pairwise constraint",
+        type=int,
+        default=1000,
+    )
+    parser.add_argument("--seed", help="The random seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for N in args.n_turbines:
+        print(f"\n{N} turbines, population size {args.n_pop}")
+
+        ti, tc, nc, values = run(args, N, args.n_worst)
+        print(
+            f"  n_worst = {args.n_worst}: {nc} components, "
+            + f"init {ti:.3f} s, calc {tc:.3f} s"
+        )
+
+        if N <= args.n_legacy_max:
+            ti0, tc0, nc0, values0 = run(args, N, None)
+            print(
+                f"  pairwise   : {nc0} components, "
+                + f"init {ti0:.3f} s, calc {tc0:.3f} s"
+            )
+            worst0 = -np.sort(-values0, axis=1)[:, : args.n_worst]
+            sel = worst0 >= -args.min_dist
+            delta = np.max(np.abs(values - worst0)[sel])
+            print(
+                f"  speed-up init {ti0/ti:.1f}, calc {tc0/tc:.1f}, "
+                + f"max delta worst violations = {delta:.3e} m"
+            )
@@ -0,0 +1,92 @@
+import time
+import argparse
+import numpy as np
+import matplotlib.pyplot as plt
+
+from foxes.utils.geom2d import ClosedPolygon, Circle
+
+
+def boundary_geometry(n_vertices, rng):
+    """Creates a composed boundary geometry"""
+    a = np.sort(rng.uniform(0.0, 2 * np.pi, n_vertices))
+    r = 3000.0 * (1 + 0.3 * np.sin(5 * a) + 0.02 * rng.random(n_vertices))
+    lease = ClosedPolygon(np.stack([r * np.cos(a), r * np.sin(a)], axis=-1))
+    extension = ClosedPolygon(
+        np.array([[2000.0, -500.0], [5000.0, -500.0], [5000.0, 1500.0], [2000.0, 1500]])
+    )
+    return lease + extension - Circle([0.0, 0.0], 800.0) - Circle([4000, 500], 300)
+
+
+def signed_dist(geom, points):
+    """The signed distances, negative inside"""
+    dists = geom.points_distance(points)
+    dists[geom.points_inside(points)] *= -1
+    return dists
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-r",
+        "--resolution",
+        help="The raster resolutions in m",
+        type=float,
+        default=[100.0, 50.0, 20.0],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-n",
+        "--n_vertices",
+        help="The number of polygon vertices",
+        type=int,
+        default=500,
+    )
+    parser.add_argument(
+        "-q", "--n_queries", help="The number of query points", type=int, default=100000
+    )
+    parser.add_argument(
+        "-b",
+        "--band",
+        help="The width of the exact band in m",
+        type=float,
+        default=None,
+    )
+    parser.add_argument("--seed", help="The random seed", type=int, default=42)
+    parser.add_argument(
+        "-p", "--plot", help="Plot the cached geometry", action="store_true"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    geom = boundary_geometry(args.n_vertices, rng)
+    p0 = geom.p_min()
+    p1 = geom.p_max()
+    points = p0 + (p1 - p0) * rng.random((args.n_queries, 2))
+
+    time0 = time.time()
+    dists0 = signed_dist(geom, points)
+    t0 = time.time() - time0
+    print(f"\nExact: {args.n_queries/t0:.3e} queries/s")
+
+    for res in args.resolution:
+        cache = geom.sdf_cache(res, band=args.band)
+
+        time0 = time.time()
+        cache.initialize()
+        time1 = time.time()
+        dists = signed_dist(cache, points)
+        time2 = time.time()
+
+        t = time2 - time1
+        delta = np.max(np.abs(dists - dists0))
+        wrong = np.sum((dists < 0) != (dists0 < 0))
+        print(f"\nResolution {res} m, band {cache.band:.2f} m")
+        print(f"  init {time1 - time0:.3f} s, {args.n_queries/t:.3e} queries/s")
+        print(f"  speed-up {t0/t:.1f}, wrong inside flags: {wrong}")
+        print(f"  max error {delta:.3e} m, error bound {cache.error_bound:.3e} m")
+
+        if args.plot:
+            fig, ax = plt.subplots()
+            cache.add_to_figure(ax, fill_mode="dist_inside")
+            plt.show()
+            plt.close(fig)
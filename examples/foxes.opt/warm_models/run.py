@@ -0,0 +1,112 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+from foxes.opt.problems import OptFarmVars
+from foxes.opt.objectives import MaxFarmPower
+import foxes.variables as FV
+
+
+def calc(args, keep_models):
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+
+    farm = foxes.WindFarm()
+    N = int(np.sqrt(args.n_t) + 0.5)
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([500.0, 500.0]),
+        step_vectors=np.array([[1300.0, 0], [200, 600.0]]),
+        steps=(N, N),
+        turbine_models=args.tmodels + ["opt_yawm", "yawm2yaw", ttype.name],
+        verbosity=0,
+    )
+
+    states = foxes.input.states.StatesTable(
+        data_source=args.states,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "ws", FV.WD: "wd", FV.WEIGHT: "weight"},
+        fixed_vars={FV.RHO: 1.225, FV.TI: 0.05},
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        chunks=None,
+        verbosity=0,
+    )
+
+    problem = OptFarmVars("opt_yawm", algo, keep_models=keep_models)
+    problem.add_var(FV.YAWM, float, 0.0, -40.0, 40.0, level="turbine")
+    problem.add_objective(MaxFarmPower(problem))
+    problem.initialize(verbosity=0)
+
+    rng = np.random.default_rng(args.seed)
+    vars_int = np.zeros(0, dtype=np.int32)
+    objs = []
+
+    time0 = time.time()
+    for i in range(args.n_calls):
+        vars_float = rng.uniform(-40.0, 40.0, problem.n_vars_float)
+        objs.append(problem.evaluate_individual(vars_int, vars_float)[0])
+    time1 = time.time()
+
+    algo.finalize()
+
+    return np.array(objs), time1 - time0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-nt", "--n_t", help="The number of turbines", type=int, default=9
+    )
+    parser.add_argument(
+        "-s",
+        "--states",
+        help="The states input file (path or static)",
+        default="wind_rose_bremen.csv",
+    )
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah025_linear_k004"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-m", "--tmodels", help="The turbine models", default=[], nargs="+"
+    )
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="auto"
+    )
+    parser.add_argument(
+        "-C", "--n_calls", help="The number of evaluations", type=int, default=50
+    )
+    parser.add_argument("--seed", help="The random seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"\nRunning {args.n_calls} evaluations, re-initializing the algorithm")
+    objs0, t0 = calc(args, False)
+    print(f"Calc time = {t0:.2f} s, {t0/args.n_calls*1e3:.1f} ms per call")
+
+    print(f"\nRunning {args.n_calls} evaluations, keeping models initialized")
+    objs, t = calc(args, True)
+    print(f"Calc time = {t:.2f} s, {t/args.n_calls*1e3:.1f} ms per call")
+    print(
+        f"Speed-up = {t0/t:.2f}, max delta objective = {np.max(np.abs(objs - objs0)):.3e}"
+    )
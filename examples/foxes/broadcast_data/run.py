@@ -0,0 +1,136 @@
+import time
+import argparse
+import numpy as np
+import matplotlib.pyplot as plt
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.core import Model
+
+
+def run(args, broadcast):
+    """Runs the farm and flow plot calculations, returns timing, counters and data"""
+
+    Model.broadcast_data = broadcast
+    Model.get_data_allocs(reset=True)
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=[ttype.name, "kTI_02"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: args.chunksize, FC.POINT: None},
+        verbosity=0,
+    )
+
+    time0 = time.time()
+    farm_results = algo.calc_farm()
+
+    o = foxes.output.FlowPlots2D(algo, farm_results)
+    L = (args.n_grid - 1) * args.dist * D
+    fig, data = o.get_mean_fig_xy(
+        args.var,
+        resolution=(args.n_xy, args.n_xy),
+        xmin=-500.0,
+        ymin=-500.0,
+        xmax=L + 500.0,
+        ymax=L + 500.0,
+        ret_data=True,
+    )
+    plt.close(fig)
+    time1 = time.time()
+
+    allocs = Model.get_data_allocs(reset=True)
+    Model.broadcast_data = False
+
+    return time1 - time0, allocs, farm_results[FV.REWS].to_numpy(), data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=100
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=4
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument(
+        "-nxy",
+        "--n_xy",
+        help="The number of grid points per axis",
+        type=int,
+        default=100,
+    )
+    parser.add_argument("-v", "--var", help="The plot variable", default=FV.WS)
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="grid9")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunksize",
+        help="The maximal states chunk size",
+        type=int,
+        default=None,
+    )
+    args = parser.parse_args()
+
+    with foxes.utils.runners.DaskRunner(
+        scheduler="synchronous", progress_bar=False
+    ) as runner:
+        results = {}
+        for broadcast in [False, True]:
+            print(f"\nCalculating with broadcast_data = {broadcast}")
+            t, allocs, rews, data = runner.run(run, args=(args, broadcast))
+            results[broadcast] = rews, data
+            print(f"Calc time = {t:.2f} s")
+            print(f"get_data allocations: {allocs['arrays']} arrays", end="")
+            print(f", {allocs['bytes']/1024**2:.1f} MB")
+
+    print(
+        f"\nMax delta {FV.REWS} = {np.max(np.abs(results[1][0] - results[0][0])):.3e}"
+    )
+    print(f"Max delta {args.var} = {np.max(np.abs(results[1][1] - results[0][1])):.3e}")
@@ -0,0 +1,147 @@
+import time
+import argparse
+import numpy as np
+import matplotlib.pyplot as plt
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def run(args, max_steps):
+    """Runs the farm and flow plot calculations, returns timing and data"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    mbook.wake_models["TurbOParkIX"] = foxes.models.wake_models.wind.TurbOParkWakeIX(
+        superposition=f"ws_{args.superposition}",
+        dx=args.dx,
+        A=args.A,
+        max_steps=max_steps,
+    )
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=[ttype.name],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=["TurbOParkIX", args.tiwake],
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: args.chunksize, FC.POINT: None},
+        verbosity=0,
+    )
+
+    time0 = time.time()
+    farm_results = algo.calc_farm()
+    time1 = time.time()
+
+    o = foxes.output.FlowPlots2D(algo, farm_results)
+    L = (args.n_grid - 1) * args.dist * D
+    fig, data = o.get_mean_fig_xy(
+        FV.WS,
+        resolution=(args.n_xy, args.n_xy),
+        xmin=-500.0,
+        ymin=-500.0,
+        xmax=L + 500.0,
+        ymax=L + 500.0,
+        ret_data=True,
+    )
+    plt.close(fig)
+    time2 = time.time()
+
+    return time1 - time0, time2 - time1, farm_results[FV.REWS].to_numpy(), data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=100
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=4
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument(
+        "-nxy",
+        "--n_xy",
+        help="The number of grid points per axis",
+        type=int,
+        default=100,
+    )
+    parser.add_argument(
+        "-dx", help="The step size of the TI integral", type=float, default=1.0
+    )
+    parser.add_argument(
+        "-m",
+        "--max_steps",
+        help="The maximal numbers of integration steps",
+        type=int,
+        default=[1000, 200, 50],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-A", help="The wake growth parameter", type=float, default=0.04
+    )
+    parser.add_argument(
+        "-sp", "--superposition", help="The wind speed superposition", default="linear"
+    )
+    parser.add_argument(
+        "-ti", "--tiwake", help="The TI wake model", default="IECTI2019_max"
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="grid9")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="auto"
+    )
+    parser.add_argument(
+        "-c",
+        "--chunksize",
+        help="The maximal states chunk size",
+        type=int,
+        default=None,
+    )
+    args = parser.parse_args()
+
+    with foxes.utils.runners.DaskRunner(
+        scheduler="synchronous", progress_bar=False
+    ) as runner:
+        print(f"\nCalculating with dx = {args.dx}, no step limit")
+        tf0, tp0, rews0, data0 = runner.run(run, args=(args, None))
+        print(f"Farm calc time = {tf0:.2f} s, flow plot calc time = {tp0:.2f} s")
+
+        for n in args.max_steps:
+            print(f"\nCalculating with dx = {args.dx}, max_steps = {n}")
+            tf, tp, rews, data = runner.run(run, args=(args, n))
+            print(f"Farm calc time = {tf:.2f} s, flow plot calc time = {tp:.2f} s")
+            print(f"Speed-up = {(tf0 + tp0)/(tf + tp):.2f}")
+            print(f"Max delta {FV.REWS} = {np.max(np.abs(rews - rews0)):.3e}")
+            print(f"Max delta {FV.WS} = {np.max(np.abs(data - data0)):.3e}")
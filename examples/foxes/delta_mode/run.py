@@ -0,0 +1,160 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def set_yawm(algo, yawm):
+    """Updates the yaw misalignments of the turbines"""
+    model = algo.mbook.turbine_models["set_yawm"]
+    model.reset()
+    model.add_var(FV.YAWM, yawm)
+    if model.initialized:
+        model.finalize(algo)
+        model.initialize(algo)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=100
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=8
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument(
+        "-i", "--n_iter", help="The number of local search steps", type=int, default=10
+    )
+    parser.add_argument(
+        "-n",
+        "--n_changed",
+        help="The number of changed turbines per step",
+        type=int,
+        default=1,
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="grid9")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-pt",
+        "--prune_tol",
+        help="The wake pruning tolerance",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "-cp",
+        "--checkpoints",
+        help="The wake delta checkpoint step in turbine order",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "-c", "--chunksize", help="The maximal chunk size", type=int, default=None
+    )
+    args = parser.parse_args()
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    mbook.turbine_models["set_yawm"] = foxes.models.turbine_models.SetFarmVars(
+        pre_rotor=True
+    )
+    D = ttype.D
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=["set_yawm", "yawm2yaw", ttype.name, "kTI_02"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="yawed",
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: args.chunksize},
+        prune_tol=args.prune_tol,
+        delta_checkpoints=args.checkpoints,
+        verbosity=0,
+    )
+
+    with foxes.utils.runners.DaskRunner(
+        scheduler="threads", progress_bar=False
+    ) as runner:
+        yawm = np.zeros((args.n_states, farm.n_turbines))
+        set_yawm(algo, yawm)
+        base_results = runner.run(algo.calc_farm, kwargs=dict(finalize=False))
+
+        # a random local search, changing a few turbines per step:
+        rng = np.random.default_rng(42)
+        t_full = 0
+        t_delta = 0
+        max_delta = 0
+        for i in range(args.n_iter):
+            changed = rng.choice(farm.n_turbines, args.n_changed, replace=False)
+            yawm[:, changed] = rng.uniform(-30.0, 30.0, args.n_changed)[None, :]
+            set_yawm(algo, yawm)
+
+            time0 = time.time()
+            dres = runner.run(
+                algo.calc_farm,
+                kwargs=dict(
+                    finalize=False, base_results=base_results, changed_turbines=changed
+                ),
+            )
+            time1 = time.time()
+            fres = runner.run(algo.calc_farm, kwargs=dict(finalize=False))
+            time2 = time.time()
+
+            t_delta += time1 - time0
+            t_full += time2 - time1
+            d = np.max(np.abs(dres[FV.P].to_numpy() - fres[FV.P].to_numpy()))
+            max_delta = max(max_delta, d)
+            print(
+                f"Step {i}: changed {list(changed)}, full {time2 - time1:.2f} s, delta {time1 - time0:.2f} s"
+            )
+
+            base_results = dres
+
+        algo.finalize()
+
+    print(f"\nTotal time full  = {t_full:.2f} s")
+    print(f"Total time delta = {t_delta:.2f} s")
+    print(f"Speed-up         = {t_full/t_delta:.2f}")
+    print(f"Max delta P      = {max_delta:.3e} kW")
@@ -0,0 +1,131 @@
+import time
+import argparse
+import tracemalloc
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def run(args, dtype):
+    """Runs the farm and point calculations, returns timing, memory and results"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=[ttype.name, "kTI_02"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: args.chunksize, FC.POINT: None},
+        dtype=dtype,
+        verbosity=0,
+    )
+
+    L = (args.n_grid - 1) * args.dist * D
+    x = np.linspace(-500.0, L + 500.0, args.n_xy)
+    points = np.zeros((args.n_states, args.n_xy, args.n_xy, 3))
+    points[:, :, :, 0] = x[None, :, None]
+    points[:, :, :, 1] = x[None, None, :]
+    points[:, :, :, 2] = 90.0
+    points = points.reshape(args.n_states, args.n_xy**2, 3)
+
+    tracemalloc.start()
+    time0 = time.time()
+    farm_results = algo.calc_farm()
+    point_results = algo.calc_points(farm_results, points)
+    time1 = time.time()
+    __, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return time1 - time0, peak, farm_results, point_results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=200
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=4
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument(
+        "-nxy",
+        "--n_xy",
+        help="The number of grid points per axis",
+        type=int,
+        default=100,
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="grid16")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunksize",
+        help="The maximal states chunk size",
+        type=int,
+        default=None,
+    )
+    args = parser.parse_args()
+
+    with foxes.utils.runners.DaskRunner(
+        scheduler="synchronous", progress_bar=False
+    ) as runner:
+        results = {}
+        for dtype in [np.float64, np.float32]:
+            print(f"\nCalculating with dtype = {dtype.__name__}")
+            t, peak, fres, pres = runner.run(run, args=(args, dtype))
+            results[dtype] = fres, pres
+            print(f"Calc time = {t:.2f} s, peak memory = {peak/1024**2:.1f} MB")
+            print(f"Point results size = {pres.nbytes/1024**2:.1f} MB")
+
+    fres0, pres0 = results[np.float64]
+    fres1, pres1 = results[np.float32]
+    P0 = fres0[FV.P].to_numpy().sum()
+    P1 = fres1[FV.P].to_numpy().sum()
+    print(f"\nRel. delta farm energy = {abs(P1/P0 - 1):.3e}")
+    for v in [FV.WS, FV.TI]:
+        d = np.abs(pres1[v].to_numpy() - pres0[v].to_numpy())
+        print(f"Max delta {v} = {np.max(d):.3e}, mean delta {v} = {np.mean(d):.3e}")
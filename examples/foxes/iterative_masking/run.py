@@ -0,0 +1,131 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.utils.runners import DaskRunner
+
+
+def calc(runner, args, mask_converged, cks):
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=args.tmodels + [ttype.name],
+        verbosity=0,
+    )
+
+    states = foxes.input.states.Timeseries(
+        data_source=args.states,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI", FV.RHO: "RHO"},
+    )
+
+    algo = foxes.algorithms.Iterative(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame=args.frame,
+        partial_wakes_model=args.pwakes,
+        mask_converged=mask_converged,
+        chunks=cks,
+        verbosity=0,
+    )
+
+    time0 = time.time()
+    farm_results = runner.run(algo.calc_farm)
+    time1 = time.time()
+
+    return farm_results, time1 - time0, algo.iterations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-s",
+        "--states",
+        help="The timeseries input file (path or static)",
+        default="timeseries_3000.csv.gz",
+    )
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=6
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="auto"
+    )
+    parser.add_argument(
+        "-f", "--frame", help="The wake frame", default="rotor_wd_farmo"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah025_linear_k004"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-m", "--tmodels", help="The turbine models", default=[], nargs="+"
+    )
+    parser.add_argument(
+        "-c", "--chunksize", help="The maximal chunk size", type=int, default=500
+    )
+    parser.add_argument("-sc", "--scheduler", help="The scheduler choice", default=None)
+    parser.add_argument(
+        "-n",
+        "--n_workers",
+        help="The number of workers for distributed run",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "-tw",
+        "--threads_per_worker",
+        help="The number of threads per worker for distributed run",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--nodask", help="Use numpy arrays instead of dask arrays", action="store_true"
+    )
+    args = parser.parse_args()
+
+    cks = None if args.nodask else {FC.STATE: args.chunksize}
+
+    with DaskRunner(
+        scheduler=args.scheduler,
+        n_workers=args.n_workers,
+        threads_per_worker=args.threads_per_worker,
+    ) as runner:
+        print(f"\nCalculating {args.n_grid**2} turbines, all states per iteration")
+        fres0, t0, it0 = calc(runner, args, False, cks)
+        print(f"Calc time = {t0:.2f} s, iterations = {it0}")
+
+        print(f"\nCalculating {args.n_grid**2} turbines, masking converged states")
+        fres, t, it = calc(runner, args, True, cks)
+        print(f"Calc time = {t:.2f} s, iterations = {it}, speed-up = {t0/t:.2f}")
+
+        dREWS = np.abs(fres[FV.REWS].to_numpy() - fres0[FV.REWS].to_numpy())
+        dP = np.abs(fres[FV.P].to_numpy() - fres0[FV.P].to_numpy())
+        print(f"Max delta REWS = {np.max(dREWS):.3e} m/s")
+        print(f"Max delta P = {np.max(dP):.3e} kW, mean delta P = {np.mean(dP):.3e} kW")
@@ -0,0 +1,158 @@
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def create_data(args):
+    """Creates multi-height data with a log profile and wind veer"""
+
+    rng = np.random.default_rng(42)
+    heights = np.linspace(args.h_min, args.h_max, args.n_heights)
+    ws0 = rng.uniform(4.0, 15.0, args.n_states)
+    wd0 = rng.uniform(0.0, 360.0, args.n_states)
+    ti0 = rng.uniform(0.04, 0.12, args.n_states)
+
+    fac = np.log(heights / 0.1) / np.log(100.0 / 0.1)
+    data = {}
+    for hi, h in enumerate(heights):
+        hh = int(h) if int(h) == h else h
+        data[f"WS-{hh}"] = ws0 * fac[hi]
+        data[f"WD-{hh}"] = (wd0 + 0.05 * (h - 100.0)) % 360.0
+        data[f"TI-{hh}"] = ti0 / fac[hi]
+    data = pd.DataFrame(data=data, index=np.arange(args.n_states))
+    data.index.name = "state"
+
+    return data, heights
+
+
+def run(args, data, heights, ipars, extrapolation):
+    """Runs the point calculation, returns timing, memory peak and results"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    states = foxes.input.states.MultiHeightStates(
+        data_source=data,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        heights=heights,
+        fixed_vars={FV.RHO: 1.225},
+        extrapolation=extrapolation,
+        ipars=ipars,
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=[ttype.name],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="centre",
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model="auto",
+        chunks={FC.STATE: args.chunksize, FC.POINT: None},
+        verbosity=0,
+    )
+    farm_results = algo.calc_farm()
+
+    L = (args.n_grid - 1) * args.dist * D
+    points = np.zeros((args.n_states, args.n_points, 3), dtype=FC.DTYPE)
+    points[:, :, 0] = np.linspace(-500.0, L + 500.0, args.n_points)[None, :]
+    points[:, :, 1] = L / 2
+    points[:, :, 2] = np.linspace(args.z_min, args.z_max, args.n_points)[None, :]
+
+    tracemalloc.start()
+    time0 = time.time()
+    point_results = algo.calc_points(farm_results, points)
+    time1 = time.time()
+    __, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return time1 - time0, peak, point_results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=200
+    )
+    parser.add_argument(
+        "-nh", "--n_heights", help="The number of heights", type=int, default=40
+    )
+    parser.add_argument(
+        "--h_min", help="The minimal data height", type=float, default=40.0
+    )
+    parser.add_argument(
+        "--h_max", help="The maximal data height", type=float, default=300.0
+    )
+    parser.add_argument(
+        "-np", "--n_points", help="The number of points", type=int, default=20000
+    )
+    parser.add_argument(
+        "--z_min", help="The minimal point height", type=float, default=10.0
+    )
+    parser.add_argument(
+        "--z_max", help="The maximal point height", type=float, default=400.0
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=3
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2014_linear_k004"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunksize",
+        help="The maximal states chunk size",
+        type=int,
+        default=50,
+    )
+    args = parser.parse_args()
+
+    data, heights = create_data(args)
+
+    with foxes.utils.runners.DaskRunner(
+        scheduler="synchronous", progress_bar=False
+    ) as runner:
+        print("\nCalculating with interp1d and linear extrapolation")
+        ipars = dict(bounds_error=False, fill_value="extrapolate")
+        t0, m0, res0 = runner.run(run, args=(args, data, heights, ipars, None))
+        print(f"Calc time = {t0:.2f} s, memory peak = {m0/1024**2:.1f} MB")
+
+        for ext in ["linear", "log"]:
+            print(f"\nCalculating with two-point interpolation and {ext} extrapolation")
+            t, m, res = runner.run(run, args=(args, data, heights, {}, ext))
+            print(f"Calc time = {t:.2f} s, memory peak = {m/1024**2:.1f} MB")
+            print(f"Speed-up = {t0/t:.2f}, memory reduction = {m0/m:.2f}")
+            for v in [FV.WS, FV.WD, FV.TI]:
+                delta = np.max(np.abs(res[v].to_numpy() - res0[v].to_numpy()))
+                print(f"Max delta {v} = {delta:.3e}")
@@ -0,0 +1,114 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+class CountingPlugin(foxes.algorithms.sequential.SequentialPlugin):
+    """Counts the per-state plugin updates"""
+
+    def initialize(self, algo):
+        super().initialize(algo)
+        self.count = 0
+
+    def update(self, algo, fres, pres=None):
+        super().update(algo, fres, pres)
+        self.count += 1
+
+
+def run(args, batch_size):
+    """Iterates through all states, returns timing and results"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI", FV.RHO: "RHO"},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[1000.0, 0], [0, 800.0]]),
+        steps=(args.n_rows, args.n_rows),
+        turbine_models=[ttype.name],
+        verbosity=0,
+    )
+
+    plugin = CountingPlugin()
+    algo = foxes.algorithms.Sequential(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame=args.frame,
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: None, FC.POINT: None},
+        plugins=[plugin],
+        batch_size=batch_size,
+        verbosity=0,
+    )
+
+    time0 = time.time()
+    for __ in algo:
+        pass
+    time1 = time.time()
+
+    results = algo.farm_results
+    algo.finalize()
+
+    return time1 - time0, results, plugin.count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-b", "--batch_size", help="The states batch size", type=int, default=100
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=2000
+    )
+    parser.add_argument(
+        "-nr", "--n_rows", help="The number of turbine rows", type=int, default=3
+    )
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2014_linear_lim_k004"],
+        nargs="+",
+    )
+    parser.add_argument("-f", "--frame", help="The wake frame", default="rotor_wd")
+    args = parser.parse_args()
+
+    print(f"Iterating through {args.n_states} states, one state per step")
+    t1, fres1, n1 = run(args, 1)
+    print(f"Calc time = {t1:.2f} s, {args.n_states/t1:.1f} states/s, updates = {n1}")
+
+    print(f"Iterating through {args.n_states} states, batches of {args.batch_size}")
+    t2, fres2, n2 = run(args, args.batch_size)
+    print(
+        f"Calc time = {t2:.2f} s, {args.n_states/t2:.1f} states/s, updates = {n2}, speed-up = {t1/t2:.2f}"
+    )
+
+    delp = np.abs(fres1[FV.P].to_numpy() - fres2[FV.P].to_numpy())
+    print(f"Max delta P = {np.max(delp):.3e} kW")
@@ -0,0 +1,145 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.algorithms.downwind.models import FarmWakesCalculation
+
+
+class MaskFarmWakesCalculation(FarmWakesCalculation):
+    """Wake calculation with dense boolean state-turbine masks"""
+
+    def calculate(self, algo, mdata, fdata):
+        torder = fdata[FV.ORDER]
+        n_order = torder.shape[1]
+        n_states = mdata.n_states
+
+        wdeltas, pdata = self.pwakes.new_wake_deltas(algo, mdata, fdata)
+        for oi in range(n_order):
+            o = torder[:, oi]
+
+            if oi > 0:
+                self.pwakes.evaluate_results(
+                    algo, mdata, fdata, pdata, wdeltas, states_turbine=o
+                )
+                trbs = np.zeros((n_states, algo.n_turbines), dtype=bool)
+                np.put_along_axis(trbs, o[:, None], True, axis=1)
+                res = algo.farm_controller.calculate(
+                    algo, mdata, fdata, pre_rotor=False, st_sel=trbs
+                )
+                fdata.update(res)
+
+            if oi < n_order - 1:
+                self.pwakes.contribute_to_wake_deltas(
+                    algo, mdata, fdata, pdata, o, wdeltas, None
+                )
+
+        return {v: fdata[v] for v in self.output_farm_vars(algo)}
+
+
+class MaskDownwind(foxes.algorithms.Downwind):
+    """Downwind algorithm with dense boolean state-turbine masks"""
+
+    @classmethod
+    def get_model(cls, name):
+        if name == "FarmWakesCalculation":
+            return MaskFarmWakesCalculation
+        return super().get_model(name)
+
+
+def run(args, acls):
+    """Runs the wind farm calculation, returns timing and results"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI", FV.RHO: "RHO"},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[600.0, 0], [0, 500.0]]),
+        steps=(args.n_x, args.n_y),
+        turbine_models=[ttype.name, "kTI_02"] + args.tmodels,
+        verbosity=0,
+    )
+
+    algo = acls(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: args.chunksize, FC.POINT: None},
+        verbosity=0,
+    )
+
+    time0 = time.time()
+    farm_results = algo.calc_farm()
+    time1 = time.time()
+
+    return time1 - time0, farm_results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=100
+    )
+    parser.add_argument(
+        "-nx", "--n_x", help="The number of turbines in x", type=int, default=25
+    )
+    parser.add_argument(
+        "-ny", "--n_y", help="The number of turbines in y", type=int, default=20
+    )
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-m",
+        "--tmodels",
+        help="Additional turbine models",
+        default=[],
+        nargs="+",
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2014_linear_lim_k004"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-c", "--chunksize", help="The maximal chunk size", type=int, default=None
+    )
+    args = parser.parse_args()
+
+    n_turbines = args.n_x * args.n_y
+    print(f"Calculating {n_turbines} turbines, boolean masks")
+    t1, fres1 = run(args, MaskDownwind)
+    print(f"Calc time = {t1:.2f} s")
+
+    print(f"Calculating {n_turbines} turbines, index selections")
+    t2, fres2 = run(args, foxes.algorithms.Downwind)
+    print(f"Calc time = {t2:.2f} s, speed-up = {t1/t2:.2f}")
+
+    delp = np.abs(fres1[FV.P].to_numpy() - fres2[FV.P].to_numpy())
+    print(f"Max delta P = {np.max(delp):.3e} kW")
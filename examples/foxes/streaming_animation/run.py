@@ -0,0 +1,162 @@
+import os
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import matplotlib.pyplot as plt
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(args):
+    """Runs the farm calculation, returns algorithm and farm results"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(args.n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=[ttype.name],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        chunks={FC.STATE: None, FC.POINT: None},
+        verbosity=0,
+    )
+
+    farm_results = algo.calc_farm()
+
+    return algo, farm_results, (args.n_grid - 1) * args.dist * D
+
+
+def animate(args, algo, farm_results, L, streaming):
+    """Writes the animation frames, returns the timing"""
+
+    fig, ax = plt.subplots(figsize=(6, 5))
+    anim = foxes.output.Animator(fig)
+    o = foxes.output.FlowPlots2D(algo, farm_results)
+    anim.add_generator(
+        o.gen_states_fig_xy(
+            args.var,
+            resolution=(args.n_xy, args.n_xy),
+            xmin=-500.0,
+            ymin=-500.0,
+            xmax=L + 500.0,
+            ymax=L + 500.0,
+            vmin=0.0,
+            vmax=15.0,
+            fig=fig,
+            ax=ax,
+            ret_im=True,
+            title=None,
+            animated=True,
+            chunk_states=args.chunk_states if streaming else None,
+        )
+    )
+
+    time0 = time.time()
+    if streaming:
+        fname = os.path.join(args.out_dir, "streaming_{:04d}.png")
+        anim.save(fname, n_workers=args.n_workers, verbosity=0)
+    else:
+        ani = anim.animate(verbosity=0)
+        fname = os.path.join(args.out_dir, "ani.gif")
+        ani.save(fname, writer="pillow", fps=5)
+    plt.close(fig)
+
+    return time.time() - time0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-s", "--n_states", help="The number of states", type=int, default=60
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=3
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument(
+        "-nxy",
+        "--n_xy",
+        help="The number of grid points per axis",
+        type=int,
+        default=150,
+    )
+    parser.add_argument(
+        "-cs",
+        "--chunk_states",
+        help="The number of states per chunk of the streaming mode",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "-nw",
+        "--n_workers",
+        help="The number of rendering processes of the streaming mode",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "-o", "--out_dir", help="The output directory", default="frames"
+    )
+    parser.add_argument("-v", "--var", help="The plot variable", default=FV.WS)
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Bastankhah2014_linear_k004"],
+        nargs="+",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    with foxes.utils.runners.DaskRunner(
+        scheduler="synchronous", progress_bar=False
+    ) as runner:
+        algo, farm_results, L = runner.run(calc, args=(args,))
+
+        for streaming in [False, True]:
+            print(f"\nAnimation with streaming = {streaming}")
+            tracemalloc.start()
+            t = runner.run(animate, args=(args, algo, farm_results, L, streaming))
+            __, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"Time = {t:.2f} s, peak memory = {peak/1024**2:.1f} MB")
@@ -0,0 +1,161 @@
+import time
+import argparse
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.utils.runners import DaskRunner
+
+
+def calc(args, mbook, farm, states, max_dense):
+    """Runs the points calculation for the given search mode"""
+
+    wframe = foxes.models.wake_frames.Streamlines2D(step=args.step, max_dense=max_dense)
+    mbook.wake_frames["streamlines_bench"] = wframe
+
+    cks = (
+        None
+        if args.nodask
+        else {FC.STATE: args.chunksize, "point": args.chunksize_points}
+    )
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="streamlines_bench",
+        partial_wakes_model=args.pwakes,
+        chunks=cks,
+        verbosity=0,
+    )
+
+    with DaskRunner(
+        scheduler=args.scheduler,
+        n_workers=args.n_workers,
+        threads_per_worker=args.threads_per_worker,
+    ) as runner:
+        farm_results = runner.run(algo.calc_farm, kwargs=dict(finalize=False))
+
+        g = np.linspace(0.0, 2500.0, args.resolution)
+        points = np.zeros((states.size(), args.resolution**2, 3), dtype=FC.DTYPE)
+        points[:, :, 0] = np.repeat(g, args.resolution)[None]
+        points[:, :, 1] = np.tile(g, args.resolution)[None]
+        points[:, :, 2] = farm.turbines[0].H
+
+        time0 = time.time()
+        point_results = runner.run(
+            algo.calc_points, args=(farm_results, points), kwargs=dict(finalize=False)
+        )
+        wsp = point_results[FV.WS].to_numpy()
+        time1 = time.time()
+
+    algo.finalize(clear_mem=True)
+    del mbook.wake_frames["streamlines_bench"]
+
+    return time1 - time0, wsp
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-f",
+        "--file_pattern",
+        help="The search pattern for input *.nc files",
+        default="wind_rotation.nc",
+    )
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-c", "--chunksize", help="The maximal chunk size", type=int, default=1000
+    )
+    parser.add_argument(
+        "-cp",
+        "--chunksize_points",
+        help="The maximal chunk size for points",
+        type=int,
+        default=20000,
+    )
+    parser.add_argument("-sc", "--scheduler", help="The scheduler choice", default=None)
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Jensen_linear_k007"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-s", "--step", help="The streamline step size", type=float, default=20.0
+    )
+    parser.add_argument(
+        "-res", "--resolution", help="The points per grid axis", type=int, default=500
+    )
+    parser.add_argument(
+        "-nt", "--n_turbines", help="The number of turbines", default=9, type=int
+    )
+    parser.add_argument(
+        "-n",
+        "--n_workers",
+        help="The number of workers for distributed run",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "-tw",
+        "--threads_per_worker",
+        help="The number of threads per worker for distributed run",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--nodask", help="Use numpy arrays instead of dask arrays", action="store_true"
+    )
+    args = parser.parse_args()
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+
+    states = foxes.input.states.FieldDataNC(
+        args.file_pattern,
+        states_coord="state",
+        x_coord="x",
+        y_coord="y",
+        h_coord="h",
+        time_format=None,
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2ncvar={FV.WS: "ws", FV.WD: "wd"},
+        fixed_vars={FV.RHO: 1.225, FV.TI: 0.1},
+        pre_load=True,
+        bounds_error=False,
+    )
+
+    farm = foxes.WindFarm()
+    N = int(args.n_turbines**0.5)
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([500.0, 500.0]),
+        step_vectors=np.array([[500.0, 0], [0, 500.0]]),
+        steps=(N, N),
+        turbine_models=[ttype.name],
+    )
+
+    n_points = args.resolution**2
+    print(f"Calculating {n_points} points, brute-force nearest streamline points")
+    t_dense, ws_dense = calc(args, mbook, farm, states, max_dense=np.inf)
+    print(f"Calc time = {t_dense:.2f} s")
+
+    print(f"Calculating {n_points} points, KD-tree nearest streamline points")
+    t_tree, ws_tree = calc(args, mbook, farm, states, max_dense=0)
+    print(f"Calc time = {t_tree:.2f} s, speed-up = {t_dense/t_tree:.2f}")
+
+    print(f"Max delta WS = {np.nanmax(np.abs(ws_tree - ws_dense)):.3e} m/s")
@@ -0,0 +1,102 @@
+import time
+import argparse
+import numpy as np
+import xarray as xr
+from scipy.interpolate import interpn
+
+from foxes.utils import TableInterpolator
+
+
+def tables(rng):
+    """Creates lookup tables of the same layout as in the models"""
+
+    ws = np.arange(0.0, 25.5, 0.5)
+    ti = np.array([0.04, 0.06, 0.08, 0.1, 0.15, 0.2])
+    rho = np.array([0.95, 1.0, 1.1, 1.15, 1.225, 1.275])
+    wd = np.arange(0.0, 361.0, 10.0)
+    pp = np.array([30.0, 50.0, 60.0, 75.0, 90.0, 100.0])
+
+    return {
+        "WsTI2PCtFromTwo": ([ws, ti], rng.uniform(size=(len(ws), len(ti)))),
+        "WsRho2PCtFromTwo": ([ws, rho], rng.uniform(size=(len(ws), len(rho)))),
+        "TableFactors": ([ws, wd], rng.uniform(size=(len(ws), len(wd)))),
+        "LookupTable": ([ws, pp], rng.uniform(size=(len(ws), len(pp), 2))),
+    }
+
+
+def legacy(model, axes, data, qts, method):
+    """The interpolation call before the table engine"""
+    if model == "LookupTable":
+        ds = xr.Dataset(
+            coords={"ws": axes[0], "pp": axes[1]},
+            data_vars={
+                "P": (("ws", "pp"), data[..., 0]),
+                "CT": (("ws", "pp"), data[..., 1]),
+            },
+        )
+        indata = {
+            "ws": xr.DataArray(qts[:, 0], dims=["_z"]),
+            "pp": xr.DataArray(qts[:, 1], dims=["_z"]),
+        }
+        odata = ds.interp(**indata, method=method)
+        return np.stack([odata["P"].to_numpy(), odata["CT"].to_numpy()], axis=-1)
+    return interpn(axes, data, qts, method=method, bounds_error=True, fill_value=0.0)
+
+
+def calls_per_second(f, n_calls):
+    """Measures the calls per second of a function"""
+    f()
+    time0 = time.time()
+    for __ in range(n_calls):
+        f()
+    return n_calls / (time.time() - time0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n", "--n_points", help="The number of query points", type=int, default=1000
+    )
+    parser.add_argument(
+        "-c", "--n_calls", help="The number of calls", type=int, default=1000
+    )
+    parser.add_argument(
+        "-m",
+        "--method",
+        help="The interpolation method",
+        default="linear",
+        choices=TableInterpolator.METHODS,
+    )
+    parser.add_argument(
+        "-s",
+        "--cubic_spline",
+        help="Precompile the cubic spline, requires scipy>=1.12",
+        action="store_true",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for model, (axes, data) in tables(rng).items():
+        qts = np.stack([rng.uniform(a[0], a[-1], args.n_points) for a in axes], axis=-1)
+        table = TableInterpolator(
+            axes,
+            data,
+            method=args.method,
+            bounds_error=True,
+            fill_value=0.0,
+            cubic_spline=args.cubic_spline,
+        )
+
+        r0 = legacy(model, axes, data, qts, args.method)
+        r1 = table(qts)
+        delta = np.max(np.abs(r1 - r0))
+
+        n0 = calls_per_second(
+            lambda: legacy(model, axes, data, qts, args.method), args.n_calls
+        )
+        n1 = calls_per_second(lambda: table(qts), args.n_calls)
+
+        print(f"\n{model}, {args.n_points} points, method {args.method}")
+        print(f"  before: {n0:.0f} calls/s")
+        print(f"  after : {n1:.0f} calls/s, speed-up = {n1/n0:.2f}")
+        print(f"  max delta = {delta:.3e}")
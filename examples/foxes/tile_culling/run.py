@@ -0,0 +1,132 @@
+import time
+import argparse
+import numpy as np
+import matplotlib.pyplot as plt
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def run(args, tile_culling, prune_tol):
+    """Runs the flow plot calculation, returns timing and image data"""
+
+    mbook = foxes.models.ModelBook()
+    ttype = foxes.models.turbine_types.PCtFile(args.turbine_file)
+    mbook.turbine_types[ttype.name] = ttype
+    D = ttype.D
+
+    states = foxes.input.states.SingleStateStates(
+        ws=args.ws, wd=args.wd, ti=args.ti, rho=1.225
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[args.dist * D, 0.0], [0.0, args.dist * D]]),
+        steps=(args.n_grid, args.n_grid),
+        turbine_models=[ttype.name],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=args.rotor,
+        wake_models=args.wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=args.pwakes,
+        prune_tol=prune_tol,
+        tile_culling=tile_culling,
+        chunks={FC.STATE: None, FC.POINT: args.chunksize},
+        verbosity=0,
+    )
+    farm_results = algo.calc_farm()
+
+    time0 = time.time()
+    o = foxes.output.FlowPlots2D(algo, farm_results)
+    L = (args.n_grid - 1) * args.dist * D
+    fig, data = o.get_mean_fig_xy(
+        args.var,
+        resolution=(args.n_xy, args.n_xy),
+        xmin=-1000.0,
+        ymin=-1000.0,
+        xmax=L + 1000.0,
+        ymax=L + 1000.0,
+        ret_data=True,
+    )
+    plt.close(fig)
+    time1 = time.time()
+
+    return time1 - time0, data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-t",
+        "--turbine_file",
+        help="The P-ct-curve csv file (path or static)",
+        default="NREL-5MW-D126-H90.csv",
+    )
+    parser.add_argument(
+        "-g", "--n_grid", help="The number of turbines per row", type=int, default=6
+    )
+    parser.add_argument(
+        "-d", "--dist", help="The turbine distance in D", type=float, default=5.0
+    )
+    parser.add_argument("--ws", help="The wind speed", type=float, default=9.0)
+    parser.add_argument("--wd", help="The wind direction", type=float, default=280.0)
+    parser.add_argument("--ti", help="The TI value", type=float, default=0.06)
+    parser.add_argument(
+        "-nxy",
+        "--n_xy",
+        help="The number of grid points per axis",
+        type=int,
+        default=800,
+    )
+    parser.add_argument(
+        "-tol",
+        "--prune_tol",
+        help="The pruning tolerance(s)",
+        type=float,
+        default=[1e-5],
+        nargs="+",
+    )
+    parser.add_argument("-v", "--var", help="The plot variable", default=FV.WS)
+    parser.add_argument("-r", "--rotor", help="The rotor model", default="centre")
+    parser.add_argument(
+        "-p", "--pwakes", help="The partial wakes model", default="rotor_points"
+    )
+    parser.add_argument(
+        "-w",
+        "--wakes",
+        help="The wake models",
+        default=["Jensen_linear_k007", "Bastankhah2014_linear_k004"],
+        nargs="+",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunksize",
+        help="The maximal point chunk size",
+        type=int,
+        default=20000,
+    )
+    args = parser.parse_args()
+
+    for w in args.wakes:
+        args_w = argparse.Namespace(**vars(args))
+        args_w.wakes = [w]
+
+        print(f"\nCalculating flow plot for wake model {w} without tile culling")
+        t0, data0 = run(args_w, False, None)
+        print(f"Calc time = {t0:.2f} s")
+
+        for tol in [None] + args.prune_tol:
+            print(f"\nCalculating flow plot for wake model {w}, prune_tol = {tol}")
+            t, data = run(args_w, True, tol)
+            delta = np.abs(data - data0)
+            print(f"Calc time = {t:.2f} s, speed-up = {t0/t:.2f}")
+            print(f"Max delta {args.var} = {np.max(delta):.3e}")
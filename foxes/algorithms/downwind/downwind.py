@@ -1,6 +1,10 @@
+import numpy as np
+from xarray import Dataset
+
 from foxes.core import Algorithm, FarmDataModelList
 from foxes.core import PointDataModel, PointDataModelList, FarmController
 import foxes.models as fm
+from foxes.utils import ResultsCache
 import foxes.variables as FV
 import foxes.constants as FC
 from . import models as mdls
@@ -30,6 +34,18 @@ class Downwind(Algorithm):
         The farm controller
     n_states: int
         The number of states
+    prune_tol: float
+        The error tolerance for pruning negligible
+        wake interactions, or None for no pruning
+    tile_culling: bool
+        Flag for skipping point tiles outside of the
+        wake envelopes in point calculations
+    results_cache: foxes.utils.ResultsCache
+        The on-disk results cache, or None
+    delta_checkpoints: int
+        The interval of turbine order ranks at which
+        wake deltas are stored for delta mode
+        calculations, or None
 
     :group: algorithms.downwind
 
@@ -65,7 +81,12 @@ class Downwind(Algorithm):
         farm_controller="basic_ctrl",
         chunks={FC.STATE: 1000, FC.POINT: 10000},
         wake_mirrors={},
+        prune_tol=None,
+        tile_culling=False,
+        results_cache=None,
+        delta_checkpoints=None,
         dbook=None,
+        dtype=None,
         verbosity=1,
     ):
         """
@@ -100,17 +121,48 @@ class Downwind(Algorithm):
         wake_mirrors: dict
             Switch on wake mirrors for wake models.
             Key: wake model name, value: list of heights
+        prune_tol: float, optional
+            The error tolerance for pruning negligible
+            wake interactions, or None for no pruning
+        tile_culling: bool
+            Flag for skipping point tiles outside of the
+            wake envelopes in point calculations. With
+            prune_tol, the tile selection is approximate
+        results_cache: foxes.utils.ResultsCache or str, optional
+            The on-disk results cache, or its directory,
+            or None for no caching
+        delta_checkpoints: int, optional
+            The interval of turbine order ranks at which
+            wake deltas are stored for delta mode
+            calculations, or None for no checkpoints.
+            Checkpoints are kept per chunk until
+            finalization, at the cost of one copy of
+            the wake deltas each
         dbook: foxes.DataBook, optional
             The data book, or None for default
+        dtype: numpy.dtype, optional
+            The floating point type of rotor points, wake
+            deltas and point results, e.g. numpy.float32.
+            Farm results are always of type FC.DTYPE.
+            Default: FC.DTYPE
         verbosity: int
             The verbosity level, 0 means silent
 
         """
-        super().__init__(mbook, farm, chunks, verbosity, dbook)
+        super().__init__(mbook, farm, chunks, verbosity, dbook, dtype)
 
         self.states = states
         self.n_states = None
         self.states_data = None
+        self.farm_vars = None
+        self.prune_tol = prune_tol
+        self.tile_culling = tile_culling
+        self.results_cache = (
+            ResultsCache(results_cache, verbosity=verbosity)
+            if results_cache is not None and not isinstance(results_cache, ResultsCache)
+            else results_cache
+        )
+        self.delta_checkpoints = delta_checkpoints
 
         self.rotor_model = self.mbook.rotor_models[rotor_model]
         self.rotor_model.name = rotor_model
@@ -143,6 +195,38 @@ class Downwind(Algorithm):
         self.farm_controller = self.mbook.farm_controllers[farm_controller]
         self.farm_controller.name = farm_controller
 
+        self._mlists = {}
+        self._delta_turbines = None
+        self._delta_results = None
+
+    @property
+    def delta_turbines(self):
+        """
+        The changed turbines of a delta mode calculation
+
+        Returns
+        -------
+        changed: numpy.ndarray of bool
+            The changed turbine flags, or None if
+            not in delta mode. Shape: (n_states, n_turbines)
+
+        """
+        return self._delta_turbines
+
+    @property
+    def delta_results(self):
+        """
+        The base farm results of a delta mode calculation
+
+        Returns
+        -------
+        base_results: xarray.Dataset
+            The base farm results, or None if
+            not in delta mode
+
+        """
+        return self._delta_results
+
     def _print_deco(self, func_name, n_points=None):
         """
         Helper function for printing model names
@@ -255,7 +339,7 @@ class Downwind(Algorithm):
         calc_pars = []
         t2f = fm.farm_models.Turbine2FarmModel
         mlist = FarmDataModelList(models=[])
-        mlist.name = f"{self.name}_calc"
+        mlist.name = f"{self.name}_calc_amb" if ambient else f"{self.name}_calc"
 
         # 0) set XHYD:
         m = fm.turbine_models.SetXYHD()
@@ -264,7 +348,7 @@ class Downwind(Algorithm):
 
         # 1) run pre-rotor turbine models via farm controller:
         mlist.models.append(self.farm_controller)
-        calc_pars.append(calc_parameters.get(mlist.models[-1].name, {}))
+        calc_pars.append(dict(calc_parameters.get(mlist.models[-1].name, {})))
         calc_pars[-1]["pre_rotor"] = True
 
         # 2) calculate yaw from wind direction at rotor centre:
@@ -274,7 +358,7 @@ class Downwind(Algorithm):
 
         # 3) calculate ambient rotor results:
         mlist.models.append(self.rotor_model)
-        calc_pars.append(calc_parameters.get(mlist.models[-1].name, {}))
+        calc_pars.append(dict(calc_parameters.get(mlist.models[-1].name, {})))
         calc_pars[-1].update(
             {"store_rpoints": True, "store_rweights": True, "store_amb_res": True}
         )
@@ -285,7 +369,7 @@ class Downwind(Algorithm):
 
         # 5) run post-rotor turbine models via farm controller:
         mlist.models.append(self.farm_controller)
-        calc_pars.append(calc_parameters.get(mlist.models[-1].name, {}))
+        calc_pars.append(dict(calc_parameters.get(mlist.models[-1].name, {})))
         calc_pars[-1]["pre_rotor"] = False
 
         # 6) copy results to ambient, requires self.farm_vars:
@@ -295,11 +379,36 @@ class Downwind(Algorithm):
 
         # 7) calculate wake effects:
         if not ambient:
-            mlist.models.append(self.get_model("FarmWakesCalculation")())
+            mlist.models.append(
+                self.get_model("FarmWakesCalculation")(prune_tol=self.prune_tol)
+            )
             calc_pars.append(calc_parameters.get(mlist.models[-1].name, {}))
 
         return mlist, calc_pars
 
+    def _get_farm_models(self, calc_parameters, ambient):
+        """
+        Helper function that provides the model list,
+        reusing it until finalization
+        """
+        return self._cached_models(
+            ("farm", ambient),
+            calc_parameters,
+            lambda: self._collect_farm_models(calc_parameters, ambient),
+        )
+
+    def _cached_models(self, key, calc_parameters, collect):
+        """
+        Helper function that reuses a model list until
+        finalization, or until the calculation parameters change
+        """
+        phash = ResultsCache.hash(calc_parameters)
+        if key in self._mlists and self._mlists[key][2] != phash:
+            self._mlists.pop(key)[0].finalize(self, self.verbosity)
+        if key not in self._mlists:
+            self._mlists[key] = (*collect(), phash)
+        return self._mlists[key][:2]
+
     def _calc_farm_vars(self, mlist):
         """Helper function that gathers the farm variables"""
         self.farm_vars = sorted(list(set([FV.WEIGHT] + mlist.output_farm_vars(self))))
@@ -318,7 +427,67 @@ class Downwind(Algorithm):
 
         return farm_results
 
-    def calc_farm(
+    def _cache_key_data(self):
+        """Helper function that collects the configuration for the results cache"""
+        return [
+            type(self).__name__,
+            type(self.states).__name__,
+            self.chunks,
+            self.prune_tol,
+            [(t.name, t.xy, t.H, t.D, t.models) for t in self.farm.turbines],
+            self.all_models(with_states=False),
+        ]
+
+    def _cache_partial(self):
+        """Helper function that checks if missing states can be calculated separately"""
+        return not isinstance(self.wake_frame, fm.wake_frames.Timelines)
+
+    def _cached_calc(self, key_data, datasets, calc_func, finalize, **kwargs):
+        """Helper function that runs a calculation via the results cache"""
+        sname = f"{self.states.name}_"
+        tname = f"{type(self.states).__name__}_"
+        kdata = []
+        for ds in datasets:
+            ds = ds.drop_vars(FV.WEIGHT, errors="ignore")
+            ds = ds.rename(
+                {
+                    v: tname + v[len(sname) :]
+                    for v in ds.variables
+                    if v.startswith(sname)
+                }
+            )
+            kdata.append(ds)
+        key, skeys = self.results_cache.keys(self._cache_key_data() + key_data, *kdata)
+        sinds = datasets[0][FC.STATE].to_numpy()
+        uniq = len(np.unique(sinds)) == len(sinds)
+        done = []
+
+        def func(isel):
+            done.append(True)
+            if isel is None:
+                return calc_func(finalize=finalize, **kwargs)
+            elif uniq:
+                return calc_func(
+                    finalize=finalize, sel={FC.STATE: sinds[isel]}, **kwargs
+                )
+            else:
+                results = calc_func(finalize=finalize, **kwargs)
+                return results.isel({FC.STATE: isel})
+
+        results = self.results_cache.calculate(
+            key, skeys, func, partial=self._cache_partial()
+        )
+
+        if FV.WEIGHT in results:
+            results[FV.WEIGHT] = datasets[0][FV.WEIGHT].compute()
+
+        if finalize and not len(done):
+            self.print("\n")
+            self.finalize()
+
+        return results
+
+    def _calc_farm(
         self,
         calc_parameters={},
         persist=True,
@@ -327,33 +496,7 @@ class Downwind(Algorithm):
         chunked_results=False,
         **kwargs,
     ):
-        """
-        Calculate farm data.
-
-        Parameters
-        ----------
-        calc_parameters: dict
-            Parameters for model calculation.
-            Key: model name str, value: parameter dict
-        persist: bool
-            Switch for forcing dask to load all model data
-            into memory
-        finalize: bool
-            Flag for finalization after calculation
-        ambient: bool
-            Flag for ambient instead of waked calculation
-        chunked_results: bool
-            Flag for chunked results
-        kwargs: dict, optional
-            Additional parameters for run_calculation
-
-        Returns
-        -------
-        farm_results: xarray.Dataset
-            The farm results. The calculated variables have
-            dimensions (state, turbine)
-
-        """
+        """Helper function that runs the farm calculation"""
         # initialize algorithm:
         if not self.initialized:
             self.initialize()
@@ -362,7 +505,7 @@ class Downwind(Algorithm):
         self._print_deco("calc_farm")
 
         # collect models:
-        mlist, calc_pars = self._collect_farm_models(calc_parameters, ambient)
+        mlist, calc_pars = self._get_farm_models(calc_parameters, ambient)
 
         # initialize models:
         if not mlist.initialized:
@@ -402,6 +545,158 @@ class Downwind(Algorithm):
 
         return farm_results
 
+    def _set_delta_mode(self, base_results, changed_turbines):
+        """Helper function that checks and sets the delta mode data"""
+        n_states, n_turbines = self.n_states, self.n_turbines
+        if (
+            base_results.sizes.get(FC.STATE, None) != n_states
+            or base_results.sizes.get(FC.TURBINE, None) != n_turbines
+        ):
+            raise ValueError(
+                f"Algorithm '{self.name}': Expecting base results with {n_states} states and {n_turbines} turbines, got sizes {dict(base_results.sizes)}"
+            )
+
+        changed = np.asarray(changed_turbines)
+        if changed.dtype == bool:
+            if changed.shape not in [(n_turbines,), (n_states, n_turbines)]:
+                raise ValueError(
+                    f"Algorithm '{self.name}': Expecting changed turbines of shape ({n_turbines},) or ({n_states}, {n_turbines}), got {changed.shape}"
+                )
+            changed = np.broadcast_to(changed, (n_states, n_turbines))
+        else:
+            tinds = [
+                self.farm.turbine_names.index(t) if isinstance(t, str) else int(t)
+                for t in changed.flat
+            ]
+            changed = np.zeros((n_states, n_turbines), dtype=bool)
+            changed[:, tinds] = True
+
+        self._delta_turbines = changed
+        self._delta_results = base_results.compute()
+
+    def calc_farm(
+        self,
+        calc_parameters={},
+        persist=True,
+        finalize=True,
+        ambient=False,
+        chunked_results=False,
+        base_results=None,
+        changed_turbines=None,
+        **kwargs,
+    ):
+        """
+        Calculate farm data.
+
+        If a results cache is set, the results are taken
+        from the cache, and only missing states are
+        calculated.
+
+        In delta mode, i.e., if base results and changed
+        turbines are given, only the changed turbines and
+        the turbines that follow them in the turbine order
+        are recalculated. The results of all upstream
+        turbines are taken from the base results. If the
+        models have not been finalized, the ambient rotor
+        results of turbines with unchanged rotor points
+        and the wake delta checkpoints of the previous
+        calculation are reused. All inputs other than the
+        changed turbines' must agree with the base results
+        calculation.
+
+        Parameters
+        ----------
+        calc_parameters: dict
+            Parameters for model calculation.
+            Key: model name str, value: parameter dict
+        persist: bool
+            Switch for forcing dask to load all model data
+            into memory
+        finalize: bool
+            Flag for finalization after calculation. Otherwise
+            the initialized models and model data are reused
+            by subsequent calls
+        ambient: bool
+            Flag for ambient instead of waked calculation
+        chunked_results: bool
+            Flag for chunked results
+        base_results: xarray.Dataset, optional
+            The farm results of a previous calculation,
+            for delta mode
+        changed_turbines: list or numpy.ndarray, optional
+            The turbines whose inputs differ from the base
+            results calculation, for delta mode. Either a
+            list of turbine indices or names, or boolean
+            flags with shape (n_turbines,) or
+            (n_states, n_turbines)
+        kwargs: dict, optional
+            Additional parameters for run_calculation
+
+        Returns
+        -------
+        farm_results: xarray.Dataset
+            The farm results. The calculated variables have
+            dimensions (state, turbine)
+
+        """
+        if base_results is not None or changed_turbines is not None:
+            if base_results is None or changed_turbines is None:
+                raise KeyError(
+                    f"Algorithm '{self.name}': Delta mode requires both base_results and changed_turbines"
+                )
+            if "sel" in kwargs or "isel" in kwargs:
+                raise ValueError(
+                    f"Algorithm '{self.name}': States selection is not supported in delta mode"
+                )
+
+            if not self.initialized:
+                self.initialize()
+            self._set_delta_mode(base_results, changed_turbines)
+            try:
+                farm_results = self._calc_farm(
+                    calc_parameters=calc_parameters,
+                    persist=persist,
+                    finalize=finalize,
+                    ambient=ambient,
+                    chunked_results=chunked_results,
+                    **kwargs,
+                )
+            finally:
+                self._delta_turbines = None
+                self._delta_results = None
+
+            return farm_results
+
+        pars = dict(
+            calc_parameters=calc_parameters,
+            persist=persist,
+            ambient=ambient,
+            **kwargs,
+        )
+        if self.results_cache is None or "sel" in kwargs or "isel" in kwargs:
+            return self._calc_farm(
+                finalize=finalize, chunked_results=chunked_results, **pars
+            )
+
+        if not self.initialized:
+            self.initialize()
+
+        farm_results = self._cached_calc(
+            ["calc_farm", pars],
+            [self.get_models_data()],
+            self._calc_farm,
+            finalize,
+            **pars,
+        )
+
+        if self.farm_vars is None:
+            self.farm_vars = [v for v in farm_results.data_vars if v != FC.TNAME]
+
+        if chunked_results:
+            farm_results = self.chunked(farm_results)
+
+        return farm_results
+
     def _collect_point_models(
         self,
         calc_parameters={},
@@ -449,13 +744,18 @@ class Downwind(Algorithm):
         # 3) calc wake effects:
         if not ambient:
             mlist.models.append(
-                self.get_model("PointWakesCalculation")(emodels, emodels_cpars)
+                self.get_model("PointWakesCalculation")(
+                    emodels,
+                    emodels_cpars,
+                    prune_tol=self.prune_tol,
+                    tile_culling=self.tile_culling,
+                )
             )
             calc_pars.append(calc_parameters.get(mlist.models[-1].name, {}))
 
         return mlist, calc_pars
 
-    def calc_points(
+    def _calc_points(
         self,
         farm_results,
         points,
@@ -468,44 +768,7 @@ class Downwind(Algorithm):
         chunked_results=False,
         **kwargs,
     ):
-        """
-        Calculate data at a given set of points.
-
-        Parameters
-        ----------
-        farm_results: xarray.Dataset
-            The farm results. The calculated variables have
-            dimensions (state, turbine)
-        points: numpy.ndarray
-            The points of interest, shape: (n_states, n_points, 3)
-        point_models: str or foxes.core.PointDataModel
-            Additional point models to be executed
-        calc_parameters: dict
-            Parameters for model calculation.
-            Key: model name str, value: parameter dict
-        persist_mdata: bool
-            Switch for forcing dask to load all model data
-            into memory
-        persist_fdata: bool
-            Switch for forcing dask to load all farm data
-            into memory
-        finalize: bool
-            Flag for finalization after calculation
-        ambient: bool
-            Flag for ambient instead of waked calculation
-        chunked_results: bool
-            Flag for chunked results
-        kwargs: dict, optional
-            Additional parameters for run_calculation
-
-        Returns
-        -------
-        point_results: xarray.Dataset
-            The point results. The calculated variables have
-            dimensions (state, point)
-
-        """
-
+        """Helper function that runs the points calculation"""
         if not self.initialized:
             self.initialize()
         if not ambient and farm_results is None:
@@ -517,9 +780,18 @@ class Downwind(Algorithm):
         self._print_deco("calc_points", n_points=points.shape[1])
 
         # collect models and initialize:
-        mlist, calc_pars = self._collect_point_models(
-            calc_parameters, point_models, ambient
-        )
+        if point_models is None:
+            mlist, calc_pars = self._cached_models(
+                ("points", ambient),
+                calc_parameters,
+                lambda: self._collect_point_models(
+                    calc_parameters, point_models, ambient
+                ),
+            )
+        else:
+            mlist, calc_pars = self._collect_point_models(
+                calc_parameters, point_models, ambient
+            )
 
         # initialize models:
         if not mlist.initialized:
@@ -586,6 +858,100 @@ class Downwind(Algorithm):
 
         return point_results
 
+    def calc_points(
+        self,
+        farm_results,
+        points,
+        point_models=None,
+        calc_parameters={},
+        persist_mdata=True,
+        persist_pdata=False,
+        finalize=True,
+        ambient=False,
+        chunked_results=False,
+        **kwargs,
+    ):
+        """
+        Calculate data at a given set of points.
+
+        If a results cache is set, the results are taken
+        from the cache, and only missing states are
+        calculated.
+
+        Parameters
+        ----------
+        farm_results: xarray.Dataset
+            The farm results. The calculated variables have
+            dimensions (state, turbine)
+        points: numpy.ndarray
+            The points of interest, shape: (n_states, n_points, 3)
+        point_models: str or foxes.core.PointDataModel
+            Additional point models to be executed
+        calc_parameters: dict
+            Parameters for model calculation.
+            Key: model name str, value: parameter dict
+        persist_mdata: bool
+            Switch for forcing dask to load all model data
+            into memory
+        persist_fdata: bool
+            Switch for forcing dask to load all farm data
+            into memory
+        finalize: bool
+            Flag for finalization after calculation. Otherwise
+            the initialized models and model data are reused
+            by subsequent calls
+        ambient: bool
+            Flag for ambient instead of waked calculation
+        chunked_results: bool
+            Flag for chunked results
+        kwargs: dict, optional
+            Additional parameters for run_calculation
+
+        Returns
+        -------
+        point_results: xarray.Dataset
+            The point results. The calculated variables have
+            dimensions (state, point)
+
+        """
+        pars = dict(
+            point_models=point_models,
+            calc_parameters=calc_parameters,
+            persist_mdata=persist_mdata,
+            persist_pdata=persist_pdata,
+            ambient=ambient,
+            **kwargs,
+        )
+        if self.results_cache is None or "sel" in kwargs or "isel" in kwargs:
+            return self._calc_points(
+                farm_results,
+                points,
+                finalize=finalize,
+                chunked_results=chunked_results,
+                **pars,
+            )
+
+        if not self.initialized:
+            self.initialize()
+
+        datasets = [self.get_models_data()]
+        if farm_results is not None:
+            datasets.append(farm_results)
+        datasets.append(Dataset({FC.POINTS: ((FC.STATE, FC.POINT, FC.XYH), points)}))
+
+        point_results = self._cached_calc(
+            ["calc_points", pars],
+            datasets,
+            lambda **kw: self._calc_points(farm_results, points, **kw),
+            finalize,
+            **pars,
+        )
+
+        if chunked_results:
+            point_results = self.chunked(point_results)
+
+        return point_results
+
     def finalize(self, clear_mem=False):
         """
         Finalizes the algorithm.
@@ -596,6 +962,10 @@ class Downwind(Algorithm):
             Clear idata memory
 
         """
+        for mlist, *__ in self._mlists.values():
+            mlist.finalize(self, self.verbosity)
+        self._mlists = {}
+
         for m in self.all_models():
             m.finalize(self, self.verbosity)
 
@@ -1,22 +1,38 @@
 import numpy as np
+from copy import deepcopy
 
 import foxes.variables as FV
-from foxes.core import FarmDataModel
+import foxes.constants as FC
+from foxes.core import FarmDataModel, Data
 
 
 class FarmWakesCalculation(FarmDataModel):
     """
     This model calculates wakes effects on farm data.
 
+    Attributes
+    ----------
+    prune_tol: float
+        The error tolerance for pruning negligible
+        wake interactions, or None for no pruning
+
     :group: algorithms.downwind.models
 
     """
 
-    def __init__(self):
+    def __init__(self, prune_tol=None):
         """
         Constructor.
+
+        Parameters
+        ----------
+        prune_tol: float, optional
+            The error tolerance for pruning negligible
+            wake interactions, or None for no pruning
+
         """
         super().__init__()
+        self.prune_tol = prune_tol
 
     def output_farm_vars(self, algo):
         """
@@ -65,6 +81,205 @@ class FarmWakesCalculation(FarmDataModel):
         self.pwakes = algo.partial_wakes_model
         super().initialize(algo, verbosity)
 
+    def get_targets(self, algo, mdata, fdata, states_source_turbine, sel=None):
+        """
+        Selects the target turbines with non-negligible
+        wake interaction for the given source turbines.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray of int
+            For each state, one turbine index corresponding
+            to the wake causing turbine. Shape: (n_states,)
+        sel: numpy.ndarray of bool, optional
+            Pre-selection of target turbines, shape:
+            (n_states, n_turbines)
+
+        Returns
+        -------
+        targets: numpy.ndarray of int
+            For each state, the indices of the target
+            turbines, shape: (n_states, n_targets)
+
+        """
+        pdata = Data.from_points(points=fdata[FV.TXYH], data={}, dims={})
+        wcoos = self.pwakes.wake_frame.get_wake_coos(
+            algo, mdata, fdata, pdata, states_source_turbine
+        )
+        x = wcoos[:, :, 0]
+        r = np.linalg.norm(wcoos[:, :, 1:3], axis=-1)
+        r = np.maximum(r - fdata[FV.D] / 2, 0.0)
+        del wcoos
+
+        isel = np.zeros_like(x, dtype=bool)
+        for w in self.pwakes.wake_models:
+            isel |= w.calc_interaction_spsel(
+                algo,
+                mdata,
+                fdata,
+                pdata,
+                states_source_turbine,
+                x,
+                r,
+                self.prune_tol,
+            )
+        if sel is not None:
+            isel &= sel
+
+        return self.sel2targets(isel, states_source_turbine)
+
+    @classmethod
+    def sel2targets(cls, sel, states_source_turbine):
+        """
+        Converts a target selection into target indices.
+
+        Parameters
+        ----------
+        sel: numpy.ndarray of bool
+            The selection of target turbines, shape:
+            (n_states, n_turbines)
+        states_source_turbine: numpy.ndarray of int
+            For each state, one turbine index corresponding
+            to the wake causing turbine. Shape: (n_states,)
+
+        Returns
+        -------
+        targets: numpy.ndarray of int
+            For each state, the indices of the target
+            turbines, padded by the source turbine,
+            shape: (n_states, n_targets)
+
+        """
+        counts = np.sum(sel, axis=1)
+        n_targets = np.max(counts)
+        targets = np.argsort(~sel, axis=1, kind="stable")[:, :n_targets]
+
+        # pad by the source turbine, which has already been evaluated:
+        pad = np.arange(n_targets)[None, :] >= counts[:, None]
+        targets[pad] = np.broadcast_to(states_source_turbine[:, None], targets.shape)[
+            pad
+        ]
+
+        return targets
+
+    def _copy_states(self, target, source, sinds):
+        """Helper function that copies the wake deltas of selected states"""
+        if isinstance(source, dict):
+            for k, d in source.items():
+                self._copy_states(target[k], d, sinds)
+        elif isinstance(source, (list, tuple)):
+            for t, d in zip(target, source):
+                self._copy_states(t, d, sinds)
+        else:
+            target[sinds] = source[sinds]
+
+    def _reset_targets(self, target, source, tsel):
+        """Helper function that resets the wake deltas of selected turbines"""
+        if isinstance(source, dict):
+            for k, d in source.items():
+                self._reset_targets(target[k], d, tsel)
+        elif isinstance(source, (list, tuple)):
+            for t, d in zip(target, source):
+                self._reset_targets(t, d, tsel)
+        else:
+            psel = np.repeat(tsel, source.shape[1] // tsel.shape[1], axis=1)
+            target[psel] = source[psel]
+
+    def _init_delta(self, algo, mdata, fdata, torder, rank, ovars):
+        """
+        Helper function that prepares a delta mode calculation
+
+        Returns
+        -------
+        base: dict
+            The base results of the chunk, key: variable
+            name, value: numpy.ndarray with shape
+            (n_states, n_turbines)
+        r0: numpy.ndarray of int
+            For each state, the rank of the first turbine
+            that is recalculated, shape: (n_states,)
+
+        """
+        n_states, n_order = torder.shape
+        i0 = mdata.states_i0(counter=True, algo=algo)
+        s = np.s_[i0 : i0 + n_states]
+
+        bres = algo.delta_results
+        missing = [v for v in ovars + [FV.ORDER] if v not in bres]
+        if len(missing):
+            raise KeyError(
+                f"Model '{self.name}': Missing variables {missing} in delta mode base results"
+            )
+        base = {v: bres[v].to_numpy()[s] for v in ovars}
+
+        changed = algo.delta_turbines[s]
+        r0 = np.min(np.where(changed, rank, n_order), axis=1)
+
+        # states with modified order are recalculated completely:
+        r0[np.any(bres[FV.ORDER].to_numpy()[s] != torder, axis=1)] = 0
+
+        return base, r0
+
+    def _get_checkpoints(self, algo, mdata, fdata, torder, rank, ovars, base, r0):
+        """
+        Helper function that selects the stored checkpoints
+        that agree with the base results
+
+        Returns
+        -------
+        cache: dict
+            The checkpoints cache of the chunk
+        c0: numpy.ndarray of int
+            For each state, the rank of the selected
+            checkpoint, shape: (n_states,)
+        geo: numpy.ndarray of bool
+            The turbines with changed geometry since the
+            checkpoints were stored, shape: (n_states, n_turbines)
+
+        """
+        n_states, n_order = torder.shape
+        i0 = mdata.states_i0(counter=True, algo=algo)
+        ckey = self.var("checkpoints")
+        c0 = np.zeros(n_states, dtype=FC.ITYPE)
+
+        cache = self._store[i0].get(ckey, None) if i0 in self._store else None
+        if (
+            cache is None
+            or cache["step"] != algo.delta_checkpoints
+            or cache["order"].shape != torder.shape
+        ):
+            return None, c0, None
+        elif r0 is None:
+            return cache, c0, None
+
+        # the rank of the first turbine that deviates from the base results:
+        diff = np.any(cache["order"] != torder, axis=1)[:, None]
+        for v in ovars:
+            a = cache["results"][v]
+            diff = diff | ~((a == base[v]) | (np.isnan(a) & np.isnan(base[v])))
+        d0 = np.min(np.where(diff, rank, n_order), axis=1)
+
+        # the last valid checkpoint of each state:
+        d0 = np.minimum(d0, r0)
+        for k in cache["wdeltas"].keys():
+            c0[k <= d0] = np.maximum(c0[k <= d0], k)
+
+        # targets that require contributions from upstream of the checkpoint:
+        geo = np.zeros((n_states, algo.n_turbines), dtype=bool)
+        for v in [FV.TXYH, FV.D, FV.YAW]:
+            d = cache["geometry"][v] != fdata[v]
+            geo |= np.any(d.reshape(n_states, algo.n_turbines, -1), axis=2)
+        for k, stale in cache["stale"].items():
+            geo |= stale & (c0 == k)[:, None]
+
+        return cache, c0, geo
+
     def calculate(self, algo, mdata, fdata):
         """ "
         The main model calculation.
@@ -88,33 +303,126 @@ class FarmWakesCalculation(FarmDataModel):
             Values: numpy.ndarray with shape (n_states, n_turbines)
 
         """
-        torder = fdata[FV.ORDER]
+        torder = fdata[FV.ORDER].astype(FC.ITYPE)
         n_order = torder.shape[1]
         n_states = mdata.n_states
+        ovars = self.output_farm_vars(algo)
+        delta = algo.delta_turbines is not None
+        cstep = algo.delta_checkpoints
 
         def _evaluate(algo, mdata, fdata, pdata, wdeltas, o):
             self.pwakes.evaluate_results(
                 algo, mdata, fdata, pdata, wdeltas, states_turbine=o
             )
 
-            trbs = np.zeros((n_states, algo.n_turbines), dtype=bool)
-            np.put_along_axis(trbs, o[:, None], True, axis=1)
+            trbs = (np.arange(n_states), o)
 
             res = algo.farm_controller.calculate(
                 algo, mdata, fdata, pre_rotor=False, st_sel=trbs
             )
             fdata.update(res)
 
+        # the rank of each turbine in the order:
+        rank = np.zeros_like(torder)
+        np.put_along_axis(
+            rank, torder, np.arange(n_order)[None, :].repeat(n_states, 0), axis=1
+        )
+
+        # delta mode, only changed and downstream turbines are recalculated:
+        base = None
+        r0 = np.zeros(n_states, dtype=FC.ITYPE)
+        if delta:
+            base, r0 = self._init_delta(algo, mdata, fdata, torder, rank, ovars)
+            affected = rank >= r0[:, None]
+            for v in ovars:
+                fdata[v][~affected] = base[v][~affected]
+
+        # restore wake deltas from checkpoints:
         wdeltas, pdata = self.pwakes.new_wake_deltas(algo, mdata, fdata)
-        for oi in range(n_order):
+        c0 = np.zeros(n_states, dtype=FC.ITYPE)
+        cache = None
+        geo = None
+        o0 = None
+        if cstep is not None:
+            cache, c0, geo = self._get_checkpoints(
+                algo, mdata, fdata, torder, rank, ovars, base, r0 if delta else None
+            )
+            if np.any(c0 > 0):
+                fresh = deepcopy(wdeltas)
+                for k in np.unique(c0[c0 > 0]):
+                    self._copy_states(wdeltas, cache["wdeltas"][k], c0 == k)
+
+                # upstream sources still contribute to targets with changed geometry:
+                geo &= (c0 > 0)[:, None] & (rank >= c0[:, None])
+                self._reset_targets(wdeltas, fresh, geo)
+                del fresh
+                for k, stale in cache["stale"].items():
+                    stale |= (k < c0)[:, None] & geo
+                if np.any(geo):
+                    o0 = 0
+
+            if cache is None:
+                i0 = mdata.states_i0(counter=True, algo=algo)
+                if i0 not in self._store:
+                    self._store[i0] = Data(
+                        data={},
+                        dims={},
+                        loop_dims=mdata.loop_dims,
+                        name=f"{self.name}_{i0}",
+                    )
+                cache = dict(step=cstep, wdeltas={}, stale={})
+                self._store[i0][self.var("checkpoints")] = cache
+                self._store[i0].dims[self.var("checkpoints")] = None
+
+        o0 = np.min(c0) if o0 is None else o0
+        for oi in range(o0, n_order):
             o = torder[:, oi]
+            active = oi >= c0
 
-            if oi > 0:
+            # store checkpoint:
+            if cstep is not None and oi > 0 and oi % cstep == 0:
+                if oi in cache["wdeltas"] and not np.all(active):
+                    self._copy_states(cache["wdeltas"][oi], wdeltas, active)
+                    cache["stale"][oi][active] = False
+                else:
+                    cache["wdeltas"][oi] = deepcopy(wdeltas)
+                    cache["stale"][oi] = np.zeros((n_states, n_order), dtype=bool)
+
+            if oi > 0 and np.any(oi >= r0):
                 _evaluate(algo, mdata, fdata, pdata, wdeltas, o)
 
+                # reuse the results of unchanged upstream turbines:
+                if delta and np.any(oi < r0):
+                    trbs = (np.where(oi < r0)[0], o[oi < r0])
+                    for v in ovars:
+                        fdata[v][trbs] = base[v][trbs]
+
             if oi < n_order - 1:
+                # only downstream turbines remain to be evaluated:
+                sel = rank > oi
+                if not np.all(active):
+                    sel &= active[:, None]
+                    if geo is not None:
+                        sel |= geo & (rank > oi) & (~active)[:, None]
+                if delta and cstep is None:
+                    sel &= affected
+                if self.prune_tol is not None:
+                    targets = self.get_targets(algo, mdata, fdata, o, sel=sel)
+                elif not np.all(sel == (rank > oi)):
+                    targets = self.sel2targets(sel, o)
+                else:
+                    targets = None
+                if targets is not None and targets.shape[1] == 0:
+                    continue
+
                 self.pwakes.contribute_to_wake_deltas(
-                    algo, mdata, fdata, pdata, o, wdeltas
+                    algo, mdata, fdata, pdata, o, wdeltas, targets
                 )
 
-        return {v: fdata[v] for v in self.output_farm_vars(algo)}
+        # record the state of the checkpoints:
+        if cstep is not None:
+            cache["order"] = torder
+            cache["results"] = {v: fdata[v].copy() for v in ovars}
+            cache["geometry"] = {v: fdata[v].copy() for v in [FV.TXYH, FV.D, FV.YAW]}
+
+        return {v: fdata[v] for v in ovars}
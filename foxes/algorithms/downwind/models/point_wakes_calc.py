@@ -1,6 +1,8 @@
+import numpy as np
+
 import foxes.variables as FV
 import foxes.constants as FC
-from foxes.core import PointDataModel
+from foxes.core import PointDataModel, PartialWakesModel, Data
 
 
 class PointWakesCalculation(PointDataModel):
@@ -17,12 +19,30 @@ class PointWakesCalculation(PointDataModel):
         The calculation parameters for extra models
     wake_models: list of foxes.core.WakeModel
         The wake models, default: from algo
+    prune_tol: float
+        The error tolerance for pruning negligible
+        wake interactions, or None for exact culling
+    tile_culling: bool
+        Flag for skipping point tiles outside of
+        the wake envelopes of the source turbines.
+        With prune_tol, the selection is approximate
+    tile_size: float
+        The edge length of the point tiles, or None
+        for automatic choice
 
     :group: algorithms.downwind.models
 
     """
 
-    def __init__(self, emodels=None, emodels_cpars=None, wake_models=None):
+    def __init__(
+        self,
+        emodels=None,
+        emodels_cpars=None,
+        wake_models=None,
+        prune_tol=None,
+        tile_culling=False,
+        tile_size=None,
+    ):
         """
         Constructor.
 
@@ -34,6 +54,18 @@ class PointWakesCalculation(PointDataModel):
             The calculation parameters for extra models
         wake_models: list of foxes.core.WakeModel, optional
             The wake models, default: from algo
+        prune_tol: float, optional
+            The error tolerance for pruning negligible
+            wake interactions, or None for exact culling
+        tile_culling: bool
+            Flag for skipping point tiles outside of
+            the wake envelopes of the source turbines.
+            With prune_tol, the selection is approximate,
+            since the wake models are evaluated at the
+            largest downstream distance of each tile
+        tile_size: float, optional
+            The edge length of the point tiles, or None
+            for automatic choice
 
         """
         super().__init__()
@@ -41,6 +73,9 @@ class PointWakesCalculation(PointDataModel):
         self.emodels = emodels
         self.emodels_cpars = emodels_cpars
         self.wake_models = wake_models
+        self.prune_tol = prune_tol
+        self.tile_culling = tile_culling
+        self.tile_size = tile_size
 
     def sub_models(self):
         """
@@ -86,6 +121,124 @@ class PointWakesCalculation(PointDataModel):
         """
         return self.pvars
 
+    def get_tiles(self, algo, pdata):
+        """
+        Groups the evaluation points into spatial tiles.
+
+        The tiles are the cells of a regular grid, based
+        on the point positions of the first state. The
+        bounding spheres are then computed for each state.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        pdata: foxes.core.Data
+            The point data
+
+        Returns
+        -------
+        tinds: numpy.ndarray of int
+            The point indices of each tile, padded by
+            repeating the first point of the tile,
+            shape: (n_tiles, n_tile_points)
+        tdata: foxes.core.Data
+            The point data of the tile centres
+        tradius: numpy.ndarray
+            The radii of the tile bounding spheres,
+            shape: (n_states, n_tiles)
+
+        """
+        points = pdata[FC.POINTS]
+        n_points = points.shape[1]
+        pmin = np.min(points[0], axis=0)
+        ext = np.max(points[0], axis=0) - pmin
+
+        if self.tile_size is None:
+            dsel = ext > 0
+            n_dims = np.sum(dsel)
+            if n_points < 4 or n_dims == 0:
+                return None
+            size = (np.prod(ext[dsel]) / np.sqrt(n_points)) ** (1 / n_dims)
+        else:
+            size = self.tile_size
+
+        cells = ((points[0] - pmin[None, :]) / size).astype(FC.ITYPE)
+        cells = np.ravel_multi_index(cells.T, np.max(cells, axis=0) + 1)
+        __, tiles, counts = np.unique(cells, return_inverse=True, return_counts=True)
+        n_tiles = len(counts)
+        if n_tiles < 2:
+            return None
+
+        order = np.argsort(tiles, kind="stable")
+        starts = np.cumsum(counts) - counts
+        n_tpoints = np.max(counts)
+        tinds = np.zeros((n_tiles, n_tpoints), dtype=FC.ITYPE)
+        tinds[tiles[order], np.arange(n_points) - np.repeat(starts, counts)] = order
+        pad = np.arange(n_tpoints)[None, :] >= counts[:, None]
+        tinds[pad] = np.repeat(tinds[:, 0], n_tpoints - counts)
+
+        tpoints = points[:, tinds]
+        centres = (np.min(tpoints, axis=2) + np.max(tpoints, axis=2)) / 2
+        tradius = np.max(np.linalg.norm(tpoints - centres[:, :, None], axis=-1), axis=2)
+        tdata = Data.from_points(points=centres, data={}, dims={})
+
+        return tinds, tdata, tradius
+
+    def select_points(self, algo, mdata, fdata, states_source_turbine, wmodels, tiles):
+        """
+        Selects the points of the tiles that intersect
+        with the wake envelopes of the source turbines.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        wmodels: list of foxes.core.WakeModel
+            The wake models
+        tiles: tuple
+            The tiles, as provided by get_tiles
+
+        Returns
+        -------
+        pinds: numpy.ndarray of int
+            For each state, the indices of the selected
+            points, shape: (n_states, n_spoints), or
+            None for all points
+
+        """
+        tinds, tdata, tradius = tiles
+        bounds = algo.wake_frame.get_wake_coos_bounds(
+            algo, mdata, fdata, tdata, states_source_turbine, tradius
+        )
+        if bounds is None:
+            return None
+        x, r = bounds
+
+        tol = 0.0 if self.prune_tol is None else self.prune_tol
+        tsel = np.zeros_like(x, dtype=bool)
+        for w in wmodels:
+            tsel |= w.calc_interaction_spsel(
+                algo, mdata, fdata, tdata, states_source_turbine, x, r, tol
+            )
+
+        # gathering does not pay off for large selections:
+        n_stiles = np.max(np.sum(tsel, axis=1))
+        if n_stiles > 0.75 * tsel.shape[1]:
+            return None
+
+        # selected tiles first, padded by arbitrary tiles:
+        stiles = np.argsort(~tsel, axis=1, kind="stable")[:, :n_stiles]
+
+        return tinds[stiles].reshape(mdata.n_states, -1)
+
     def contribute_to_wake_deltas(
         self,
         algo,
@@ -95,6 +248,7 @@ class PointWakesCalculation(PointDataModel):
         states_source_turbine,
         wmodels,
         wdeltas,
+        pinds=None,
     ):
         """
         Contribute to wake deltas from source turbines
@@ -119,17 +273,33 @@ class PointWakesCalculation(PointDataModel):
             Key: Variable name str, for which the
             wake delta applies, values: numpy.ndarray with
             shape (n_states, n_points, ...)
+        pinds: numpy.ndarray of int, optional
+            For each state, the indices of the points
+            to be evaluated, shape: (n_states, n_spoints).
+            None means all points
 
         """
+        if pinds is not None:
+            if pinds.shape[1] == 0:
+                return
+
+            hpdata, hwdeltas = PartialWakesModel.select_points(pdata, wdeltas, pinds)
+
+        else:
+            hpdata = pdata
+            hwdeltas = wdeltas
+
         wcoos = algo.wake_frame.get_wake_coos(
-            algo, mdata, fdata, pdata, states_source_turbine
+            algo, mdata, fdata, hpdata, states_source_turbine
         )
 
         for w in wmodels:
             w.contribute_to_wake_deltas(
-                algo, mdata, fdata, pdata, states_source_turbine, wcoos, wdeltas
+                algo, mdata, fdata, hpdata, states_source_turbine, wcoos, hwdeltas
             )
 
+        PartialWakesModel.update_targets(wdeltas, hwdeltas, pinds)
+
     def calculate(self, algo, mdata, fdata, pdata, states_source_turbine=None):
         """ "
         The main model calculation.
@@ -175,10 +345,16 @@ class PointWakesCalculation(PointDataModel):
             del hdeltas
 
         if states_source_turbine is None:
+            tiles = self.get_tiles(algo, pdata) if self.tile_culling else None
             for oi in range(n_order):
                 o = torder[:, oi]
+                pinds = (
+                    self.select_points(algo, mdata, fdata, o, wmodels, tiles)
+                    if tiles is not None
+                    else None
+                )
                 self.contribute_to_wake_deltas(
-                    algo, mdata, fdata, pdata, o, wmodels, wdeltas
+                    algo, mdata, fdata, pdata, o, wmodels, wdeltas, pinds
                 )
         else:
             self.contribute_to_wake_deltas(
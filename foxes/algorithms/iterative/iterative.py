@@ -1,8 +1,13 @@
+import numpy as np
+import xarray as xr
+
 from foxes.algorithms.downwind.downwind import Downwind
 
 from foxes.core import FarmDataModelList
 from foxes.utils import Dict
+import foxes.models as fm
 import foxes.variables as FV
+import foxes.constants as FC
 from . import models as mdls
 
 
@@ -16,6 +21,9 @@ class Iterative(Downwind):
         The maximal number of iterations
     conv_crit: foxes.algorithms.iterative.ConvCrit
         The convergence criteria
+    mask_converged: bool
+        Flag for running only the states that have
+        not yet converged in subsequent iterations
     prev_farm_results: xarray.Dataset
         Results from the previous iteration
 
@@ -44,7 +52,9 @@ class Iterative(Downwind):
         except AttributeError:
             return super().get_model(name)
 
-    def __init__(self, *args, max_it=None, conv_crit=None, **kwargs):
+    def __init__(
+        self, *args, max_it=None, conv_crit=None, mask_converged=False, **kwargs
+    ):
         """
         Constructor.
 
@@ -56,6 +66,12 @@ class Iterative(Downwind):
             The maximal number of iterations
         conv_crit: foxes.algorithms.iterative.ConvCrit, optional
             The convergence criteria
+        mask_converged: bool
+            Flag for running only the states that have
+            not yet converged in subsequent iterations,
+            with converged results carried over unchanged.
+            Requires independent states, i.e., cannot be
+            combined with wake frames that couple states
         kwargs: dict, optional
             Keyword arguments for Downwind
 
@@ -66,8 +82,10 @@ class Iterative(Downwind):
         self.conv_crit = (
             self.get_model("DefaultConv")() if conv_crit is None else conv_crit
         )
+        self.mask_converged = mask_converged
         self.prev_farm_results = None
         self._it = None
+        self._active = None
         self._mlist = None
         self._reamb = False
         self._urelax = Dict(
@@ -91,6 +109,23 @@ class Iterative(Downwind):
             raise ValueError(f"Attempt to set_urelax after initialization")
         self._urelax[entry_point].update(urel)
 
+    def initialize(self):
+        """
+        Initializes the algorithm.
+        """
+        if self.mask_converged and isinstance(
+            self.wake_frame,
+            (fm.wake_frames.Timelines, fm.wake_frames.SeqDynamicWakes),
+        ):
+            raise ValueError(
+                f"Algorithm '{self.name}': Option mask_converged is not supported for wake frame '{self.wake_frame.name}', since it couples states"
+            )
+        if self.delta_checkpoints is not None:
+            raise ValueError(
+                f"Algorithm '{self.name}': Option delta_checkpoints is not supported, since delta mode is not available for iterative calculations"
+            )
+        super().initialize()
+
     @property
     def urelax(self):
         """
@@ -117,6 +152,20 @@ class Iterative(Downwind):
         """
         return self._it
 
+    @property
+    def active_states(self):
+        """
+        The states of the current iteration
+
+        Returns
+        -------
+        active: numpy.ndarray of bool
+            The active states flags, or None
+            for all states. Shape: (n_states,)
+
+        """
+        return self._active
+
     def _collect_farm_models(
         self,
         calc_parameters,
@@ -176,7 +225,11 @@ class Iterative(Downwind):
                 urelax = mdls.URelax(**self._urelax["pre_wake"])
 
             # add model that calculates wake effects:
-            mlist.models.append(self.get_model("FarmWakesCalculation")(urelax=urelax))
+            mlist.models.append(
+                self.get_model("FarmWakesCalculation")(
+                    urelax=urelax, prune_tol=self.prune_tol
+                )
+            )
             calc_pars.append(calc_parameters.get(mlist.models[-1].name, {}))
 
             # add under-relaxation:
@@ -186,11 +239,19 @@ class Iterative(Downwind):
 
             return mlist, calc_pars
 
+    def _get_farm_models(self, calc_parameters, ambient):
+        """Helper function that provides the model list"""
+        return self._collect_farm_models(calc_parameters, ambient)
+
     def _calc_farm_vars(self, mlist):
         """Helper function that gathers the farm variables"""
         if self._it == 0:
             super()._calc_farm_vars(mlist)
 
+    def _cache_partial(self):
+        """Helper function that checks if missing states can be calculated separately"""
+        return False
+
     def _run_farm_calc(self, mlist, *data, **kwargs):
         """Helper function for running the main farm calculation"""
         ir = (
@@ -200,16 +261,24 @@ class Iterative(Downwind):
         )
         return super()._run_farm_calc(mlist, *data, initial_results=ir, **kwargs)
 
-    def calc_farm(self, finalize=True, **kwargs):
+    def calc_farm(self, *args, base_results=None, changed_turbines=None, **kwargs):
         """
         Calculate farm data.
 
+        Delta mode is not supported, since the iterations
+        couple all turbines, such that upstream results
+        cannot be taken from base results.
+
         Parameters
         ----------
-        finalize: bool
-            Flag for finalization after calculation
+        args: tuple, optional
+            Arguments for Downwind.calc_farm
+        base_results: xarray.Dataset, optional
+            Not supported, must be None
+        changed_turbines: list or numpy.ndarray, optional
+            Not supported, must be None
         kwargs: dict, optional
-            Arguments for calc_farm in the base class.
+            Keyword arguments for Downwind.calc_farm
 
         Returns
         -------
@@ -218,19 +287,47 @@ class Iterative(Downwind):
             dimensions (state, turbine)
 
         """
+        if base_results is not None or changed_turbines is not None:
+            raise NotImplementedError(
+                f"Algorithm '{self.name}': Delta mode is not supported for iterative calculations"
+            )
+        return super().calc_farm(*args, **kwargs)
+
+    def _calc_farm(self, finalize=True, **kwargs):
+        """Helper function that runs the farm calculation iteratively"""
         fres = None
         self._it = -1
+        self._active = None
         while self._it < self.max_it:
             self._it += 1
 
             self.print(f"\nAlgorithm {self.name}: Iteration {self._it}\n", vlim=0)
+            if self._active is not None:
+                self.print(
+                    f"Algorithm {self.name}: Active states {np.sum(self._active)} / {self.n_states}\n",
+                    vlim=0,
+                )
 
             self.prev_farm_results = fres
-            fres = super().calc_farm(finalize=False, **kwargs)
+            fres = super()._calc_farm(finalize=False, **kwargs)
 
-            conv = self.conv_crit.check_converged(
-                self, self.prev_farm_results, fres, verbosity=self.verbosity + 1
-            )
+            if self.mask_converged:
+                if self._active is not None:
+                    active = xr.DataArray(self._active, dims=[FC.STATE])
+                    for v, d in fres.data_vars.items():
+                        if FC.STATE in d.dims:
+                            fres[v] = d.where(active, self.prev_farm_results[v])
+
+                sconv = self.conv_crit.check_converged_states(
+                    self, self.prev_farm_results, fres, verbosity=self.verbosity + 1
+                )
+                conv = np.all(sconv)
+                self._active = ~sconv
+
+            else:
+                conv = self.conv_crit.check_converged(
+                    self, self.prev_farm_results, fres, verbosity=self.verbosity + 1
+                )
 
             if conv:
                 self.print(f"\nAlgorithm {self.name}: Convergence reached.\n", vlim=0)
@@ -239,6 +336,8 @@ class Iterative(Downwind):
             if self._it == 0:
                 self.verbosity -= 1
 
+        self._active = None
+
         # finalize models:
         if finalize:
             self.print("\n")
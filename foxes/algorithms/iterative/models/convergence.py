@@ -2,6 +2,7 @@ from abc import ABCMeta, abstractmethod
 import numpy as np
 
 import foxes.variables as FV
+import foxes.constants as FC
 from foxes.utils import delta_wd
 
 
@@ -56,6 +57,33 @@ class ConvCrit(metaclass=ABCMeta):
         """
         pass
 
+    def check_converged_states(self, algo, prev_results, results, verbosity=0):
+        """
+        Check convergence criteria for each state.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        prev_results: xarray.Dataset
+            The farm results of previous
+            iteration, or None if first
+        results: xarray.Dataset
+            The farm results of current
+            iteration
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        convergence: numpy.ndarray of bool
+            Convergence flags, true if converged.
+            Shape: (n_states,)
+
+        """
+        conv = self.check_converged(algo, prev_results, results, verbosity)
+        return np.full(results.sizes[FC.STATE], conv, dtype=bool)
+
     @abstractmethod
     def get_deltas(self):
         """
@@ -141,6 +169,40 @@ class ConvCritList(ConvCrit):
 
         return True
 
+    def check_converged_states(self, algo, prev_results, results, verbosity=0):
+        """
+        Check convergence criteria for each state.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        prev_results: xarray.Dataset
+            The farm results of previous
+            iteration, or None if first
+        results: xarray.Dataset
+            The farm results of current
+            iteration
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        convergence: numpy.ndarray of bool
+            Convergence flags, true if converged.
+            Shape: (n_states,)
+
+        """
+        self._failed = None
+        conv = np.ones(results.sizes[FC.STATE], dtype=bool)
+        for c in self.crits:
+            cnv = c.check_converged_states(algo, prev_results, results, verbosity)
+            if self._failed is None and not np.all(cnv):
+                self._failed = c
+            conv &= cnv
+
+        return conv
+
     def get_deltas(self):
         """
         Get the most recent evaluation deltas.
@@ -246,6 +308,61 @@ class ConvVarDelta(ConvCrit):
 
         return ok
 
+    def check_converged_states(self, algo, prev_results, results, verbosity=0):
+        """
+        Check convergence criteria for each state.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        prev_results: xarray.Dataset
+            The farm results of previous
+            iteration, or None if first
+        results: xarray.Dataset
+            The farm results of current
+            iteration
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        Returns
+        -------
+        convergence: numpy.ndarray of bool
+            Convergence flags, true if converged.
+            Shape: (n_states,)
+
+        """
+        n_states = results.sizes[FC.STATE]
+        if prev_results is None:
+            return np.zeros(n_states, dtype=bool)
+
+        if verbosity > 0:
+            print(f"\n{self.name}: Convergence check")
+            L = max([len(v) for v in self.limits.keys()])
+
+        conv = np.ones(n_states, dtype=bool)
+        self._deltas = {}
+        for v, lim in self.limits.items():
+            x0 = prev_results[v].transpose(FC.STATE, ...).to_numpy()
+            x = results[v].transpose(FC.STATE, ...).to_numpy()
+            if v in self.wd_vars:
+                delta = np.abs(delta_wd(x0, x))
+            else:
+                delta = np.abs(x - x0)
+            delta = np.max(delta.reshape(n_states, -1), axis=1)
+            self._deltas[v] = np.max(delta)
+            conv &= delta <= lim
+
+            if verbosity > 0:
+                check = self._deltas[v]
+                r = "FAILED" if check > lim else "OK"
+                n = np.sum(~(delta <= lim))
+                print(
+                    f"  {v:<{L}}: delta = {check:.3e}, lim = {lim:.3e}  --  {r} ({n} states)"
+                )
+
+        return conv
+
     def get_deltas(self):
         """
         Get the most recent evaluation deltas.
@@ -1,10 +1,12 @@
 import numpy as np
 
 import foxes.variables as FV
-from foxes.core import FarmDataModel
+import foxes.constants as FC
+from foxes.core import Data
+import foxes.algorithms.downwind.models as dmdls
 
 
-class FarmWakesCalculation(FarmDataModel):
+class FarmWakesCalculation(dmdls.FarmWakesCalculation):
     """
     This model calculates wakes effects on farm data.
 
@@ -17,7 +19,7 @@ class FarmWakesCalculation(FarmDataModel):
 
     """
 
-    def __init__(self, urelax=None):
+    def __init__(self, urelax=None, prune_tol=None):
         """
         Constructor.
 
@@ -25,31 +27,14 @@ class FarmWakesCalculation(FarmDataModel):
         ----------
         urelax: foxes.algorithms.iterative.models.URelax, optional
             The under-relaxation model
+        prune_tol: float, optional
+            The error tolerance for pruning negligible
+            wake interactions, or None for no pruning
 
         """
-        super().__init__()
+        super().__init__(prune_tol)
         self.urelax = urelax
 
-    def output_farm_vars(self, algo):
-        """
-        The variables which are being modified by the model.
-
-        Parameters
-        ----------
-        algo: foxes.core.Algorithm
-            The calculation algorithm
-
-        Returns
-        -------
-        output_vars: list of str
-            The output variable names
-
-        """
-        ovars = algo.rotor_model.output_farm_vars(
-            algo
-        ) + algo.farm_controller.output_farm_vars(algo)
-        return list(dict.fromkeys(ovars))
-
     def sub_models(self):
         """
         List of all sub-models
@@ -62,20 +47,43 @@ class FarmWakesCalculation(FarmDataModel):
         """
         return [self.pwakes] if self.urelax is None else [self.urelax, self.pwakes]
 
-    def initialize(self, algo, verbosity=0):
-        """
-        Initializes the model.
-
-        Parameters
-        ----------
-        algo: foxes.core.Algorithm
-            The calculation algorithm
-        verbosity: int
-            The verbosity level, 0 = silent
+    def _select_states(self, algo, mdata, fdata, sinds):
+        """Helper function that creates state subset data"""
 
-        """
-        self.pwakes = algo.partial_wakes_model
-        super().initialize(algo, verbosity)
+        # include the rotor data from the first iteration:
+        hmdata = {}
+        hmdims = {}
+        for v in [FC.RPOINTS, FC.RWEIGHTS, FC.AMB_RPOINT_RESULTS]:
+            d, dims = algo.rotor_model.from_data_or_store(
+                v, algo, mdata, ret_dims=True, safe=True
+            )
+            if d is not None:
+                hmdata[v] = d
+                hmdims[v] = dims
+        hmdata.update(mdata)
+        hmdims.update(mdata.dims)
+
+        # the subset is keyed by the parent chunk in model stores:
+        i0 = mdata.states_i0(counter=True, algo=algo)
+
+        def _sel(data, dims, loop_dims, name):
+            sdata = {}
+            sdims = {}
+            for v, d in data.items():
+                sdims[v] = (FC.STATE,) if v == FC.STATE else dims.get(v, None)
+                if isinstance(d, dict):
+                    sdata[v] = {k: a[sinds] for k, a in d.items()}
+                elif sdims[v] is not None and FC.STATE in sdims[v]:
+                    sdata[v] = np.take(d, sinds, axis=sdims[v].index(FC.STATE))
+                else:
+                    sdata[v] = d
+            return Data(sdata, sdims, loop_dims, name, parent_i0=i0)
+
+        smdata = _sel(hmdata, hmdims, mdata.loop_dims, f"{mdata.name}_sel")
+        sfdata = _sel(fdata, fdata.dims, fdata.loop_dims, f"{fdata.name}_sel")
+        smdata.add(FC.STATES_SEL, i0 + sinds, (FC.STATE,))
+
+        return smdata, sfdata
 
     def calculate(self, algo, mdata, fdata):
         """ "
@@ -101,6 +109,24 @@ class FarmWakesCalculation(FarmDataModel):
 
         """
 
+        # run only states that are not yet converged:
+        if algo.active_states is not None:
+            i0 = mdata.states_i0(counter=True, algo=algo)
+            active = algo.active_states[i0 : i0 + mdata.n_states]
+            if not np.all(active):
+                ovars = self.output_farm_vars(algo)
+                sinds = np.where(active)[0]
+                if len(sinds):
+                    smdata, sfdata = self._select_states(algo, mdata, fdata, sinds)
+                    res = self._calc_wakes(algo, smdata, sfdata)
+                    for v in ovars:
+                        fdata[v][sinds] = res[v]
+                return {v: fdata[v] for v in ovars}
+
+        return self._calc_wakes(algo, mdata, fdata)
+
+    def _calc_wakes(self, algo, mdata, fdata):
+        """Helper function that runs the wake calculation"""
         torder = fdata[FV.ORDER]
         n_order = torder.shape[1]
         n_states = mdata.n_states
@@ -110,8 +136,7 @@ class FarmWakesCalculation(FarmDataModel):
                 algo, mdata, fdata, pdata, wdeltas, states_turbine=o
             )
 
-            trbs = np.zeros((n_states, algo.n_turbines), dtype=bool)
-            np.put_along_axis(trbs, o[:, None], True, axis=1)
+            trbs = (np.arange(n_states), o)
 
             res = algo.farm_controller.calculate(
                 algo, mdata, fdata, pre_rotor=False, st_sel=trbs
@@ -126,7 +151,17 @@ class FarmWakesCalculation(FarmDataModel):
         wdeltas, pdata = self.pwakes.new_wake_deltas(algo, mdata, fdata)
         for oi in range(n_order):
             o = torder[:, oi]
-            self.pwakes.contribute_to_wake_deltas(algo, mdata, fdata, pdata, o, wdeltas)
+
+            if self.prune_tol is not None:
+                targets = self.get_targets(algo, mdata, fdata, o)
+                if targets.shape[1] == 0:
+                    continue
+            else:
+                targets = None
+
+            self.pwakes.contribute_to_wake_deltas(
+                algo, mdata, fdata, pdata, o, wdeltas, targets
+            )
 
         for oi in range(n_order):
             _evaluate(algo, mdata, fdata, pdata, wdeltas, torder[:, oi])
@@ -1,4 +1,5 @@
 from foxes.core import FarmDataModel
+import foxes.constants as FC
 
 
 class URelax(FarmDataModel):
@@ -71,14 +72,17 @@ class URelax(FarmDataModel):
             Values: numpy.ndarray with shape (n_states, n_turbines)
 
         """
-        i0 = fdata.states_i0(counter=True, algo=algo)
-        i1 = i0 + fdata.n_states
+        if FC.STATES_SEL in mdata:
+            ssel = mdata[FC.STATES_SEL]
+        else:
+            i0 = fdata.states_i0(counter=True, algo=algo)
+            ssel = slice(i0, i0 + fdata.n_states)
         pres = algo.prev_farm_results
 
         out = {}
         for v, u in self.urel.items():
             if u > 0 and pres is not None:
-                odata = pres[v].to_numpy()[i0:i1]
+                odata = pres[v].to_numpy()[ssel]
                 out[v] = u * odata + (1 - u) * fdata[v]
             else:
                 out[v] = fdata[v]
@@ -3,8 +3,8 @@ from foxes.core.states import States
 
 class SeqState(States):
     """
-    A single state during sequential iteration, just serving
-    as a structural placeholder
+    A single state or a batch of states during sequential
+    iteration, just serving as a structural placeholder
 
     Parameters
     ----------
@@ -85,7 +85,12 @@ class SeqState(States):
             The index labels of states, or None for default integers
 
         """
-        return [self._indx] if self._size == 1 else self.states.index()
+        if self._size == 1:
+            return [self._indx]
+        elif self._counter is not None:
+            return self.states.index()[self._counter : self._counter + self._size]
+        else:
+            return self.states.index()
 
     @property
     def counter(self):
@@ -115,7 +120,13 @@ class SeqState(States):
             The weights, shape: (n_states, n_turbines)
 
         """
-        return self._weight[None, :] if self._size == 1 else self.states.weights(algo)
+        if self._size == 1:
+            return self._weight[None, :]
+        elif self._counter is not None:
+            i0 = self._counter
+            return self.states.weights(algo)[i0 : i0 + self._size]
+        else:
+            return self.states.weights(algo)
 
     def output_point_vars(self, algo):
         """
@@ -30,6 +30,9 @@ class Sequential(Downwind):
         The points of interest, shape: (n_states, n_points, 3)
     plugins: list of foxes.algorithm.sequential.SequentialIterPlugin
         The plugins, updated with every iteration
+    batch_size: int
+        The number of states that are calculated together,
+        ahead of iteration. Dynamic wakes require 1
 
     :group: algorithms.sequential
 
@@ -67,6 +70,7 @@ class Sequential(Downwind):
         calc_pars={},
         chunks={FC.STATE: None, FC.POINT: 10000},
         plugins=[],
+        batch_size=1,
         **kwargs,
     ):
         """
@@ -93,6 +97,9 @@ class Sequential(Downwind):
             The xarray.Dataset chunk parameters
         plugins: list of foxes.algorithm.sequential.SequentialIterPlugin
             The plugins, updated with every iteration
+        batch_size: int
+            The number of states that are calculated together,
+            ahead of iteration. Dynamic wakes require 1
         kwargs: dict, optional
             Additional arguments for Downwind
 
@@ -105,9 +112,20 @@ class Sequential(Downwind):
         self.states0 = self.states.states
         self.points = points
         self.plugins = plugins
+        self.batch_size = batch_size
 
         self._i = None
 
+    def initialize(self):
+        """
+        Initializes the algorithm.
+        """
+        if self.delta_checkpoints is not None:
+            raise ValueError(
+                f"Algorithm '{self.name}': Option delta_checkpoints is not supported, since delta mode is not available for sequential calculations"
+            )
+        super().initialize()
+
     @property
     def iterating(self):
         """
@@ -132,6 +150,7 @@ class Sequential(Downwind):
             self._inds = self.states0.index()
             self._weights = self.states0.weights(self)
             self._i = 0
+            self._i1 = 0
             self._counter = 0
 
             self._mlist, self._calc_pars = self._collect_farm_models(
@@ -192,54 +211,110 @@ class Sequential(Downwind):
                     name="pdata",
                 )
 
+            # dynamic wakes depend on the results of all previous states:
+            from foxes.models.wake_frames import SeqDynamicWakes
+
+            self._n_batch = self.batch_size
+            if isinstance(self.wake_frame, SeqDynamicWakes):
+                self._n_batch = 1
+
             for p in self.plugins:
                 p.initialize(self)
 
         return self
 
-    def __next__(self):
-        """Run calculation for current step, then iterate to next"""
+    def _calc_batch(self):
+        """Helper function that calculates the next batch of states"""
+        i0 = self._i
+        i1 = min(i0 + self._n_batch, len(self._inds))
+        n_states = i1 - i0
+        self.states._counter = i0
+        self.states._size = n_states
+        self.states._indx = self._inds[i0]
+        self.states._weight = self._weights[i0]
 
-        if self._i < len(self._inds):
-            self._counter = self._i
-            self.states._counter = self._i
-            self.states._size = 1
-            self.states._indx = self._inds[self._i]
-            self.states._weight = self._weights[self._i]
+        mdata = Data(
+            data={
+                v: d[i0:i1] if self._mdata.dims[v][0] == FC.STATE else d
+                for v, d in self._mdata.items()
+            },
+            dims={v: d for v, d in self._mdata.dims.items()},
+            loop_dims=[FC.STATE],
+            name="mdata",
+        )
 
-            mdata = Data(
-                data={
-                    v: d[self._i, None] if self._mdata.dims[v][0] == FC.STATE else d
-                    for v, d in self._mdata.items()
-                },
-                dims={v: d for v, d in self._mdata.dims.items()},
-                loop_dims=[FC.STATE],
-                name="mdata",
-            )
+        fdata = Data(
+            data={
+                v: np.zeros((n_states, self.n_turbines), dtype=FC.DTYPE)
+                for v in self.farm_vars
+            },
+            dims={v: (FC.STATE, FC.TURBINE) for v in self.farm_vars},
+            loop_dims=[FC.STATE],
+            name="fdata",
+        )
 
-            fdata = Data(
+        fres = self._mlist.calculate(self, mdata, fdata, parameters=self._calc_pars)
+        fres[FV.WEIGHT] = self._weights[i0:i1]
+
+        for v, d in fres.items():
+            self._fdata[v][i0:i1] = d
+
+        fres[FC.TNAME] = np.array(self.farm.turbine_names)
+        if FV.ORDER in fres:
+            fres[FV.ORDER] = fres[FV.ORDER].astype(FC.ITYPE)
+        self._bfres = Dataset(
+            coords={
+                FC.STATE: self._inds[i0:i1],
+                FC.TURBINE: np.arange(self.n_turbines),
+            },
+            data_vars={
+                v: ((FC.TURBINE,) if v == FC.TNAME else (FC.STATE, FC.TURBINE), d)
+                for v, d in fres.items()
+            },
+        )
+
+        if self.points is not None:
+            n_points = self.points.shape[1]
+            pdata = Data.from_points(
+                self.points[i0:i1],
                 data={
-                    v: np.zeros((1, self.n_turbines), dtype=FC.DTYPE)
-                    for v in self.farm_vars
+                    v: np.zeros((n_states, n_points), dtype=FC.DTYPE)
+                    for v in self._pvars
                 },
-                dims={v: (FC.STATE, FC.TURBINE) for v in self.farm_vars},
-                loop_dims=[FC.STATE],
-                name="fdata",
+                dims={v: (FC.STATE, FC.POINT) for v in self._pvars},
+                name="pdata",
             )
 
-            fres = self._mlist.calculate(self, mdata, fdata, parameters=self._calc_pars)
-            fres[FV.WEIGHT] = self.weight[None, :]
+            pres = self._plist.calculate(
+                self, mdata, fdata, pdata, parameters=self._calc_pars_p
+            )
 
-            for v, d in fres.items():
-                self._fdata[v][self._i] = d[0]
+            for v, d in pres.items():
+                self._pdata[v][i0:i1] = d
 
-            fres = Dataset(
-                coords={FC.STATE: [self.index], FC.TURBINE: np.arange(self.n_turbines)},
-                data_vars={v: ((FC.STATE, FC.TURBINE), d) for v, d in fres.items()},
+            self._bpres = Dataset(
+                coords={FC.STATE: self._inds[i0:i1], FC.POINT: np.arange(n_points)},
+                data_vars={v: ((FC.STATE, FC.POINT), d) for v, d in pres.items()},
             )
-            fres[FC.TNAME] = ((FC.TURBINE,), self.farm.turbine_names)
-            if FV.ORDER in fres:
-                fres[FV.ORDER] = fres[FV.ORDER].astype(FC.ITYPE)
+
+        self._i0 = i0
+        self._i1 = i1
+
+    def __next__(self):
+        """Run calculation for current step, then iterate to next"""
+
+        if self._i < len(self._inds):
+            if self._i >= self._i1:
+                self._calc_batch()
+
+            self._counter = self._i
+            self.states._counter = self._i
+            self.states._size = 1
+            self.states._indx = self._inds[self._i]
+            self.states._weight = self._weights[self._i]
+
+            sel = {FC.STATE: [self._i - self._i0]}
+            fres = self._bfres.isel(sel)
 
             if self.points is None:
                 for p in self.plugins:
@@ -249,27 +324,7 @@ class Sequential(Downwind):
                 return fres
 
             else:
-                n_points = self.points.shape[1]
-                pdata = Data.from_points(
-                    self.points[self.counter, None],
-                    data={
-                        v: np.zeros((1, n_points), dtype=FC.DTYPE) for v in self._pvars
-                    },
-                    dims={v: (FC.STATE, FC.POINT) for v in self._pvars},
-                    name="pdata",
-                )
-
-                pres = self._plist.calculate(
-                    self, mdata, fdata, pdata, parameters=self._calc_pars_p
-                )
-
-                for v, d in pres.items():
-                    self._pdata[v][self._i] = d[0]
-
-                pres = Dataset(
-                    coords={FC.STATE: [self.index], FC.POINT: np.arange(n_points)},
-                    data_vars={v: ((FC.STATE, FC.POINT), d) for v, d in pres.items()},
-                )
+                pres = self._bpres.isel(sel)
 
                 for p in self.plugins:
                     p.update(self, fres, pres)
@@ -281,6 +336,10 @@ class Sequential(Downwind):
             del self._mdata
 
             self._i = None
+            self._i0 = None
+            self._i1 = None
+            self._bfres = None
+            self._bpres = None
             self.states._counter = None
             self.states._size = len(self._inds)
             self.states._indx = self._inds
@@ -483,7 +542,34 @@ class Sequential(Downwind):
 
         return results
 
-    def calc_farm(self, *args, **kwargs):
+    def calc_farm(self, *args, base_results=None, changed_turbines=None, **kwargs):
+        """
+        Returns the farm results of the current iteration.
+
+        Delta mode is not supported, since the results
+        are calculated by the iteration.
+
+        Parameters
+        ----------
+        args: tuple, optional
+            Ignored arguments
+        base_results: xarray.Dataset, optional
+            Not supported, must be None
+        changed_turbines: list or numpy.ndarray, optional
+            Not supported, must be None
+        kwargs: dict, optional
+            Ignored keyword arguments
+
+        Returns
+        -------
+        farm_results: xarray.Dataset
+            The farm results of the current iteration
+
+        """
+        if base_results is not None or changed_turbines is not None:
+            raise NotImplementedError(
+                f"Algorithm '{self.name}': Delta mode is not supported for sequential calculations"
+            )
         if not self.iterating:
             raise ValueError(f"calc_farm call is only allowed during iterations")
 
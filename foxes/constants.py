@@ -76,6 +76,11 @@ TMODEL_SELS = "tmodel_sels"
 :group: foxes.constants
 """
 
+TMODEL_PATTERNS = "tmodel_patterns"
+"""Turbine model state patterns identifier
+:group: foxes.constants
+"""
+
 STATES_SEL = "states_sel"
 """Identifier for states selection
 :group: foxes.constants
@@ -28,12 +28,15 @@ class Algorithm(Model):
         The verbosity level, 0 means silent
     dbook: foxes.DataBook
         The data book, or None for default
+    dtype: numpy.dtype
+        The floating point type of the heavy point arrays,
+        i.e., rotor points, wake deltas and point results
 
     :group: core
 
     """
 
-    def __init__(self, mbook, farm, chunks, verbosity, dbook=None):
+    def __init__(self, mbook, farm, chunks, verbosity, dbook=None, dtype=None):
         """
         Constructor.
 
@@ -50,6 +53,10 @@ class Algorithm(Model):
             The verbosity level, 0 means silent
         dbook: foxes.DataBook, optional
             The data book, or None for default
+        dtype: numpy.dtype, optional
+            The floating point type of the heavy point arrays,
+            i.e., rotor points, wake deltas and point results,
+            e.g. numpy.float32. Default: FC.DTYPE
 
         """
         super().__init__()
@@ -62,8 +69,16 @@ class Algorithm(Model):
         self.n_states = None
         self.n_turbines = farm.n_turbines
         self.dbook = StaticData() if dbook is None else dbook
+        self.dtype = np.dtype(FC.DTYPE if dtype is None else dtype)
+        if not np.issubdtype(self.dtype, np.floating):
+            raise TypeError(
+                f"Algorithm '{self.name}': Expecting floating point dtype, got '{self.dtype}'"
+            )
 
         self._idata_mem = Dict()
+        self._models_data = None
+        self._mdata_vars = None
+        self._mdata_updates = set()
 
     def print(self, *args, vlim=1, **kwargs):
         """
@@ -208,6 +223,7 @@ class Algorithm(Model):
         if not force and mname in self._idata_mem:
             raise KeyError(f"Attempt to overwrite stored data for model '{mname}'")
         self._idata_mem[mname] = idata
+        self._mdata_updates.add(mname)
 
     def get_model_data(self, model):
         """
@@ -242,6 +258,7 @@ class Algorithm(Model):
             del self._idata_mem[mname]
         except KeyError:
             raise KeyError(f"Attempt to delete data of model '{mname}', but not stored")
+        self._mdata_updates.add(mname)
 
     def update_n_turbines(self):
         """
@@ -297,6 +314,7 @@ class Algorithm(Model):
                             )
 
             self._idata_mem.update(newk)
+            self._models_data = None
 
     def get_models_idata(self):
         """
@@ -322,10 +340,46 @@ class Algorithm(Model):
                 idata["data_vars"].update(hidata["data_vars"])
         return idata
 
+    def __update_models_data(self):
+        """
+        Private helper function
+        """
+        ds = self._models_data
+        drop = []
+        idata = {"coords": {}, "data_vars": {}}
+        for mname in self._mdata_updates:
+            if mname[:2] == "__":
+                continue
+            if mname not in self._idata_mem:
+                return None
+            for c, d in self._idata_mem[mname]["coords"].items():
+                if (
+                    c not in ds.coords
+                    or len(d) != ds.sizes[c]
+                    or np.any(ds.coords[c].values != d)
+                ):
+                    return None
+            drop += self._mdata_vars.get(mname, [])
+            idata["data_vars"].update(self._idata_mem[mname]["data_vars"])
+
+        sizes = self.__get_sizes(idata, "models")
+        for c, s in sizes.items():
+            if c not in ds.sizes or ds.sizes[c] != s:
+                return None
+        idata["coords"] = {c: ds.coords[c].values for c in sizes if c in ds.coords}
+
+        ds = ds.drop_vars([v for v in drop if v in ds.data_vars])
+        return ds.assign(self.__get_xrdata(idata, sizes).data_vars)
+
     def get_models_data(self, idata=None):
         """
         Creates xarray from model input data.
 
+        Without explicit idata, the result is kept in memory
+        and reused by subsequent calls. Only the data of models
+        that have been (re-)initialized or finalized in the
+        meantime is updated.
+
         Parameters
         ----------
         idata: dict, optional
@@ -340,10 +394,26 @@ class Algorithm(Model):
             The model input data
 
         """
-        if idata is None:
+        if idata is not None:
+            sizes = self.__get_sizes(idata, "models")
+            return self.__get_xrdata(idata, sizes)
+
+        if self._models_data is not None and len(self._mdata_updates):
+            self._models_data = self.__update_models_data()
+
+        if self._models_data is None:
             idata = self.get_models_idata()
-        sizes = self.__get_sizes(idata, "models")
-        return self.__get_xrdata(idata, sizes)
+            sizes = self.__get_sizes(idata, "models")
+            self._models_data = self.__get_xrdata(idata, sizes)
+
+        self._mdata_vars = {
+            mname: list(hidata["data_vars"].keys())
+            for mname, hidata in self._idata_mem.items()
+            if mname[:2] != "__"
+        }
+        self._mdata_updates = set()
+
+        return self._models_data
 
     def new_point_data(self, points, states_indices=None):
         """
@@ -394,6 +464,9 @@ class Algorithm(Model):
         super().finalize(self, self.verbosity)
         if clear_mem:
             self._idata_mem = Dict()
+        self._models_data = None
+        self._mdata_vars = None
+        self._mdata_updates = set()
 
     @classmethod
     def new(cls, algo_type, *args, **kwargs):
@@ -22,12 +22,15 @@ class Data(Dict):
         `apply_ufunc` calculations
     sizes: dict
         The dimension sizes
+    parent_i0: int
+        The state counter of the first state of the
+        parent chunk, for state subsets, or None
 
     :group: core
 
     """
 
-    def __init__(self, data, dims, loop_dims, name="data"):
+    def __init__(self, data, dims, loop_dims, name="data", parent_i0=None):
         """
         Constructor.
 
@@ -43,9 +46,13 @@ class Data(Dict):
             `apply_ufunc` calculations
         name: str
             The data container name
+        parent_i0: int, optional
+            The state counter of the first state of the
+            parent chunk, for state subsets
 
         """
         super().__init__(name=name)
+        self.parent_i0 = parent_i0
 
         self.update(data)
         self.dims = dims
@@ -100,6 +107,9 @@ class Data(Dict):
         """
         Get the state counter for first state in chunk
 
+        For state subsets the counter of the parent
+        chunk is returned.
+
         Parameters
         ----------
         counter: bool
@@ -116,6 +126,8 @@ class Data(Dict):
         """
         if FC.STATE not in self:
             return None
+        elif counter and self.parent_i0 is not None:
+            return self.parent_i0
         elif counter:
             if algo is None:
                 raise KeyError(f"{self.name}: Missing algo for deducing state counter")
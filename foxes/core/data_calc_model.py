@@ -69,6 +69,7 @@ class DataCalcModel(Model):
         out_dims,
         calc_pars,
         init_vars,
+        dtype,
     ):
         """
         Wrapper that mitigates between apply_ufunc and `calculate`.
@@ -105,7 +106,7 @@ class DataCalcModel(Model):
         odims = {v: out_dims for v in out_vars}
         odata = {
             v: (
-                np.full(oshape, np.nan, dtype=FC.DTYPE)
+                np.full(oshape, np.nan, dtype=dtype)
                 if v not in init_vars
                 else prev[init_vars.index(v)].copy()
             )
@@ -162,7 +163,7 @@ class DataCalcModel(Model):
 
         # create output:
         n_vars = len(out_vars)
-        data = np.zeros(oshape + [n_vars], dtype=FC.DTYPE)
+        data = np.zeros(oshape + [n_vars], dtype=dtype)
         for v in out_vars:
             data[..., out_vars.index(v)] = results[v]
 
@@ -178,6 +179,7 @@ class DataCalcModel(Model):
         initial_results=None,
         sel=None,
         isel=None,
+        dtype=None,
         **calc_pars,
     ):
         """
@@ -206,6 +208,9 @@ class DataCalcModel(Model):
             Selection of loop_dim variable subset values
         isel: dict, optional
             Selection of loop_dim variable subset index values
+        dtype: numpy.dtype, optional
+            The floating point type of the output data,
+            default: FC.DTYPE
         calc_pars: dict, optional
             Additional arguments for the `calculate` function
 
@@ -306,6 +311,7 @@ class DataCalcModel(Model):
             out_dims=out_dims,
             calc_pars=calc_pars,
             init_vars=ivars,
+            dtype=FC.DTYPE if dtype is None else dtype,
         )
 
         # run parallel computation:
@@ -316,7 +322,7 @@ class DataCalcModel(Model):
             *ldata,
             input_core_dims=iidims + icdims,
             output_core_dims=[out_core_vars],
-            output_dtypes=[FC.DTYPE],
+            output_dtypes=[wargs["dtype"]],
             dask="parallelized",
             dask_gufunc_kwargs=dargs,
             kwargs=wargs,
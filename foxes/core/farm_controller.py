@@ -16,9 +16,14 @@ class FarmController(FarmDataModel):
         The turbine type of each turbine
     turbine_model_names: list of str
         Names of all turbine models found in the farm
-    turbine_model_sels: numpy.ndarray of bool
-        Selection flags for all turbine models,
-        shape: (n_states, n_turbines, n_models)
+    turbine_model_sels: numpy.ndarray of int
+        The state selection of each turbine model, either
+        the index of the state pattern, or -1 for all states,
+        or -2 for no states, shape: (n_turbines, n_models)
+    turbine_model_patterns: numpy.ndarray of bool
+        The distinct state patterns of the state
+        dependent turbine model selections,
+        shape: (n_states, n_patterns)
     pre_rotor_models: foxes.core.FarmDataModelList
         The turbine models with pre-rotor flag
     post_rotor_models: foxes.core.FarmDataModelList
@@ -47,6 +52,7 @@ class FarmController(FarmDataModel):
         self.turbine_types = None
         self.turbine_model_names = None
         self.turbine_model_sels = None
+        self.turbine_model_patterns = None
         self.pre_rotor_models = None
         self.post_rotor_models = None
 
@@ -119,12 +125,11 @@ class FarmController(FarmDataModel):
                         m = models[ti][tmis[ti]]
                         tmodels.append(m)
 
-                        tsel = np.zeros((algo.n_states, algo.n_turbines), dtype=bool)
+                        tsel = {}
                         for tj, jnames in enumerate(mnames):
                             mi = tmis[tj]
                             if mi < len(jnames) and jnames[mi] == mname:
-                                ssel = algo.farm.turbines[tj].mstates_sel[mi]
-                                tsel[:, tj] = True if ssel is None else ssel
+                                tsel[tj] = algo.farm.turbines[tj].mstates_sel[mi]
                                 tmis[tj] += 1
                         tmsels.append(tsel)
 
@@ -224,25 +229,66 @@ class FarmController(FarmDataModel):
         )
         tmsels = tmsels_pre + tmsels_post
         self.turbine_model_names = mnames_pre + mnames_post
-        if len(self.turbine_model_names):
-            self.turbine_model_sels = np.stack(tmsels, axis=2)
-        else:
+        if not len(self.turbine_model_names):
             raise ValueError(f"Controller '{self.name}': No turbine model found.")
 
+        # compress selections into distinct state patterns:
+        n_models = len(self.turbine_model_names)
+        self.turbine_model_sels = np.full(
+            (algo.n_turbines, n_models), -2, dtype=FC.ITYPE
+        )
+        pats = {}
+        for mi, tsel in enumerate(tmsels):
+            for ti, ssel in tsel.items():
+                if ssel is None or np.all(ssel):
+                    self.turbine_model_sels[ti, mi] = -1
+                elif np.any(ssel):
+                    ssel = np.zeros(algo.n_states, dtype=bool) | ssel
+                    k = pats.setdefault(ssel.tobytes(), (len(pats), ssel))[0]
+                    self.turbine_model_sels[ti, mi] = k
+        self.turbine_model_patterns = np.zeros((algo.n_states, len(pats)), dtype=bool)
+        for k, ssel in pats.values():
+            self.turbine_model_patterns[:, k] = ssel
+
     def __get_pars(self, algo, models, ptype, mdata=None, st_sel=None, from_data=True):
         """
         Private helper function for gathering model parameters.
         """
-        if from_data:
-            s = mdata[FC.TMODEL_SELS]
+        if not self.turbine_model_patterns.shape[1]:
+            pats = None
+        elif from_data:
+            pats = mdata[FC.TMODEL_SELS]
         else:
-            s = self.turbine_model_sels
-        if st_sel is not None:
-            s = s & st_sel[:, :, None]
+            pats = self.turbine_model_patterns
+
+        pars = []
+        for m in models:
+            codes = self.turbine_model_sels[:, self.turbine_model_names.index(m.name)]
+
+            # index based selection, avoiding the full mask:
+            if isinstance(st_sel, tuple):
+                codes = codes[st_sel[1]]
+                msel = codes == -1
+                if pats is not None:
+                    dep = codes >= 0
+                    msel[dep] = pats[st_sel[0][dep], codes[dep]]
+                if np.all(msel):
+                    pars.append({"st_sel": st_sel})
+                else:
+                    pars.append({"st_sel": (st_sel[0][msel], st_sel[1][msel])})
+
+            # expand the state patterns for this chunk:
+            else:
+                n_states = mdata.n_states if from_data else algo.n_states
+                msel = np.zeros((n_states, len(codes)), dtype=bool)
+                msel[:, codes == -1] = True
+                if pats is not None:
+                    dep = np.where(codes >= 0)[0]
+                    msel[:, dep] = pats[:, codes[dep]]
+                if st_sel is not None:
+                    msel &= st_sel
+                pars.append({"st_sel": msel})
 
-        pars = [
-            {"st_sel": s[:, :, self.turbine_model_names.index(m.name)]} for m in models
-        ]
         for mi, m in enumerate(models):
             if m.name in self.pars:
                 pars[mi].update(self.pars[m.name][ptype])
@@ -288,11 +334,11 @@ class FarmController(FarmDataModel):
 
         """
         idata = super().load_data(algo, verbosity)
-        idata["coords"][FC.TMODELS] = self.turbine_model_names
-        idata["data_vars"][FC.TMODEL_SELS] = (
-            (FC.STATE, FC.TURBINE, FC.TMODELS),
-            self.turbine_model_sels,
-        )
+        if self.turbine_model_patterns.shape[1]:
+            idata["data_vars"][FC.TMODEL_SELS] = (
+                (FC.STATE, FC.TMODEL_PATTERNS),
+                self.turbine_model_patterns,
+            )
         return idata
 
     def output_farm_vars(self, algo):
@@ -335,9 +381,11 @@ class FarmController(FarmDataModel):
         pre_rotor: bool
             Flag for running pre-rotor or post-rotor
             models
-        st_sel: numpy.ndarray of bool, optional
-            Selection of states and turbines, shape:
-            (n_states, n_turbines). None for all.
+        st_sel: numpy.ndarray of bool or tuple, optional
+            Selection of states and turbines, either a
+            boolean mask of shape (n_states, n_turbines),
+            or a tuple of state and turbine index arrays.
+            None for all.
 
         Returns
         -------
@@ -348,9 +396,7 @@ class FarmController(FarmDataModel):
         """
         s = self.pre_rotor_models if pre_rotor else self.post_rotor_models
         pars = self.__get_pars(algo, s.models, "calc", mdata, st_sel, from_data=True)
-        res = s.calculate(algo, mdata, fdata, parameters=pars)
-        self.turbine_model_sels = mdata[FC.TMODEL_SELS]
-        return res
+        return s.calculate(algo, mdata, fdata, parameters=pars)
 
     def finalize(self, algo, verbosity=0):
         """
@@ -367,3 +413,4 @@ class FarmController(FarmDataModel):
         super().finalize(algo, verbosity)
         self.turbine_model_names = None
         self.turbine_model_sels = None
+        self.turbine_model_patterns = None
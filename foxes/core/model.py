@@ -14,12 +14,23 @@ class Model(ABC):
     ----------
     name: str
         The model name
+    broadcast_data: bool
+        Class-wide flag for returning read-only broadcast
+        views instead of upcast copies from get_data, and
+        for state-invariant rotor points
+    check_nan: bool
+        Class-wide flag for the NaN validation in get_data,
+        switch off for skipping it in production runs
 
     :group: core
 
     """
 
     _ids = {}
+    _allocs = {"arrays": 0, "bytes": 0}
+
+    broadcast_data = False
+    check_nan = True
 
     def __init__(self):
         """
@@ -180,6 +191,34 @@ class Model(ABC):
             self._store = {}
             self.__initialized = False
 
+    @classmethod
+    def get_data_allocs(cls, reset=False):
+        """
+        Returns the counters of the arrays that were
+        allocated by get_data.
+
+        Parameters
+        ----------
+        reset: bool
+            Reset the counters to zero
+
+        Returns
+        -------
+        allocs: dict
+            The counters, keys: arrays, bytes
+
+        """
+        out = dict(Model._allocs)
+        if reset:
+            Model._allocs.update({k: 0 for k in out})
+        return out
+
+    @staticmethod
+    def _count_alloc(a):
+        """Helper function for allocation counting"""
+        Model._allocs["arrays"] += 1
+        Model._allocs["bytes"] += a.nbytes
+
     def get_data(
         self,
         variable,
@@ -193,6 +232,7 @@ class Model(ABC):
         accept_none=False,
         accept_nan=True,
         algo=None,
+        broadcast=None,
     ):
         """
         Getter for a data entry in the model object
@@ -231,8 +271,13 @@ class Model(ABC):
             Do not throw an error if data entry is np.nan
         algo: foxes.core.Algorithm, optional
             The algorithm, needed for data from previous iteration
+        broadcast: bool, optional
+            Return read-only broadcast views instead of upcast
+            or translated copies. Default: broadcast_data
 
         """
+        if broadcast is None:
+            broadcast = self.broadcast_data
 
         def _geta(a):
             sources = [s for s in [mdata, fdata, pdata, algo, self] if s is not None]
@@ -272,15 +317,19 @@ class Model(ABC):
 
                 if a is not None and upcast:
                     if target == FC.STATE_TURBINE:
-                        out = np.full((n_states, n_turbines), np.nan, dtype=FC.DTYPE)
-                        out[:] = a
+                        shp = (n_states, n_turbines)
                     elif target == FC.STATE_POINT:
-                        out = np.full((n_states, n_points), np.nan, dtype=FC.DTYPE)
-                        out[:] = a
+                        shp = (n_states, n_points)
                     else:
                         raise KeyError(
                             f"Model '{self.name}': Wrong parameter 'target = {target}' for 'upcast = True' in get_data. Choose: FC.STATE_TURBINE, FC.STATE_POINT"
                         )
+                    if broadcast:
+                        out = np.broadcast_to(np.asarray(a, dtype=FC.DTYPE), shp)
+                    else:
+                        out = np.full(shp, np.nan, dtype=FC.DTYPE)
+                        out[:] = a
+                        self._count_alloc(out)
 
                 else:
                     out = a
@@ -311,11 +360,15 @@ class Model(ABC):
                 elif target == FC.STATE_POINT and states_source_turbine is not None:
                     # from fdata, uniform for points:
                     st_sel = (np.arange(n_states), states_source_turbine)
-                    out = np.zeros((n_states, n_points), dtype=FC.DTYPE)
-                    out[:] = fdata[variable][st_sel][:, None]
+                    out = fdata[variable][st_sel][:, None]
+                    out = np.broadcast_to(out, (n_states, n_points))
 
                     # from previous iteration, if requested:
-                    if pdata is not None and FC.STATES_SEL in pdata:
+                    prev = pdata is not None and FC.STATES_SEL in pdata
+                    if not broadcast or prev:
+                        out = out.astype(FC.DTYPE)
+                        self._count_alloc(out)
+                    if prev:
                         if not np.all(
                             states_source_turbine == pdata[FC.STATE_SOURCE_TURBINE]
                         ):
@@ -378,9 +431,11 @@ class Model(ABC):
             )
 
         # check for nan:
-        elif not accept_nan:
+        # the first value decides in most cases, avoiding a full scan:
+        elif not accept_nan and self.check_nan:
             try:
-                if np.all(np.isnan(np.atleast_1d(out))):
+                a = np.atleast_1d(out)
+                if (a.size == 0 or np.isnan(a.flat[0])) and np.all(np.isnan(a)):
                     raise ValueError(
                         f"Model '{self.name}': Requested variable '{variable}' contains NaN values."
                     )
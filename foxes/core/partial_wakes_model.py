@@ -1,7 +1,10 @@
 from abc import abstractmethod
+import numpy as np
 
 from foxes.utils import all_subclasses
+import foxes.constants as FC
 
+from .data import Data
 from .model import Model
 
 
@@ -103,6 +106,7 @@ class PartialWakesModel(Model):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -124,10 +128,129 @@ class PartialWakesModel(Model):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
         pass
 
+    def select_targets(self, fdata, pdata, wake_deltas, targets):
+        """
+        Selects the evaluation points and the wake
+        deltas of the given target turbines.
+
+        Parameters
+        ----------
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data
+        wake_deltas: dict
+            The wake deltas. Key: Variable name str,
+            values: numpy.ndarray with shape (n_states, n_points)
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines, shape: (n_states, n_targets).
+            None means all turbines
+
+        Returns
+        -------
+        tpdata: foxes.core.Data
+            The evaluation point data of the targets
+        twdeltas: dict
+            The wake deltas of the targets. Key: Variable
+            name str, values: numpy.ndarray with shape
+            (n_states, n_tpoints)
+        pinds: numpy.ndarray of int
+            The point indices of the targets, shape:
+            (n_states, n_tpoints), or None
+
+        """
+        if targets is None:
+            return pdata, wake_deltas, None
+
+        n_states, n_targets = targets.shape
+        n_tpoints = pdata.n_points // fdata.n_turbines
+        pinds = targets[:, :, None] * n_tpoints + np.arange(n_tpoints)[None, None, :]
+        pinds = pinds.reshape(n_states, n_targets * n_tpoints)
+        tpdata, twdeltas = self.select_points(pdata, wake_deltas, pinds)
+
+        return tpdata, twdeltas, pinds
+
+    @staticmethod
+    def select_points(pdata, wake_deltas, pinds):
+        """
+        Selects the evaluation points and the wake
+        deltas of the given point indices.
+
+        Parameters
+        ----------
+        pdata: foxes.core.Data
+            The evaluation point data
+        wake_deltas: dict
+            The wake deltas. Key: Variable name str,
+            values: numpy.ndarray with shape (n_states, n_points, ...)
+        pinds: numpy.ndarray of int
+            For each state, the indices of the selected
+            points, shape: (n_states, n_spoints)
+
+        Returns
+        -------
+        spdata: foxes.core.Data
+            The data of the selected points
+        swdeltas: dict
+            The wake deltas of the selected points. Key:
+            Variable name str, values: numpy.ndarray with
+            shape (n_states, n_spoints, ...)
+
+        """
+
+        def _gather(a):
+            i = pinds.reshape(pinds.shape + (1,) * (len(a.shape) - 2))
+            return np.take_along_axis(a, i, axis=1)
+
+        data = {}
+        dims = {}
+        for v, d in pdata.items():
+            dims[v] = pdata.dims.get(v, None)
+            if dims[v] is not None and tuple(dims[v][:2]) == (FC.STATE, FC.POINT):
+                data[v] = _gather(d)
+            else:
+                data[v] = d
+        spdata = Data(data, dims, pdata.loop_dims, name=pdata.name)
+
+        swdeltas = {v: _gather(d) for v, d in wake_deltas.items()}
+
+        return spdata, swdeltas
+
+    @staticmethod
+    def update_targets(wake_deltas, twdeltas, pinds):
+        """
+        Writes target wake deltas back into the
+        full wake deltas.
+
+        Parameters
+        ----------
+        wake_deltas: dict
+            The wake deltas, modified in-place. Key: Variable
+            name str, values: numpy.ndarray with shape
+            (n_states, n_points)
+        twdeltas: dict
+            The wake deltas of the targets. Key: Variable
+            name str, values: numpy.ndarray with shape
+            (n_states, n_tpoints)
+        pinds: numpy.ndarray of int
+            The point indices of the targets, shape:
+            (n_states, n_tpoints), or None
+
+        """
+        if pinds is not None:
+            for v, d in twdeltas.items():
+                i = pinds.reshape(pinds.shape + (1,) * (len(d.shape) - 2))
+                np.put_along_axis(wake_deltas[v], i, d, axis=1)
+
     @abstractmethod
     def evaluate_results(
         self,
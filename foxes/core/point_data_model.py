@@ -84,6 +84,7 @@ class PointDataModel(DataCalcModel):
             out_vars=out_vars,
             loop_dims=[FC.STATE, FC.POINT],
             out_core_vars=[FC.VARS],
+            dtype=algo.dtype,
             **calc_pars,
         )
 
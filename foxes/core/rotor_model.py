@@ -114,6 +114,12 @@ class RotorModel(FarmDataModel):
         """
         Calculates rotor points from design points.
 
+        The rotor points are cached per chunk, keyed on the
+        turbine positions, yaw angles and rotor diameters.
+        If these do not vary with state, the points are
+        calculated once per turbine, and kept as a broadcast
+        view if broadcast_data is set.
+
         Parameters
         ----------
         algo: foxes.core.Algorithm
@@ -126,29 +132,60 @@ class RotorModel(FarmDataModel):
         Returns
         -------
         points: numpy.ndarray
-            The rotor points, shape:
+            The rotor points, read-only, shape:
             (n_states, n_turbines, n_rpoints, 3)
 
         """
-
         n_states = mdata.n_states
-        n_points = self.n_rotor_points()
-        n_turbines = algo.n_turbines
-        dpoints = self.design_points()
+        txyh = fdata[FV.TXYH]
+        yaw = fdata[FV.YAW]
         D = fdata[FV.D]
 
-        rax = np.zeros((n_states, n_turbines, 3, 3), dtype=FC.DTYPE)
-        n = rax[:, :, 0, 0:2]
-        m = rax[:, :, 1, 0:2]
-        n[:] = wd2uv(fdata[FV.YAW], axis=-1)
-        m[:] = np.stack([-n[:, :, 1], n[:, :, 0]], axis=-1)
+        # check the geometry cache of this chunk:
+        i0 = mdata.states_i0(counter=True, algo=algo)
+        ckey = self.var("rotor_geometry")
+        if i0 in self._store and ckey in self._store[i0]:
+            ctxyh, cyaw, cD, points = self._store[i0][ckey]
+            if (
+                np.array_equal(ctxyh, txyh)
+                and np.array_equal(cyaw, yaw)
+                and np.array_equal(cD, D)
+            ):
+                return points
+
+        # state-invariant geometry is calculated once per turbine:
+        invariant = (
+            np.all(txyh == txyh[:1]) and np.all(yaw == yaw[:1]) and np.all(D == D[:1])
+        )
+        s = np.s_[:1] if invariant else np.s_[:]
+
+        n = wd2uv(yaw[s], axis=-1)
+        rax = np.zeros(n.shape[:2] + (3, 3), dtype=FC.DTYPE)
+        rax[:, :, 0, 0:2] = n
+        rax[:, :, 1, 0:2] = np.stack([-n[:, :, 1], n[:, :, 0]], axis=-1)
         rax[:, :, 2, 2] = 1
 
-        points = np.zeros((n_states, n_turbines, n_points, 3), dtype=FC.DTYPE)
-        points[:] = fdata[FV.TXYH][:, :, None, :]
-        points[:] += (
-            0.5 * D[:, :, None, None] * np.einsum("stad,pa->stpd", rax, dpoints)
+        points = txyh[s][:, :, None, :] + 0.5 * D[s][:, :, None, None] * np.einsum(
+            "stad,pa->stpd", rax, self.design_points()
         )
+        points = points.astype(algo.dtype, copy=False)
+        if invariant:
+            points = np.broadcast_to(points, (n_states,) + points.shape[1:])
+            if not self.broadcast_data:
+                points = points.copy()
+        points.flags.writeable = False
+
+        # state subsets must not replace the cache of the parent chunk:
+        if i0 is not None and mdata.parent_i0 is None:
+            if i0 not in self._store:
+                self._store[i0] = Data(
+                    data={},
+                    dims={},
+                    loop_dims=mdata.loop_dims,
+                    name=f"{self.name}_{i0}",
+                )
+            self._store[i0][ckey] = (txyh.copy(), yaw.copy(), D.copy(), points)
+            self._store[i0].dims[ckey] = None
 
         return points
 
@@ -322,6 +359,10 @@ class RotorModel(FarmDataModel):
         """
         Calculate ambient rotor effective results.
 
+        In delta mode, the stored ambient rotor point
+        results of the previous calculation are reused
+        for turbines with unchanged inputs and rotor points.
+
         Parameters
         ----------
         algo: foxes.core.Algorithm
@@ -354,8 +395,29 @@ class RotorModel(FarmDataModel):
 
         """
 
+        # in delta mode, the previous ambient results may be reused:
+        prev = None
+        if (
+            store_amb_res
+            and states_turbine is None
+            and getattr(algo, "delta_turbines", None) is not None
+        ):
+            i0 = mdata.states_i0(counter=True, algo=algo)
+            if (
+                i0 in self._store
+                and FC.RPOINTS in self._store[i0]
+                and FC.AMB_RPOINT_RESULTS in self._store[i0]
+            ):
+                prev = (
+                    self._store[i0][FC.RPOINTS],
+                    self._store[i0][FC.AMB_RPOINT_RESULTS],
+                    algo.delta_turbines[i0 : i0 + mdata.n_states],
+                )
+
+        if rpoints is None:
+            rpoints = mdata.get(FC.RPOINTS, None)
         if rpoints is None:
-            rpoints = mdata.get(FC.RPOINTS, self.get_rotor_points(algo, mdata, fdata))
+            rpoints = self.get_rotor_points(algo, mdata, fdata)
         if store_rpoints:
             mdata[FC.RPOINTS] = rpoints
             mdata.dims[FC.RPOINTS] = (FC.STATE, FC.TURBINE, FC.RPOINT, FC.XYH)
@@ -366,7 +428,6 @@ class RotorModel(FarmDataModel):
             stsel = (np.arange(n_states), states_turbine)
             rpoints = rpoints[stsel][:, None]
         n_states, n_turbines, n_rpoints, __ = rpoints.shape
-        n_points = n_turbines * n_rpoints
 
         if weights is None:
             weights = mdata.get(FC.RWEIGHTS, self.rotor_point_weights())
@@ -376,23 +437,53 @@ class RotorModel(FarmDataModel):
             self.data_to_store(FC.RWEIGHTS, algo, mdata)
 
         svars = algo.states.output_point_vars(algo)
-        points = rpoints.reshape(n_states, n_points, 3)
-        pdata = {FC.POINTS: points}
-        pdims = {FC.POINTS: (FC.STATE, FC.POINT, FC.XYH)}
-        pdata.update(
-            {v: np.full((n_states, n_points), np.nan, dtype=FC.DTYPE) for v in svars}
-        )
-        pdims.update({v: (FC.STATE, FC.POINT) for v in svars})
-        pdata = Data(pdata, pdims, loop_dims=[FC.STATE, FC.POINT])
-        del pdims, points
 
-        sres = algo.states.calculate(algo, mdata, fdata, pdata)
-        pdata.update(sres)
-        del sres
+        # select turbines with changed inputs or rotor points:
+        tsel = np.s_[:]
+        if prev is not None:
+            prpoints, pres, changed = prev
+            if prpoints.shape == rpoints.shape and all(v in pres for v in svars):
+                tsel = np.any(changed, axis=0) | np.any(
+                    prpoints != rpoints, axis=(0, 2, 3)
+                )
+            else:
+                prev = None
 
         rpoint_results = {}
-        for v in svars:
-            rpoint_results[v] = pdata[v].reshape(n_states, n_turbines, n_rpoints)
+        if prev is None or np.any(tsel):
+            hrpoints = rpoints[:, tsel]
+            n_points = hrpoints.shape[1] * n_rpoints
+            points = hrpoints.reshape(n_states, n_points, 3)
+            pdata = {FC.POINTS: points}
+            pdims = {FC.POINTS: (FC.STATE, FC.POINT, FC.XYH)}
+            pdata.update(
+                {
+                    v: np.full((n_states, n_points), np.nan, dtype=algo.dtype)
+                    for v in svars
+                }
+            )
+            pdims.update({v: (FC.STATE, FC.POINT) for v in svars})
+            pdata = Data(pdata, pdims, loop_dims=[FC.STATE, FC.POINT])
+            del pdims, points
+
+            sres = algo.states.calculate(algo, mdata, fdata, pdata)
+            pdata.update(sres)
+            del sres
+
+            for v in svars:
+                rpoint_results[v] = (
+                    pdata[v]
+                    .astype(algo.dtype, copy=False)
+                    .reshape(n_states, hrpoints.shape[1], n_rpoints)
+                )
+            del hrpoints, pdata
+
+        if prev is not None:
+            for v in svars:
+                res = pres[v].copy()
+                if v in rpoint_results:
+                    res[:, tsel] = rpoint_results[v]
+                rpoint_results[v] = res
 
         if store_amb_res:
             mdata[FC.AMB_RPOINT_RESULTS] = rpoint_results
@@ -1,3 +1,4 @@
+import numpy as np
 from abc import abstractmethod
 
 from foxes.utils import all_subclasses
@@ -12,6 +13,12 @@ class TurbineModel(FarmDataModel):
     Turbine models are FarmDataModels that run
     on a selection of turbines.
 
+    The state-turbine selection is either a boolean
+    mask of shape (n_states, n_turbines), or a tuple
+    (sinds, tinds) of state and turbine index arrays,
+    each of shape (n_sel,). Both types can directly
+    be used for indexing farm data arrays.
+
     :group: core
 
     """
@@ -32,9 +39,10 @@ class TurbineModel(FarmDataModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -45,6 +53,65 @@ class TurbineModel(FarmDataModel):
         """
         pass
 
+    @staticmethod
+    def st_sel_mask(st_sel, n_states, n_turbines):
+        """
+        Converts a state-turbine selection into
+        a boolean mask.
+
+        Parameters
+        ----------
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection
+        n_states: int
+            The number of states
+        n_turbines: int
+            The number of turbines
+
+        Returns
+        -------
+        mask: numpy.ndarray of bool
+            The state-turbine mask, shape: (n_states, n_turbines)
+
+        """
+        if isinstance(st_sel, tuple):
+            mask = np.zeros((n_states, n_turbines), dtype=bool)
+            mask[st_sel] = True
+            return mask
+        return st_sel
+
+    @staticmethod
+    def st_sel_restrict(st_sel, sel):
+        """
+        Restricts a state-turbine selection.
+
+        Parameters
+        ----------
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection
+        sel: numpy.ndarray of bool
+            The restriction, either for the selected
+            entries, shape: (n_sel,), or for all states
+            and turbines, shape: (n_states, n_turbines)
+
+        Returns
+        -------
+        st_sel: numpy.ndarray of bool or tuple
+            The restricted selection, of the same
+            type as the input selection
+
+        """
+        if isinstance(st_sel, tuple):
+            if sel.ndim > 1:
+                sel = sel[st_sel]
+            return (st_sel[0][sel], st_sel[1][sel])
+        elif sel.ndim > 1:
+            return st_sel & sel
+        else:
+            out = np.zeros_like(st_sel)
+            out[st_sel] = sel
+            return out
+
     @classmethod
     def new(cls, tmodel_type, *args, **kwargs):
         """
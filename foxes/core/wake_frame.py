@@ -2,7 +2,7 @@ from abc import abstractmethod
 import numpy as np
 from scipy.interpolate import interpn
 
-from foxes.utils import all_subclasses
+from foxes.utils import all_subclasses, wd2uv, uv2wd
 import foxes.constants as FC
 import foxes.variables as FV
 
@@ -78,6 +78,127 @@ class WakeFrame(Model):
         """
         pass
 
+    def get_wake_coos_bounds(
+        self, algo, mdata, fdata, pdata, states_source_turbine, radius
+    ):
+        """
+        Calculate conservative bounds of the wake coordinates
+        of all points within spheres around the evaluation points.
+
+        The default implementation returns None, indicating
+        that no bounds are available.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data, containing the
+            sphere centres
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        radius: numpy.ndarray
+            The sphere radii, shape: (n_states, n_points)
+
+        Returns
+        -------
+        x_max: numpy.ndarray
+            The upper bounds of the wake frame x coordinates,
+            shape: (n_states, n_points)
+        r_min: numpy.ndarray
+            The lower bounds of the radial wake frame distances,
+            shape: (n_states, n_points)
+
+        """
+        return None
+
+    def get_order_coos(self, algo, mdata, fdata, states=None):
+        """
+        Calculates the wake frame x coordinates of all
+        rotor centres, in the wakes of all turbines.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states: numpy.ndarray, optional
+            The indices of the states of interest,
+            or None for all states
+
+        Returns
+        -------
+        coosx: numpy.ndarray
+            The wake frame x coordinates, shape:
+            (n_states, n_turbines_source, n_turbines_target)
+
+        """
+        n_states = fdata.n_states
+        n_turbines = algo.n_turbines
+        pdata = Data.from_points(points=fdata[FV.TXYH])
+
+        coosx = np.zeros((n_states, n_turbines, n_turbines), dtype=FC.DTYPE)
+        for ti in range(n_turbines):
+            coosx[:, ti, :] = self.get_wake_coos(
+                algo, mdata, fdata, pdata, np.full(n_states, ti)
+            )[..., 0]
+
+        return coosx if states is None else coosx[states]
+
+    def calc_order_from_coos(self, algo, mdata, fdata, wd_bin=None):
+        """
+        Calculates the order of turbine evaluation by sorting
+        the wake frame x coordinates of the rotor centres.
+
+        The coordinates in the wake of the last turbine
+        serve as primary sort key, the other turbines
+        break ties in reversed order.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        wd_bin: float, optional
+            The size of ambient wind direction bins in degrees.
+            If given and the turbine positions are the same
+            for all states, the order is calculated for the
+            first state of each bin and shared with the other
+            states of the bin
+
+        Returns
+        -------
+        order: numpy.ndarray
+            The turbine order, shape: (n_states, n_turbines)
+
+        """
+        states = None
+        sinds = None
+        if wd_bin is not None:
+            txyh = fdata[FV.TXYH]
+            if np.all(txyh == txyh[0, None]):
+                wd = uv2wd(np.mean(wd2uv(fdata[FV.AMB_WD]), axis=1))
+                bins = (np.mod(wd + wd_bin / 2, 360) // wd_bin).astype(FC.ITYPE)
+                __, states, sinds = np.unique(
+                    bins, return_index=True, return_inverse=True
+                )
+
+        coosx = self.get_order_coos(algo, mdata, fdata, states)
+        order = np.lexsort(np.moveaxis(coosx, 1, 0), axis=-1).astype(FC.ITYPE)
+
+        return order if sinds is None else order[sinds.reshape(-1)]
+
     def get_wake_modelling_data(
         self,
         algo,
@@ -146,21 +267,29 @@ class WakeFrame(Model):
             f"Wake frame '{self.name}': Centreline points requested but not implemented."
         )
 
-    def calc_centreline_integral(
+    def get_centreline_integral_table(
         self,
         algo,
         mdata,
         fdata,
         states_source_turbine,
         variables,
-        x,
+        x_max,
         dx,
         wake_models=None,
         self_wake=True,
-        **ipars,
+        max_steps=None,
     ):
         """
-        Integrates variables along the centreline.
+        Calculates the cumulative integrals of variables
+        along the centreline.
+
+        The table is stored in the model data and reused
+        by subsequent calls for the same source turbines,
+        if it covers the requested range with the same
+        step size. Only tables that
+        do not depend on the data of other turbines are
+        stored, i.e., with self_wake or ambient variables.
 
         Parameters
         ----------
@@ -175,39 +304,56 @@ class WakeFrame(Model):
             wake causing turbine. Shape: (n_states,)
         variables: list of str
             The variables to be integrated
-        x: numpy.ndarray
-            The wake frame x coordinates of the upper integral bounds,
-            shape: (n_states, n_points)
+        x_max: float
+            The minimal upper bound of the table
         dx: float
             The step size of the integral
         wake_models: list of foxes.core.WakeModels
             The wake models to consider, default: from algo
         self_wake: bool
             Flag for considering only wake from states_source_turbine
-        ipars: dict, optional
-            Additional interpolation parameters
+        max_steps: int, optional
+            The maximal number of steps, the step size is
+            increased for long wakes if exceeded
 
         Returns
         -------
-        results: numpy.ndarray
-            The integration results, shape: (n_states, n_points, n_vars)
+        dx: float
+            The step size of the table
+        table: numpy.ndarray
+            The integrals from zero to the nodes at
+            multiples of dx, shape: (n_states, n_nodes, n_vars)
 
         """
         # prepare:
-        n_states, n_points = x.shape
+        n_states = len(states_source_turbine)
         vrs = [FV.amb2var.get(v, v) for v in variables]
-        n_vars = len(vrs)
+        ambient = all([v in FV.amb2var for v in variables])
+
+        # adapt the resolution for long wakes:
+        n_steps = max(int(np.ceil(x_max / dx)), 1)
+        if max_steps is not None and n_steps > max_steps:
+            n_steps = max_steps
+            dx = x_max / n_steps
+
+        # check for stored table:
+        wmodels = algo.wake_models if wake_models is None else wake_models
+        check = (
+            tuple(variables),
+            dx,
+            ambient or tuple([w.name for w in wmodels]),
+            states_source_turbine.tobytes(),
+        )
+        mkey = self.var("centreline_integrals")
+        store = ambient or self_wake
+        if store and mkey in mdata and check in mdata[mkey]:
+            hdx, table = mdata[mkey][check]
+            if (table.shape[1] - 1) * hdx >= x_max:
+                return hdx, table
 
         # calc evaluation points:
-        xmin = 0.0
-        xmax = np.nanmax(x)
-        n_steps = int((xmax - xmin) / dx)
-        if xmin + n_steps * dx < xmax:
-            n_steps += 1
-        n_ix = n_steps + 1
-        xs = np.arange(xmin, xmin + n_ix * dx, dx)
         xpts = np.zeros((n_states, n_steps), dtype=FC.DTYPE)
-        xpts[:] = xs[None, 1:]
+        xpts[:] = (np.arange(n_steps) + 1)[None, :] * dx
         pts = self.get_centreline_points(
             algo, mdata, fdata, states_source_turbine, xpts
         )
@@ -226,13 +372,6 @@ class WakeFrame(Model):
         pdata.update(res)
         del res, amb2var
 
-        # find out if all vars ambient:
-        ambient = True
-        for v in variables:
-            if v not in FV.amb2var:
-                ambient = False
-                break
-
         # calc wakes:
         if not ambient:
             wcalc = algo.get_model("PointWakesCalculation")(wake_models=wake_models)
@@ -243,10 +382,94 @@ class WakeFrame(Model):
             del wcalc, res
 
         # collect integration results:
-        iresults = np.zeros((n_states, n_ix, n_vars), dtype=FC.DTYPE)
+        table = np.zeros((n_states, n_steps + 1, len(variables)), dtype=FC.DTYPE)
         for vi, v in enumerate(variables):
-            for i in range(n_steps):
-                iresults[:, i + 1, vi] = iresults[:, i, vi] + pdata[v][:, i] * dx
+            table[:, 1:, vi] = np.cumsum(pdata[v] * dx, axis=1)
+
+        if store:
+            if mkey not in mdata:
+                mdata[mkey] = {}
+            mdata[mkey][check] = (dx, table)
+
+        return dx, table
+
+    def calc_centreline_integral(
+        self,
+        algo,
+        mdata,
+        fdata,
+        states_source_turbine,
+        variables,
+        x,
+        dx,
+        wake_models=None,
+        self_wake=True,
+        max_steps=None,
+        **ipars,
+    ):
+        """
+        Integrates variables along the centreline.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        variables: list of str
+            The variables to be integrated
+        x: numpy.ndarray
+            The wake frame x coordinates of the upper integral bounds,
+            shape: (n_states, n_points)
+        dx: float
+            The step size of the integral
+        wake_models: list of foxes.core.WakeModels
+            The wake models to consider, default: from algo
+        self_wake: bool
+            Flag for considering only wake from states_source_turbine
+        max_steps: int, optional
+            The maximal number of steps, the step size is
+            increased for long wakes if exceeded
+        ipars: dict, optional
+            Additional interpolation parameters
+
+        Returns
+        -------
+        results: numpy.ndarray
+            The integration results, shape: (n_states, n_points, n_vars)
+
+        """
+        n_states, n_points = x.shape
+        n_vars = len(variables)
+
+        dx, table = self.get_centreline_integral_table(
+            algo,
+            mdata,
+            fdata,
+            states_source_turbine,
+            variables,
+            np.nanmax(x),
+            dx,
+            wake_models,
+            self_wake,
+            max_steps,
+        )
+        n_nodes = table.shape[1]
+
+        # linear interpolation on the regular grid of nodes:
+        if ipars.get("method", "linear") == "linear":
+            q = x / dx
+            i = np.clip(np.nan_to_num(q), 0, n_nodes - 2).astype(FC.ITYPE)
+            w = (q - i)[:, :, None]
+            s = np.arange(n_states)[:, None]
+            results = (1 - w) * table[s, i] + w * table[s, i + 1]
+            results[(q < 0) | (q > n_nodes - 1)] = 0.0
+            return results
 
         # interpolate to x of interest:
         qts = np.zeros((n_states, n_points, 2), dtype=FC.DTYPE)
@@ -254,8 +477,8 @@ class WakeFrame(Model):
         qts[:, :, 1] = x
         qts = qts.reshape(n_states * n_points, 2)
         results = interpn(
-            (np.arange(n_states), xs),
-            iresults,
+            (np.arange(n_states), np.arange(n_nodes) * dx),
+            table,
             qts,
             bounds_error=False,
             fill_value=0.0,
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+import numpy as np
 
 from foxes.utils import all_subclasses
 
@@ -81,6 +82,57 @@ class WakeModel(Model):
         """
         pass
 
+    def calc_interaction_spsel(
+        self,
+        algo,
+        mdata,
+        fdata,
+        pdata,
+        states_source_turbine,
+        x,
+        r,
+        tol,
+    ):
+        """
+        Selects the evaluation points for which the
+        wake contribution may be non-negligible.
+
+        This is used for pruning wake interactions. The
+        default implementation selects all points.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The wake frame x coordinates of the evaluation
+            points, shape: (n_states, n_points)
+        r: numpy.ndarray
+            The smallest radial wake frame distances of the
+            target discs around the evaluation points,
+            shape: (n_states, n_points)
+        tol: float
+            The error tolerance for the relative
+            wake deltas
+
+        Returns
+        -------
+        sp_sel: numpy.ndarray of bool
+            The state-point selection of possibly
+            affected points, shape: (n_states, n_points)
+
+        """
+        return np.ones(x.shape, dtype=bool)
+
     def finalize_wake_deltas(
         self,
         algo,
@@ -4,7 +4,7 @@ import xarray as xr
 from scipy.interpolate import interpn
 
 from foxes.core import States
-from foxes.utils import wd2uv, uv2wd
+from foxes.utils import wd2uv, uv2wd, grid_coeffs, grid_interp
 from foxes.data import STATES, StaticData
 import foxes.variables as FV
 import foxes.constants as FC
@@ -49,6 +49,9 @@ class FieldDataNC(States):
         The datetime parsing format string
     interp_nans: bool
         Linearly interpolate nan values
+    max_cache: int
+        The maximal number of state-point pairs for which
+        the interpolation coefficients are cached
     interpn_pars: dict, optional
         Additional parameters for scipy.interpolate.interpn
 
@@ -72,6 +75,7 @@ class FieldDataNC(States):
         sel=None,
         isel=None,
         interp_nans=False,
+        max_cache=5e6,
         verbosity=1,
         **interpn_pars,
     ):
@@ -112,6 +116,9 @@ class FieldDataNC(States):
             Subset selection via xr.Dataset.isel()
         interp_nans: bool
             Linearly interpolate nan values
+        max_cache: int
+            The maximal number of state-point pairs for which
+            the interpolation coefficients are cached
         verbosity: int
             Verbosity level for pre_load file reading
         interpn_pars: dict, optional
@@ -134,6 +141,7 @@ class FieldDataNC(States):
         self.isel = isel
         self.interpn_pars = interpn_pars
         self.interp_nans = interp_nans
+        self.max_cache = max_cache
 
         self.var2ncvar = {
             v: var2ncvar.get(v, v) for v in output_vars if v not in fixed_vars
@@ -142,6 +150,8 @@ class FieldDataNC(States):
         self._inds = None
         self._N = None
         self._weights = None
+        self._coeffs = {}
+        self._n_coeffs = 0
 
         # pre-load file reading, usually prior to DaskRunner:
         if not isinstance(self.data_source, xr.Dataset):
@@ -272,6 +282,61 @@ class FieldDataNC(States):
 
         return data
 
+    def _to_uv(self, data):
+        """
+        Helper function for translating WD, WS into U, V,
+        returns a copy of the data
+        """
+        data = data.copy()
+        if FV.WD in self.ovars and FV.WS in self.ovars:
+            wd = data[..., self._dkys[FV.WD]]
+            ws = (
+                data[..., self._dkys[FV.WS]]
+                if FV.WS in self._dkys
+                else self.fixed_vars[FV.WS]
+            )
+            wdwsi = [self._dkys[FV.WD], self._dkys[FV.WS]]
+            data[..., wdwsi] = wd2uv(wd, ws, axis=-1)
+        return data
+
+    def _use_grid_interp(self, gvars):
+        """
+        Helper function that checks if linear interpolation
+        with exact states is applicable
+        """
+        pars = self.interpn_pars
+        return (
+            pars.get("method", "linear") == "linear"
+            and not len(set(pars.keys()) - {"method", "bounds_error", "fill_value"})
+            and all(len(a) > 1 and np.all(np.diff(a) > 0) for a in gvars)
+        )
+
+    def _grid_interp(self, algo, mdata, points, gvars, data, corner_fun):
+        """
+        Helper function for linear interpolation with exact states
+        """
+        # reuse coefficients of previously seen points,
+        # e.g. rotor points during iterations:
+        n_states, n_pts = points.shape[:2]
+        key = (mdata.states_i0(counter=True, algo=algo), n_states, n_pts)
+        pts = points[..., ::-1]
+        hit = self._coeffs.get(key, None)
+        if (
+            hit is None
+            or not np.array_equal(hit[0], pts)
+            or any(not np.array_equal(a, b) for a, b in zip(hit[1], gvars))
+        ):
+            bounds_error = self.interpn_pars.get("bounds_error", True)
+            coeffs = grid_coeffs(gvars, pts, bounds_error)
+            if self._n_coeffs + n_states * n_pts <= self.max_cache:
+                self._coeffs[key] = (pts.copy(), gvars, coeffs)
+                self._n_coeffs += n_states * n_pts
+        else:
+            coeffs = hit[2]
+
+        fill_value = self.interpn_pars.get("fill_value", np.nan)
+        return grid_interp(data, *coeffs, fill_value, corner_fun)
+
     def output_point_vars(self, algo):
         """
         The variables which are being modified by the model.
@@ -421,6 +486,22 @@ class FieldDataNC(States):
         """
         return self._weights
 
+    def finalize(self, algo, verbosity=0):
+        """
+        Finalizes the model.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        verbosity: int
+            The verbosity level
+
+        """
+        super().finalize(algo, verbosity)
+        self._coeffs = {}
+        self._n_coeffs = 0
+
     def calculate(self, algo, mdata, fdata, pdata):
         """ "
         The main model calculation.
@@ -456,7 +537,7 @@ class FieldDataNC(States):
             x = mdata[self.X]
             y = mdata[self.Y]
             h = mdata[self.H]
-            data = mdata[self.DATA].copy()
+            data = mdata[self.DATA]
 
         # read data for this chunk:
         else:
@@ -474,25 +555,17 @@ class FieldDataNC(States):
         n_y = len(y)
         n_x = len(x)
 
-        # translate WS, WD into U, V:
-        if FV.WD in self.ovars and FV.WS in self.ovars:
-            wd = data[..., self._dkys[FV.WD]]
-            ws = (
-                data[..., self._dkys[FV.WS]]
-                if FV.WS in self._dkys
-                else self.fixed_vars[FV.WS]
-            )
-            wdwsi = [self._dkys[FV.WD], self._dkys[FV.WS]]
-            data[..., wdwsi] = wd2uv(wd, ws, axis=-1)
-            del ws, wd
-
-        # prepare points:
+        # prepare grid:
         sts = np.arange(n_states)
-        pts = np.append(points, np.zeros((n_states, n_pts, 1), dtype=FC.DTYPE), axis=2)
-        pts[:, :, 3] = sts[:, None]
-        pts = pts.reshape(n_states * n_pts, 4)
-        pts = np.flip(pts, axis=1)
         gvars = (sts, h, y, x)
+        fast = self._use_grid_interp(gvars[1:])
+
+        # translate WS, WD into U, V, for fast interpolation
+        # only at the grid cell corners of the points:
+        if FV.WD in self.ovars and FV.WS in self.ovars:
+            wdwsi = [self._dkys[FV.WD], self._dkys[FV.WS]]
+        if not fast or self.interp_nans:
+            data = self._to_uv(data)
 
         # interpolate nan values:
         if self.interp_nans and np.any(np.isnan(data)):
@@ -516,9 +589,19 @@ class FieldDataNC(States):
 
         # interpolate:
         try:
-            data = interpn(gvars, data, pts, **self.interpn_pars).reshape(
-                n_states, n_pts, self._n_dvars
-            )
+            if fast:
+                cfun = None if self.interp_nans else self._to_uv
+                data = self._grid_interp(algo, mdata, points, gvars[1:], data, cfun)
+            else:
+                pts = np.append(
+                    points, np.zeros((n_states, n_pts, 1), dtype=FC.DTYPE), axis=2
+                )
+                pts[:, :, 3] = sts[:, None]
+                pts = np.flip(pts.reshape(n_states * n_pts, 4), axis=1)
+                data = interpn(gvars, data, pts, **self.interpn_pars).reshape(
+                    n_states, n_pts, self._n_dvars
+                )
+                del pts
         except ValueError as e:
             print(f"\n\nStates '{self.name}': Interpolation error")
             print("INPUT VARS: (state, heights, y, x)")
@@ -526,10 +609,12 @@ class FieldDataNC(States):
                 "DATA BOUNDS:", [np.min(d) for d in gvars], [np.max(d) for d in gvars]
             )
             print(
-                "EVAL BOUNDS:", [np.min(p) for p in pts.T], [np.max(p) for p in pts.T]
+                "EVAL BOUNDS:",
+                [np.min(sts)] + [np.min(points[..., i]) for i in [2, 1, 0]],
+                [np.max(sts)] + [np.max(points[..., i]) for i in [2, 1, 0]],
             )
             raise e
-        del pts, x, y, h, gvars
+        del x, y, h, gvars
 
         # interpolate nan values:
         if self.interp_nans and np.any(np.isnan(data)):
@@ -8,7 +8,7 @@ from foxes.utils import PandasFileHelper
 from foxes.data import STATES
 import foxes.variables as FV
 import foxes.constants as FC
-from foxes.utils import wd2uv, uv2wd
+from foxes.utils import wd2uv, uv2wd, vertical_coeffs
 
 
 class MultiHeightStates(States):
@@ -41,6 +41,14 @@ class MultiHeightStates(States):
         States subset selection
     states_loc: list
         State index selection via pandas loc function
+    extrapolation: str
+        The extrapolation mode for heights outside of
+        the data: None, const, linear, log
+    z0: float
+        The roughness length of the log-law extrapolation
+    ipars: dict
+        Parameters for scipy.interpolate.interp1d, if given
+        the interpolation is based on the latter
     RDICT: dict
         Default pandas file reading parameters
 
@@ -60,6 +68,8 @@ class MultiHeightStates(States):
         pd_read_pars={},
         states_sel=None,
         states_loc=None,
+        extrapolation=None,
+        z0=0.1,
         ipars={},
     ):
         """
@@ -84,8 +94,18 @@ class MultiHeightStates(States):
             States subset selection
         states_loc: list, optional
             State index selection via pandas loc function
+        extrapolation: str, optional
+            The extrapolation mode for heights outside of
+            the data: None raises an error, 'const' takes the
+            nearest value, 'linear' extrapolates linearly,
+            'log' applies the logarithmic wind profile to
+            the wind speed and takes the nearest values of
+            other variables
+        z0: float
+            The roughness length of the log-law extrapolation
         ipars: dict, optional
-            Parameters for scipy.interpolate.interp1d
+            Parameters for scipy.interpolate.interp1d, if given
+            the interpolation is based on the latter
 
         """
         super().__init__()
@@ -96,6 +116,8 @@ class MultiHeightStates(States):
         self.rpars = pd_read_pars
         self.var2col = var2col
         self.fixed_vars = fixed_vars
+        self.extrapolation = extrapolation
+        self.z0 = z0
         self.ipars = ipars
         self.states_sel = states_sel
         self.states_loc = states_loc
@@ -191,6 +213,7 @@ class MultiHeightStates(States):
             data = PandasFileHelper().read_file(self.data_source, **rpars)
             isorg = False
         else:
+            data = self.data_source
             isorg = True
 
         if self.states_sel is not None:
@@ -338,13 +361,38 @@ class MultiHeightStates(States):
         n_h = len(h)
         vrs = list(mdata[self.VARS])
 
-        coeffs = np.zeros((n_h, n_h), dtype=FC.DTYPE)
-        np.fill_diagonal(coeffs, 1.0)
-        ipars = dict(assume_sorted=True, bounds_error=True)
-        ipars.update(self.ipars)
-        intp = interp1d(h, coeffs, axis=0, **ipars)
-        ires = intp(z)
-        del coeffs, intp
+        # legacy interpolation by interp1d, with dense weights:
+        if len(self.ipars):
+            coeffs = np.zeros((n_h, n_h), dtype=FC.DTYPE)
+            np.fill_diagonal(coeffs, 1.0)
+            ipars = dict(assume_sorted=True, bounds_error=True)
+            ipars.update(self.ipars)
+            intp = interp1d(h, coeffs, axis=0, **ipars)
+            ires = intp(z)
+            del coeffs, intp
+
+            def _interp(data, log=False):
+                return np.einsum("sh...,sph->sp...", data, ires)
+
+        # two bracketing heights per point:
+        else:
+            if self.extrapolation == "log":
+                hcoeffs = {
+                    False: vertical_coeffs(h, z, "const"),
+                    True: vertical_coeffs(h, z, "log", self.z0),
+                }
+            else:
+                hcoeffs = {False: vertical_coeffs(h, z, self.extrapolation)}
+                hcoeffs[True] = hcoeffs[False]
+            sts = np.arange(mdata.n_states)[:, None]
+
+            def _interp(data, log=False):
+                inds, weights = hcoeffs[log]
+                w = weights.reshape(weights.shape + (1,) * (len(data.shape) - 2))
+                return (
+                    w[:, :, 0] * data[sts, inds[..., 0]]
+                    + w[:, :, 1] * data[sts, inds[..., 1]]
+                )
 
         has_wd = FV.WD in vrs
         if has_wd:
@@ -364,10 +412,14 @@ class MultiHeightStates(States):
                 raise KeyError(
                     f"States '{self.name}': Found variable '{FV.WD}', but missing variable '{FV.WS}'"
                 )
-            uv = np.einsum("shd,sph->spd", uvh, ires)
+            uv = _interp(uvh, log=True)
             del uvh
 
-        ires = np.einsum("svh,sph->svp", mdata[self.DATA], ires)
+        data = np.moveaxis(mdata[self.DATA], 2, 1)
+        ires = {
+            v: _interp(data[:, :, vi], log=(v == FV.WS)) for vi, v in enumerate(vrs)
+        }
+        del data
 
         results = {}
         for v in self.ovars:
@@ -381,7 +433,7 @@ class MultiHeightStates(States):
             elif v in self._solo.keys():
                 results[v][:] = mdata[self.var(v)][:, None]
             else:
-                results[v] = ires[:, vrs.index(v)]
+                results[v] = ires[v]
 
         return results
 
@@ -151,7 +151,7 @@ class StatesTable(States):
                 )
             self._tvars.update(self._profiles[v].input_vars())
         self._tvars -= set(self.fixed_vars.keys())
-        self._tvars = list(self._tvars)
+        self._tvars = sorted(list(self._tvars))
         super().initialize(algo, verbosity)
 
     def sub_models(self):
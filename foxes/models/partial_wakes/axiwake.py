@@ -125,6 +125,7 @@ class PartialAxiwake(PartialWakesModel):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -146,16 +147,26 @@ class PartialAxiwake(PartialWakesModel):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
         # prepare:
         n_states = mdata.n_states
-        n_turbines = algo.n_turbines
-        D = fdata[FV.D]
+        tpdata, twdeltas, pinds = self.select_targets(
+            fdata, pdata, wake_deltas, targets
+        )
+        n_turbines = tpdata.n_points
+        if targets is None:
+            D = fdata[FV.D]
+        else:
+            D = np.take_along_axis(fdata[FV.D], targets, axis=1)
 
         # calc coordinates to rotor centres:
         wcoos = self.wake_frame.get_wake_coos(
-            algo, mdata, fdata, pdata, states_source_turbine
+            algo, mdata, fdata, tpdata, states_source_turbine
         )
 
         # prepare x and r coordinates:
@@ -228,7 +239,7 @@ class PartialAxiwake(PartialWakesModel):
         # evaluate wake models:
         for w in self.wake_models:
             wdeltas, sp_sel = w.calc_wakes_spsel_x_r(
-                algo, mdata, fdata, pdata, states_source_turbine, x, r
+                algo, mdata, fdata, tpdata, states_source_turbine, x, r
             )
 
             for v, wdel in wdeltas.items():
@@ -241,18 +252,20 @@ class PartialAxiwake(PartialWakesModel):
                         f"Model '{self.name}': Missing wake superposition entry for variable '{v}' in wake model '{w.name}', found {sorted(list(w.superp.keys()))}"
                     )
 
-                wake_deltas[v] = superp.calc_wakes_plus_wake(
+                twdeltas[v] = superp.calc_wakes_plus_wake(
                     algo,
                     mdata,
                     fdata,
-                    pdata,
+                    tpdata,
                     states_source_turbine,
                     sp_sel,
                     v,
-                    wake_deltas[v],
+                    twdeltas[v],
                     d,
                 )
 
+        self.update_targets(wake_deltas, twdeltas, pinds)
+
     def evaluate_results(
         self,
         algo,
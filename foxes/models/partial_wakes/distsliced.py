@@ -145,6 +145,7 @@ class PartialDistSlicedWake(PartialWakesModel):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -166,22 +167,36 @@ class PartialDistSlicedWake(PartialWakesModel):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
 
+        # select targets:
+        tpdata, twdeltas, pinds = self.select_targets(
+            fdata, pdata, wake_deltas, targets
+        )
+
         # calc x-coordinates of rotor centres:
-        hpdata = Data.from_points(points=fdata[FV.TXYH])
+        if targets is None:
+            txyh = fdata[FV.TXYH]
+        else:
+            txyh = np.take_along_axis(fdata[FV.TXYH], targets[:, :, None], axis=1)
+        hpdata = Data.from_points(points=txyh, data={}, dims={})
         x = self.wake_frame.get_wake_coos(
             algo, mdata, fdata, hpdata, states_source_turbine
         )[:, :, 0]
+        del txyh
 
         # evaluate grid rotor:
         n_states = fdata.n_states
-        n_turbines = fdata.n_turbines
+        n_turbines = hpdata.n_points
         n_rpoints = self.grotor.n_rotor_points()
-        n_points = fdata.n_turbines * n_rpoints
+        n_points = n_turbines * n_rpoints
         wcoos = self.wake_frame.get_wake_coos(
-            algo, mdata, fdata, pdata, states_source_turbine
+            algo, mdata, fdata, tpdata, states_source_turbine
         )
         yz = wcoos.reshape(n_states, n_turbines, n_rpoints, 3)[:, :, :, 1:3]
         del wcoos
@@ -208,18 +223,20 @@ class PartialDistSlicedWake(PartialWakesModel):
                         f"Model '{self.name}': Missing wake superposition entry for variable '{v}' in wake model '{w.name}', found {sorted(list(w.superp.keys()))}"
                     )
 
-                wake_deltas[v] = superp.calc_wakes_plus_wake(
+                twdeltas[v] = superp.calc_wakes_plus_wake(
                     algo,
                     mdata,
                     fdata,
-                    pdata,
+                    tpdata,
                     states_source_turbine,
                     wsps,
                     v,
-                    wake_deltas[v],
+                    twdeltas[v],
                     d,
                 )
 
+        self.update_targets(wake_deltas, twdeltas, pinds)
+
     def evaluate_results(
         self,
         algo,
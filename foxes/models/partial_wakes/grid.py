@@ -46,6 +46,7 @@ class PartialGrid(PartialDistSlicedWake):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -67,16 +68,27 @@ class PartialGrid(PartialDistSlicedWake):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
 
+        # select targets:
+        tpdata, twdeltas, pinds = self.select_targets(
+            fdata, pdata, wake_deltas, targets
+        )
+
         # evaluate grid rotor:
         wcoos = self.wake_frame.get_wake_coos(
-            algo, mdata, fdata, pdata, states_source_turbine
+            algo, mdata, fdata, tpdata, states_source_turbine
         )
 
         # evaluate wake models:
         for w in self.wake_models:
             w.contribute_to_wake_deltas(
-                algo, mdata, fdata, pdata, states_source_turbine, wcoos, wake_deltas
+                algo, mdata, fdata, tpdata, states_source_turbine, wcoos, twdeltas
             )
+
+        self.update_targets(wake_deltas, twdeltas, pinds)
@@ -168,6 +168,7 @@ class Mapped(PartialWakesModel):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -189,11 +190,21 @@ class Mapped(PartialWakesModel):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
         for pwi, pw in enumerate(self._pwakes):
             pw.contribute_to_wake_deltas(
-                algo, mdata, fdata, pdata[pwi], states_source_turbine, wake_deltas[pwi]
+                algo,
+                mdata,
+                fdata,
+                pdata[pwi],
+                states_source_turbine,
+                wake_deltas[pwi],
+                targets,
             )
 
     def evaluate_results(
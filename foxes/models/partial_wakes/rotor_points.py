@@ -89,6 +89,7 @@ class RotorPoints(PartialWakesModel):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -110,17 +111,27 @@ class RotorPoints(PartialWakesModel):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
+        tpdata, twdeltas, pinds = self.select_targets(
+            fdata, pdata, wake_deltas, targets
+        )
+
         wcoos = self.wake_frame.get_wake_coos(
-            algo, mdata, fdata, pdata, states_source_turbine
+            algo, mdata, fdata, tpdata, states_source_turbine
         )
 
         for w in self.wake_models:
             w.contribute_to_wake_deltas(
-                algo, mdata, fdata, pdata, states_source_turbine, wcoos, wake_deltas
+                algo, mdata, fdata, tpdata, states_source_turbine, wcoos, twdeltas
             )
 
+        self.update_targets(wake_deltas, twdeltas, pinds)
+
     def evaluate_results(
         self,
         algo,
@@ -117,6 +117,7 @@ class PartialTopHat(PartialWakesModel):
         pdata,
         states_source_turbine,
         wake_deltas,
+        targets=None,
     ):
         """
         Modifies wake deltas by contributions from the
@@ -138,40 +139,54 @@ class PartialTopHat(PartialWakesModel):
         wake_deltas: Any
             The wake deltas object created by the
             `new_wake_deltas` function
+        targets: numpy.ndarray of int, optional
+            For each state, the indices of the target
+            turbines that should be considered, shape:
+            (n_states, n_targets). None means all turbines
 
         """
         n_states = mdata.n_states
-        n_points = fdata.n_turbines
         stsel = (np.arange(n_states), states_source_turbine)
 
-        if (
-            self.WCOOS_ID not in mdata
-            or mdata[self.WCOOS_ID] != states_source_turbine[0]
-        ):
+        tpdata, twdeltas, pinds = self.select_targets(
+            fdata, pdata, wake_deltas, targets
+        )
+        n_points = tpdata.n_points
+
+        if targets is not None:
             wcoos = self.wake_frame.get_wake_coos(
-                algo, mdata, fdata, pdata, states_source_turbine
+                algo, mdata, fdata, tpdata, states_source_turbine
             )
-            mdata[self.WCOOS_ID] = states_source_turbine[0]
-            mdata[self.WCOOS_X] = wcoos[:, :, 0]
-            mdata[self.WCOOS_R] = np.linalg.norm(wcoos[:, :, 1:3], axis=-1)
-            wcoos[:, :, 1:3] = 0
+            x = wcoos[:, :, 0]
+            R = np.linalg.norm(wcoos[:, :, 1:3], axis=-1)
+            D = np.take_along_axis(fdata[FV.D], targets, axis=1)
+            del wcoos
+
         else:
-            wcoos = np.zeros((n_states, n_points), dtype=FC.DTYPE)
-            wcoos[:, :, 0] = mdata[self.WCOOS_X]
+            if (
+                self.WCOOS_ID not in mdata
+                or mdata[self.WCOOS_ID] != states_source_turbine[0]
+            ):
+                wcoos = self.wake_frame.get_wake_coos(
+                    algo, mdata, fdata, pdata, states_source_turbine
+                )
+                mdata[self.WCOOS_ID] = states_source_turbine[0]
+                mdata[self.WCOOS_X] = wcoos[:, :, 0]
+                mdata[self.WCOOS_R] = np.linalg.norm(wcoos[:, :, 1:3], axis=-1)
+                del wcoos
+
+            x = mdata[self.WCOOS_X]
+            R = mdata[self.WCOOS_R]
+            D = fdata[FV.D]
 
         ct = np.zeros((n_states, n_points), dtype=FC.DTYPE)
         ct[:] = fdata[FV.CT][stsel][:, None]
-        x = mdata[self.WCOOS_X]
 
         sel0 = (ct > 0.0) & (x > 0.0)
         if np.any(sel0):
-            R = mdata[self.WCOOS_R]
-            r = np.zeros_like(R)
-            D = fdata[FV.D]
-
             for w in self.wake_models:
                 wr = w.calc_wake_radius(
-                    algo, mdata, fdata, pdata, states_source_turbine, x, ct
+                    algo, mdata, fdata, tpdata, states_source_turbine, x, ct
                 )
 
                 sel_sp = sel0 & (wr > R - D / 2)
@@ -184,7 +199,7 @@ class PartialTopHat(PartialWakesModel):
                         algo,
                         mdata,
                         fdata,
-                        pdata,
+                        tpdata,
                         states_source_turbine,
                         sel_sp,
                         hx,
@@ -206,18 +221,20 @@ class PartialTopHat(PartialWakesModel):
                                 f"Model '{self.name}': Missing wake superposition entry for variable '{v}' in wake model '{w.name}', found {sorted(list(w.superp.keys()))}"
                             )
 
-                        wake_deltas[v] = superp.calc_wakes_plus_wake(
+                        twdeltas[v] = superp.calc_wakes_plus_wake(
                             algo,
                             mdata,
                             fdata,
-                            pdata,
+                            tpdata,
                             states_source_turbine,
                             sel_sp,
                             v,
-                            wake_deltas[v],
+                            twdeltas[v],
                             weights * d,
                         )
 
+        self.update_targets(wake_deltas, twdeltas, pinds)
+
     def evaluate_results(
         self,
         algo,
@@ -81,7 +81,7 @@ class CentreRotor(RotorModel):
             (n_states, n_turbines, n_rpoints, 3)
 
         """
-        return fdata[FV.TXYH][:, :, None, :]
+        return fdata[FV.TXYH][:, :, None, :].astype(algo.dtype, copy=False)
 
     def eval_rpoint_results(
         self,
@@ -79,9 +79,10 @@ class Calculator(TurbineModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -91,6 +92,7 @@ class Calculator(TurbineModel):
 
         """
         ins = [fdata[v] if v in fdata else mdata[v] for v in self.in_vars]
+        st_sel = self.st_sel_mask(st_sel, fdata.n_states, fdata.n_turbines)
         outs = self.func(*ins, st_sel=st_sel)
 
         return {v: outs[vi] for vi, v in enumerate(self.out_vars)}
@@ -3,7 +3,7 @@ import pandas as pd
 import xarray as xr
 
 from foxes.core import TurbineModel
-from foxes.utils import PandasFileHelper
+from foxes.utils import PandasFileHelper, TableInterpolator
 import foxes.constants as FC
 
 
@@ -55,7 +55,8 @@ class LookupTable(TurbineModel):
         pd_file_read_pars: dict
             Parameters for pandas file reading
         xr_interp_args: dict
-            Parameters for xarray interpolation method
+            Parameters for the interpolation, compatible with
+            the xarray interpolation method: method, kwargs
         kwargs: dict, optional
             Additional parameters, added as default
             values if not in data
@@ -71,6 +72,7 @@ class LookupTable(TurbineModel):
         self._rpars = pd_file_read_pars
         self._xargs = xr_interp_args
         self._data = None
+        self._table = None
 
         for v, d in kwargs.items():
             if v not in input_vars:
@@ -154,6 +156,16 @@ class LookupTable(TurbineModel):
                 print(self._data)
                 print()
 
+        if self._table is None:
+            ipars = dict(bounds_error=False, fill_value=np.nan)
+            ipars.update(self._xargs.get("kwargs", {}))
+            self._table = TableInterpolator(
+                [self._data[v].to_numpy() for v in self.input_vars],
+                np.stack([self._data[v].to_numpy() for v in self.output_vars], axis=-1),
+                method=self._xargs.get("method", "linear"),
+                **ipars,
+            )
+
         return super().load_data(algo, verbosity)
 
     def calculate(self, algo, mdata, fdata, st_sel):
@@ -171,9 +183,10 @@ class LookupTable(TurbineModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -182,21 +195,21 @@ class LookupTable(TurbineModel):
             Values: numpy.ndarray with shape (n_states, n_turbines)
 
         """
-        indata = {
-            v: xr.DataArray(
+        qts = np.stack(
+            [
                 self.get_data(
                     v, FC.STATE_TURBINE, lookup="fs", fdata=fdata, upcast=True
-                )[st_sel],
-                dims=["_z"],
-            )
-            for v in self.input_vars
-        }
+                )[st_sel]
+                for v in self.input_vars
+            ],
+            axis=-1,
+        )
 
-        odata = self._data.interp(**indata, **self._xargs)
+        odata = self._table(qts)
 
         out = {}
-        for v in self.output_vars:
+        for i, v in enumerate(self.output_vars):
             out[v] = fdata[v]
-            out[v][st_sel] = odata[v]
+            out[v][st_sel] = odata[:, i]
 
         return out
@@ -150,9 +150,10 @@ class PowerMask(TurbineModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
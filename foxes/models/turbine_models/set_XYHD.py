@@ -83,9 +83,10 @@ class SetXYHD(TurbineModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -105,6 +106,7 @@ class SetXYHD(TurbineModel):
             if self.set_H:
                 fdata[FV.H] = fdata[FV.TXYH][..., 2]
 
+        st_sel = self.st_sel_mask(st_sel, n_states, n_turbines)
         for ti in range(n_turbines):
             ssel = st_sel[:, ti]
             if np.any(ssel):
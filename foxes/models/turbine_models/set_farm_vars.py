@@ -132,9 +132,10 @@ class SetFarmVars(TurbineModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -145,7 +146,7 @@ class SetFarmVars(TurbineModel):
         """
         n_states = fdata.n_states
         n_turbines = fdata.n_turbines
-        allt = np.all(st_sel)
+        allt = not isinstance(st_sel, tuple) and np.all(st_sel)
 
         for v in self.vars:
             data = mdata[self.var(v)]
@@ -159,7 +160,7 @@ class SetFarmVars(TurbineModel):
                 if v not in fdata:
                     fdata[v] = np.full((n_states, n_turbines), np.nan, dtype=FC.DTYPE)
 
-                tsel = st_sel & hsel
+                tsel = self.st_sel_restrict(st_sel, hsel)
                 fdata[v][tsel] = data[tsel]
 
         return {v: fdata[v] for v in self.vars}
@@ -1,9 +1,8 @@
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interpn
 
 from foxes.core import TurbineModel
-from foxes.utils import PandasFileHelper
+from foxes.utils import PandasFileHelper, TableInterpolator
 import foxes.constants as FC
 
 
@@ -57,7 +56,8 @@ class TableFactors(TurbineModel):
         pd_file_read_pars: dict
             Parameters for pandas file reading
         ipars: dict, optional
-            Parameters for scipy.interpolate.interpn
+            Parameters for foxes.utils.TableInterpolator,
+            compatible with scipy.interpolate.interpn
 
         """
         super().__init__()
@@ -71,6 +71,7 @@ class TableFactors(TurbineModel):
 
         self._cvals = None
         self._data = None
+        self._table = None
 
     def output_farm_vars(self, algo):
         """
@@ -115,6 +116,9 @@ class TableFactors(TurbineModel):
         self._rvals = self._data.index.to_numpy(FC.DTYPE)
         self._cvals = self._data.columns.to_numpy(FC.DTYPE)
         self._data = self._data.to_numpy(FC.DTYPE)
+        self._table = TableInterpolator(
+            (self._rvals, self._cvals), self._data, **self._ipars
+        )
 
     def calculate(self, algo, mdata, fdata, st_sel):
         """ "
@@ -131,9 +135,10 @@ class TableFactors(TurbineModel):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -142,15 +147,12 @@ class TableFactors(TurbineModel):
             Values: numpy.ndarray with shape (n_states, n_turbines)
 
         """
-        n_sel = np.sum(st_sel)
-        qts = np.zeros((n_sel, 2), dtype=FC.DTYPE)
-        qts[:, 0] = fdata[self.row_var][st_sel]
-        qts[:, 1] = fdata[self.col_var][st_sel]
+        qts = np.stack(
+            [fdata[self.row_var][st_sel], fdata[self.col_var][st_sel]], axis=-1
+        )
 
         try:
-            factors = interpn(
-                (self._rvals, self._cvals), self._data, qts, **self._ipars
-            )
+            factors = self._table(qts)
         except ValueError as e:
             print(f"\nDATA       : ({self.row_var}, {self.col_var})")
             print(
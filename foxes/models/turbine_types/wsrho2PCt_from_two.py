@@ -1,9 +1,8 @@
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interpn
 
 from foxes.core import TurbineType
-from foxes.utils import PandasFileHelper
+from foxes.utils import PandasFileHelper, TableInterpolator
 from foxes.data import PCTCURVE, parse_Pct_two_files
 import foxes.variables as FV
 import foxes.constants as FC
@@ -37,9 +36,11 @@ class WsRho2PCtFromTwo(TurbineType):
     rpars_ct: dict, optional
         Parameters for pandas ct file reading
     ipars_P: dict, optional
-        Parameters for scipy.interpolate.interpn()
+        Parameters for foxes.utils.TableInterpolator,
+        compatible with scipy.interpolate.interpn()
     ipars_ct: dict, optional
-        Parameters for scipy.interpolate.interpn()
+        Parameters for foxes.utils.TableInterpolator,
+        compatible with scipy.interpolate.interpn()
 
     :group: models.turbine_types
 
@@ -81,9 +82,11 @@ class WsRho2PCtFromTwo(TurbineType):
         pd_file_read_pars_ct:  dict
             Parameters for pandas ct file reading
         interpn_pars_P: dict, optional
-            Parameters for scipy.interpolate.interpn()
+            Parameters for foxes.utils.TableInterpolator,
+            compatible with scipy.interpolate.interpn()
         interpn_pars_ct: dict, optional
-            Parameters for scipy.interpolate.interpn()
+            Parameters for foxes.utils.TableInterpolator,
+            compatible with scipy.interpolate.interpn()
         parameters: dict, optional
             Additional parameters for TurbineType class
 
@@ -114,6 +117,8 @@ class WsRho2PCtFromTwo(TurbineType):
 
         self._P = None
         self._ct = None
+        self._P_table = None
+        self._ct_table = None
 
     def output_farm_vars(self, algo):
         """
@@ -185,6 +190,14 @@ class WsRho2PCtFromTwo(TurbineType):
         self._rho_ct = np.sort(data.columns.to_numpy())
         self._ct = data[self._rho_ct].to_numpy(FC.DTYPE)
 
+        # prepare interpolation:
+        self._P_table = TableInterpolator(
+            (self._ws_P, self._rho_P), self._P, **self.ipars_P
+        )
+        self._ct_table = TableInterpolator(
+            (self._ws_ct, self._rho_ct), self._ct, **self.ipars_ct
+        )
+
         return super().load_data(algo, verbosity)
 
     def _bounds_info(self, target, qts):
@@ -219,9 +232,10 @@ class WsRho2PCtFromTwo(TurbineType):
             The model data
         fdata: foxes.core.Data
             The farm data
-        st_sel: numpy.ndarray of bool
-            The state-turbine selection,
-            shape: (n_states, n_turbines)
+        st_sel: numpy.ndarray of bool or tuple
+            The state-turbine selection, either a boolean
+            mask of shape (n_states, n_turbines), or a tuple
+            of state and turbine index arrays, see TurbineModel
 
         Returns
         -------
@@ -232,17 +246,14 @@ class WsRho2PCtFromTwo(TurbineType):
         """
 
         # calculate P:
-        st_sel_P = (
-            st_sel
-            & (fdata[self.WSP] >= self._ws_P[0])
-            & (fdata[self.WSP] <= self._ws_P[-1])
-        )
-        st_sel_P0 = st_sel & ~st_sel_P
-        if np.any(st_sel_P0):
-            fdata[FV.P][st_sel_P0] = 0
-        if np.any(st_sel_P):
+        ws = fdata[self.WSP][st_sel]
+        sel = (ws >= self._ws_P[0]) & (ws <= self._ws_P[-1])
+        st_sel_P = self.st_sel_restrict(st_sel, sel)
+        if not np.all(sel):
+            fdata[FV.P][self.st_sel_restrict(st_sel, ~sel)] = 0
+        if np.any(sel):
             # prepare interpolation:
-            n_sel = np.sum(st_sel_P)
+            n_sel = np.sum(sel)
             qts = np.zeros((n_sel, 2), dtype=FC.DTYPE)  # ws, rho
             qts[:, 0] = fdata[self.WSP][st_sel_P]
             qts[:, 1] = fdata[FV.RHO][st_sel_P]
@@ -263,26 +274,21 @@ class WsRho2PCtFromTwo(TurbineType):
 
             # run interpolation:
             try:
-                fdata[FV.P][st_sel_P] = interpn(
-                    (self._ws_P, self._rho_P), self._P, qts, **self.ipars_P
-                )
+                fdata[FV.P][st_sel_P] = self._P_table(qts)
             except ValueError as e:
                 self._bounds_info(FV.P, qts)
                 raise e
-        del st_sel_P, st_sel_P0
+        del ws, sel, st_sel_P
 
         # calculate ct:
-        st_sel_ct = (
-            st_sel
-            & (fdata[self.WSCT] >= self._ws_P[0])
-            & (fdata[self.WSCT] <= self._ws_P[-1])
-        )
-        st_sel_ct0 = st_sel & ~st_sel_ct
-        if np.any(st_sel_ct0):
-            fdata[FV.CT][st_sel_ct0] = 0
-        if np.any(st_sel_ct):
+        ws = fdata[self.WSCT][st_sel]
+        sel = (ws >= self._ws_P[0]) & (ws <= self._ws_P[-1])
+        st_sel_ct = self.st_sel_restrict(st_sel, sel)
+        if not np.all(sel):
+            fdata[FV.CT][self.st_sel_restrict(st_sel, ~sel)] = 0
+        if np.any(sel):
             # prepare interpolation:
-            n_sel = np.sum(st_sel_ct)
+            n_sel = np.sum(sel)
             qts = np.zeros((n_sel, 2), dtype=FC.DTYPE)  # ws, rho
             qts[:, 0] = fdata[self.WSP][st_sel_ct]
             qts[:, 1] = fdata[FV.RHO][st_sel_ct]
@@ -303,9 +309,7 @@ class WsRho2PCtFromTwo(TurbineType):
 
             # run interpolation:
             try:
-                fdata[FV.CT][st_sel_ct] = interpn(
-                    (self._ws_ct, self._rho_ct), self._ct, qts, **self.ipars_ct
-                )
+                fdata[FV.CT][st_sel_ct] = self._ct_table(qts)
             except ValueError as e:
                 self._bounds_info(FV.CT, qts)
                 raise e
@@ -328,3 +332,5 @@ class WsRho2PCtFromTwo(TurbineType):
         del self._ws_P, self._rho_P, self._ws_ct, self._rho_ct
         self._P = None
         self._ct = None
+        self._P_table = None
+        self._ct_table = None
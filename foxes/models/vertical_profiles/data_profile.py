@@ -3,6 +3,7 @@ import pandas as pd
 from scipy.interpolate import interp1d
 
 from foxes.core import VerticalProfile
+from foxes.utils import vertical_coeffs
 
 
 class DataProfile(VerticalProfile):
@@ -17,8 +18,14 @@ class DataProfile(VerticalProfile):
         The z values, shape: (n_z,)
     data_v: numpy.ndarray
         The variable values, shape: (n_z,)
+    extrapolation: str
+        The extrapolation mode for heights outside of
+        the data: None, const, linear, log
+    z0: float
+        The roughness length of the log-law extrapolation
     interp_pars: dict
-        Additional parameters for interpolation
+        Additional parameters for interpolation by
+        scipy.interpolate.interp1d, if given
 
     :group: models.vertical_profiles
 
@@ -31,6 +38,8 @@ class DataProfile(VerticalProfile):
         col_z=None,
         col_var=None,
         pd_read_pars={},
+        extrapolation=None,
+        z0=0.1,
         **interp_pars
     ):
         """
@@ -48,12 +57,22 @@ class DataProfile(VerticalProfile):
             The column of variable data
         pd_read_pars: dict
             Additional parameters for pandas.read_csv()
+        extrapolation: str, optional
+            The extrapolation mode for heights outside of
+            the data: None raises an error, 'const' takes the
+            nearest value, 'linear' extrapolates linearly,
+            'log' applies the logarithmic wind profile
+        z0: float
+            The roughness length of the log-law extrapolation
         interp_pars: dict, optional
-            Additional parameters for interpolation
+            Additional parameters for interpolation by
+            scipy.interpolate.interp1d, if given
 
         """
         super().__init__()
         self.var = variable
+        self.extrapolation = extrapolation
+        self.z0 = z0
         self.interp_pars = interp_pars
 
         if isinstance(data_source, np.ndarray):
@@ -109,4 +128,10 @@ class DataProfile(VerticalProfile):
             shape as heights
 
         """
-        return interp1d(self.data_z, self.data_v, **self.interp_pars)(heights)
+        if len(self.interp_pars):
+            return interp1d(self.data_z, self.data_v, **self.interp_pars)(heights)
+
+        inds, weights = vertical_coeffs(
+            self.data_z, heights, self.extrapolation, self.z0
+        )
+        return np.sum(weights * self.data_v[inds], axis=-1)
@@ -104,6 +104,44 @@ class FarmOrder(WakeFrame):
             algo, mdata, fdata, pdata, states_source_turbine
         )
 
+    def get_wake_coos_bounds(
+        self, algo, mdata, fdata, pdata, states_source_turbine, radius
+    ):
+        """
+        Calculate conservative bounds of the wake coordinates
+        of all points within spheres around the evaluation points.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data, containing the
+            sphere centres
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        radius: numpy.ndarray
+            The sphere radii, shape: (n_states, n_points)
+
+        Returns
+        -------
+        x_max: numpy.ndarray
+            The upper bounds of the wake frame x coordinates,
+            shape: (n_states, n_points)
+        r_min: numpy.ndarray
+            The lower bounds of the radial wake frame distances,
+            shape: (n_states, n_points)
+
+        """
+        return self.base_frame.get_wake_coos_bounds(
+            algo, mdata, fdata, pdata, states_source_turbine, radius
+        )
+
     def get_centreline_points(self, algo, mdata, fdata, states_source_turbine, x):
         """
         Gets the points along the centreline for given
@@ -109,6 +109,47 @@ class RotorWD(WakeFrame):
 
         return coos
 
+    def get_wake_coos_bounds(
+        self, algo, mdata, fdata, pdata, states_source_turbine, radius
+    ):
+        """
+        Calculate conservative bounds of the wake coordinates
+        of all points within spheres around the evaluation points.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data, containing the
+            sphere centres
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        radius: numpy.ndarray
+            The sphere radii, shape: (n_states, n_points)
+
+        Returns
+        -------
+        x_max: numpy.ndarray
+            The upper bounds of the wake frame x coordinates,
+            shape: (n_states, n_points)
+        r_min: numpy.ndarray
+            The lower bounds of the radial wake frame distances,
+            shape: (n_states, n_points)
+
+        """
+        # the wake frame is a rotated frame, hence distances are preserved:
+        coos = self.get_wake_coos(algo, mdata, fdata, pdata, states_source_turbine)
+        x_max = coos[:, :, 0] + radius
+        r_min = np.maximum(np.linalg.norm(coos[:, :, 1:3], axis=-1) - radius, 0.0)
+
+        return x_max, r_min
+
     def get_centreline_points(self, algo, mdata, fdata, states_source_turbine, x):
         """
         Gets the points along the centreline for given
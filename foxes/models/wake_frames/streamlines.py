@@ -1,5 +1,6 @@
 import numpy as np
 from scipy.interpolate import interpn
+from scipy.spatial import cKDTree
 
 from foxes.core import WakeFrame
 from foxes.utils import wd2uv
@@ -21,12 +22,22 @@ class Streamlines2D(WakeFrame):
     cl_ipars: dict
         Interpolation parameters for centre line
         point interpolation
+    max_dense: int
+        The maximal number of point-vertex pairs for
+        brute-force nearest streamline point searches,
+        larger searches use one KD-tree per state
+    order_wd_bin: float
+        The size of ambient wind direction bins in degrees
+        for sharing the turbine order between states,
+        or None for calculating the order of each state
 
     :group: models.wake_frames
 
     """
 
-    def __init__(self, step, max_length=1e4, cl_ipars={}):
+    def __init__(
+        self, step, max_length=1e4, cl_ipars={}, max_dense=1e6, order_wd_bin=None
+    ):
         """
         Constructor.
 
@@ -39,12 +50,22 @@ class Streamlines2D(WakeFrame):
         cl_ipars: dict
             Interpolation parameters for centre line
             point interpolation
+        max_dense: int
+            The maximal number of point-vertex pairs for
+            brute-force nearest streamline point searches,
+            larger searches use one KD-tree per state
+        order_wd_bin: float, optional
+            The size of ambient wind direction bins in degrees
+            for sharing the turbine order between states,
+            or None for calculating the order of each state
 
         """
         super().__init__()
         self.step = step
         self.max_length = max_length
         self.cl_ipars = cl_ipars
+        self.max_dense = max_dense
+        self.order_wd_bin = order_wd_bin
 
         self.DATA = self.var("DATA")
 
@@ -133,30 +154,54 @@ class Streamlines2D(WakeFrame):
         Helper function, calculates streamline coordinates
         for given points and given turbine
         """
+        st_sel = (np.arange(mdata.n_states), states_source_turbine)
+        data = self.get_streamline_data(algo, mdata, fdata)[st_sel]
+        return self._project(data, points)
 
-        # prepare:
-        n_states = mdata.n_states
-        n_points = points.shape[1]
-        st_sel = (np.arange(n_states), states_source_turbine)
+    def _project(self, data, points):
+        """
+        Helper function, calculates streamline coordinates
+        for given points and one streamline per state
+        """
 
         # find nearest streamline points:
-        data = self.get_streamline_data(algo, mdata, fdata)[st_sel]
-        dists = np.linalg.norm(points[:, :, None, :2] - data[:, None, :, :2], axis=-1)
-        selp = np.argmin(dists, axis=2)
-        data = np.take_along_axis(data[:, None], selp[:, :, None, None], axis=2)[
-            :, :, 0
-        ]
-        slen = self.step * selp
-        del dists, selp
-
-        # calculate coordinates:
+        n_states, n_points = points.shape[:2]
+        n_spts = data.shape[1]
+        pxy = points[:, :, :2]
+        sxy = data[:, :, :2]
+        if n_states * n_points * n_spts <= self.max_dense:
+            dx = pxy[:, :, None, 0] - sxy[:, None, :, 0]
+            dy = pxy[:, :, None, 1] - sxy[:, None, :, 1]
+            selp = np.argmin(dx * dx + dy * dy, axis=2)
+            del dx, dy
+        else:
+            selp = np.zeros((n_states, n_points), dtype=FC.ITYPE)
+            for si in range(n_states):
+                selp[si] = cKDTree(sxy[si]).query(pxy[si])[1]
+
+        # project onto the two streamline segments next to the nearest point,
+        # extending the first and the last segment beyond the streamline ends:
+        dist = np.full((n_states, n_points), np.inf, dtype=FC.DTYPE)
         coos = np.zeros((n_states, n_points, 3), dtype=FC.DTYPE)
-        nx = wd2uv(data[:, :, 3])
-        ny = np.stack([-nx[:, :, 1], nx[:, :, 0]], axis=2)
-        delta = points[:, :, :2] - data[:, :, :2]
-        coos[:, :, 0] = slen + np.einsum("spd,spd->sp", delta, nx)
-        coos[:, :, 1] = np.einsum("spd,spd->sp", delta, ny)
-        coos[:, :, 2] = points[:, :, 2] - data[:, :, 2]
+        for i0 in [np.maximum(selp - 1, 0), np.minimum(selp, n_spts - 2)]:
+            p0 = np.take_along_axis(data, i0[:, :, None], axis=1)
+            p1 = np.take_along_axis(data, i0[:, :, None] + 1, axis=1)
+            tv = p1[:, :, :2] - p0[:, :, :2]
+            tl = np.linalg.norm(tv, axis=-1)
+            tv /= tl[:, :, None]
+            delta = pxy - p0[:, :, :2]
+            lam = np.einsum("spd,spd->sp", delta, tv) / tl
+            lam[i0 > 0] = np.maximum(lam[i0 > 0], 0)
+            lam[i0 < n_spts - 2] = np.minimum(lam[i0 < n_spts - 2], 1)
+            delta -= lam[:, :, None] * tl[:, :, None] * tv
+            d = np.linalg.norm(delta, axis=-1)
+
+            sel = d < dist
+            if np.any(sel):
+                dist[sel] = d[sel]
+                coos[sel, 0] = self.step * i0[sel] + lam[sel] * tl[sel]
+                coos[sel, 1] = tv[sel, 0] * delta[sel, 1] - tv[sel, 1] * delta[sel, 0]
+                coos[sel, 2] = points[sel, 2] - p0[sel, 2]
 
         return coos
 
@@ -182,26 +227,55 @@ class Streamlines2D(WakeFrame):
             The turbine order, shape: (n_states, n_turbines)
 
         """
-        # prepare:
-        n_states = fdata.n_states
-        n_turbines = algo.n_turbines
-        pdata = Data.from_points(points=fdata[FV.TXYH])
+        return self.calc_order_from_coos(algo, mdata, fdata, self.order_wd_bin)
+
+    def get_order_coos(self, algo, mdata, fdata, states=None):
+        """
+        Calculates the wake frame x coordinates of all
+        rotor centres, in the wakes of all turbines.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states: numpy.ndarray, optional
+            The indices of the states of interest,
+            or None for all states
+
+        Returns
+        -------
+        coosx: numpy.ndarray
+            The wake frame x coordinates, shape:
+            (n_states, n_turbines_source, n_turbines_target)
 
-        # calculate streamline x coordinates for turbines rotor centre points:
-        # n_states, n_turbines_source, n_turbines_target
+        """
+        data = self.get_streamline_data(algo, mdata, fdata)
+        points = fdata[FV.TXYH]
+        if states is not None:
+            data = data[states]
+            points = points[states]
+        n_states, n_turbines = points.shape[:2]
+        n_spts = data.shape[2]
+
+        # project blocks of (state, source turbine) pairs at once:
         coosx = np.zeros((n_states, n_turbines, n_turbines), dtype=FC.DTYPE)
-        for ti in range(n_turbines):
-            coosx[:, ti, :] = self.get_wake_coos(
-                algo, mdata, fdata, pdata, np.full(n_states, ti)
-            )[..., 0]
-
-        # derive turbine order:
-        # TODO: Remove loop over states
-        order = np.zeros((n_states, n_turbines), dtype=FC.ITYPE)
-        for si in range(n_states):
-            order[si] = np.lexsort(keys=coosx[si])
-
-        return order
+        n_blk = max(int(self.max_dense / (n_turbines**2 * n_spts)), 1)
+        for s0 in range(0, n_states, n_blk):
+            s1 = min(s0 + n_blk, n_states)
+            n = (s1 - s0) * n_turbines
+            hdata = data[s0:s1].reshape(n, n_spts, 4)
+            hpts = np.broadcast_to(
+                points[s0:s1, None], (s1 - s0, n_turbines, n_turbines, 3)
+            ).reshape(n, n_turbines, 3)
+            coosx[s0:s1] = self._project(hdata, hpts)[..., 0].reshape(
+                s1 - s0, n_turbines, n_turbines
+            )
+
+        return coosx
 
     def get_wake_coos(self, algo, mdata, fdata, pdata, states_source_turbine):
         """
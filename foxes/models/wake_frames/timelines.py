@@ -21,12 +21,15 @@ class Timelines(WakeFrame):
     dt_min: float, optional
         The delta t value in minutes,
         if not from timeseries data
+    max_dense: int
+        The maximal number of state-point pairs per
+        coordinate calculation of the turbine order
 
     :group: models.wake_frames
 
     """
 
-    def __init__(self, max_wake_length=2e4, cl_ipars={}, dt_min=None):
+    def __init__(self, max_wake_length=2e4, cl_ipars={}, dt_min=None, max_dense=1e6):
         """
         Constructor.
 
@@ -40,12 +43,16 @@ class Timelines(WakeFrame):
         dt_min: float, optional
             The delta t value in minutes,
             if not from timeseries data
+        max_dense: int
+            The maximal number of state-point pairs per
+            coordinate calculation of the turbine order
 
         """
         super().__init__()
         self.max_wake_length = max_wake_length
         self.cl_ipars = cl_ipars
         self.dt_min = dt_min
+        self.max_dense = max_dense
 
     def initialize(self, algo, verbosity=0):
         """
@@ -142,27 +149,7 @@ class Timelines(WakeFrame):
             The turbine order, shape: (n_states, n_turbines)
 
         """
-
-        # prepare:
-        n_states = fdata.n_states
-        n_turbines = algo.n_turbines
-        pdata = Data.from_points(points=fdata[FV.TXYH])
-
-        # calculate streamline x coordinates for turbines rotor centre points:
-        # n_states, n_turbines_source, n_turbines_target
-        coosx = np.zeros((n_states, n_turbines, n_turbines), dtype=FC.DTYPE)
-        for ti in range(n_turbines):
-            coosx[:, ti, :] = self.get_wake_coos(
-                algo, mdata, fdata, pdata, np.full(n_states, ti)
-            )[..., 0]
-
-        # derive turbine order:
-        # TODO: Remove loop over states
-        order = np.zeros((n_states, n_turbines), dtype=FC.ITYPE)
-        for si in range(n_states):
-            order[si] = np.lexsort(keys=coosx[si])
-
-        return order
+        return self.calc_order_from_coos(algo, mdata, fdata)
 
     def get_wake_coos(self, algo, mdata, fdata, pdata, states_source_turbine):
         """
@@ -192,20 +179,34 @@ class Timelines(WakeFrame):
 
         # prepare:
         n_states = mdata.n_states
-        n_points = pdata.n_points
         points = pdata[FC.POINTS]
         stsel = (np.arange(n_states), states_source_turbine)
         rxyz = fdata[FV.TXYH][stsel]
 
-        D = np.zeros((n_states, n_points), dtype=FC.DTYPE)
-        D[:] = fdata[FV.D][stsel][:, None]
+        wcoos, trace_si = self._calc_coos(algo, mdata, points - rxyz[:, None])
 
+        # turbines that cause wake:
+        pdata.add(FC.STATE_SOURCE_TURBINE, states_source_turbine, (FC.STATE,))
+
+        # states that cause wake for each target point:
+        pdata.add(FC.STATES_SEL, trace_si, (FC.STATE, FC.POINT))
+
+        return wcoos
+
+    def _calc_coos(self, algo, mdata, rpoints):
+        """
+        Helper function, calculates the wake frame coordinates
+        and the wake causing states for points relative to
+        the rotor centres of the source turbines, given as
+        rpoints with shape (n_states, n_points, 3)
+        """
+        n_states, n_points = rpoints.shape[:2]
         i0 = mdata.states_i0(counter=True, algo=algo)
         i1 = i0 + mdata.n_states
         dxy = self._dxy[:i1]
 
         trace_p = np.zeros((n_states, n_points, 2), dtype=FC.DTYPE)
-        trace_p[:] = points[:, :, :2] - rxyz[:, None, :2]
+        trace_p[:] = rpoints[:, :, :2]
         trace_l = np.zeros((n_states, n_points), dtype=FC.DTYPE)
         trace_d = np.full((n_states, n_points), np.inf, dtype=FC.DTYPE)
         trace_si = np.zeros((n_states, n_points), dtype=FC.ITYPE)
@@ -214,8 +215,7 @@ class Timelines(WakeFrame):
         wcoos = np.full((n_states, n_points, 3), 1e20, dtype=FC.DTYPE)
         wcoosx = wcoos[:, :, 0]
         wcoosy = wcoos[:, :, 1]
-        wcoos[:, :, 2] = points[:, :, 2] - rxyz[:, None, 2]
-        del rxyz
+        wcoos[:, :, 2] = rpoints[:, :, 2]
 
         while True:
             sel = (trace_si > 0) & (trace_l < self.max_wake_length)
@@ -255,13 +255,48 @@ class Timelines(WakeFrame):
             else:
                 break
 
-        # turbines that cause wake:
-        pdata.add(FC.STATE_SOURCE_TURBINE, states_source_turbine, (FC.STATE,))
+        return wcoos, trace_si
 
-        # states that cause wake for each target point:
-        pdata.add(FC.STATES_SEL, trace_si, (FC.STATE, FC.POINT))
+    def get_order_coos(self, algo, mdata, fdata, states=None):
+        """
+        Calculates the wake frame x coordinates of all
+        rotor centres, in the wakes of all turbines.
 
-        return wcoos
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        states: numpy.ndarray, optional
+            The indices of the states of interest,
+            or None for all states
+
+        Returns
+        -------
+        coosx: numpy.ndarray
+            The wake frame x coordinates, shape:
+            (n_states, n_turbines_source, n_turbines_target)
+
+        """
+        txyh = fdata[FV.TXYH]
+        n_states, n_turbines = txyh.shape[:2]
+
+        # source-target pairs for blocks of source turbines:
+        coosx = np.zeros((n_states, n_turbines, n_turbines), dtype=FC.DTYPE)
+        n_blk = max(int(self.max_dense / (n_states * n_turbines)), 1)
+        for t0 in range(0, n_turbines, n_blk):
+            t1 = min(t0 + n_blk, n_turbines)
+            rpoints = txyh[:, None] - txyh[:, t0:t1, None]
+            rpoints = rpoints.reshape(n_states, (t1 - t0) * n_turbines, 3)
+            coosx[:, t0:t1] = (
+                self._calc_coos(algo, mdata, rpoints)[0][..., 0]
+            ).reshape(n_states, t1 - t0, n_turbines)
+            del rpoints
+
+        return coosx if states is None else coosx[states]
 
     def get_centreline_points(self, algo, mdata, fdata, states_source_turbine, x):
         """
@@ -161,7 +161,7 @@ class YawedWakes(WakeFrame):
             upcast=True,
             states_source_turbine=states_source_turbine,
         )
-        gamma *= np.pi / 180
+        gamma = gamma * np.pi / 180
 
         # get k:
         k = self.get_data(
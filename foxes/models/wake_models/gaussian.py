@@ -106,3 +106,65 @@ class GaussianWakeModel(AxisymmetricWakeModel):
             wdeltas[v] = ampld[:, None] * np.exp(-0.5 * (rsel / sigma[:, None]) ** 2)
 
         return wdeltas, sp_sel
+
+    def calc_interaction_spsel(
+        self,
+        algo,
+        mdata,
+        fdata,
+        pdata,
+        states_source_turbine,
+        x,
+        r,
+        tol,
+    ):
+        """
+        Selects the evaluation points for which the
+        wake contribution may be non-negligible.
+
+        Points are selected if the Gaussian wake delta at
+        the radial distance r exceeds the tolerance.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The wake frame x coordinates of the evaluation
+            points, shape: (n_states, n_points)
+        r: numpy.ndarray
+            The smallest radial wake frame distances of the
+            target discs around the evaluation points,
+            shape: (n_states, n_points)
+        tol: float
+            The error tolerance for the relative
+            wake deltas
+
+        Returns
+        -------
+        sp_sel: numpy.ndarray of bool
+            The state-point selection of possibly
+            affected points, shape: (n_states, n_points)
+
+        """
+        amsi, sp_sel = self.calc_amplitude_sigma_spsel(
+            algo, mdata, fdata, pdata, states_source_turbine, x
+        )
+
+        if np.any(sp_sel):
+            rsel = r[sp_sel]
+            sel = np.zeros(len(rsel), dtype=bool)
+            for ampld, sigma in amsi.values():
+                sel |= np.abs(ampld) * np.exp(-0.5 * (rsel / sigma) ** 2) > tol
+            sp_sel[sp_sel] = sel
+
+        return sp_sel
@@ -98,10 +98,10 @@ class RankineHalfBody(WakeModel):
         """
         n_states = mdata.n_states
         n_points = pdata.n_points
-        wake_deltas["U"] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
-        wake_deltas["V"] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
-        wake_deltas[FV.WD] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas["U"] = np.zeros((n_states, n_points), dtype=algo.dtype)
+        wake_deltas["V"] = np.zeros((n_states, n_points), dtype=algo.dtype)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
+        wake_deltas[FV.WD] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def contribute_to_wake_deltas(
         self,
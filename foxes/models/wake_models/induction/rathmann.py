@@ -102,7 +102,7 @@ class Rathmann(WakeModel):
         """
         n_states = mdata.n_states
         n_points = pdata.n_points
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def contribute_to_wake_deltas(
         self,
@@ -109,7 +109,7 @@ class SelfSimilar(WakeModel):
         """
         n_states = mdata.n_states
         n_points = pdata.n_points
-        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, n_points), dtype=algo.dtype)
 
     def _mu(self, x_R):
         """Helper function: define mu (eqn 11 from [1])"""
@@ -234,3 +234,65 @@ class TopHatWakeModel(AxisymmetricWakeModel):
                 wdeltas[v][nsel] = 0.0
 
         return wdeltas, sp_sel
+
+    def calc_interaction_spsel(
+        self,
+        algo,
+        mdata,
+        fdata,
+        pdata,
+        states_source_turbine,
+        x,
+        r,
+        tol,
+    ):
+        """
+        Selects the evaluation points for which the
+        wake contribution may be non-negligible.
+
+        Parameters
+        ----------
+        algo: foxes.core.Algorithm
+            The calculation algorithm
+        mdata: foxes.core.Data
+            The model data
+        fdata: foxes.core.Data
+            The farm data
+        pdata: foxes.core.Data
+            The evaluation point data
+        states_source_turbine: numpy.ndarray
+            For each state, one turbine index for the
+            wake causing turbine. Shape: (n_states,)
+        x: numpy.ndarray
+            The wake frame x coordinates of the evaluation
+            points, shape: (n_states, n_points)
+        r: numpy.ndarray
+            The smallest radial wake frame distances of the
+            target discs around the evaluation points,
+            shape: (n_states, n_points)
+        tol: float
+            The error tolerance for the relative
+            wake deltas
+
+        Returns
+        -------
+        sp_sel: numpy.ndarray of bool
+            The state-point selection of possibly
+            affected points, shape: (n_states, n_points)
+
+        """
+        ct = self.get_data(
+            FV.CT,
+            FC.STATE_POINT,
+            lookup="w",
+            fdata=fdata,
+            pdata=pdata,
+            states_source_turbine=states_source_turbine,
+            algo=algo,
+        )
+
+        wake_r = self.calc_wake_radius(
+            algo, mdata, fdata, pdata, states_source_turbine, x, ct
+        )
+
+        return (ct > 0.0) & (x > 1e-5) & (r < wake_r)
@@ -127,7 +127,9 @@ class Bastankhah2014(GaussianWakeModel):
             shape (n_states, n_points, ...)
 
         """
-        wake_deltas[FV.WS] = np.zeros((mdata.n_states, pdata.n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros(
+            (mdata.n_states, pdata.n_points), dtype=algo.dtype
+        )
 
     def calc_amplitude_sigma_spsel(
         self,
@@ -517,7 +517,7 @@ class Bastankhah2016(DistSlicedWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=algo.dtype)
 
     def calc_wakes_spsel_x_yz(
         self,
@@ -578,7 +578,7 @@ class Bastankhah2016(DistSlicedWakeModel):
                 upcast=True,
                 states_source_turbine=states_source_turbine,
             )
-            gamma *= np.pi / 180
+            gamma = gamma * np.pi / 180
 
             # get k:
             k = self.get_data(
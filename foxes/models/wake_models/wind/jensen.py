@@ -75,7 +75,7 @@ class JensenWake(TopHatWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=algo.dtype)
 
     def calc_wake_radius(
         self,
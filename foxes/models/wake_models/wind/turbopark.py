@@ -131,7 +131,7 @@ class TurbOParkWake(GaussianWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=algo.dtype)
 
     def calc_amplitude_sigma_spsel(
         self,
@@ -286,6 +286,9 @@ class TurbOParkWakeIX(GaussianWakeModel):
         Flag for considering only own wake in ti integral
     induction: foxes.core.AxialInductionModel or str
         The induction model
+    max_steps: int
+        The maximal number of integration steps, the
+        step size is increased for long wakes if exceeded
     ipars: dict
         Additional parameters for centreline integration
 
@@ -302,6 +305,7 @@ class TurbOParkWakeIX(GaussianWakeModel):
         ti_var=FV.TI,
         self_wake=True,
         induction="Madsen",
+        max_steps=None,
         **ipars,
     ):
         """
@@ -325,6 +329,9 @@ class TurbOParkWakeIX(GaussianWakeModel):
             Flag for considering only own wake in ti integral
         induction: foxes.core.AxialInductionModel or str
             The induction model
+        max_steps: int, optional
+            The maximal number of integration steps, the
+            step size is increased for long wakes if exceeded
         ipars: dict, optional
             Additional parameters for centreline integration
 
@@ -339,6 +346,7 @@ class TurbOParkWakeIX(GaussianWakeModel):
         self._tiwakes = None
         self.self_wake = self_wake
         self.induction = induction
+        self.max_steps = max_steps
 
     def __repr__(self):
         s = super().__repr__()
@@ -399,7 +407,7 @@ class TurbOParkWakeIX(GaussianWakeModel):
 
         """
         n_states = mdata.n_states
-        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=FC.DTYPE)
+        wake_deltas[FV.WS] = np.zeros((n_states, pdata.n_points), dtype=algo.dtype)
 
         # find TI wake models:
         self._tiwakes = []
@@ -504,17 +512,14 @@ class TurbOParkWakeIX(GaussianWakeModel):
                 dx=self.dx,
                 wake_models=self._tiwakes,
                 self_wake=self.self_wake,
+                max_steps=self.max_steps,
                 **self.ipars,
             )[:, :, 0]
 
             # calculate sigma (eqn 1, plus epsilon from eqn 4 for x = 0)
             sigma = D * epsilon + self.A * ti_ix[sp_sel]
 
-            del (
-                x,
-                sbeta,
-                epsilon,
-            )
+            del x, epsilon
 
             # calculate amplitude, same as in Bastankhah model (eqn 7)
             ct_eff = ct / (8 * (sigma / D) ** 2)
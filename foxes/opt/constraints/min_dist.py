@@ -1,6 +1,7 @@
 import numpy as np
 
 from foxes.opt.core.farm_constraint import FarmConstraint
+from foxes.utils import min_dist_worst
 import foxes.variables as FV
 import foxes.constants as FC
 
@@ -20,6 +21,10 @@ class MinDistConstraint(FarmConstraint):
         The minimal distance
     min_dist_unit: str
         The minimal distance unit, either m or D
+    n_worst: int
+        The number of components, each representing one
+        of the largest violations, or None for one
+        component per turbine pair
 
     :group: opt.constraints
 
@@ -32,6 +37,7 @@ class MinDistConstraint(FarmConstraint):
         min_dist_unit="m",
         name="dist",
         sel_turbines=None,
+        n_worst=None,
         **kwargs,
     ):
         """
@@ -49,12 +55,21 @@ class MinDistConstraint(FarmConstraint):
             The name of the constraint
         sel_turbines: list of int, optional
             The selected turbines
+        n_worst: int, optional
+            The number of components, each representing one
+            of the largest violations, or None for one
+            component per turbine pair. Only nearby pairs
+            are then checked, based on a KD-tree search.
+            The components are clipped from below at minus
+            the maximal minimal distance, and are
+            continuous in the turbine positions
         kwargs: dict, optional
             Additional parameters for `iwopy.Constraint`
 
         """
         self.min_dist = min_dist
         self.min_dist_unit = min_dist_unit
+        self.n_worst = n_worst
 
         selt = problem.sel_turbines if sel_turbines is None else sel_turbines
         vrs = []
@@ -74,18 +89,28 @@ class MinDistConstraint(FarmConstraint):
 
         """
         N = self.farm.n_turbines
-        self._i2t = []  # i --> (ti, tj)
-        self._t2i = np.full([N, N], -1)  # (ti, tj) --> i
-        i = 0
-        for ti in self.sel_turbines:
-            for tj in range(N):
-                if ti != tj and self._t2i[ti, tj] < 0:
-                    self._i2t.append([ti, tj])
-                    self._t2i[ti, tj] = i
-                    self._t2i[tj, ti] = i
-                    i += 1
-        self._i2t = np.array(self._i2t)
-        self._cnames = [f"{self.name}_{ti}_{tj}" for ti, tj in self._i2t]
+        selt = np.array(self.sel_turbines, dtype=FC.ITYPE)
+        self._sel = None
+        if len(selt) < N:
+            self._sel = np.zeros(N, dtype=bool)
+            self._sel[selt] = True
+
+        if self.n_worst is not None:
+            self._i2t = None
+            self._cnames = [f"{self.name}_{i}" for i in range(self.n_worst)]
+
+        else:
+            # all pairs (ti, tj), with ti selected and tj
+            # not preceding ti in the turbine selection:
+            pos = np.full(N, len(selt), dtype=FC.ITYPE)
+            pos[selt] = np.arange(len(selt))
+            k = np.repeat(np.arange(len(selt)), N)
+            ti = selt[k]
+            tj = np.tile(np.arange(N), len(selt))
+            s = (ti != tj) & (pos[tj] > k)
+            self._i2t = np.stack([ti[s], tj[s]], axis=-1)
+            self._cnames = [f"{self.name}_{ti}_{tj}" for ti, tj in self._i2t]
+
         super().initialize(verbosity)
 
     def n_components(self):
@@ -99,7 +124,7 @@ class MinDistConstraint(FarmConstraint):
             The number of components.
 
         """
-        return len(self._i2t)
+        return self.n_worst if self._i2t is None else len(self._i2t)
 
     def vardeps_float(self):
         """
@@ -114,14 +139,26 @@ class MinDistConstraint(FarmConstraint):
 
         """
         turbs = list(self.problem.sel_turbines)
+        if self._i2t is None:
+            return np.ones((self.n_components(), 2 * len(turbs)), dtype=bool)
+
+        tpos = np.full(self.farm.n_turbines, -1, dtype=FC.ITYPE)
+        tpos[turbs] = np.arange(len(turbs))
         deps = np.zeros((self.n_components(), len(turbs), 2), dtype=bool)
-        for i, titj in enumerate(self._i2t):
-            for t in titj:
-                if t in turbs:
-                    j = turbs.index(t)
-                    deps[i, j] = True
+        for t in self._i2t.T:
+            s = tpos[t] >= 0
+            deps[np.where(s)[0], tpos[t[s]]] = True
         return deps.reshape(self.n_components(), 2 * len(turbs))
 
+    def _get_D(self, problem_results, n_pop=None, n_states=None):
+        """Helper function that extracts state independent rotor diameters"""
+        D = problem_results[FV.D].to_numpy()
+        if n_pop is not None:
+            D = D.reshape(n_pop, n_states, D.shape[-1])
+        if not np.all(np.abs(np.min(D, axis=-2) - np.max(D, axis=-2)) < 1e-13):
+            raise ValueError(f"Constraint '{self.name}': Require state independet D")
+        return D[..., 0, :]
+
     def calc_individual(self, vars_int, vars_float, problem_results, components=None):
         """
         Calculate values for a single individual of the
@@ -157,6 +194,12 @@ class MinDistConstraint(FarmConstraint):
         if components is not None and len(components) < self.n_components():
             s = components
 
+        if self._i2t is None:
+            mind = self.min_dist
+            if self.min_dist_unit == "D":
+                mind = self.min_dist * self._get_D(problem_results)[None]
+            return min_dist_worst(xy[None], mind, self.n_worst, self._sel)[0, s]
+
         a = np.take_along_axis(xy, self._i2t[s][:, 0, None], axis=0)
         b = np.take_along_axis(xy, self._i2t[s][:, 1, None], axis=0)
         d = np.linalg.norm(a - b, axis=-1)
@@ -165,13 +208,7 @@ class MinDistConstraint(FarmConstraint):
             mind = self.min_dist
 
         elif self.min_dist_unit == "D":
-            D = problem_results[FV.D].to_numpy()
-            if not np.all(np.abs(np.min(D, axis=0) - np.max(D, axis=0)) < 1e-13):
-                raise ValueError(
-                    f"Constraint '{self.name}': Require state independet D"
-                )
-            D = D[0]
-
+            D = self._get_D(problem_results)
             Da = np.take_along_axis(D, self._i2t[s][:, 0], axis=0)
             Db = np.take_along_axis(D, self._i2t[s][:, 1], axis=0)
             mind = self.min_dist * np.maximum(Da, Db)
@@ -217,6 +254,12 @@ class MinDistConstraint(FarmConstraint):
         if components is not None and len(components) < self.n_components():
             s = components
 
+        if self._i2t is None:
+            mind = self.min_dist
+            if self.min_dist_unit == "D":
+                mind = self.min_dist * self._get_D(problem_results, n_pop, n_states)
+            return min_dist_worst(xy, mind, self.n_worst, self._sel)[:, s]
+
         a = np.take_along_axis(xy, self._i2t[s][None, :, 0, None], axis=1)
         b = np.take_along_axis(xy, self._i2t[s][None, :, 1, None], axis=1)
         d = np.linalg.norm(a - b, axis=-1)
@@ -225,13 +268,7 @@ class MinDistConstraint(FarmConstraint):
             mind = self.min_dist
 
         elif self.min_dist_unit == "D":
-            D = problem_results[FV.D].to_numpy().reshape(n_pop, n_states, n_turbines)
-            if not np.all(np.abs(np.min(D, axis=1) - np.max(D, axis=1)) < 1e-13):
-                raise ValueError(
-                    f"Constraint '{self.name}': Require state independet D"
-                )
-            D = D[:, 0]
-
+            D = self._get_D(problem_results, n_pop, n_states)
             Da = np.take_along_axis(D, self._i2t[s][None, :, 0], axis=1)
             Db = np.take_along_axis(D, self._i2t[s][None, :, 1], axis=1)
             mind = self.min_dist * np.maximum(Da, Db)
@@ -20,6 +20,9 @@ class FarmOptProblem(Problem):
         Additional parameters for algo.calc_farm()
     points : numpy.ndarray
         The probe points, shape: (n_states, n_points, 3)
+    keep_models: bool
+        Flag for keeping the algorithm's models and model
+        data initialized between calculations
 
     :group: opt.core
 
@@ -33,6 +36,7 @@ class FarmOptProblem(Problem):
         sel_turbines=None,
         calc_farm_args={},
         points=None,
+        keep_models=False,
         **kwargs,
     ):
         """
@@ -53,6 +57,11 @@ class FarmOptProblem(Problem):
             Additional parameters for algo.calc_farm()
         points : numpy.ndarray, optional
             The probe points, shape: (n_states, n_points, 3)
+        keep_models: bool
+            Flag for keeping the algorithm's models and model
+            data initialized between calculations. Only the
+            models that depend on changed variables are then
+            re-initialized
         kwargs: dict, optional
             Additional parameters for `iwopy.Problem`
 
@@ -63,6 +72,7 @@ class FarmOptProblem(Problem):
         self.runner = runner
         self.calc_farm_args = calc_farm_args
         self.points = points
+        self.keep_models = keep_models
 
         self._sel_turbines = sel_turbines
         self._count = None
@@ -198,13 +208,35 @@ class FarmOptProblem(Problem):
             self.algo.initialize()
         self._org_states_name = self.algo.states.name
         self._org_n_states = self.algo.n_states
+        self._n_turbines = self.algo.n_turbines
 
         self.algo.finalize()
+        if self.keep_models:
+            self.algo.initialize()
 
         self._count = 0
 
         super().initialize(verbosity)
 
+    def _check_n_turbines(self):
+        """
+        Reset the algorithm, if the number
+        of turbines has changed
+        """
+        if self.farm.n_turbines != self._n_turbines:
+            if self.algo.initialized:
+                self.algo.finalize()
+            self._n_turbines = self.farm.n_turbines
+
+    def _reinit_model(self, model):
+        """
+        Re-initialize an initialized model,
+        such that its model data is updated
+        """
+        if model.initialized:
+            model.finalize(self.algo)
+            model.initialize(self.algo)
+
     def _reset_states(self, states):
         """
         Reset the states in the algorithm
@@ -230,6 +262,8 @@ class FarmOptProblem(Problem):
             The float variable values, shape: (n_vars_float,)
 
         """
+        self._check_n_turbines()
+
         # reset states, if needed:
         if isinstance(self.algo.states, PopStates):
             self._reset_states(self.algo.states.states)
@@ -251,6 +285,8 @@ class FarmOptProblem(Problem):
             The float variable values, shape: (n_pop, n_vars_float,)
 
         """
+        self._check_n_turbines()
+
         # set/reset pop states, if needed:
         n_pop = len(vars_float)
         if not isinstance(self.algo.states, PopStates):
@@ -259,6 +295,16 @@ class FarmOptProblem(Problem):
             ostates = self.algo.states.states
             self._reset_states(PopStates(ostates, n_pop))
 
+    def _calc_args(self, args=None):
+        """
+        Helper function that provides the
+        arguments for the calculation
+        """
+        args = dict(self.calc_farm_args if args is None else args)
+        if self.keep_models:
+            args["finalize"] = False
+        return args
+
     def apply_individual(self, vars_int, vars_float):
         """
         Apply new variables to the problem.
@@ -279,13 +325,15 @@ class FarmOptProblem(Problem):
         """
         self._count += 1
         self.update_problem_individual(vars_int, vars_float)
-        farm_results = self.runner.run(self.algo.calc_farm, kwargs=self.calc_farm_args)
+        farm_results = self.runner.run(self.algo.calc_farm, kwargs=self._calc_args())
 
         if self.points is None:
             return farm_results
         else:
             point_results = self.runner.run(
-                self.algo.calc_points, args=(farm_results, self.points)
+                self.algo.calc_points,
+                args=(farm_results, self.points),
+                kwargs=self._calc_args({}),
             )
             return farm_results, point_results
 
@@ -311,7 +359,7 @@ class FarmOptProblem(Problem):
         self._count += 1
 
         self.update_problem_population(vars_int, vars_float)
-        farm_results = self.runner.run(self.algo.calc_farm, kwargs=self.calc_farm_args)
+        farm_results = self.runner.run(self.algo.calc_farm, kwargs=self._calc_args())
         farm_results["n_pop"] = len(vars_float)
         farm_results["n_org_states"] = self._org_n_states
 
@@ -324,7 +372,9 @@ class FarmOptProblem(Problem):
             pop_points[:] = self.points[None, :, :, :]
             pop_points = pop_points.reshape(n_pop * n_states, n_points, 3)
             point_results = self.runner.run(
-                self.algo.calc_points, args=(farm_results, pop_points)
+                self.algo.calc_points,
+                args=(farm_results, pop_points),
+                kwargs=self._calc_args({}),
             )
             return farm_results, point_results
 
@@ -164,6 +164,7 @@ class FarmVarsProblem(FarmOptProblem):
                         )
                         data[:, self.sel_turbines] = vals
                         model.add_var(v, data)
+                self._reinit_model(model)
 
         if len(fvars):
             raise KeyError(
@@ -212,6 +213,7 @@ class FarmVarsProblem(FarmOptProblem):
                         data[:, self.sel_turbines] = vals.reshape(shp1)
                         model.add_var(v, data)
                         del data
+                self._reinit_model(model)
 
         if len(fvars):
             raise KeyError(
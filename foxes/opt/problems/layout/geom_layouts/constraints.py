@@ -1,8 +1,7 @@
 import numpy as np
-from scipy.spatial.distance import cdist
 from iwopy import Constraint
 
-import foxes.constants as FC
+from foxes.utils import min_dist_worst, nearest_dists
 
 
 class Valid(Constraint):
@@ -229,7 +228,13 @@ class MinDist(Constraint):
     """
 
     def __init__(
-        self, problem, min_dist=None, n_turbines=None, name="min_dist", **kwargs
+        self,
+        problem,
+        min_dist=None,
+        n_turbines=None,
+        name="min_dist",
+        n_worst=None,
+        **kwargs,
     ):
         """
         Constructor.
@@ -245,6 +250,14 @@ class MinDist(Constraint):
             The number of turbines
         name: str
             The constraint name
+        n_worst: int, optional
+            The number of components, each representing one
+            of the largest violations, or None for one
+            component per turbine pair. Only nearby pairs
+            are then checked, based on a KD-tree search.
+            The components are clipped from below at minus
+            the maximal minimal distance, and are
+            continuous in the turbine positions
         kwargs: dict, optional
             Additioal parameters for the base class
 
@@ -258,6 +271,7 @@ class MinDist(Constraint):
         )
         self.min_dist = problem.min_dist if min_dist is None else min_dist
         self.n_turbines = problem.n_turbines if n_turbines is None else n_turbines
+        self.n_worst = n_worst
 
     def initialize(self, verbosity=0):
         """
@@ -269,19 +283,12 @@ class MinDist(Constraint):
             The verbosity level, 0 = silent
 
         """
-        N = self.n_turbines
-        self._i2t = []  # i --> (ti, tj)
-        self._t2i = np.full([N, N], -1)  # (ti, tj) --> i
-        i = 0
-        for ti in range(N):
-            for tj in range(N):
-                if ti != tj and self._t2i[ti, tj] < 0:
-                    self._i2t.append([ti, tj])
-                    self._t2i[ti, tj] = i
-                    self._t2i[tj, ti] = i
-                    i += 1
-        self._i2t = np.array(self._i2t)
-        self._cnames = [f"{self.name}_{ti}_{tj}" for ti, tj in self._i2t]
+        if self.n_worst is not None:
+            self._i2t = None
+            self._cnames = [f"{self.name}_{i}" for i in range(self.n_worst)]
+        else:
+            self._i2t = np.stack(np.triu_indices(self.n_turbines, k=1), axis=-1)
+            self._cnames = [f"{self.name}_{ti}_{tj}" for ti, tj in self._i2t]
         super().initialize(verbosity)
 
     def n_components(self):
@@ -295,7 +302,7 @@ class MinDist(Constraint):
             The number of components.
 
         """
-        return len(self._i2t)
+        return self.n_worst if self._i2t is None else len(self._i2t)
 
     def calc_individual(self, vars_int, vars_float, problem_results, cmpnts=None):
         """
@@ -322,6 +329,9 @@ class MinDist(Constraint):
         """
         xy, __ = problem_results
 
+        if self._i2t is None:
+            return min_dist_worst(xy[None], self.min_dist, self.n_worst)[0]
+
         a = np.take_along_axis(xy, self._i2t[:, 0, None], axis=0)
         b = np.take_along_axis(xy, self._i2t[:, 1, None], axis=0)
         d = np.linalg.norm(a - b, axis=-1)
@@ -352,6 +362,9 @@ class MinDist(Constraint):
         """
         xy, __ = problem_results
 
+        if self._i2t is None:
+            return min_dist_worst(xy, self.min_dist, self.n_worst)
+
         a = np.take_along_axis(xy, self._i2t[None, :, 0, None], axis=1)
         b = np.take_along_axis(xy, self._i2t[None, :, 1, None], axis=1)
         d = np.linalg.norm(a - b, axis=-1)
@@ -765,9 +778,8 @@ class CMinDensity(Constraint):
 
         """
         xy, valid = problem_results
-        xy = xy[valid]
-        dists = cdist(self._probes, xy)
-        return np.nanmax(np.nanmin(dists, axis=1)) - self.min_value
+        dists = nearest_dists(xy[None, valid], self._probes)
+        return np.max(dists) - self.min_value
 
     def calc_population(self, vars_int, vars_float, problem_results, cmpnts=None):
         """
@@ -791,12 +803,8 @@ class CMinDensity(Constraint):
             The component values, shape: (n_pop, n_sel_components)
 
         """
-        n_pop = vars_float.shape[0]
         xy, valid = problem_results
-        out = np.full(n_pop, 1e20, dtype=FC.DTYPE)
-        for pi in range(n_pop):
-            if np.any(valid[pi]):
-                hxy = xy[pi][valid[pi]]
-                dists = cdist(self._probes, hxy)
-                out[pi] = np.nanmax(np.nanmin(dists, axis=1)) - self.min_value
+        dists = nearest_dists(xy, self._probes, valid)
+        out = np.max(dists, axis=1) - self.min_value
+        out[~np.any(valid, axis=1)] = 1e20
         return out[:, None]
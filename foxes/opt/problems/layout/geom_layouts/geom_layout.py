@@ -79,6 +79,7 @@ class GeomLayout(Problem):
             The verbosity level, 0 = silent
 
         """
+        self.boundary.initialize(verbosity)
         super().initialize(verbosity)
         self.apply_individual(self.initial_values_int(), self.initial_values_float())
 
@@ -77,6 +77,7 @@ class GeomLayoutGridded(Problem):
             The verbosity level, 0 = silent
 
         """
+        self.boundary.initialize(verbosity)
         super().initialize(verbosity)
 
         pmin = self.boundary.p_min()
@@ -79,6 +79,7 @@ class GeomRegGrid(Problem):
             The verbosity level, 0 = silent
 
         """
+        self.boundary.initialize(verbosity)
         super().initialize(verbosity)
 
         pmin = self.boundary.p_min()
@@ -93,6 +93,7 @@ class GeomRegGrids(Problem):
             The verbosity level, 0 = silent
 
         """
+        self.boundary.initialize(verbosity)
         super().initialize(verbosity)
 
         pmin = self.boundary.p_min()
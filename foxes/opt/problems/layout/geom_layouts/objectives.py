@@ -1,8 +1,7 @@
 import numpy as np
 from iwopy import Objective
-from scipy.spatial.distance import cdist
 
-import foxes.constants as FC
+from foxes.utils import nearest_dists
 
 
 class OMaxN(Objective):
@@ -480,9 +479,8 @@ class MaxDensity(Objective):
 
         """
         xy, valid = problem_results
-        xy = xy[valid]
-        dists = cdist(self._probes, xy)
-        return np.nanmax(np.nanmin(dists, axis=1))
+        dists = nearest_dists(xy[None, valid], self._probes)
+        return np.max(dists)
 
     def calc_population(self, vars_int, vars_float, problem_results, cmpnts=None):
         """
@@ -506,14 +504,10 @@ class MaxDensity(Objective):
             The component values, shape: (n_pop, n_sel_components)
 
         """
-        n_pop = vars_float.shape[0]
         xy, valid = problem_results
-        out = np.full(n_pop, 1e20, dtype=FC.DTYPE)
-        for pi in range(n_pop):
-            if np.any(valid[pi]):
-                hxy = xy[pi][valid[pi]]
-                dists = cdist(self._probes, hxy)
-                out[pi] = np.nanmax(np.nanmin(dists, axis=1))
+        dists = nearest_dists(xy, self._probes, valid)
+        out = np.max(dists, axis=1)
+        out[~np.any(valid, axis=1)] = 1e20
         return out[:, None]
 
 
@@ -608,18 +602,9 @@ class MeMiMaDist(Objective):
 
         """
         xy, valid = problem_results
-        # xy = xy[valid]
-
-        dists = cdist(xy, xy)
-        np.fill_diagonal(dists, np.inf)
-        dists = np.min(dists, axis=1) / self.scale / len(xy)
-
-        mean = np.average(dists)
-        mi = np.min(dists)
-        ma = np.max(dists)
-        return np.atleast_1d(
-            self.c1 * mean**2 - self.c2 * (mean - mi) ** 2 - self.c3 * (mean - ma) ** 2
-        )
+        return self.calc_population(
+            vars_int[None, :], vars_float[None, :], (xy[None, :], valid[None, :])
+        )[0]
 
     def calc_population(self, vars_int, vars_float, problem_results, cmpnts=None):
         """
@@ -644,23 +629,14 @@ class MeMiMaDist(Objective):
 
         """
         xy, valid = problem_results
-        n_pop, n_xy = xy.shape[:2]
-
-        out = np.zeros((n_pop, 1), dtype=FC.DTYPE)
-        for pi in range(n_pop):
-            hxy = xy[pi]  # , valid[pi]]
-
-            dists = cdist(hxy, hxy)
-            np.fill_diagonal(dists, np.inf)
-            dists = np.min(dists, axis=1) / self.scale / n_xy
-
-            mean = np.average(dists)
-            mi = np.min(dists)
-            ma = np.max(dists)
-            out[pi, 0] = (
-                self.c1 * mean**2
-                - self.c2 * (mean - mi) ** 2
-                - self.c3 * (mean - ma) ** 2
-            )
-
-        return out
+        n_xy = xy.shape[1]
+
+        dists = nearest_dists(xy) / self.scale / n_xy
+        mean = np.average(dists, axis=1)
+        mi = np.min(dists, axis=1)
+        ma = np.max(dists, axis=1)
+        out = (
+            self.c1 * mean**2 - self.c2 * (mean - mi) ** 2 - self.c3 * (mean - ma) ** 2
+        )
+
+        return out[:, None]
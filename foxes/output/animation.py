@@ -1,4 +1,16 @@
+import pickle
 import matplotlib.animation as animation
+import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+
+def _save_frame(fig_data, fname, dpi, savefig_pars):
+    """Helper function for rendering a pickled figure in a worker"""
+    fig = pickle.loads(fig_data)
+    fig.savefig(fname, dpi=dpi, **savefig_pars)
+    plt.close(fig)
+    return fname
 
 
 class Animator:
@@ -53,31 +65,12 @@ class Animator:
         """
         return self._gens
 
-    def animate(self, verbosity=1, **kwargs):
-        """
-        Create the animation
-
-        Parameters
-        ----------
-        verbostiy: int
-            The verbosity level, 0 = silent
-        kwargs: dict, optional
-            Arguments for pyplot.animation.ArtistAnimation
-
-        Returns
-        -------
-        ani: pyplot.animation.ArtistAnimation
-            The animation
-
-        """
-        if len(self.generators) == 0:
-            return None
-
+    def _gen_frames(self, verbosity):
+        """Helper generator for the artists of each frame"""
         if verbosity > 0:
             print("Creating animation data")
 
         si = 0
-        arts = []
         while True:
             if verbosity > 1:
                 print(f"  Frame {si}")
@@ -104,7 +97,7 @@ class Animator:
                     pass
 
             if len(harts):
-                arts.append(harts)
+                yield harts
                 si += 1
             else:
                 break
@@ -112,8 +105,126 @@ class Animator:
         if verbosity > 1:
             print("Done.")
 
+    def animate(self, verbosity=1, **kwargs):
+        """
+        Create the animation
+
+        Parameters
+        ----------
+        verbostiy: int
+            The verbosity level, 0 = silent
+        kwargs: dict, optional
+            Arguments for pyplot.animation.ArtistAnimation
+
+        Returns
+        -------
+        ani: pyplot.animation.ArtistAnimation
+            The animation
+
+        """
+        if len(self.generators) == 0:
+            return None
+
+        arts = list(self._gen_frames(verbosity))
+
         kwa = dict(interval=200, blit=True, repeat_delay=2000)
         kwa.update(kwargs)
-        ani = animation.ArtistAnimation(fig, arts, **kwa)
+        ani = animation.ArtistAnimation(self.fig, arts, **kwa)
 
         return ani
+
+    def save(
+        self,
+        fname,
+        writer=None,
+        fps=5,
+        dpi=None,
+        n_workers=None,
+        verbosity=1,
+        **kwargs,
+    ):
+        """
+        Renders the frames one after the other and
+        writes them to disk, without keeping the
+        artists of previous frames in memory.
+
+        Parameters
+        ----------
+        fname: str
+            The output file. For image sequences this is
+            a pattern for the frame counter, e.g.
+            'frame_{:04d}.png'
+        writer: str, optional
+            The name of the pyplot.animation writer for
+            video files, e.g. 'ffmpeg' or 'pillow', or
+            None for an image sequence
+        fps: int
+            The frames per second of video files
+        dpi: float, optional
+            The image resolution
+        n_workers: int, optional
+            The number of processes that render the
+            images of an image sequence, or None for
+            rendering in the main process
+        verbosity: int
+            The verbosity level, 0 = silent
+        kwargs: dict, optional
+            Arguments for the writer, or for
+            pyplot.Figure.savefig in case of an image
+            sequence
+
+        Returns
+        -------
+        n_frames: int
+            The number of written frames
+
+        """
+        if writer is not None and n_workers is not None:
+            raise ValueError(
+                f"Animator: Parameter 'n_workers' is only supported for image sequences, got writer '{writer}'"
+            )
+
+        n_frames = 0
+        with ExitStack() as stack:
+            if writer is not None:
+                wrt = animation.writers[writer](fps=fps, **kwargs)
+            elif n_workers is not None:
+                pool = stack.enter_context(ProcessPoolExecutor(n_workers))
+                futures = []
+
+            for artists in self._gen_frames(verbosity):
+                if writer is not None:
+                    if n_frames == 0:
+                        stack.enter_context(wrt.saving(self.fig, fname, dpi))
+                    wrt.grab_frame()
+                elif n_workers is None:
+                    self.fig.savefig(fname.format(n_frames), dpi=dpi, **kwargs)
+                else:
+                    # bound the number of pickled figures in flight:
+                    if len(futures) >= 2 * n_workers:
+                        futures.pop(0).result()
+                    futures.append(
+                        pool.submit(
+                            _save_frame,
+                            pickle.dumps(self.fig),
+                            fname.format(n_frames),
+                            dpi,
+                            kwargs,
+                        )
+                    )
+                n_frames += 1
+
+                for a in artists:
+                    try:
+                        a.remove()
+                    except NotImplementedError:
+                        a.set_visible(False)
+
+            if writer is None and n_workers is not None:
+                for f in futures:
+                    f.result()
+
+        if verbosity > 0:
+            print(f"Animator: Written {n_frames} frames to '{fname}'")
+
+        return n_frames
@@ -19,12 +19,14 @@ class FarmResultsEval(Output):
     ----------
     results: xarray.Dataset
         The farm results
+    chunk_size: int
+        The number of states per chunk in reductions
 
     :group: output
 
     """
 
-    def __init__(self, farm_results):
+    def __init__(self, farm_results, chunk_size=None):
         """
         Constructor.
 
@@ -32,9 +34,13 @@ class FarmResultsEval(Output):
         ----------
         farm_results: xarray.Dataset
             The farm results
+        chunk_size: int, optional
+            The number of states per chunk in reductions,
+            default: about one million values per chunk
 
         """
         self.results = farm_results
+        self.chunk_size = chunk_size
 
     def weinsum(self, rhs, *vars):
         """
@@ -89,6 +95,168 @@ class FarmResultsEval(Output):
 
         return np.einsum(expr, *fields)
 
+    def _get_chunks(self):
+        """Helper function for the state chunk bounds"""
+        n_states = self.results.sizes[FC.STATE]
+        if self.chunk_size is None:
+            n_turbines = self.results.sizes[FC.TURBINE]
+            chunk_size = max(2**20 // max(n_turbines, 1), 1)
+        else:
+            chunk_size = self.chunk_size
+        return [
+            (s0, min(s0 + chunk_size, n_states))
+            for s0 in range(0, n_states, chunk_size)
+        ]
+
+    def _get_chunk(self, v, s0, s1):
+        """Helper function for chunk data, without copies of numpy data"""
+        return np.asarray(self.results[v].data[s0:s1])
+
+    def reduce_fused(self, vars_ops, dim=FC.STATE):
+        """
+        Computes multiple reductions of multiple variables
+        in a single traversal of the farm results.
+
+        The data is processed in chunks of states, such
+        that no full copies of the fields are created.
+        Weighted means ignore states with NaN values and
+        re-normalise the weights accordingly.
+
+        Parameters
+        ----------
+        vars_ops: dict
+            The operations per variable. Key: str, the variable
+            name. Value: str or list of str, the operations,
+            choices are: sum, mean, min, max, std.
+        dim: str
+            The dimension to be reduced, either
+            FC.STATE or FC.TURBINE
+
+        Returns
+        -------
+        results: dict
+            The results, key: (variable, operation),
+            value: numpy.ndarray of shape (n_turbines,) for
+            states reduction, or (n_states,) for turbines
+            reduction
+
+        """
+        if dim not in [FC.STATE, FC.TURBINE]:
+            raise KeyError(
+                f"Unknown dimension '{dim}', choices: {FC.STATE}, {FC.TURBINE}"
+            )
+        vops = {}
+        for v, ops in vars_ops.items():
+            vops[v] = [ops] if isinstance(ops, str) else list(ops)
+            for op in vops[v]:
+                if op not in ["sum", "mean", "min", "max", "std"]:
+                    raise KeyError(
+                        f"Unknown operation '{op}' for variable '{v}'. Please choose: sum, mean, min, max, std"
+                    )
+        mvars = [v for v, ops in vops.items() if "mean" in ops]
+
+        n_states = self.results.sizes[FC.STATE]
+        n_turbines = self.results.sizes[FC.TURBINE]
+        chunks = self._get_chunks()
+
+        def _rows_mean(f, w, c, keep):
+            """Weighted sums over turbines, NaN for dropped states"""
+            if np.all(keep):
+                return np.einsum("st,st,t->s", f, w, c)
+            out = np.einsum("st,st,t->s", np.where(keep[:, None], f, 0), w, c)
+            out[~keep] = np.nan
+            return out
+
+        res = {}
+        acc = {}
+        if dim == FC.STATE:
+            ones = None
+        else:
+            ones = np.ones(n_turbines, dtype=FC.DTYPE)
+            for v, ops in vops.items():
+                for op in ops:
+                    res[(v, op)] = np.zeros(n_states, dtype=FC.DTYPE)
+        wsums = {v: np.zeros((2, n_turbines), dtype=FC.DTYPE) for v in mvars}
+
+        for s0, s1 in chunks:
+            w = self._get_chunk(FV.WEIGHT, s0, s1) if len(mvars) else None
+
+            for v, ops in vops.items():
+                f = self._get_chunk(v, s0, s1)
+
+                if "mean" in ops:
+                    keep = ~np.any(np.isnan(f), axis=1)
+                    wsums[v][0] += np.sum(w, axis=0)
+                    wsums[v][1] += np.sum(w[keep], axis=0)
+
+                for op in ops:
+                    k = (v, op)
+
+                    if dim == FC.TURBINE:
+                        if op == "mean":
+                            res[k][s0:s1] = _rows_mean(f, w, ones, keep)
+                        elif op == "std":
+                            res[k][s0:s1] = np.std(f, axis=1)
+                        else:
+                            res[k][s0:s1] = getattr(np, op)(f, axis=1)
+
+                    elif op == "mean":
+                        hf = f if np.all(keep) else np.where(keep[:, None], f, 0)
+                        fw = np.einsum("st,st->t", hf, w)
+                        acc[k] = fw if k not in acc else acc[k] + fw
+
+                    elif op == "std":
+                        # parallel variance algorithm by Chan et al.:
+                        n = s1 - s0
+                        mean = np.mean(f, axis=0)
+                        m2 = np.sum((f - mean[None, :]) ** 2, axis=0)
+                        if k not in acc:
+                            acc[k] = (n, mean, m2)
+                        else:
+                            na, meana, m2a = acc[k]
+                            delta = mean - meana
+                            nab = na + n
+                            acc[k] = (
+                                nab,
+                                meana + delta * n / nab,
+                                m2a + m2 + delta**2 * na * n / nab,
+                            )
+
+                    else:
+                        r = getattr(np, op)(f, axis=0)
+                        if k not in acc:
+                            acc[k] = r
+                        elif op == "sum":
+                            acc[k] += r
+                        elif op == "min":
+                            acc[k] = np.minimum(acc[k], r)
+                        else:
+                            acc[k] = np.maximum(acc[k], r)
+
+        # weight re-normalisation in case of NaN values:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wfac = {v: wsums[v][0] / wsums[v][1] for v in mvars}
+
+        if dim == FC.STATE:
+            for k, a in acc.items():
+                if k[1] == "mean":
+                    res[k] = a * wfac[k[0]]
+                elif k[1] == "std":
+                    res[k] = np.sqrt(a[2] / a[0])
+                else:
+                    res[k] = a
+
+        else:
+            for v in mvars:
+                if np.any(wsums[v][0] != wsums[v][1]):
+                    for s0, s1 in chunks:
+                        f = self._get_chunk(v, s0, s1)
+                        w = self._get_chunk(FV.WEIGHT, s0, s1)
+                        keep = ~np.any(np.isnan(f), axis=1)
+                        res[(v, "mean")][s0:s1] = _rows_mean(f, w, wfac[v], keep)
+
+        return res
+
     def reduce_states(self, vars_op):
         """
         Reduces the states dimension by some operation
@@ -108,26 +276,8 @@ class FarmResultsEval(Output):
         """
         n_turbines = self.results.sizes[FC.TURBINE]
 
-        rdata = {}
-        for v, op in vars_op.items():
-            if op == "mean":
-                rdata[v] = self.weinsum("t", v)
-            elif op == "sum":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.sum(vdata, axis=0)
-            elif op == "min":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.min(vdata, axis=0)
-            elif op == "max":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.max(vdata, axis=0)
-            elif op == "std":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.std(vdata, axis=0)
-            else:
-                raise KeyError(
-                    f"Unknown operation '{op}' for variable '{v}'. Please choose: sum, mean, min, max"
-                )
+        res = self.reduce_fused(vars_op, dim=FC.STATE)
+        rdata = {v: res[(v, op)] for v, op in vars_op.items()}
 
         data = pd.DataFrame(index=range(n_turbines), data=rdata)
         data.index.name = FC.TURBINE
@@ -153,23 +303,8 @@ class FarmResultsEval(Output):
         """
         states = self.results.coords[FC.STATE].to_numpy()
 
-        rdata = {}
-        for v, op in vars_op.items():
-            if op == "mean":
-                rdata[v] = self.weinsum("s", v)
-            elif op == "sum":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.sum(vdata, axis=1)
-            elif op == "min":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.min(vdata, axis=1)
-            elif op == "max":
-                vdata = self.results[v].to_numpy()
-                rdata[v] = np.max(vdata, axis=1)
-            else:
-                raise KeyError(
-                    f"Unknown operation '{op}' for variable '{v}'. Please choose: sum, mean, min, max"
-                )
+        res = self.reduce_fused(vars_op, dim=FC.TURBINE)
+        rdata = {v: res[(v, op)] for v, op in vars_op.items()}
 
         data = pd.DataFrame(index=states, data=rdata)
         data.index.name = FC.STATE
@@ -199,26 +334,26 @@ class FarmResultsEval(Output):
             The fully contracted results
 
         """
-        sdata = self.reduce_states(states_op)
+        vops = {v: [op] for v, op in states_op.items()}
+        wmean = [
+            v
+            for v, op in turbines_op.items()
+            if op == "mean" and states_op[v] != "mean"
+        ]
+        if len(wmean) and "sum" not in vops.get(FV.WEIGHT, []):
+            vops[FV.WEIGHT] = vops.get(FV.WEIGHT, []) + ["sum"]
+        sres = self.reduce_fused(vops, dim=FC.STATE)
 
         rdata = {}
         for v, op in turbines_op.items():
-            vdata = sdata[v].to_numpy()
+            vdata = sres[(v, states_op[v])]
             if op == "mean":
                 if states_op[v] == "mean":
-                    rdata[v] = self.weinsum("", v)
+                    rdata[v] = np.sum(vdata)
                 else:
-                    vdata = sdata[v].to_numpy()
-                    rdata[v] = self.weinsum("", vdata[None, :])
-            elif op == "sum":
-                vdata = sdata[v].to_numpy()
-                rdata[v] = np.sum(vdata)
-            elif op == "min":
-                vdata = sdata[v].to_numpy()
-                rdata[v] = np.min(vdata)
-            elif op == "max":
-                vdata = sdata[v].to_numpy()
-                rdata[v] = np.max(vdata)
+                    rdata[v] = np.sum(vdata * sres[(FV.WEIGHT, "sum")])
+            elif op in ["sum", "min", "max"]:
+                rdata[v] = getattr(np, op)(vdata)
             else:
                 raise KeyError(
                     f"Unknown operation '{op}' for variable '{v}'. Please choose: sum, mean, min, max"
@@ -551,9 +686,11 @@ class FarmResultsEval(Output):
             The farm efficiency
 
         """
-        P = self.calc_mean_farm_power()
-        P0 = self.calc_mean_farm_power(ambient=True) + 1e-14
-        return P / P0
+        vars = [FV.P, FV.AMB_P]
+        cdata = self.reduce_all(
+            states_op={v: "mean" for v in vars}, turbines_op={v: "sum" for v in vars}
+        )
+        return cdata[FV.P] / (cdata[FV.AMB_P] + 1e-14)
 
     def gen_stdata(
         self,
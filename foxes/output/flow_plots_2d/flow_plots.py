@@ -482,6 +482,7 @@ class FlowPlots2D(SliceData):
         ret_im=False,
         animated=False,
         rotor_color=None,
+        chunk_states=None,
         **kwargs,
     ):
         """
@@ -527,6 +528,10 @@ class FlowPlots2D(SliceData):
             Switch for usage for an animation
         rotor_color: str, optional
             Indicate the rotor orientation by a colored line
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other, while yielding the figures of the
+            previous chunk
         kwargs: dict, optional
             Additional parameters for SliceData.get_states_data_xy
 
@@ -546,89 +551,98 @@ class FlowPlots2D(SliceData):
         wdi = variables.index(FV.WD)
         wsi = variables.index(FV.WS)
 
-        data, states, gdata = self.get_states_data_xy(
+        out = self.get_states_data_xy(
             variables=variables,
             vmin={var: vmin} if vmin is not None else {},
             vmax={var: vmax} if vmax is not None else {},
             data_format="numpy",
             ret_states=True,
             ret_grid=True,
+            chunk_states=chunk_states,
             **kwargs,
         )
-        x_pos, y_pos, z_pos, __ = gdata
-
-        # define wind vector arrows:
-        qpars = dict(angles="xy", scale_units="xy", scale=0.05)
-        qpars.update(quiver_pars)
-        quiv = (
-            None
-            if quiver_n is None
-            else (
-                quiver_n,
-                qpars,
-                data[..., wdi],
-                data[..., wsi],
-            )
-        )
-
-        # loop over states:
-        for si, s in enumerate(states):
-            if animated and si > 0 and vmin is not None and vmax is not None:
-                add_bar = False
-            if not animated and title is None:
-                ttl = f"State {s}"
-                ttl += f", z =  {int(np.round(z_pos))} m"
-            elif callable(title):
-                ttl = title(si, s)
-            else:
-                ttl = title
-
-            # get data for show_turbines
-            if rotor_color is not None:
-                try:
-                    turb_angle = self.fres[FV.AMB_WD][si] + self.fres[FV.YAWM][si]
-                except KeyError:
-                    turb_angle = self.fres[FV.AMB_WD][si]
-
-                show_rotor_dict = {
-                    "color": rotor_color,
-                    "D": self.fres[FV.D][si],
-                    "H": self.fres[FV.H][si],
-                    "X": self.fres[FV.X][si],
-                    "Y": self.fres[FV.Y][si],
-                    "AMB_WD": self.fres[FV.AMB_WD][si],
-                    "turb_angle": turb_angle,
-                }
-            else:
-                show_rotor_dict = None
-
-            out = get_fig(
-                var=var,
-                fig=fig,
-                figsize=figsize,
-                ax=ax,
-                data=data[..., vi],
-                si=si,
-                s=s,
-                levels=levels,
-                x_pos=x_pos,
-                y_pos=y_pos,
-                cmap=cmap,
-                xlabel=xlabel,
-                ylabel=ylabel,
-                title=ttl,
-                add_bar=add_bar,
-                vlabel=vlabel,
-                vmin=vmin,
-                vmax=vmax,
-                quiv=quiv,
-                ret_state=ret_state,
-                ret_im=ret_im,
-                animated=animated,
-                show_rotor_dict=show_rotor_dict,
+        chunks = [out[:2]] if chunk_states is None else out[0]
+        x_pos, y_pos, z_pos, __ = out[-1]
+
+        # loop over chunks of states:
+        si = 0
+        for data, states in chunks:
+            # define wind vector arrows:
+            qpars = dict(angles="xy", scale_units="xy", scale=0.05)
+            qpars.update(quiver_pars)
+            quiv = (
+                None
+                if quiver_n is None
+                else (
+                    quiver_n,
+                    qpars,
+                    data[..., wdi],
+                    data[..., wsi],
+                )
             )
 
-            yield out
+            # loop over states:
+            for ci, s in enumerate(states):
+                if animated and si > 0 and vmin is not None and vmax is not None:
+                    add_bar = False
+                if not animated and title is None:
+                    ttl = f"State {s}"
+                    ttl += f", z =  {int(np.round(z_pos))} m"
+                elif callable(title):
+                    ttl = title(si, s)
+                else:
+                    ttl = title
+
+                # get data for show_turbines
+                if rotor_color is not None:
+                    try:
+                        turb_angle = self.fres[FV.AMB_WD][si] + self.fres[FV.YAWM][si]
+                    except KeyError:
+                        turb_angle = self.fres[FV.AMB_WD][si]
+
+                    show_rotor_dict = {
+                        "color": rotor_color,
+                        "D": self.fres[FV.D][si],
+                        "H": self.fres[FV.H][si],
+                        "X": self.fres[FV.X][si],
+                        "Y": self.fres[FV.Y][si],
+                        "AMB_WD": self.fres[FV.AMB_WD][si],
+                        "turb_angle": turb_angle,
+                    }
+                else:
+                    show_rotor_dict = None
+
+                out = get_fig(
+                    var=var,
+                    fig=fig,
+                    figsize=figsize,
+                    ax=ax,
+                    data=data[..., vi],
+                    si=ci,
+                    s=s,
+                    levels=levels,
+                    x_pos=x_pos,
+                    y_pos=y_pos,
+                    cmap=cmap,
+                    xlabel=xlabel,
+                    ylabel=ylabel,
+                    title=ttl,
+                    add_bar=add_bar,
+                    vlabel=vlabel,
+                    vmin=vmin,
+                    vmax=vmax,
+                    quiv=quiv,
+                    ret_state=ret_state,
+                    ret_im=ret_im,
+                    animated=animated,
+                    show_rotor_dict=show_rotor_dict,
+                )
+
+                if ret_state:
+                    out = (out[0], si) + out[2:]
+
+                yield out
+                si += 1
 
     def gen_states_fig_xz(
         self,
@@ -652,6 +666,7 @@ class FlowPlots2D(SliceData):
         ret_im=False,
         animated=False,
         rotor_color=None,
+        chunk_states=None,
         **kwargs,
     ):
         """
@@ -699,6 +714,10 @@ class FlowPlots2D(SliceData):
             Switch for usage for an animation
         rotor_color: str, optional
             Indicate the rotor orientation by a colored line
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other, while yielding the figures of the
+            previous chunk
         kwargs: dict, optional
             Additional parameters for SliceData.get_states_data_xz
 
@@ -718,90 +737,99 @@ class FlowPlots2D(SliceData):
         wdi = variables.index(FV.WD)
         wsi = variables.index(FV.WS)
 
-        data, states, gdata = self.get_states_data_xz(
+        out = self.get_states_data_xz(
             variables=variables,
             vmin={var: vmin} if vmin is not None else {},
             vmax={var: vmax} if vmax is not None else {},
             data_format="numpy",
             ret_states=True,
             ret_grid=True,
+            chunk_states=chunk_states,
             **kwargs,
         )
-        x_pos, y_pos, z_pos, __ = gdata
-
-        # define wind vector arrows:
-        qpars = dict(angles="xy", scale_units="xy", scale=0.05)
-        qpars.update(quiver_pars)
-        quiv = (
-            None
-            if quiver_n is None
-            else (
-                quiver_n,
-                qpars,
-                data[..., wdi],
-                data[..., wsi],
-            )
-        )
-
-        # loop over states:
-        for si, s in enumerate(states):
-            if animated and si > 0 and vmin is not None and vmax is not None:
-                add_bar = False
-            if not animated and title is None:
-                ttl = f"State {s}"
-                ttl += f", x direction = {x_direction}°"
-                ttl += f", y =  {int(np.round(y_pos))} m"
-            elif callable(title):
-                ttl = title(si, s)
-            else:
-                ttl = title
-
-            # get data for show_turbines
-            if rotor_color is not None:
-                try:
-                    turb_angle = self.fres[FV.AMB_WD][si] + self.fres[FV.YAWM][si]
-                except KeyError:
-                    turb_angle = self.fres[FV.AMB_WD][si]
-
-                show_rotor_dict = {
-                    "color": rotor_color,
-                    "D": self.fres[FV.D][si],
-                    "H": self.fres[FV.H][si],
-                    "X": self.fres[FV.X][si],
-                    "Y": self.fres[FV.Y][si],
-                    "AMB_WD": self.fres[FV.AMB_WD][si],
-                    "turb_angle": turb_angle,
-                }
-            else:
-                show_rotor_dict = None
-
-            out = get_fig(
-                var=var,
-                fig=fig,
-                figsize=figsize,
-                ax=ax,
-                data=data[..., vi],
-                si=si,
-                s=s,
-                levels=levels,
-                x_pos=x_pos,
-                y_pos=z_pos,
-                cmap=cmap,
-                xlabel=xlabel,
-                ylabel=zlabel,
-                title=ttl,
-                add_bar=add_bar,
-                vlabel=vlabel,
-                quiv=quiv,
-                vmin=vmin,
-                vmax=vmax,
-                ret_state=ret_state,
-                ret_im=ret_im,
-                animated=animated,
-                show_rotor_dict=show_rotor_dict,
+        chunks = [out[:2]] if chunk_states is None else out[0]
+        x_pos, y_pos, z_pos, __ = out[-1]
+
+        # loop over chunks of states:
+        si = 0
+        for data, states in chunks:
+            # define wind vector arrows:
+            qpars = dict(angles="xy", scale_units="xy", scale=0.05)
+            qpars.update(quiver_pars)
+            quiv = (
+                None
+                if quiver_n is None
+                else (
+                    quiver_n,
+                    qpars,
+                    data[..., wdi],
+                    data[..., wsi],
+                )
             )
 
-            yield out
+            # loop over states:
+            for ci, s in enumerate(states):
+                if animated and si > 0 and vmin is not None and vmax is not None:
+                    add_bar = False
+                if not animated and title is None:
+                    ttl = f"State {s}"
+                    ttl += f", x direction = {x_direction}°"
+                    ttl += f", y =  {int(np.round(y_pos))} m"
+                elif callable(title):
+                    ttl = title(si, s)
+                else:
+                    ttl = title
+
+                # get data for show_turbines
+                if rotor_color is not None:
+                    try:
+                        turb_angle = self.fres[FV.AMB_WD][si] + self.fres[FV.YAWM][si]
+                    except KeyError:
+                        turb_angle = self.fres[FV.AMB_WD][si]
+
+                    show_rotor_dict = {
+                        "color": rotor_color,
+                        "D": self.fres[FV.D][si],
+                        "H": self.fres[FV.H][si],
+                        "X": self.fres[FV.X][si],
+                        "Y": self.fres[FV.Y][si],
+                        "AMB_WD": self.fres[FV.AMB_WD][si],
+                        "turb_angle": turb_angle,
+                    }
+                else:
+                    show_rotor_dict = None
+
+                out = get_fig(
+                    var=var,
+                    fig=fig,
+                    figsize=figsize,
+                    ax=ax,
+                    data=data[..., vi],
+                    si=ci,
+                    s=s,
+                    levels=levels,
+                    x_pos=x_pos,
+                    y_pos=z_pos,
+                    cmap=cmap,
+                    xlabel=xlabel,
+                    ylabel=zlabel,
+                    title=ttl,
+                    add_bar=add_bar,
+                    vlabel=vlabel,
+                    quiv=quiv,
+                    vmin=vmin,
+                    vmax=vmax,
+                    ret_state=ret_state,
+                    ret_im=ret_im,
+                    animated=animated,
+                    show_rotor_dict=show_rotor_dict,
+                )
+
+                if ret_state:
+                    out = (out[0], si) + out[2:]
+
+                yield out
+                si += 1
 
     def gen_states_fig_yz(
         self,
@@ -825,6 +853,7 @@ class FlowPlots2D(SliceData):
         ret_im=False,
         animated=False,
         rotor_color=None,
+        chunk_states=None,
         **kwargs,
     ):
         """
@@ -872,6 +901,10 @@ class FlowPlots2D(SliceData):
             Switch for usage for an animation
         rotor_color: str, optional
             Indicate the rotor orientation by a colored line
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other, while yielding the figures of the
+            previous chunk
         kwargs: dict, optional
             Additional parameters for SliceData.get_states_data_yz
 
@@ -891,88 +924,97 @@ class FlowPlots2D(SliceData):
         wdi = variables.index(FV.WD)
         wsi = variables.index(FV.WS)
 
-        data, states, gdata = self.get_states_data_yz(
+        out = self.get_states_data_yz(
             variables=variables,
             vmin={var: vmin} if vmin is not None else {},
             vmax={var: vmax} if vmax is not None else {},
             data_format="numpy",
             ret_states=True,
             ret_grid=True,
+            chunk_states=chunk_states,
             **kwargs,
         )
-        x_pos, y_pos, z_pos, __ = gdata
-
-        # define wind vector arrows:
-        qpars = dict(angles="xy", scale_units="xy", scale=0.05)
-        qpars.update(quiver_pars)
-        quiv = (
-            None
-            if quiver_n is None
-            else (
-                quiver_n,
-                qpars,
-                data[..., wdi],
-                data[..., wsi],
-            )
-        )
-
-        # loop over states:
-        for si, s in enumerate(states):
-            if animated and si > 0 and vmin is not None and vmax is not None:
-                add_bar = False
-            if not animated and title is None:
-                ttl = f"State {s}" if title is None else title
-                ttl += f", x direction = {x_direction}°"
-                ttl += f", x =  {int(np.round(x_pos))} m"
-            elif callable(title):
-                ttl = title(si, s)
-            else:
-                ttl = title
-
-            # get data for show_turbines
-            if rotor_color is not None:
-                try:
-                    turb_angle = self.fres[FV.AMB_WD][si] + self.fres[FV.YAWM][si]
-                except KeyError:
-                    turb_angle = self.fres[FV.AMB_WD][si]
-
-                show_rotor_dict = {
-                    "color": rotor_color,
-                    "D": self.fres[FV.D][si],
-                    "H": self.fres[FV.H][si],
-                    "X": self.fres[FV.X][si],
-                    "Y": self.fres[FV.Y][si],
-                    "AMB_WD": self.fres[FV.AMB_WD][si],
-                    "turb_angle": turb_angle,
-                }
-            else:
-                show_rotor_dict = None
-
-            out = get_fig(
-                var=var,
-                fig=fig,
-                figsize=figsize,
-                ax=ax,
-                data=data[..., vi],
-                si=si,
-                s=s,
-                levels=levels,
-                x_pos=y_pos,
-                y_pos=z_pos,
-                cmap=cmap,
-                xlabel=ylabel,
-                ylabel=zlabel,
-                title=ttl,
-                add_bar=add_bar,
-                vlabel=vlabel,
-                vmin=vmin,
-                vmax=vmax,
-                quiv=quiv,
-                ret_state=ret_state,
-                ret_im=ret_im,
-                invert_axis="x",
-                animated=animated,
-                show_rotor_dict=show_rotor_dict,
+        chunks = [out[:2]] if chunk_states is None else out[0]
+        x_pos, y_pos, z_pos, __ = out[-1]
+
+        # loop over chunks of states:
+        si = 0
+        for data, states in chunks:
+            # define wind vector arrows:
+            qpars = dict(angles="xy", scale_units="xy", scale=0.05)
+            qpars.update(quiver_pars)
+            quiv = (
+                None
+                if quiver_n is None
+                else (
+                    quiver_n,
+                    qpars,
+                    data[..., wdi],
+                    data[..., wsi],
+                )
             )
 
-            yield out
+            # loop over states:
+            for ci, s in enumerate(states):
+                if animated and si > 0 and vmin is not None and vmax is not None:
+                    add_bar = False
+                if not animated and title is None:
+                    ttl = f"State {s}" if title is None else title
+                    ttl += f", x direction = {x_direction}°"
+                    ttl += f", x =  {int(np.round(x_pos))} m"
+                elif callable(title):
+                    ttl = title(si, s)
+                else:
+                    ttl = title
+
+                # get data for show_turbines
+                if rotor_color is not None:
+                    try:
+                        turb_angle = self.fres[FV.AMB_WD][si] + self.fres[FV.YAWM][si]
+                    except KeyError:
+                        turb_angle = self.fres[FV.AMB_WD][si]
+
+                    show_rotor_dict = {
+                        "color": rotor_color,
+                        "D": self.fres[FV.D][si],
+                        "H": self.fres[FV.H][si],
+                        "X": self.fres[FV.X][si],
+                        "Y": self.fres[FV.Y][si],
+                        "AMB_WD": self.fres[FV.AMB_WD][si],
+                        "turb_angle": turb_angle,
+                    }
+                else:
+                    show_rotor_dict = None
+
+                out = get_fig(
+                    var=var,
+                    fig=fig,
+                    figsize=figsize,
+                    ax=ax,
+                    data=data[..., vi],
+                    si=ci,
+                    s=s,
+                    levels=levels,
+                    x_pos=y_pos,
+                    y_pos=z_pos,
+                    cmap=cmap,
+                    xlabel=ylabel,
+                    ylabel=zlabel,
+                    title=ttl,
+                    add_bar=add_bar,
+                    vlabel=vlabel,
+                    vmin=vmin,
+                    vmax=vmax,
+                    quiv=quiv,
+                    ret_state=ret_state,
+                    ret_im=ret_im,
+                    invert_axis="x",
+                    animated=animated,
+                    show_rotor_dict=show_rotor_dict,
+                )
+
+                if ret_state:
+                    out = (out[0], si) + out[2:]
+
+                yield out
+                si += 1
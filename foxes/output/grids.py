@@ -100,7 +100,8 @@ def get_grid_xy(
     z_pos: float
         The z position of the grid
     g_pts: numpy.ndarray
-        The grid points, shape: (n_states, n_pts, 3)
+        The grid points, shape: (n_states, n_pts, 3),
+        as read-only view of the same points for all states
 
     """
 
@@ -134,10 +135,10 @@ def get_grid_xy(
     N_x, N_y = len(x_pos), len(y_pos)
     n_pts = len(x_pos) * len(y_pos)
     z_pos = 0.5 * (z_min + z_max)
-    g_pts = np.zeros((n_states, N_x, N_y, 3), dtype=FC.DTYPE)
-    g_pts[:, :, :, 0] = x_pos[None, :, None]
-    g_pts[:, :, :, 1] = y_pos[None, None, :]
-    g_pts[:, :, :, 2] = z_pos
+    g_pts = np.zeros((N_x, N_y, 3), dtype=FC.DTYPE)
+    g_pts[:, :, 0] = x_pos[:, None]
+    g_pts[:, :, 1] = y_pos[None, :]
+    g_pts[:, :, 2] = z_pos
 
     if verbosity > 1:
         print("\nFlowPlots2D plot grid:")
@@ -152,7 +153,7 @@ def get_grid_xy(
         x_pos,
         y_pos,
         z_pos,
-        g_pts.reshape(n_states, n_pts, 3),
+        np.broadcast_to(g_pts.reshape(1, n_pts, 3), (n_states, n_pts, 3)),
     )
 
 
@@ -207,7 +208,8 @@ def get_grid_xz(
     z_pos: numpy.ndarray
         The z grid positions, shape: (n_z,)
     g_pts: numpy.ndarray
-        The grid points, shape: (n_states, n_pts, 3)
+        The grid points, shape: (n_states, n_pts, 3),
+        as read-only view of the same points for all states
 
     """
 
@@ -255,10 +257,10 @@ def get_grid_xz(
     N_x, N_z = len(x_pos), len(z_pos)
     n_pts = len(x_pos) * len(z_pos)
     y_pos = 0.5 * (y_min + y_max)
-    g_pts = np.zeros((n_states, N_x, N_z, 3), dtype=FC.DTYPE)
-    g_pts[:] += x_pos[None, :, None, None] * n_x[None, None, None, :]
-    g_pts[:] += y_pos * n_y[None, None, None, :]
-    g_pts[:] += z_pos[None, None, :, None] * n_z[None, None, None, :]
+    g_pts = np.zeros((N_x, N_z, 3), dtype=FC.DTYPE)
+    g_pts[:] += x_pos[:, None, None] * n_x[None, None, :]
+    g_pts[:] += y_pos * n_y[None, None, :]
+    g_pts[:] += z_pos[None, :, None] * n_z[None, None, :]
 
     if verbosity > 1:
         print("\nFlowPlots2D plot grid:")
@@ -273,7 +275,7 @@ def get_grid_xz(
         x_pos,
         y_pos,
         z_pos,
-        g_pts.reshape(n_states, n_pts, 3),
+        np.broadcast_to(g_pts.reshape(1, n_pts, 3), (n_states, n_pts, 3)),
     )
 
 
@@ -328,7 +330,8 @@ def get_grid_yz(
     z_pos: numpy.ndarray
         The z grid positions, shape: (n_z,)
     g_pts: numpy.ndarray
-        The grid points, shape: (n_states, n_pts, 3)
+        The grid points, shape: (n_states, n_pts, 3),
+        as read-only view of the same points for all states
 
     """
 
@@ -376,10 +379,10 @@ def get_grid_yz(
     N_y, N_z = len(y_pos), len(z_pos)
     n_pts = len(y_pos) * len(z_pos)
     x_pos = 0.5 * (x_min + x_max)
-    g_pts = np.zeros((n_states, N_y, N_z, 3), dtype=FC.DTYPE)
-    g_pts[:] += x_pos * n_x[None, None, None, :]
-    g_pts[:] += y_pos[None, :, None, None] * n_y[None, None, None, :]
-    g_pts[:] += z_pos[None, None, :, None] * n_z[None, None, None, :]
+    g_pts = np.zeros((N_y, N_z, 3), dtype=FC.DTYPE)
+    g_pts[:] += x_pos * n_x[None, None, :]
+    g_pts[:] += y_pos[:, None, None] * n_y[None, None, :]
+    g_pts[:] += z_pos[None, :, None] * n_z[None, None, :]
 
     if verbosity > 1:
         print("\nFlowPlots2D plot grid:")
@@ -394,7 +397,7 @@ def get_grid_yz(
         x_pos,
         y_pos,
         z_pos,
-        g_pts.reshape(n_states, n_pts, 3),
+        np.broadcast_to(g_pts.reshape(1, n_pts, 3), (n_states, n_pts, 3)),
     )
 
 
@@ -101,6 +101,20 @@ class SliceData(Output):
                     f"Unknown data format '{format}', choices: numpy, pandas, xarray"
                 )
 
+    def _get_sinds(self, states_sel, states_isel):
+        """Helper function that translates states selections into indices"""
+        sinds = np.arange(self.fres.sizes[FC.STATE])
+        if states_sel is not None:
+            sinds = self.fres.indexes[FC.STATE].get_indexer(states_sel)
+            if np.any(sinds < 0):
+                missing = list(np.asarray(states_sel)[sinds < 0])
+                raise KeyError(
+                    f"{type(self).__name__}: States {missing} not found in farm results"
+                )
+        if states_isel is not None:
+            sinds = sinds[states_isel]
+        return sinds
+
     def _calc_mean_data(
         self,
         ori,
@@ -120,6 +134,8 @@ class SliceData(Output):
         states_sel,
         states_isel,
         weight_turbine,
+        chunk_states,
+        add_std,
         to_file,
         write_pars,
         ret_states,
@@ -127,30 +143,63 @@ class SliceData(Output):
         **kwargs,
     ):
         """Helper function for mean data calculation"""
-        # calculate point results:
-        point_results = grids.calc_point_results(
-            algo=self.algo,
-            farm_results=self.fres,
-            g_pts=g_pts,
-            sel={FC.STATE: states_sel} if states_sel is not None else None,
-            isel={FC.STATE: states_isel} if states_isel is not None else None,
-            verbosity=verbosity,
-            **kwargs,
-        )
-        states = point_results[FC.STATE].to_numpy()
-        if variables is None:
-            variables = list(point_results.data_vars.keys())
-        else:
-            point_results.drop_vars(variables)
+        # prepare states selection:
+        weights = self.fres[FV.WEIGHT][:, weight_turbine].to_numpy()
+        n_states = len(weights)
+        sinds = self._get_sinds(states_sel, states_isel)
+        n_chunk = len(sinds) if chunk_states is None else chunk_states
+        chunks = [sinds[i : i + n_chunk] for i in range(0, len(sinds), n_chunk)]
+
+        # accumulate weighted sums over chunks of states:
+        states = []
+        data = {}
+        wsum = 0
+        m2 = {}
+        max_size = 0
+        for ci, cinds in enumerate(chunks):
+            pars = dict(kwargs)
+            if ci < len(chunks) - 1:
+                pars["finalize"] = False
+            point_results = grids.calc_point_results(
+                algo=self.algo,
+                farm_results=self.fres,
+                g_pts=g_pts,
+                isel={FC.STATE: cinds} if len(cinds) < n_states else None,
+                verbosity=verbosity,
+                **pars,
+            )
+            states.append(point_results[FC.STATE].to_numpy())
+            if variables is None:
+                variables = list(point_results.data_vars.keys())
+            max_size = max(
+                max_size, point_results.nbytes + len(cinds) * g_pts[0].nbytes
+            )
+
+            w = weights[cinds]
+            wc = np.sum(w)
+            for v in variables:
+                d = point_results[v].to_numpy()
+                dsum = np.einsum("s,sp->p", w, d)
+                if add_std and wc > 0:
+                    mc = dsum / wc
+                    m2c = np.einsum("s,sp->p", w, (d - mc[None, :]) ** 2)
+                    if v not in m2:
+                        m2[v] = m2c
+                    else:
+                        delta = mc - data[v] / wsum
+                        m2[v] += m2c + delta**2 * wsum * wc / (wsum + wc)
+                data[v] = dsum if v not in data else data[v] + dsum
+            wsum += wc
+            del point_results
+        states = np.concatenate(states)
+        for v in data:
+            data[v] /= wsum
         del g_pts
 
-        # take mean over states:
-        weights = self.fres[FV.WEIGHT][:, weight_turbine].to_numpy()
-        data = {
-            v: np.einsum("s,sp->p", weights, point_results[v].to_numpy())
-            for v in variables
-        }
-        del point_results
+        if verbosity > 0:
+            print(
+                f"{type(self).__name__}: Mean over {len(states)} states in {len(chunks)} chunks, max chunk data size {max_size/1024**2:.1f} MB"
+            )
 
         # apply data modification:
         a_pos, b_pos, c_pos, data = self._data_mod(
@@ -166,6 +215,11 @@ class SliceData(Output):
             vmax,
         )
 
+        # add standard deviations:
+        for v, m in m2.items():
+            std = np.sqrt(m / wsum)
+            data[f"{v}_std"] = std / normalize_v[v] if v in normalize_v else std
+
         # translate to selected format:
         if data_format == "numpy":
             data = grids.np2np_p(data, a_pos, b_pos)
@@ -205,6 +259,8 @@ class SliceData(Output):
         states_sel=None,
         states_isel=None,
         weight_turbine=0,
+        chunk_states=None,
+        add_std=False,
         to_file=None,
         write_pars={},
         ret_states=False,
@@ -257,6 +313,12 @@ class SliceData(Output):
             Reduce to the selected states indices
         weight_turbine: int, optional
             Index of the turbine from which to take the weight
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other, accumulating the mean on the fly
+        add_std: bool
+            Add the standard deviations over states as
+            variables '<var>_std'
         to_file: str, optional
             Write data to this file name
         write_pars: dict
@@ -300,6 +362,8 @@ class SliceData(Output):
             states_sel,
             states_isel,
             weight_turbine,
+            chunk_states,
+            add_std,
             to_file,
             write_pars,
             ret_states,
@@ -335,6 +399,8 @@ class SliceData(Output):
         states_sel=None,
         states_isel=None,
         weight_turbine=0,
+        chunk_states=None,
+        add_std=False,
         to_file=None,
         write_pars={},
         ret_states=False,
@@ -389,6 +455,12 @@ class SliceData(Output):
             Reduce to the selected states indices
         weight_turbine: int, optional
             Index of the turbine from which to take the weight
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other, accumulating the mean on the fly
+        add_std: bool
+            Add the standard deviations over states as
+            variables '<var>_std'
         to_file: str, optional
             Write data to this file name
         write_pars: dict
@@ -443,6 +515,8 @@ class SliceData(Output):
             states_sel,
             states_isel,
             weight_turbine,
+            chunk_states,
+            add_std,
             to_file,
             write_pars,
             ret_states,
@@ -478,6 +552,8 @@ class SliceData(Output):
         states_sel=None,
         states_isel=None,
         weight_turbine=0,
+        chunk_states=None,
+        add_std=False,
         to_file=None,
         write_pars={},
         ret_states=False,
@@ -532,6 +608,12 @@ class SliceData(Output):
             Reduce to the selected states indices
         weight_turbine: int, optional
             Index of the turbine from which to take the weight
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other, accumulating the mean on the fly
+        add_std: bool
+            Add the standard deviations over states as
+            variables '<var>_std'
         to_file: str, optional
             Write data to this file name
         write_pars: dict
@@ -586,6 +668,8 @@ class SliceData(Output):
             states_sel,
             states_isel,
             weight_turbine,
+            chunk_states,
+            add_std,
             to_file,
             write_pars,
             ret_states,
@@ -616,6 +700,7 @@ class SliceData(Output):
         vmax,
         states_sel,
         states_isel,
+        chunk_states,
         to_file,
         write_pars,
         ret_states,
@@ -623,59 +708,112 @@ class SliceData(Output):
         **kwargs,
     ):
         """Helper function for states data calculation"""
-        # calculate point results:
-        if states_sel is not None:
-            kwargs["sel"] = {FC.STATE: states_sel}
-        if states_isel is not None:
-            kwargs["isel"] = {FC.STATE: states_isel}
-        point_results = grids.calc_point_results(
-            algo=self.algo,
-            farm_results=self.fres,
-            g_pts=g_pts,
-            verbosity=verbosity,
-            **kwargs,
-        )
-        states = point_results[FC.STATE].to_numpy()
-        if variables is None:
-            variables = list(point_results.data_vars.keys())
-        else:
-            point_results.drop_vars(variables)
-        del g_pts
-
-        # convert to numpy:
-        data = {v: point_results[v].to_numpy() for v in variables}
-        del point_results
+        if chunk_states is not None and to_file is not None:
+            raise ValueError(
+                f"{type(self).__name__}: Parameter 'to_file' is not supported for chunk_states = {chunk_states}"
+            )
 
-        # apply data modification:
-        a_pos, b_pos, c_pos, data = self._data_mod(
+        # apply position modification:
+        a_pos, b_pos, c_pos, __ = self._data_mod(
             a_pos,
             b_pos,
             c_pos,
-            data,
+            {},
             normalize_a,
             normalize_b,
             normalize_c,
-            normalize_v,
-            vmin,
-            vmax,
+            {},
+            {},
+            {},
         )
 
-        # translate to selected format:
-        if data_format == "numpy":
-            data = grids.np2np_sp(data, states, a_pos, b_pos)
-            self._write(data_format, data, to_file, verbosity, **write_pars)
-        elif data_format == "pandas":
-            data = grids.np2pd_sp(data, states, a_pos, b_pos, ori, label_map)
-            self._write(data_format, data, to_file, verbosity, **write_pars)
-        elif data_format == "xarray":
-            data = grids.np2xr_sp(data, states, a_pos, b_pos, c_pos, ori, label_map)
-            self._write(data_format, data, to_file, verbosity, **write_pars)
-        else:
-            raise ValueError(
-                f"Unknown data format '{data_format}', choices: numpy, pandas, xarray"
+        def _calc(variables, **pars):
+            """Helper function for the data of a selection of states"""
+            # calculate point results:
+            point_results = grids.calc_point_results(
+                algo=self.algo,
+                farm_results=self.fres,
+                g_pts=g_pts,
+                verbosity=verbosity,
+                **pars,
             )
+            states = point_results[FC.STATE].to_numpy()
+            if variables is None:
+                variables = list(point_results.data_vars.keys())
+            else:
+                point_results.drop_vars(variables)
 
-        return (data, states) if ret_states else data
+            # convert to numpy:
+            data = {v: point_results[v].to_numpy() for v in variables}
+            del point_results
+
+            # apply data modification:
+            __, __, __, data = self._data_mod(
+                a_pos,
+                b_pos,
+                c_pos,
+                data,
+                None,
+                None,
+                None,
+                normalize_v,
+                vmin,
+                vmax,
+            )
+
+            # translate to selected format:
+            if data_format == "numpy":
+                data = grids.np2np_sp(data, states, a_pos, b_pos)
+                self._write(data_format, data, to_file, verbosity, **write_pars)
+            elif data_format == "pandas":
+                data = grids.np2pd_sp(data, states, a_pos, b_pos, ori, label_map)
+                self._write(data_format, data, to_file, verbosity, **write_pars)
+            elif data_format == "xarray":
+                data = grids.np2xr_sp(data, states, a_pos, b_pos, c_pos, ori, label_map)
+                self._write(data_format, data, to_file, verbosity, **write_pars)
+            else:
+                raise ValueError(
+                    f"Unknown data format '{data_format}', choices: numpy, pandas, xarray"
+                )
+
+            return (data, states) if ret_states else data
+
+        if chunk_states is None:
+            if states_sel is not None:
+                kwargs["sel"] = {FC.STATE: states_sel}
+            if states_isel is not None:
+                kwargs["isel"] = {FC.STATE: states_isel}
+            return _calc(variables, **kwargs)
+
+        # prepare states selection:
+        sinds = self._get_sinds(states_sel, states_isel)
+        chunks = [
+            sinds[i : i + chunk_states] for i in range(0, len(sinds), chunk_states)
+        ]
+
+        def _gen():
+            """Helper generator over chunks of states"""
+            finalize = kwargs.get("finalize", True)
+            done = False
+            try:
+                for ci, cinds in enumerate(chunks):
+                    if verbosity > 0:
+                        print(
+                            f"{type(self).__name__}: Chunk {ci+1} of {len(chunks)}, {len(cinds)} states"
+                        )
+                    pars = dict(kwargs)
+                    if ci < len(chunks) - 1:
+                        pars["finalize"] = False
+                    results = _calc(variables, isel={FC.STATE: cinds}, **pars)
+                    done = ci == len(chunks) - 1
+                    yield results
+
+            # finalize if stopped early, e.g. by break or exception:
+            finally:
+                if finalize and not done and self.algo.initialized:
+                    self.algo.finalize()
+
+        return _gen()
 
     def get_states_data_xy(
         self,
@@ -698,6 +836,7 @@ class SliceData(Output):
         vmax={},
         states_sel=None,
         states_isel=None,
+        chunk_states=None,
         to_file=None,
         write_pars={},
         ret_states=False,
@@ -748,6 +887,11 @@ class SliceData(Output):
             Reduce to selected states
         states_isel: list, optional
             Reduce to the selected states indices
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other. If given, a generator is returned that
+            yields the data of each chunk, or tuples (data, states)
+            if ret_states is True
         to_file: str, optional
             Write data to this file name
         write_pars: dict
@@ -764,8 +908,9 @@ class SliceData(Output):
 
         Returns
         -------
-        data: dict or pandas.DataFrame or xarray.Dataset
-            The gridded data
+        data: dict or pandas.DataFrame or xarray.Dataset or Generator
+            The gridded data, or a generator over the data
+            of chunks of states
         states: numpy.ndarray, optional
             The states indices
         grid_data: tuple, optional
@@ -790,6 +935,7 @@ class SliceData(Output):
             vmax,
             states_sel,
             states_isel,
+            chunk_states,
             to_file,
             write_pars,
             ret_states,
@@ -798,7 +944,7 @@ class SliceData(Output):
         )
 
         if ret_grid:
-            out = list(data) if ret_states else [data]
+            out = list(data) if ret_states and chunk_states is None else [data]
             return tuple(out + [gdata])
         return data
 
@@ -824,6 +970,7 @@ class SliceData(Output):
         vmax={},
         states_sel=None,
         states_isel=None,
+        chunk_states=None,
         to_file=None,
         write_pars={},
         ret_states=False,
@@ -876,6 +1023,11 @@ class SliceData(Output):
             Reduce to selected states
         states_isel: list, optional
             Reduce to the selected states indices
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other. If given, a generator is returned that
+            yields the data of each chunk, or tuples (data, states)
+            if ret_states is True
         to_file: str, optional
             Write data to this file name
         write_pars: dict
@@ -892,8 +1044,9 @@ class SliceData(Output):
 
         Returns
         -------
-        data: dict or pandas.DataFrame or xarray.Dataset
-            The gridded data
+        data: dict or pandas.DataFrame or xarray.Dataset or Generator
+            The gridded data, or a generator over the data
+            of chunks of states
         states: numpy.ndarray, optional
             The states indices
         grid_data: tuple, optional
@@ -929,6 +1082,7 @@ class SliceData(Output):
             vmax,
             states_sel,
             states_isel,
+            chunk_states,
             to_file,
             write_pars,
             ret_states,
@@ -937,7 +1091,7 @@ class SliceData(Output):
         )
 
         if ret_grid:
-            out = list(data) if ret_states else [data]
+            out = list(data) if ret_states and chunk_states is None else [data]
             return tuple(out + [gdata])
         return data
 
@@ -963,6 +1117,7 @@ class SliceData(Output):
         vmax={},
         states_sel=None,
         states_isel=None,
+        chunk_states=None,
         to_file=None,
         write_pars={},
         ret_states=False,
@@ -1015,6 +1170,11 @@ class SliceData(Output):
             Reduce to selected states
         states_isel: list, optional
             Reduce to the selected states indices
+        chunk_states: int, optional
+            Calculate chunks of this number of states one after
+            the other. If given, a generator is returned that
+            yields the data of each chunk, or tuples (data, states)
+            if ret_states is True
         to_file: str, optional
             Write data to this file name
         write_pars: dict
@@ -1031,8 +1191,9 @@ class SliceData(Output):
 
         Returns
         -------
-        data: dict or pandas.DataFrame or xarray.Dataset
-            The gridded data
+        data: dict or pandas.DataFrame or xarray.Dataset or Generator
+            The gridded data, or a generator over the data
+            of chunks of states
         states: numpy.ndarray, optional
             The states indices
         grid_data: tuple, optional
@@ -1068,6 +1229,7 @@ class SliceData(Output):
             vmax,
             states_sel,
             states_isel,
+            chunk_states,
             to_file,
             write_pars,
             ret_states,
@@ -1076,6 +1238,6 @@ class SliceData(Output):
         )
 
         if ret_grid:
-            out = list(data) if ret_states else [data]
+            out = list(data) if ret_states and chunk_states is None else [data]
             return tuple(out + [gdata])
         return data
@@ -16,6 +16,11 @@ from .regularize import sqrt_reg
 from .windrose_plot import TabWindroseAxes
 from .tab_files import read_tab_file
 from .random_xy import random_xy_square
+from .grid_interp import grid_coeffs, grid_interp
+from .vertical_interp import vertical_coeffs
+from .table_interp import TableInterpolator
+from .results_cache import ResultsCache
+from .min_dist import min_dist_pairs, min_dist_worst, nearest_dists
 
 from . import two_circles
 from . import abl
@@ -7,3 +7,4 @@ from .area_geometry import AreaUnion, AreaIntersection
 from .polygon import ClosedPolygon
 from .circle import Circle
 from .half_plane import HalfPlane
+from .sdf_cache import SDFCache
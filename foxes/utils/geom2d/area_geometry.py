@@ -80,6 +80,39 @@ class AreaGeometry(metaclass=ABCMeta):
         """
         pass
 
+    def initialize(self, verbosity=0):
+        """
+        Initializes the geometry.
+
+        Parameters
+        ----------
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        """
+        pass
+
+    def sdf_cache(self, resolution, **kwargs):
+        """
+        Get a rasterised signed distance cache of the geometry.
+
+        Parameters
+        ----------
+        resolution: float
+            The grid spacing
+        kwargs: dict, optional
+            Additional parameters for the SDFCache
+
+        Returns
+        -------
+        cache: foxes.utils.geom2d.SDFCache
+            The cached geometry
+
+        """
+        from .sdf_cache import SDFCache
+
+        return SDFCache(self, resolution, **kwargs)
+
     def add_to_figure(
         self,
         ax,
@@ -329,6 +362,18 @@ class InvertedAreaGeometry(AreaGeometry):
         """
         return ~self._geometry.points_inside(points)
 
+    def initialize(self, verbosity=0):
+        """
+        Initializes the geometry.
+
+        Parameters
+        ----------
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        """
+        self._geometry.initialize(verbosity)
+
     def add_to_figure(
         self,
         ax,
@@ -527,6 +572,19 @@ class AreaUnion(AreaGeometry):
             inside = inside | g.points_inside(points)
         return inside
 
+    def initialize(self, verbosity=0):
+        """
+        Initializes the geometry.
+
+        Parameters
+        ----------
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        """
+        for g in self.geometries:
+            g.initialize(verbosity)
+
     def add_to_figure(
         self,
         ax,
@@ -1,7 +1,7 @@
 import numpy as np
 from matplotlib.path import Path
 from matplotlib.patches import PathPatch
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 import matplotlib.pyplot as plt
 
 from .area_geometry import AreaGeometry
@@ -17,12 +17,18 @@ class ClosedPolygon(AreaGeometry):
         The polygon points
     poly: matplotlib.path.Path
         The closed polygon geometry
+    min_tree_segments: int
+        The minimal number of boundary segments for
+        searching candidate segments by a KD-tree
+    chunk_size: int
+        The maximal number of point-segment pairs
+        in vectorised distance evaluations
 
     :group: utils.geom2d
 
     """
 
-    def __init__(self, points):
+    def __init__(self, points, min_tree_segments=64, chunk_size=2**20):
         """
         Constructor.
 
@@ -30,9 +36,17 @@ class ClosedPolygon(AreaGeometry):
         ----------
         points: numpy.ndarray
             The polygon points, shape: (n_points, 2)
+        min_tree_segments: int
+            The minimal number of boundary segments for
+            searching candidate segments by a KD-tree
+        chunk_size: int
+            The maximal number of point-segment pairs
+            in vectorised distance evaluations
 
         """
         self.points = points
+        self.min_tree_segments = min_tree_segments
+        self.chunk_size = chunk_size
 
         if not np.all(points[0] == points[-1]):
             self.points = np.append(self.points, points[[0]], axis=0)
@@ -41,6 +55,28 @@ class ClosedPolygon(AreaGeometry):
 
         self._pathp = None
 
+        # segment start points, directions and inverse squared lengths:
+        pA = self.points[:-1].astype(np.float64)
+        n = self.points[1:] - pA
+        n2 = np.sum(n**2, axis=1)
+        n2i = np.zeros_like(n2)
+        n2i[n2 > 0] = 1 / n2[n2 > 0]
+        self._segs = [pA[:, 0], pA[:, 1], n[:, 0], n[:, 1], n2i]
+
+        # KD-tree of segment pieces of bounded length:
+        self._tree = None
+        n_segs = len(n2)
+        if n_segs >= min_tree_segments:
+            lens = np.sqrt(n2)
+            h = np.mean(lens)
+            counts = np.maximum(np.ceil(lens / h), 1).astype(np.int64)
+            s = np.repeat(np.arange(n_segs), counts)
+            i = np.arange(len(s)) - np.repeat(np.cumsum(counts) - counts, counts)
+            t = (i + 0.5) / counts[s]
+            self._piece2seg = s
+            self._tree = cKDTree(pA[s] + t[:, None] * n[s])
+            self._piece_hlen = 0.5 * np.max(lens / counts)
+
     def p_min(self):
         """
         Returns minimal (x,y) point.
@@ -65,6 +101,51 @@ class ClosedPolygon(AreaGeometry):
         """
         return np.max(self.points, axis=0)
 
+    def _segments_distance(self, points, segs=None):
+        """
+        Helper function for exact point-to-segment distances,
+        minimized over candidate segments.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The probe points, shape (n_points, 2)
+        segs: numpy.ndarray of int, optional
+            The candidate segment indices, shape: (n_points, n_cands).
+            Default: all segments
+
+        Returns
+        -------
+        dist: numpy.ndarray
+            The smallest distances, shape: (n_points,)
+        p_nearest: numpy.ndarray
+            The nearest points, shape: (n_points, 2)
+
+        """
+        if segs is None:
+            ax, ay, nx, ny, n2i = [a[None, :] for a in self._segs]
+        else:
+            ax, ay, nx, ny, n2i = [a[segs] for a in self._segs]
+
+        qx = points[:, 0, None] - ax
+        qy = points[:, 1, None] - ay
+        t = np.clip((qx * nx + qy * ny) * n2i, 0.0, 1.0)
+        qx -= t * nx
+        qy -= t * ny
+        d2 = qx**2 + qy**2
+
+        mini = np.argmin(d2, axis=1)[:, None]
+        dists = np.sqrt(np.take_along_axis(d2, mini, axis=1)[:, 0])
+        minp = np.stack(
+            [
+                points[:, 0] - np.take_along_axis(qx, mini, axis=1)[:, 0],
+                points[:, 1] - np.take_along_axis(qy, mini, axis=1)[:, 0],
+            ],
+            axis=-1,
+        )
+
+        return dists, minp
+
     def points_distance(self, points, return_nearest=False):
         """
         Calculates point distances wrt boundary.
@@ -86,46 +167,41 @@ class ClosedPolygon(AreaGeometry):
             return_nearest is True, shape: (n_points, 2)
 
         """
-
-        dists = cdist(points, self.points[:-1])
-
-        if return_nearest:
-            mini = np.argmin(dists, axis=1)
-            dists = np.take_along_axis(dists, mini[:, None], axis=1)[:, 0]
-            minp = self.points[mini]
-            del mini
+        points = np.asarray(points, dtype=np.float64)
+        n_pts = len(points)
+        n_segs = len(self.points) - 1
+        dists = np.zeros(n_pts, dtype=np.float64)
+        minp = np.zeros((n_pts, 2), dtype=np.float64)
+
+        # small polygons: check all segments, in chunks of points:
+        if self._tree is None:
+            chunk = max(self.chunk_size // n_segs, 1)
+            for i0 in range(0, n_pts, chunk):
+                i1 = min(i0 + chunk, n_pts)
+                dists[i0:i1], minp[i0:i1] = self._segments_distance(points[i0:i1])
+
+        # large polygons: check only the segments whose pieces are
+        # close enough to possibly beat the nearest piece's segment:
         else:
-            dists = np.min(dists, axis=1)
-
-        for pi in range(len(self.points) - 1):
-            pA = self.points[pi]
-            pB = self.points[pi + 1]
-            n = pB - pA
-            d = np.linalg.norm(n)
-
-            if d > 0:
-                n /= d
-                q = points - pA[None, :]
-                x = np.einsum("pd,d->p", q, n)
-
-                sel = (x > 0) & (x < d)
-                if np.any(sel):
-                    x = x[sel]
-                    y2 = np.maximum(np.linalg.norm(q[sel], axis=1) ** 2 - x**2, 0.0)
-
-                    dsel = dists[sel]
-                    dists[sel] = np.minimum(dsel, np.sqrt(y2))
-
-                    if return_nearest:
-                        mini = np.argwhere(np.sqrt(y2) < dsel)
-                        hminp = minp[sel]
-                        hminp[mini] = pA[None, :] + x[mini, None] * n[None, :]
-                        minp[sel] = hminp
-                        del mini, hminp
-
-                    del y2, dsel
-
-                del x, sel
+            dists[:] = np.inf
+            todo = np.arange(n_pts)
+            n_pieces = self._tree.n
+            k = min(16, n_pieces)
+            while True:
+                dpcs, pcs = self._tree.query(points[todo], k=k)
+                dpcs = dpcs.reshape(len(todo), k)
+                pcs = pcs.reshape(len(todo), k)
+                d, p = self._segments_distance(points[todo], self._piece2seg[pcs])
+                sel = d < dists[todo]
+                dists[todo[sel]] = d[sel]
+                minp[todo[sel]] = p[sel]
+
+                # more distant pieces may belong to closer segments:
+                sel = dpcs[:, -1] <= dists[todo] + self._piece_hlen
+                if k == n_pieces or not np.any(sel):
+                    break
+                todo = todo[sel]
+                k = min(2 * k, n_pieces)
 
         if return_nearest:
             return dists, minp
@@ -147,7 +223,14 @@ class ClosedPolygon(AreaGeometry):
             True if point is inside, shape: (n_points,)
 
         """
-        return self.poly.contains_points(points)
+        points = np.asarray(points)
+        inside = np.all(
+            (points >= self.p_min()[None, :]) & (points <= self.p_max()[None, :]),
+            axis=1,
+        )
+        if np.any(inside):
+            inside[inside] = self.poly.contains_points(points[inside])
+        return inside
 
     def add_to_figure(
         self, ax, show_boundary=True, fill_mode=None, pars_boundary={}, pars_distance={}
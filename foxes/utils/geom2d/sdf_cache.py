@@ -0,0 +1,272 @@
+import numpy as np
+
+from .area_geometry import AreaGeometry
+
+
+class SDFCache(AreaGeometry):
+    """
+    A rasterised signed distance cache of an area geometry.
+
+    The signed distances, negative inside, are evaluated
+    once on the nodes of a regular grid and then looked up
+    by bilinear interpolation. For signed distance fields
+    the interpolation error is bounded by the half cell
+    diagonal. Points within a band around the boundary, or
+    outside of the grid, are evaluated exactly by the
+    original geometry.
+
+    Attributes
+    ----------
+    geometry: foxes.utils.geom2d.AreaGeometry
+        The original geometry
+    resolution: float
+        The grid spacing
+    band: float
+        The width of the band around the boundary
+        within which points are evaluated exactly
+    margin: float
+        The grid extension beyond the geometry bounds
+    error_bound: float
+        The bound of the interpolation error
+
+    :group: utils.geom2d
+
+    """
+
+    def __init__(
+        self,
+        geometry,
+        resolution,
+        band=None,
+        margin=None,
+        p_min=None,
+        p_max=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        geometry: foxes.utils.geom2d.AreaGeometry
+            The original geometry
+        resolution: float
+            The grid spacing
+        band: float, optional
+            The width of the band around the boundary
+            within which points are evaluated exactly,
+            at least the error bound. Default: the
+            error bound
+        margin: float, optional
+            The grid extension beyond the geometry bounds,
+            default: two grid cells
+        p_min: numpy.ndarray, optional
+            The minimal (x,y) point of the grid, required
+            for unbounded geometries. Shape: (2,)
+        p_max: numpy.ndarray, optional
+            The maximal (x,y) point of the grid, required
+            for unbounded geometries. Shape: (2,)
+
+        """
+        self.geometry = geometry
+        self.resolution = resolution
+        self.error_bound = resolution / np.sqrt(2)
+        self.band = self.error_bound if band is None else max(band, self.error_bound)
+        self.margin = 2 * resolution if margin is None else margin
+
+        self._p0 = geometry.p_min() if p_min is None else np.array(p_min, dtype=float)
+        self._p1 = geometry.p_max() if p_max is None else np.array(p_max, dtype=float)
+        if np.any(~np.isfinite(self._p0)) or np.any(~np.isfinite(self._p1)):
+            raise ValueError(
+                f"SDFCache: Unbounded geometry of type '{type(geometry).__name__}', please specify p_min and p_max"
+            )
+        self._p0 = self._p0 - self.margin
+        self._p1 = self._p1 + self.margin
+
+        self._sdf = None
+
+    def initialize(self, verbosity=0):
+        """
+        Initializes the geometry, by evaluating
+        the signed distances on the grid.
+
+        Parameters
+        ----------
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        """
+        self.geometry.initialize(verbosity)
+        if self._sdf is not None:
+            return
+
+        nx, ny = np.ceil((self._p1 - self._p0) / self.resolution).astype(int) + 1
+        x = self._p0[0] + np.arange(nx) * self.resolution
+        y = self._p0[1] + np.arange(ny) * self.resolution
+        if verbosity > 0:
+            print(f"SDFCache: Evaluating {nx} x {ny} grid nodes")
+
+        pts = np.zeros((nx, ny, 2), dtype=np.float64)
+        pts[..., 0] = x[:, None]
+        pts[..., 1] = y[None, :]
+        pts = pts.reshape(nx * ny, 2)
+
+        sdf = self.geometry.points_distance(pts)
+        sdf[self.geometry.points_inside(pts)] *= -1
+        self._sdf = sdf.reshape(nx, ny)
+
+    def p_min(self):
+        """
+        Returns minimal (x,y) point.
+
+        Returns
+        -------
+        p_min: numpy.ndarray
+            The minimal (x,y) point, shape = (2,)
+
+        """
+        return self.geometry.p_min()
+
+    def p_max(self):
+        """
+        Returns maximal (x,y) point.
+
+        Returns
+        -------
+        p_min: numpy.ndarray
+            The maximal (x,y) point, shape = (2,)
+
+        """
+        return self.geometry.p_max()
+
+    def _evaluate(self, points):
+        """Helper function for signed distances and inside flags"""
+        if self._sdf is None:
+            self.initialize()
+
+        nx, ny = self._sdf.shape
+        points = np.asarray(points, dtype=np.float64)
+        q = (points - self._p0[None, :]) / self.resolution
+        exact = np.any((q < 0) | (q > [nx - 1, ny - 1]), axis=1)
+
+        # bilinear interpolation:
+        i = np.clip(q[:, 0].astype(np.int64), 0, nx - 2)
+        j = np.clip(q[:, 1].astype(np.int64), 0, ny - 2)
+        wx = q[:, 0] - i
+        wy = q[:, 1] - j
+        s = self._sdf
+        sdist = (1 - wx) * ((1 - wy) * s[i, j] + wy * s[i, j + 1]) + wx * (
+            (1 - wy) * s[i + 1, j] + wy * s[i + 1, j + 1]
+        )
+        inside = sdist < 0
+
+        # exact evaluation within the band:
+        exact |= np.abs(sdist) <= self.band
+        if np.any(exact):
+            pts = points[exact]
+            ins = self.geometry.points_inside(pts)
+            d = self.geometry.points_distance(pts)
+            d[ins] *= -1
+            sdist[exact] = d
+            inside[exact] = ins
+
+        return sdist, inside
+
+    def signed_distance(self, points):
+        """
+        Calculates the signed distances, negative inside.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The probe points, shape (n_points, 2)
+
+        Returns
+        -------
+        sdist: numpy.ndarray
+            The signed distances, shape: (n_points,)
+
+        """
+        return self._evaluate(points)[0]
+
+    def points_distance(self, points, return_nearest=False):
+        """
+        Calculates point distances wrt boundary.
+
+        Interpolated distances deviate by at most the
+        error bound. Nearest points are evaluated exactly.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The probe points, shape (n_points, 2)
+        return_nearest: bool
+            Flag for return of the nearest point on bundary
+
+        Returns
+        -------
+        dist: numpy.ndarray
+            The smallest distances to the boundary,
+            shape: (n_points,)
+        p_nearest: numpy.ndarray, optional
+            The nearest points on the boundary, if
+            return_nearest is True, shape: (n_points, 2)
+
+        """
+        if return_nearest:
+            return self.geometry.points_distance(points, return_nearest=True)
+        return np.abs(self._evaluate(points)[0])
+
+    def points_inside(self, points):
+        """
+        Tests if points are inside the geometry.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The probe points, shape (n_points, 2)
+
+        Returns
+        -------
+        inside: numpy.ndarray
+            True if point is inside, shape: (n_points,)
+
+        """
+        return self._evaluate(points)[1]
+
+    def add_to_figure(
+        self,
+        ax,
+        show_boundary=False,
+        fill_mode="inside_slategray",
+        pars_boundary={},
+        pars_distance={},
+    ):
+        """
+        Add image to (x,y) figure.
+
+        Parameters
+        ----------
+        ax: matplotlib.pyplot.Axis
+            The axis object
+        show_boundary: bool
+            Add the boundary line to the image
+        fill_mode: str, optional
+            Fill the area. Options:
+            dist, dist_inside, dist_outside, inside_<color>,
+            outside_<color>
+        pars_boundary: dict
+            Parameters for boundary plotting command
+        pars_distance: dict
+            Parameters for distance plotting command
+
+        """
+        self.geometry.add_to_figure(
+            ax,
+            show_boundary,
+            fill_mode=None,
+            pars_boundary=pars_boundary,
+            pars_distance={},
+        )
+        super().add_to_figure(
+            ax, show_boundary, fill_mode, pars_boundary, pars_distance
+        )
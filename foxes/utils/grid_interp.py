@@ -0,0 +1,151 @@
+import numpy as np
+from itertools import product
+
+import foxes.constants as FC
+
+
+def grid_coeffs(axes, points, bounds_error=True, steps=None):
+    """
+    Calculates the cell indices and the linear interpolation
+    weights of points on a regular grid.
+
+    Parameters
+    ----------
+    axes: list of numpy.ndarray
+        The strictly ascending grid coordinates,
+        each with at least two entries
+    points: numpy.ndarray
+        The points, shape: (..., n_axes)
+    bounds_error: bool
+        Flag for raising errors if bounds are exceeded
+    steps: list of float, optional
+        The step sizes of uniform axes, None entries
+        for non-uniform axes. Detected if not given
+
+    Returns
+    -------
+    inds: numpy.ndarray
+        The lower cell corner indices,
+        shape: (..., n_axes)
+    weights: numpy.ndarray
+        The weights of the upper cell corners,
+        shape: (..., n_axes)
+    outside: numpy.ndarray
+        Flags for points outside of the grid,
+        including NaN points, shape: (...)
+
+    :group: utils
+
+    """
+    # work on contiguous arrays per axis:
+    n = points.ndim - 1
+    pts = np.ascontiguousarray(points.transpose((n,) + tuple(range(n))))
+    inds = np.empty(pts.shape, dtype=FC.ITYPE)
+    weights = np.empty(pts.shape, dtype=FC.DTYPE)
+    outside = np.zeros(pts.shape[1:], dtype=bool)
+    for ai, a in enumerate(axes):
+        p = pts[ai]
+        i = inds[ai]
+
+        # min/max comparisons are False for NaN:
+        if p.size and not (np.min(p) >= a[0] and np.max(p) <= a[-1]):
+            if bounds_error:
+                raise ValueError(
+                    f"One of the requested points is out of bounds in dimension {ai}"
+                )
+            outside |= ~((p >= a[0]) & (p <= a[-1]))
+            p = np.where(np.isnan(p), a[0], p)
+
+        # uniform axes fast path, truncating cast:
+        if steps is None:
+            delta = a[1:] - a[:-1]
+            step = delta[0] if np.allclose(delta, delta[0]) else None
+        else:
+            step = steps[ai]
+        if step is not None:
+            x = (p - a[0]) / step
+            i[:] = x
+            np.clip(i, 0, len(a) - 2, out=i)
+            np.subtract(x, i, out=weights[ai])
+
+        # general case:
+        else:
+            i[:] = np.searchsorted(a, p, side="right") - 1
+            np.clip(i, 0, len(a) - 2, out=i)
+            weights[ai] = (p - a[i]) / (a[i + 1] - a[i])
+
+    taxes = tuple(range(1, n + 1)) + (0,)
+    return inds.transpose(taxes), weights.transpose(taxes), outside
+
+
+def grid_interp(data, inds, weights, outside=None, fill_value=np.nan, corner_fun=None):
+    """
+    Multi-linear interpolation of state dependent data
+    on a regular grid, with exact state selection.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        The grid data, shape: (n_states, n_1, ..., n_axes, n_vars)
+    inds: numpy.ndarray
+        The lower cell corner indices, as provided
+        by grid_coeffs, shape: (n_states, n_points, n_axes)
+    weights: numpy.ndarray
+        The weights of the upper cell corners, as provided
+        by grid_coeffs, shape: (n_states, n_points, n_axes)
+    outside: numpy.ndarray, optional
+        Flags for points outside of the grid,
+        shape: (n_states, n_points)
+    fill_value: float, optional
+        The value for points outside of the grid,
+        or None for linear extrapolation
+    corner_fun: Function, optional
+        Transformation of the cell corner data before
+        weighting, f(data) -> data, with data shape
+        (n_states, n_points, n_vars)
+
+    Returns
+    -------
+    results: numpy.ndarray
+        The interpolated data, shape: (n_states, n_points, n_vars)
+
+    :group: utils
+
+    """
+    n_states, n_points, n_axes = inds.shape
+    gshape = data.shape[1:-1]
+    n_vars = data.shape[-1]
+
+    # flat indices of the lower cell corners:
+    strides = [1]
+    for n in gshape[::-1]:
+        strides.insert(0, strides[0] * n)
+    base = inds @ np.array(strides[1:], dtype=FC.ITYPE)
+    if n_states > 1:
+        base += np.arange(n_states)[:, None] * strides[0]
+    data = data.reshape(n_states * strides[0], n_vars)
+
+    # a single variable is summed without variables axis:
+    single = n_vars == 1 and corner_fun is None
+    if single:
+        data = data[:, 0]
+
+    # sum over cell corners:
+    wghts = [(1 - weights[..., ai], weights[..., ai]) for ai in range(n_axes)]
+    results = 0
+    for corner in product([0, 1], repeat=n_axes):
+        w = wghts[0][corner[0]]
+        for ai in range(1, n_axes):
+            w = w * wghts[ai][corner[ai]]
+        offset = sum(st for c, st in zip(corner, strides[1:]) if c)
+        cdata = data[base + offset]
+        if corner_fun is not None:
+            cdata = corner_fun(cdata)
+        results = results + (w if single else w[..., None]) * cdata
+    if single:
+        results = results[..., None]
+
+    if outside is not None and fill_value is not None:
+        results[outside] = fill_value
+
+    return results
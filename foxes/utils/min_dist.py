@@ -0,0 +1,218 @@
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+
+import foxes.constants as FC
+
+
+def min_dist_pairs(xy, radius, sel=None):
+    """
+    Finds all pairs of points within a search radius,
+    for a population of point sets.
+
+    The point sets are shifted apart and searched by
+    a single KD-tree, such that only nearby pairs are
+    checked.
+
+    Parameters
+    ----------
+    xy: numpy.ndarray
+        The points, shape: (n_pop, n_points, 2)
+    radius: float
+        The search radius
+    sel: numpy.ndarray of bool, optional
+        The selected points, pairs with at least one
+        selected point are returned. Shape: (n_points,)
+
+    Returns
+    -------
+    pop: numpy.ndarray of int
+        The population index of each pair, shape: (n_pairs,)
+    pairs: numpy.ndarray of int
+        The point indices of each pair, shape: (n_pairs, 2)
+
+    :group: utils
+
+    """
+    n_pop, n_points = xy.shape[:2]
+
+    pmin = np.min(xy, axis=1)
+    step = np.max(np.max(xy, axis=1) - pmin, axis=0)[0] + 2 * radius + 1
+    hxy = xy - pmin[:, None, :]
+    hxy[:, :, 0] += step * np.arange(n_pop)[:, None]
+
+    pairs = cKDTree(hxy.reshape(n_pop * n_points, 2)).query_pairs(
+        radius, output_type="ndarray"
+    )
+    pop = pairs[:, 0] // n_points
+    pairs = pairs % n_points
+
+    if sel is not None:
+        s = sel[pairs[:, 0]] | sel[pairs[:, 1]]
+        pop = pop[s]
+        pairs = pairs[s]
+
+    return pop, pairs
+
+
+def min_dist_worst(xy, min_dist, n_worst, sel=None):
+    """
+    Calculates the largest minimal distance violations
+    for a population of point sets.
+
+    Parameters
+    ----------
+    xy: numpy.ndarray
+        The points, shape: (n_pop, n_points, 2)
+    min_dist: float or numpy.ndarray
+        The minimal distance, or the minimal distance
+        of each point, shape: (n_pop, n_points). For
+        point pairs the larger value applies
+    n_worst: int
+        The number of largest violations
+    sel: numpy.ndarray of bool, optional
+        The selected points, only pairs with at least
+        one selected point are considered. Shape: (n_points,)
+
+    Returns
+    -------
+    values: numpy.ndarray
+        The values min_dist - dist of the worst pairs,
+        in descending order, shape: (n_pop, n_worst).
+        The values are clipped from below at the lower
+        bound -max(min_dist), which also fills missing
+        pairs. Pairs are searched within twice the
+        maximal minimal distance, such that the values
+        are continuous functions of the points
+
+    :group: utils
+
+    """
+    n_pop = xy.shape[0]
+    radius = np.max(min_dist)
+    pop, pairs = min_dist_pairs(xy, 2 * radius, sel)
+
+    a = xy[pop, pairs[:, 0]]
+    b = xy[pop, pairs[:, 1]]
+    vals = -np.linalg.norm(a - b, axis=-1)
+    if np.isscalar(min_dist):
+        vals += min_dist
+    else:
+        vals += np.maximum(min_dist[pop, pairs[:, 0]], min_dist[pop, pairs[:, 1]])
+    vals = np.maximum(vals, -radius)
+
+    # the n_worst largest values of each individual:
+    order = np.lexsort((-vals, pop))
+    pop = pop[order]
+    vals = vals[order]
+    starts = np.searchsorted(pop, np.arange(n_pop))
+    rank = np.arange(len(pop)) - starts[pop]
+    s = rank < n_worst
+
+    values = np.full((n_pop, n_worst), -radius, dtype=FC.DTYPE)
+    values[pop[s], rank[s]] = vals[s]
+
+    return values
+
+
+def nearest_dists(xy, probes=None, valid=None, max_dense=256, max_block=2**18):
+    """
+    Calculates nearest neighbour distances for a
+    population of point sets.
+
+    Small point sets are evaluated by dense distance
+    arrays, large point sets are shifted apart and
+    searched by a single KD-tree. Both run in blocks
+    of individuals.
+
+    Parameters
+    ----------
+    xy: numpy.ndarray
+        The points, shape: (n_pop, n_points, 2)
+    probes: numpy.ndarray, optional
+        The probe points, shape: (n_probes, 2). If given,
+        the distances of the probes to the nearest point of
+        each set are calculated, otherwise the distances of
+        the points to the nearest other point of their set
+    valid: numpy.ndarray of bool, optional
+        The valid points, only these are considered,
+        shape: (n_pop, n_points)
+    max_dense: int
+        The maximal number of points per set for
+        dense evaluation
+    max_block: int
+        The maximal number of distances, or queries,
+        per block of individuals
+
+    Returns
+    -------
+    dists: numpy.ndarray
+        The nearest neighbour distances, shape: (n_pop, n_probes)
+        or (n_pop, n_points). The value is infinity if
+        no neighbour exists
+
+    :group: utils
+
+    """
+    n_pop, n_points = xy.shape[:2]
+    if valid is None:
+        valid = np.ones((n_pop, n_points), dtype=bool)
+
+    k = 1 if probes is not None else 2
+    n_q = len(probes) if probes is not None else n_points
+    out = np.full((n_pop, n_q), np.inf, dtype=FC.DTYPE)
+    pops = np.where(np.sum(valid, axis=1) >= k)[0]
+
+    # small sets: dense squared distances
+    if n_points <= max_dense:
+        n_block = max(max_block // max(n_q * n_points, 1), 1)
+        for i0 in range(0, len(pops), n_block):
+            bpops = pops[i0 : i0 + n_block]
+            bvalid = valid[bpops]
+            if probes is not None:
+                counts = np.sum(bvalid, axis=1)
+                d2 = cdist(probes, xy[bpops][bvalid], "sqeuclidean")
+                d2 = np.minimum.reduceat(d2, np.cumsum(counts) - counts, axis=1)
+                out[bpops] = np.sqrt(d2.T)
+            else:
+                x = xy[bpops, :, 0]
+                y = xy[bpops, :, 1]
+                d2 = (x[:, :, None] - x[:, None, :]) ** 2
+                d2 += (y[:, :, None] - y[:, None, :]) ** 2
+                d2[:, np.arange(n_points), np.arange(n_points)] = np.inf
+                if not np.all(bvalid):
+                    d2[~np.broadcast_to(bvalid[:, None, :], d2.shape)] = np.inf
+                hout = np.sqrt(np.min(d2, axis=2))
+                hout[~bvalid] = np.inf
+                out[bpops] = hout
+        return out
+
+    # large sets: the shift guarantees that neighbours in other sets are farther
+    pmin = np.min(xy, axis=(0, 1))
+    pmax = np.max(xy, axis=(0, 1))
+    if probes is not None:
+        pmin = np.minimum(pmin, np.min(probes, axis=0))
+        pmax = np.maximum(pmax, np.max(probes, axis=0))
+    step = 3 * np.max(pmax - pmin) + 1
+
+    n_block = max(max_block // max(n_q, 1), 1)
+    for i0 in range(0, len(pops), n_block):
+        bpops = pops[i0 : i0 + n_block]
+        shift = np.zeros((len(bpops), 1, 2), dtype=FC.DTYPE)
+        shift[:, 0, 0] = step * np.arange(len(bpops))
+
+        hxy = xy[bpops] - pmin[None, None, :] + shift
+        bvalid = valid[bpops]
+        tree = cKDTree(hxy[bvalid])
+
+        if probes is not None:
+            hqts = (probes - pmin[None, :])[None, :, :] + shift
+            dists, __ = tree.query(hqts.reshape(-1, 2), k=1)
+            out[bpops] = dists.reshape(len(bpops), n_q)
+        else:
+            dists, __ = tree.query(hxy[bvalid], k=2)
+            hout = out[bpops]
+            hout[bvalid] = dists[:, 1]
+            out[bpops] = hout
+
+    return out
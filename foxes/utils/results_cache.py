@@ -0,0 +1,398 @@
+import os
+import types
+import hashlib
+import numpy as np
+import pandas as pd
+import xarray as xr
+from pathlib import Path
+
+import foxes.constants as FC
+
+
+class ResultsCache:
+    """
+    Persistent on-disk cache of calculation results,
+    stored as NetCDF files with least recently used
+    eviction.
+
+    The results are stored per configuration key, and
+    within a configuration per state, identified by
+    a key that is computed from the state dependent
+    input data. Hence extending the states only
+    requires the calculation of the missing states.
+
+    Attributes
+    ----------
+    cache_dir: pathlib.Path
+        The cache directory
+    max_size: float
+        The maximal total size of the cache files in MB,
+        or None for no limit
+    complevel: int
+        The compression level of the NetCDF files
+    verbosity: int
+        The verbosity level, 0 = silent
+
+    :group: utils
+
+    """
+
+    KEY_VAR = "_cache_key"
+
+    def __init__(self, cache_dir, max_size=1000, complevel=5, verbosity=1):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        cache_dir: str or pathlib.Path
+            The cache directory, will be created
+            if not existing
+        max_size: float, optional
+            The maximal total size of the cache files in MB,
+            or None for no limit
+        complevel: int
+            The compression level of the NetCDF files
+        verbosity: int
+            The verbosity level, 0 = silent
+
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.complevel = complevel
+        self.verbosity = verbosity
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.cache_dir})"
+
+    def print(self, *args, **kwargs):
+        """
+        Print function, based on verbosity.
+
+        Parameters
+        ----------
+        args: tuple, optional
+            Arguments for the print function
+        kwargs: dict, optional
+            Keyword arguments for the print function
+
+        """
+        if self.verbosity > 0:
+            print(*args, **kwargs)
+
+    @classmethod
+    def _hash_update(cls, h, obj, memo):
+        """Helper function that feeds an object into a hash"""
+        if obj is None or isinstance(obj, (bool, int, float, complex, str, range)):
+            h.update(f"{type(obj).__name__}:{obj!r};".encode())
+        elif isinstance(obj, np.generic):
+            cls._hash_update(h, obj.item(), memo)
+        elif isinstance(obj, bytes):
+            h.update(obj)
+        elif isinstance(obj, np.ndarray):
+            h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+            if obj.dtype == object:
+                for x in obj.flat:
+                    cls._hash_update(h, x, memo)
+            else:
+                h.update(np.ascontiguousarray(obj).tobytes())
+        elif isinstance(obj, (pd.DataFrame, pd.Series)):
+            h.update(f"{type(obj).__name__};".encode())
+            cls._hash_update(h, obj.index.to_numpy(), memo)
+            if isinstance(obj, pd.DataFrame):
+                cls._hash_update(h, obj.columns.to_numpy(), memo)
+            cls._hash_update(h, obj.to_numpy(), memo)
+        elif isinstance(obj, (xr.Dataset, xr.DataArray)):
+            if isinstance(obj, xr.DataArray):
+                obj = obj.to_dataset(name="__data__")
+            for v in sorted(obj.variables.keys()):
+                d = obj[v]
+                cls._hash_update(h, (v, d.dims, d.to_numpy()), memo)
+        elif isinstance(obj, dict):
+            h.update(b"dict;")
+            for k in sorted(obj.keys(), key=str):
+                cls._hash_update(h, (k, obj[k]), memo)
+        elif isinstance(obj, (list, tuple)):
+            h.update(f"{type(obj).__name__}:{len(obj)};".encode())
+            for x in obj:
+                cls._hash_update(h, x, memo)
+        elif isinstance(obj, (set, frozenset)):
+            h.update(b"set;")
+            for x in sorted([cls.hash(x) for x in obj]):
+                h.update(x.encode())
+        elif isinstance(
+            obj,
+            (
+                type,
+                types.FunctionType,
+                types.BuiltinFunctionType,
+                types.MethodType,
+                types.ModuleType,
+            ),
+        ):
+            m = getattr(obj, "__module__", "")
+            n = getattr(obj, "__qualname__", getattr(obj, "__name__", ""))
+            h.update(f"{type(obj).__name__}:{m}.{n};".encode())
+        elif id(obj) in memo:
+            h.update(f"ref:{type(obj).__qualname__};".encode())
+        elif hasattr(obj, "__dict__"):
+            memo.add(id(obj))
+            h.update(f"{type(obj).__module__}.{type(obj).__qualname__};".encode())
+            for k in sorted(vars(obj).keys()):
+                x = getattr(obj, k)
+                if k[0] != "_" and not isinstance(x, np.ndarray):
+                    cls._hash_update(h, (k, x), memo)
+        else:
+            h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+    @classmethod
+    def hash(cls, *objs):
+        """
+        Computes a hash key of the given objects.
+
+        Objects are hashed by their type and the values
+        of their public attributes, ignoring array
+        valued attributes. Array data should instead be
+        given directly, or as part of containers.
+
+        Parameters
+        ----------
+        objs: tuple
+            The objects
+
+        Returns
+        -------
+        key: str
+            The hash key
+
+        """
+        h = hashlib.sha1()
+        cls._hash_update(h, objs, set())
+        return h.hexdigest()
+
+    def keys(self, key_data, *datasets, state_dim=FC.STATE):
+        """
+        Computes the configuration key and the
+        state keys.
+
+        Parameters
+        ----------
+        key_data: object
+            The configuration data
+        datasets: tuple of xarray.Dataset
+            The input data. State dependent variables
+            enter the state keys, the other variables
+            enter the configuration key
+        state_dim: str
+            The name of the states dimension
+
+        Returns
+        -------
+        key: str
+            The configuration key
+        state_keys: numpy.ndarray
+            The state keys, shape: (n_states,)
+
+        """
+        n_states = None
+        sdata = []
+        edata = []
+        for ds in datasets:
+            for v in sorted(ds.variables.keys()):
+                d = ds[v]
+                if state_dim in d.dims:
+                    d = d.transpose(state_dim, ...).to_numpy()
+                    if d.dtype == object:
+                        d = d.astype(str)
+                    n_states = d.shape[0]
+                    sdata.append(np.ascontiguousarray(d.reshape(n_states, -1)))
+                    edata.append((v, d.dtype.str, d.shape[1:]))
+                else:
+                    edata.append((v, d.dims, d.to_numpy()))
+
+        key = self.hash(key_data, edata)
+
+        if n_states is None:
+            return key, None
+        rows = np.concatenate([d.view(np.uint8) for d in sdata], axis=1)
+        skeys = np.array([hashlib.sha1(r.tobytes()).hexdigest() for r in rows])
+
+        return key, skeys
+
+    def get_path(self, key):
+        """
+        Gets the path of a cache file.
+
+        Parameters
+        ----------
+        key: str
+            The configuration key
+
+        Returns
+        -------
+        path: pathlib.Path
+            The path of the cache file
+
+        """
+        return self.cache_dir / f"{key}.nc"
+
+    def load(self, key):
+        """
+        Loads cached data.
+
+        Parameters
+        ----------
+        key: str
+            The configuration key
+
+        Returns
+        -------
+        data: xarray.Dataset
+            The cached data, or None if not found
+
+        """
+        fpath = self.get_path(key)
+        if not fpath.is_file():
+            return None
+
+        with xr.open_dataset(fpath) as ds:
+            data = ds.load()
+        os.utime(fpath)
+
+        return data
+
+    def store(self, key, data):
+        """
+        Stores data, replacing previous data
+        of the same key.
+
+        Parameters
+        ----------
+        key: str
+            The configuration key
+        data: xarray.Dataset
+            The data
+
+        """
+        fpath = self.get_path(key)
+        tpath = fpath.with_suffix(".tmp")
+        enc = {
+            v: {"zlib": True, "complevel": self.complevel}
+            for v, d in data.data_vars.items()
+            if d.dtype.kind in "biuf"
+        }
+        data.to_netcdf(tpath, encoding=enc)
+        os.replace(tpath, fpath)
+
+        self.evict(keep=key)
+
+    def evict(self, keep=None):
+        """
+        Removes the least recently used cache files
+        until the total size is within the limit.
+
+        Parameters
+        ----------
+        keep: str, optional
+            A configuration key that is never removed
+
+        """
+        if self.max_size is None:
+            return
+
+        files = sorted(self.cache_dir.glob("*.nc"), key=lambda f: f.stat().st_mtime)
+        size = sum([f.stat().st_size for f in files]) / 1024**2
+        for f in files:
+            if size <= self.max_size:
+                break
+            if f.stem != keep:
+                size -= f.stat().st_size / 1024**2
+                f.unlink()
+                self.print(f"{type(self).__name__}: Removed '{f.name}'")
+
+    def clear(self):
+        """
+        Removes all cache files
+        """
+        for f in self.cache_dir.glob("*.nc"):
+            f.unlink()
+
+    @staticmethod
+    def _concat(data, state_dim):
+        """Helper function that concatenates data along the states"""
+        return xr.concat(
+            data,
+            dim=state_dim,
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )
+
+    def calculate(self, key, state_keys, func, partial=True, state_dim=FC.STATE):
+        """
+        Returns cached results, and calculates
+        and stores missing states.
+
+        Parameters
+        ----------
+        key: str
+            The configuration key
+        state_keys: numpy.ndarray
+            The state keys, shape: (n_states,)
+        func: Function
+            The calculation function, f(sinds) -> results,
+            where sinds are the indices of the states to
+            be calculated, or None for all states
+        partial: bool
+            Flag for calculating only the missing states,
+            otherwise all states are calculated if any
+            state is missing
+        state_dim: str
+            The name of the states dimension
+
+        Returns
+        -------
+        results: xarray.Dataset
+            The results, for all states
+
+        """
+        n_states = len(state_keys)
+        cached = self.load(key)
+        if cached is not None:
+            cpos = {k: i for i, k in enumerate(cached[self.KEY_VAR].to_numpy())}
+            hit = np.array([k in cpos for k in state_keys], dtype=bool)
+        else:
+            hit = np.zeros(n_states, dtype=bool)
+        n_hits = np.sum(hit)
+        self.print(
+            f"{type(self).__name__}: Found {n_hits} of {n_states} states for key {key}"
+        )
+
+        if n_hits == n_states:
+            sel = [cpos[k] for k in state_keys]
+            return cached.isel({state_dim: sel}).drop_vars(self.KEY_VAR)
+
+        if n_hits == 0 or not partial:
+            sinds = np.arange(n_states)
+            results = func(None)
+        else:
+            sinds = np.where(~hit)[0]
+            results = func(sinds)
+        results = results.compute()
+
+        new = results.assign({self.KEY_VAR: (state_dim, state_keys[sinds])})
+        if len(sinds) < n_states:
+            sel = [cpos[k] for k in state_keys[hit]]
+            old = cached.isel({state_dim: sel})
+            order = np.argsort(np.r_[np.where(hit)[0], sinds])
+            results = self._concat([old, new], state_dim).isel({state_dim: order})
+            results = results.drop_vars(self.KEY_VAR)
+
+        if cached is not None:
+            keep = ~np.isin(cached[self.KEY_VAR].to_numpy(), new[self.KEY_VAR])
+            new = self._concat([cached.isel({state_dim: keep}), new], state_dim)
+        self.store(key, new)
+
+        return results
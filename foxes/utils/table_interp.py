@@ -0,0 +1,214 @@
+import numpy as np
+from scipy.interpolate import interpn
+
+from .grid_interp import grid_coeffs, grid_interp
+import foxes.constants as FC
+
+
+class TableInterpolator:
+    """
+    Precompiled interpolation of table data on a
+    regular grid.
+
+    The axes are checked and analyzed once during
+    construction, such that repeated calls only
+    compute the cell indices and weights of the
+    query points. Uniform axes are detected and
+    treated without search.
+
+    The call signature is compatible with
+    scipy.interpolate.interpn, i.e., the same
+    methods and the same bounds treatment.
+
+    Attributes
+    ----------
+    axes: list of numpy.ndarray
+        The strictly ascending grid coordinates
+    data: numpy.ndarray
+        The table data, shape: (n_1, ..., n_axes, n_vals)
+    method: str
+        The interpolation method: nearest, linear, cubic
+    bounds_error: bool
+        Flag for raising errors if bounds are exceeded
+    fill_value: float
+        The value for points outside of the grid,
+        or None for extrapolation
+    cubic_spline: bool
+        Flag for precompiling the cubic spline
+
+    :group: utils
+
+    """
+
+    METHODS = ["nearest", "linear", "cubic"]
+
+    def __init__(
+        self,
+        axes,
+        data,
+        method="linear",
+        bounds_error=True,
+        fill_value=np.nan,
+        cubic_spline=False,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        axes: list of array_like
+            The strictly ascending grid coordinates
+        data: numpy.ndarray
+            The table data, shape: (n_1, ..., n_axes, ...),
+            i.e. with optional trailing value dimensions
+        method: str
+            The interpolation method: nearest, linear, cubic
+        bounds_error: bool
+            Flag for raising errors if bounds are exceeded
+        fill_value: float, optional
+            The value for points outside of the grid,
+            or None for extrapolation
+        cubic_spline: bool
+            Flag for precompiling the tensor product spline
+            of the cubic method, which requires scipy>=1.12.
+            Its results deviate slightly from interpn. If
+            not available, interpn is used
+
+        """
+        if method not in self.METHODS:
+            raise ValueError(
+                f"{type(self).__name__}: Unknown method '{method}', choices: {self.METHODS}"
+            )
+
+        self.axes = [np.asarray(a, dtype=FC.DTYPE) for a in axes]
+        self.method = method
+        self.bounds_error = bounds_error
+        self.fill_value = fill_value
+        self.cubic_spline = cubic_spline
+
+        n_axes = len(self.axes)
+        gshape = tuple(len(a) for a in self.axes)
+        if data.shape[:n_axes] != gshape:
+            raise ValueError(
+                f"{type(self).__name__}: Expecting data shape {gshape + data.shape[n_axes:]}, got {data.shape}"
+            )
+        self._vshape = data.shape[n_axes:]
+        self.data = np.asarray(data, dtype=FC.DTYPE).reshape(gshape + (-1,))
+
+        nmin = 4 if method == "cubic" else 2
+        self._steps = []
+        for ai, a in enumerate(self.axes):
+            if a.ndim != 1 or len(a) < nmin:
+                raise ValueError(
+                    f"{type(self).__name__}: Axis {ai} requires at least {nmin} points for method '{method}', got shape {a.shape}"
+                )
+            delta = a[1:] - a[:-1]
+            if np.any(delta <= 0):
+                raise ValueError(
+                    f"{type(self).__name__}: Axis {ai} is not strictly ascending"
+                )
+            self._steps.append(delta[0] if np.allclose(delta, delta[0]) else None)
+
+        # flat index strides of the grid:
+        self._strides = np.cumprod((1,) + gshape[:0:-1])[::-1].astype(FC.ITYPE)
+
+        self._spline = None
+        if method == "cubic" and cubic_spline:
+            try:
+                from scipy.interpolate import make_interp_spline, NdBSpline
+            except ImportError:
+                NdBSpline = None
+
+            # tensor product of not-a-knot cubic splines:
+            if NdBSpline is not None:
+                knots = []
+                coeffs = self.data
+                for ai, a in enumerate(self.axes):
+                    s = make_interp_spline(a, coeffs, k=3, axis=ai)
+                    knots.append(s.t)
+                    coeffs = np.moveaxis(s.c, 0, ai)
+                self._spline = NdBSpline(tuple(knots), coeffs, k=3, extrapolate=True)
+
+    def __repr__(self):
+        s = ", ".join([str(len(a)) for a in self.axes])
+        return f"{type(self).__name__}(({s}), method={self.method})"
+
+    def coeffs(self, points):
+        """
+        Calculates the cell indices and the weights
+        of the upper cell corners.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The points, shape: (n_points, n_axes)
+
+        Returns
+        -------
+        inds: numpy.ndarray
+            The lower cell corner indices,
+            shape: (n_points, n_axes)
+        weights: numpy.ndarray
+            The weights of the upper cell corners,
+            shape: (n_points, n_axes)
+        outside: numpy.ndarray
+            Flags for points outside of the grid,
+            including NaN points, shape: (n_points,)
+
+        """
+        try:
+            return grid_coeffs(self.axes, points, self.bounds_error, self._steps)
+        except ValueError as e:
+            raise ValueError(f"{type(self).__name__}: {e}")
+
+    def __call__(self, points):
+        """
+        Interpolates the table data.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            The points, shape: (n_points, n_axes)
+
+        Returns
+        -------
+        values: numpy.ndarray
+            The interpolated data, shape: (n_points, ...),
+            with the trailing value dimensions of the data
+
+        """
+        points = np.asarray(points, dtype=FC.DTYPE)
+        n_points = points.shape[0]
+        inds, weights, outside = self.coeffs(points)
+
+        if self.method == "linear":
+            values = grid_interp(
+                self.data[None], inds[None], weights[None], fill_value=None
+            )[0]
+
+        elif self.method == "nearest":
+            inds += weights > 0.5
+            values = self.data.reshape(-1, self.data.shape[-1])[inds @ self._strides]
+
+        else:
+            pts = points
+            if np.any(outside):
+                pts = np.where(np.isnan(points), [a[0] for a in self.axes], points)
+            if self._spline is not None:
+                values = self._spline(pts)
+            else:
+                values = interpn(
+                    self.axes,
+                    self.data,
+                    pts,
+                    method="cubic",
+                    bounds_error=False,
+                    fill_value=None,
+                )
+
+        if np.any(outside):
+            if self.fill_value is not None:
+                values[outside] = self.fill_value
+            values[np.any(np.isnan(points), axis=1)] = np.nan
+
+        return values.reshape((n_points,) + self._vshape)
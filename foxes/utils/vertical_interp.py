@@ -0,0 +1,74 @@
+import numpy as np
+
+import foxes.constants as FC
+
+
+def vertical_coeffs(heights, z, extrapolation=None, z0=0.1):
+    """
+    Calculates the two bracketing height indices and
+    their weights for the interpolation of height data.
+
+    Parameters
+    ----------
+    heights: numpy.ndarray
+        The strictly ascending heights, shape: (n_heights,)
+    z: numpy.ndarray
+        The evaluation heights, any shape
+    extrapolation: str, optional
+        The extrapolation mode for heights outside of the
+        data: None raises an error, 'const' takes the
+        nearest value, 'linear' extrapolates linearly,
+        'log' applies the logarithmic wind profile based
+        on the nearest value
+    z0: float
+        The roughness length of the log-law extrapolation
+
+    Returns
+    -------
+    inds: numpy.ndarray of int
+        The height indices, shape: (..., 2)
+    weights: numpy.ndarray
+        The height weights, shape: (..., 2)
+
+    :group: utils
+
+    """
+    h = np.asarray(heights, dtype=FC.DTYPE)
+    z = np.asarray(z, dtype=FC.DTYPE)
+    n_h = len(h)
+
+    below = z < h[0]
+    above = z > h[-1]
+    if extrapolation is None and (np.any(below) or np.any(above)):
+        raise ValueError(
+            f"Height out of bounds: Got range [{np.min(z)}, {np.max(z)}], data range [{h[0]}, {h[-1]}]"
+        )
+    elif extrapolation not in [None, "const", "linear", "log"]:
+        raise KeyError(
+            f"Unknown extrapolation '{extrapolation}', choices: None, const, linear, log"
+        )
+
+    inds = np.zeros(z.shape + (2,), dtype=FC.ITYPE)
+    weights = np.zeros(z.shape + (2,), dtype=FC.DTYPE)
+    if n_h == 1:
+        weights[..., 0] = 1
+    else:
+        i = np.clip(np.searchsorted(h, z, side="right") - 1, 0, n_h - 2)
+        t = (z - h[i]) / (h[i + 1] - h[i])
+        if extrapolation != "linear":
+            t = np.clip(t, 0.0, 1.0)
+        inds[..., 0] = i
+        inds[..., 1] = i + 1
+        weights[..., 0] = 1 - t
+        weights[..., 1] = t
+
+    if extrapolation == "log":
+        for sel, e in [(below, 0), (above, n_h - 1)]:
+            if np.any(sel):
+                inds[sel] = e
+                weights[sel, 0] = np.log(np.maximum(z[sel], z0) / z0) / np.log(
+                    h[e] / z0
+                )
+                weights[sel, 1] = 0
+
+    return inds, weights
@@ -0,0 +1,70 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.core import Model
+
+
+def calc(broadcast):
+    Model.broadcast_data = broadcast
+    Model.get_data_allocs(reset=True)
+
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(50),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[500.0, 0.0], [0.0, 500.0]],
+        steps=[3, 3],
+        turbine_models=["NREL5MW", "kTI_02"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="grid4",
+        wake_models=["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+        wake_frame="yawed",
+        partial_wakes_model="auto",
+        chunks={FC.STATE: 20},
+        verbosity=0,
+    )
+
+    try:
+        farm_results = algo.calc_farm()
+        points = np.zeros((50, 5, 3))
+        points[:, :, 0] = np.linspace(-300.0, 1500.0, 5)[None, :]
+        points[:, :, 1] = 200.0
+        points[:, :, 2] = 100.0
+        point_results = algo.calc_points(farm_results, points)
+    finally:
+        Model.broadcast_data = False
+
+    return farm_results, point_results, Model.get_data_allocs(reset=True)
+
+
+def test():
+    fres0, pres0, allocs0 = calc(False)
+    fres1, pres1, allocs1 = calc(True)
+
+    for v in [FV.REWS, FV.P, FV.CT]:
+        assert np.allclose(fres0[v].to_numpy(), fres1[v].to_numpy(), rtol=0, atol=0)
+    for v in [FV.WS, FV.TI]:
+        assert np.allclose(pres0[v].to_numpy(), pres1[v].to_numpy(), rtol=0, atol=0)
+    assert allocs1["bytes"] < allocs0["bytes"]
+
+
+if __name__ == "__main__":
+    test()
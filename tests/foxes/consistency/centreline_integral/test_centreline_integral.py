@@ -0,0 +1,124 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+class OrderCheckRotorWD(foxes.models.wake_frames.RotorWD):
+    """Records the table step sizes for short and long wakes, in both orders"""
+
+    def __init__(self):
+        super().__init__()
+        self.dxs = []
+
+    def calc_centreline_integral(
+        self, algo, mdata, fdata, states_source_turbine, variables, x, dx, **kwargs
+    ):
+        mkey = self.var("centreline_integrals")
+        tpars = {k: kwargs[k] for k in ["wake_models", "self_wake", "max_steps"]}
+        res = []
+        for x_maxs in [(500.0, 2000.0), (2000.0, 500.0)]:
+            mdata.pop(mkey, None)
+            res.append({})
+            for x_max in x_maxs:
+                res[-1][x_max] = self.get_centreline_integral_table(
+                    algo,
+                    mdata,
+                    fdata,
+                    states_source_turbine,
+                    variables,
+                    x_max,
+                    dx,
+                    **tpars,
+                )[0]
+        mdata.pop(mkey, None)
+        self.dxs.append(res)
+
+        return super().calc_centreline_integral(
+            algo, mdata, fdata, states_source_turbine, variables, x, dx, **kwargs
+        )
+
+
+def calc(dx, max_steps, ti_var, wake_frame="rotor_wd"):
+    mbook = foxes.models.ModelBook()
+    mbook.wake_frames["order_check"] = OrderCheckRotorWD()
+    mbook.wake_models["TurbOParkIX"] = foxes.models.wake_models.wind.TurbOParkWakeIX(
+        superposition="ws_linear",
+        dx=dx,
+        A=0.04,
+        ti_var=ti_var,
+        max_steps=max_steps,
+    )
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(30),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[500.0, 0.0], [0.0, 500.0]],
+        steps=[3, 3],
+        turbine_models=["NREL5MW"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="grid4",
+        wake_models=["TurbOParkIX", "IECTI2019_max"],
+        wake_frame=wake_frame,
+        partial_wakes_model="auto",
+        chunks={FC.STATE: 10},
+        verbosity=0,
+    )
+
+    farm_results = algo.calc_farm()
+
+    points = np.zeros((30, 6, 3))
+    points[:, :, 0] = np.linspace(-300.0, 1500.0, 6)[None, :]
+    points[:, :, 1] = 200.0
+    points[:, :, 2] = 100.0
+    point_results = algo.calc_points(farm_results, points)
+
+    if wake_frame == "order_check":
+        return algo.wake_frame.dxs
+
+    return farm_results[FV.REWS].to_numpy(), point_results[FV.WS].to_numpy()
+
+
+def test():
+    # the integral of the ambient TI is exact for any resolution:
+    r0, p0 = calc(5.0, None, FV.AMB_TI)
+    r1, p1 = calc(100.0, None, FV.AMB_TI)
+    r2, p2 = calc(5.0, 20, FV.AMB_TI)
+    assert np.allclose(r0, r1, rtol=1e-12, atol=0)
+    assert np.allclose(r0, r2, rtol=1e-12, atol=0)
+    assert np.allclose(p0, p1, rtol=1e-12, atol=0)
+    assert np.allclose(p0, p2, rtol=1e-12, atol=0)
+
+    # for the waked TI, the step size is increased by max_steps:
+    r0, p0 = calc(10.0, None, FV.TI)
+    r1, p1 = calc(10.0, 50, FV.TI)
+    assert np.all(np.isfinite(r1)) and np.all(np.isfinite(p1))
+    assert np.allclose(r0, r1, rtol=1e-2, atol=0)
+    assert np.allclose(p0, p1, rtol=1e-2, atol=0)
+
+    # the step size of stored tables does not depend on the call order:
+    dxs = calc(10.0, 50, FV.TI, "order_check")
+    assert len(dxs)
+    for dx0, dx1 in dxs:
+        assert dx0 == dx1
+        assert dx0[500.0] == 10.0 and dx0[2000.0] == 40.0
+
+
+if __name__ == "__main__":
+    test()
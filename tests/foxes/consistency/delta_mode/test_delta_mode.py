@@ -0,0 +1,182 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def set_yawm(algo, yawm):
+    model = algo.mbook.turbine_models["set_yawm"]
+    model.reset()
+    model.add_var(FV.YAWM, yawm)
+    if model.initialized:
+        model.finalize(algo)
+        model.initialize(algo)
+
+
+def create_algo(
+    rotor, pwakes, wakes, prune_tol, checkpoints, Algo=None, wake_frame="yawed"
+):
+    mbook = foxes.models.ModelBook()
+    mbook.turbine_models["set_yawm"] = foxes.models.turbine_models.SetFarmVars(
+        pre_rotor=True
+    )
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(50),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[600.0, 0.0], [0.0, 600.0]],
+        steps=[3, 3],
+        turbine_models=["set_yawm", "yawm2yaw", "NREL5MW", "kTI_02"],
+        verbosity=0,
+    )
+
+    if Algo is None:
+        Algo = foxes.algorithms.Downwind
+
+    return Algo(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=rotor,
+        wake_models=wakes,
+        wake_frame=wake_frame,
+        partial_wakes_model=pwakes,
+        chunks={FC.STATE: 20},
+        prune_tol=prune_tol,
+        delta_checkpoints=checkpoints,
+        verbosity=0,
+    )
+
+
+def calc(*args):
+    steps = [
+        ([4], True),
+        ([0, 8], False),
+        (["T7"], False),
+        ([2, 3], True),
+        ([1], True),
+    ]
+
+    # full reference runs, by separate algorithm:
+    algo = create_algo(*args)
+    farm = algo.farm
+    yawm = np.zeros((50, farm.n_turbines))
+    fresults = []
+    for changed, accept in steps:
+        hyawm = yawm.copy()
+        for t in changed:
+            t = farm.turbine_names.index(t) if isinstance(t, str) else t
+            hyawm[:, t] += 20.0
+        set_yawm(algo, hyawm)
+        fresults.append(algo.calc_farm())
+        if accept:
+            yawm = hyawm
+
+    # local search steps in delta mode, some of them rejected:
+    algo = create_algo(*args)
+    yawm = np.zeros((50, farm.n_turbines))
+    set_yawm(algo, yawm)
+    base_results = algo.calc_farm(finalize=False)
+    results = []
+    for si, (changed, accept) in enumerate(steps):
+        hyawm = yawm.copy()
+        for t in changed:
+            t = farm.turbine_names.index(t) if isinstance(t, str) else t
+            hyawm[:, t] += 20.0
+        set_yawm(algo, hyawm)
+
+        dres = algo.calc_farm(
+            finalize=False, base_results=base_results, changed_turbines=changed
+        )
+        results.append((dres, fresults[si]))
+
+        if accept:
+            yawm = hyawm
+            base_results = dres
+
+    algo.finalize()
+
+    return results
+
+
+def test():
+    for rotor, pwakes, wakes, prune_tol, checkpoints in [
+        (
+            "grid9",
+            "rotor_points",
+            ["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+            None,
+            None,
+        ),
+        (
+            "grid9",
+            "rotor_points",
+            ["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+            None,
+            2,
+        ),
+        ("grid9", "axiwake6", ["Jensen_linear_k007", "IECTI2019_max"], 1e-3, 3),
+    ]:
+        print(rotor, pwakes, wakes, prune_tol, checkpoints)
+        for dres, fres in calc(rotor, pwakes, wakes, prune_tol, checkpoints):
+            for v in [FV.REWS, FV.TI, FV.P, FV.CT, FV.YAW, FV.AMB_REWS]:
+                d = np.abs(dres[v].to_numpy() - fres[v].to_numpy())
+                print(f"  max delta {v}: {np.max(d):.3e}")
+                assert np.allclose(dres[v], fres[v], rtol=1e-10, atol=1e-10)
+
+    # delta mode is not available for iterative calculations:
+    args = ("centre", "rotor_points", ["Jensen_linear_k007"], None)
+    algo = create_algo(*args, None, foxes.algorithms.Iterative)
+    set_yawm(algo, np.zeros((50, algo.n_turbines)))
+    base_results = algo.calc_farm(finalize=False)
+    try:
+        algo.calc_farm(base_results=base_results, changed_turbines=[4])
+    except NotImplementedError:
+        pass
+    else:
+        raise AssertionError("Expecting NotImplementedError for Iterative")
+    finally:
+        algo.finalize()
+
+    algo = create_algo(*args, 2, foxes.algorithms.Iterative)
+    try:
+        algo.calc_farm()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expecting ValueError for delta_checkpoints")
+
+    # delta mode is not available for sequential calculations:
+    algo = create_algo(*args, None, foxes.algorithms.Sequential, "rotor_wd")
+    set_yawm(algo, np.zeros((50, algo.n_turbines)))
+    try:
+        for __ in algo:
+            algo.calc_farm(base_results=algo.cur_farm_results, changed_turbines=[4])
+    except NotImplementedError:
+        pass
+    else:
+        raise AssertionError("Expecting NotImplementedError for Sequential")
+    finally:
+        algo.finalize()
+
+    algo = create_algo(*args, 2, foxes.algorithms.Sequential, "rotor_wd")
+    try:
+        iter(algo)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expecting ValueError for delta_checkpoints")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,83 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(dtype, rotor, pwakes, wakes):
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(100),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[600.0, 0.0], [0.0, 600.0]],
+        steps=[3, 3],
+        turbine_models=["NREL5MW", "kTI_02"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model=rotor,
+        wake_models=wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model=pwakes,
+        chunks={FC.STATE: 40, FC.POINT: 1000},
+        dtype=dtype,
+        verbosity=0,
+    )
+
+    farm_results = algo.calc_farm()
+
+    points = np.zeros((100, 500, 3))
+    points[:, :, 0] = np.linspace(-500.0, 2000.0, 500)[None, :]
+    points[:, :, 1] = 600.0
+    points[:, :, 2] = 90.0
+    point_results = algo.calc_points(farm_results, points)
+
+    return farm_results, point_results
+
+
+def test():
+    for rotor, pwakes, wakes in [
+        (
+            "grid16",
+            "rotor_points",
+            ["Bastankhah2016_linear", "CrespoHernandez_quadratic"],
+        ),
+        ("grid9", "axiwake6", ["Jensen_linear_k007", "IECTI2019_max"]),
+    ]:
+        fres0, pres0 = calc(None, rotor, pwakes, wakes)
+        fres1, pres1 = calc(np.float32, rotor, pwakes, wakes)
+
+        # farm results keep double precision:
+        assert fres1[FV.P].dtype == FC.DTYPE
+        assert pres1[FV.WS].dtype == np.float32
+
+        aep0 = fres0[FV.P].to_numpy().sum()
+        aep1 = fres1[FV.P].to_numpy().sum()
+        print(rotor, pwakes, wakes, "AEP rel. delta:", abs(aep1 / aep0 - 1))
+        assert abs(aep1 / aep0 - 1) < 1e-5
+
+        # top-hat wakes may flip points at the wake boundary:
+        for v in [FV.WS, FV.TI]:
+            d = np.abs(pres1[v].to_numpy() - pres0[v].to_numpy())
+            n_fail = np.sum(d > 1e-4 * np.max(np.abs(pres0[v].to_numpy())))
+            print(f"  max delta {v}: {np.max(d):.3e}, outliers: {n_fail}")
+            assert n_fail <= 1e-4 * d.size
+
+
+if __name__ == "__main__":
+    test()
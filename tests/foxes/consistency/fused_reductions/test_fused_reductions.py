@@ -0,0 +1,51 @@
+import numpy as np
+import xarray as xr
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def test():
+    rng = np.random.default_rng(42)
+    n_states, n_turbines = 1000, 7
+
+    w = rng.random((n_states, n_turbines))
+    w /= np.sum(w, axis=0)[None, :]
+    p = rng.uniform(0.0, 5000.0, (n_states, n_turbines))
+    ws = rng.uniform(3.0, 25.0, (n_states, n_turbines))
+    dims = (FC.STATE, FC.TURBINE)
+    fres = xr.Dataset(
+        {FV.WEIGHT: (dims, w), FV.P: (dims, p.copy()), FV.WS: (dims, ws)},
+        coords={FC.STATE: np.arange(n_states)},
+    )
+    fres[FV.P].values[[5, 333, 999], [0, 3, 6]] = np.nan
+    nan = np.any(np.isnan(fres[FV.P].values), axis=1)
+
+    o = foxes.output.FarmResultsEval(fres, chunk_size=97)
+    rs = o.reduce_fused({FV.P: "mean", FV.WS: ["sum", "min", "max", "std", "mean"]})
+    rt = o.reduce_fused({FV.P: "mean", FV.WS: ["sum", "max"]}, dim=FC.TURBINE)
+
+    wk = w[~nan] / np.sum(w[~nan], axis=0)[None, :]
+    assert np.allclose(rs[(FV.P, "mean")], np.sum(p[~nan] * wk, axis=0))
+    assert np.allclose(rs[(FV.WS, "mean")], np.sum(ws * w, axis=0))
+    assert np.allclose(rs[(FV.WS, "sum")], np.sum(ws, axis=0))
+    assert np.allclose(rs[(FV.WS, "min")], np.min(ws, axis=0))
+    assert np.allclose(rs[(FV.WS, "max")], np.max(ws, axis=0))
+    assert np.allclose(rs[(FV.WS, "std")], np.std(ws, axis=0))
+
+    assert np.all(np.isnan(rt[(FV.P, "mean")][nan]))
+    wfac = np.sum(w, axis=0) / np.sum(w[~nan], axis=0)
+    assert np.allclose(
+        rt[(FV.P, "mean")][~nan], np.sum(p[~nan] * w[~nan] * wfac[None, :], axis=1)
+    )
+    assert np.allclose(rt[(FV.WS, "sum")], np.sum(ws, axis=1))
+    assert np.allclose(rt[(FV.WS, "max")], np.max(ws, axis=1))
+
+    ra = o.reduce_all({FV.P: "mean", FV.WS: "max"}, {FV.P: "sum", FV.WS: "mean"})
+    assert np.isclose(ra[FV.P], np.sum(rs[(FV.P, "mean")]))
+    assert np.isclose(ra[FV.WS], np.sum(np.max(ws, axis=0) * np.sum(w, axis=0)))
+
+
+if __name__ == "__main__":
+    test()
@@ -14,17 +14,27 @@ def test():
     sfile = "wind_rose_bremen.csv"
     lfile = thisdir / "test_farm.csv"
     cases = [
-        (foxes.algorithms.Downwind, "rotor_wd"),
-        (foxes.algorithms.Iterative, "rotor_wd"),
-        (foxes.algorithms.Iterative, "rotor_wd_farmo"),
+        (foxes.algorithms.Downwind, "rotor_wd", {}),
+        (foxes.algorithms.Iterative, "rotor_wd", {}),
+        (foxes.algorithms.Iterative, "rotor_wd_farmo", {}),
+        (
+            foxes.algorithms.Iterative,
+            "rotor_wd_farmo",
+            {
+                "mask_converged": True,
+                "conv_crit": foxes.algorithms.iterative.ConvVarDelta(
+                    {FV.REWS: 1e-7, FV.TI: 1e-8, FV.CT: 1e-8}
+                ),
+            },
+        ),
     ]
     lims = {FV.REWS: 5e-7, FV.P: 5e-4}
 
     ck = {FC.STATE: c}
 
     base_results = None
-    for Algo, frame in cases:
-        print(f"\nENTERING CASE {(Algo.__name__, frame)}\n")
+    for Algo, frame, kwargs in cases:
+        print(f"\nENTERING CASE {(Algo.__name__, frame, kwargs)}\n")
 
         mbook = foxes.models.ModelBook()
 
@@ -50,6 +60,7 @@ def test():
             partial_wakes_model="auto",
             chunks=ck,
             verbosity=1,
+            **kwargs,
         )
 
         with foxes.utils.runners.DaskRunner() as runner:
@@ -69,14 +80,14 @@ def test():
             base_results = df
 
         else:
-            print(f"CASE {(Algo.__name__, frame)}")
+            print(f"CASE {(Algo.__name__, frame, kwargs)}")
             delta = df - base_results
             print(delta)
             print(delta.min(), delta.max())
 
             for v, lim in lims.items():
                 chk = delta[v].abs()
-                print(f"CASE {(Algo.__name__, frame, v, lim)}:", chk.max())
+                print(f"CASE {(Algo.__name__, frame, kwargs, v, lim)}:", chk.max())
 
             assert (chk < lim).all()
 
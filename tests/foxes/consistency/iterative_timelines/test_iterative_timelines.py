@@ -0,0 +1,67 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(frame, mask_converged):
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_100.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "ws", FV.WD: "wd", FV.TI: "ti"},
+        fixed_vars={FV.RHO: 1.225, FV.TI: 0.07},
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([0.0, 0.0]),
+        step_vectors=np.array([[500.0, 0], [0, 500.0]]),
+        steps=(4, 4),
+        turbine_models=["NREL5MW"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Iterative(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="centre",
+        wake_models=["Bastankhah2014_linear_k004"],
+        wake_frame=frame,
+        partial_wakes_model="rotor_points",
+        chunks={FC.STATE: 30},
+        mask_converged=mask_converged,
+        conv_crit=foxes.algorithms.iterative.ConvVarDelta(
+            {FV.REWS: 1e-7, FV.TI: 1e-8, FV.CT: 1e-8}
+        ),
+        verbosity=0,
+    )
+
+    return algo.calc_farm()
+
+
+def test():
+    # state coupling wake frames cannot be masked:
+    for frame in ["timelines", "seq_dyn_wakes"]:
+        try:
+            calc(frame, mask_converged=True)
+        except ValueError as e:
+            print(f"Frame {frame}: Expected error:", e)
+        else:
+            raise AssertionError(f"Frame {frame}: Expected ValueError")
+
+    # independent states give the same results with masking:
+    res0 = calc("rotor_wd_farmo", mask_converged=False)
+    res1 = calc("rotor_wd_farmo", mask_converged=True)
+    for v in [FV.REWS, FV.P]:
+        delta = np.max(np.abs(res1[v].to_numpy() - res0[v].to_numpy()))
+        print(f"Variable {v}: max delta = {delta:.3e}")
+        assert delta < 1e-4
+
+
+if __name__ == "__main__":
+    test()
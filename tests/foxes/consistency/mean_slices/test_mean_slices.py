@@ -0,0 +1,83 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def test():
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(7),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[500.0, 0.0], [0.0, 500.0]],
+        steps=[2, 2],
+        turbine_models=["NREL5MW"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="centre",
+        wake_models=["Bastankhah2014_linear_k004"],
+        wake_frame="rotor_wd",
+        partial_wakes_model="auto",
+        chunks={FC.STATE: None, FC.POINT: None},
+        verbosity=0,
+    )
+    farm_results = algo.calc_farm()
+
+    o = foxes.output.FlowPlots2D(algo, farm_results)
+    sel = farm_results[FC.STATE].to_numpy()[[1, 3, 4, 6]]
+    pars = dict(
+        resolution=(20, 15),
+        variables=[FV.WS],
+        xmin=-300.0,
+        ymin=-300.0,
+        xmax=800.0,
+        ymax=800.0,
+        data_format="xarray",
+        states_sel=sel,
+    )
+
+    # reference from the states data:
+    sdata = o.get_states_data_xy(**pars)[FV.WS].to_numpy()
+    w = farm_results[FV.WEIGHT].sel({FC.STATE: sel}).to_numpy()[:, 0]
+    w = w[:, None, None]
+    mean = np.sum(w * sdata, axis=0) / np.sum(w)
+    std = np.sqrt(np.sum(w * (sdata - mean[None]) ** 2, axis=0) / np.sum(w))
+
+    for chunk_states in [None, 3]:
+        data = o.get_mean_data_xy(add_std=True, chunk_states=chunk_states, **pars)
+        dmean = data[FV.WS].to_numpy()
+        dstd = data[f"{FV.WS}_std"].to_numpy()
+        print(f"chunk_states = {chunk_states}:")
+        print("  max delta mean:", np.max(np.abs(dmean - mean)))
+        print("  max delta std :", np.max(np.abs(dstd - std)))
+        assert np.allclose(dmean, mean, rtol=0, atol=1e-10)
+        assert np.allclose(dstd, std, rtol=0, atol=1e-10)
+
+    # unknown state labels are rejected:
+    pars["states_sel"] = [sel[0], np.datetime64("1900-01-01")]
+    try:
+        o.get_mean_data_xy(**pars)
+    except KeyError as e:
+        print("Expected error:", e)
+    else:
+        raise AssertionError("Expected KeyError for unknown state label")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,66 @@
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from foxes.utils import min_dist_worst
+
+
+def brute_force(xy, min_dist, n_worst, sel=None):
+    n_pop, n_points = xy.shape[:2]
+    radius = np.max(min_dist)
+    mind = np.broadcast_to(min_dist, (n_pop, n_points))
+    ti, tj = np.triu_indices(n_points, k=1)
+    if sel is not None:
+        s = sel[ti] | sel[tj]
+        ti = ti[s]
+        tj = tj[s]
+
+    values = np.full((n_pop, n_worst), -radius)
+    for pi in range(n_pop):
+        d = cdist(xy[pi], xy[pi])[ti, tj]
+        vals = np.maximum(mind[pi, ti], mind[pi, tj]) - d
+        vals = np.sort(np.maximum(vals, -radius))[::-1][:n_worst]
+        values[pi, : len(vals)] = vals
+    return values
+
+
+def test():
+    rng = np.random.default_rng(42)
+    n_pop, n_points = 12, 40
+    xy = rng.uniform(0.0, 2000.0, (n_pop, n_points, 2))
+    mind = rng.uniform(150.0, 300.0, (n_pop, n_points))
+    sel = rng.random(n_points) < 0.3
+
+    for min_dist, hsel, n_worst in [
+        (250.0, None, 5),
+        (mind, None, 5),
+        (250.0, sel, 3),
+        (mind, sel, 3),
+        (250.0, None, 200),
+        (mind, sel, 200),
+    ]:
+        v = min_dist_worst(xy, min_dist, n_worst, hsel)
+        v0 = brute_force(xy, min_dist, n_worst, hsel)
+        assert v.shape == (n_pop, n_worst)
+        assert np.allclose(v, v0, rtol=0, atol=1e-8)
+        print(np.isscalar(min_dist), hsel is not None, n_worst, ": OK")
+
+    # fewer pairs in range than n_worst:
+    xy = np.zeros((2, 3, 2))
+    xy[:, :, 0] = [0.0, 100.0, 5000.0]
+    xy[1, 2, 0] = 10000.0
+    v = min_dist_worst(xy, 250.0, 4)
+    assert np.allclose(v, [[150.0, -250.0, -250.0, -250.0]] * 2)
+
+    # continuity when a pair leaves the search radius:
+    for x in [500.0, 500.001, 600.0]:
+        xy = np.array([[[0.0, 0.0], [x, 0.0]]])
+        v = min_dist_worst(xy, 250.0, 2)
+        assert np.allclose(v, [[-250.0, -250.0]])
+    for x in [250.0, 300.0, 499.999]:
+        xy = np.array([[[0.0, 0.0], [x, 0.0]]])
+        v = min_dist_worst(xy, 250.0, 1)
+        assert np.allclose(v, [[250.0 - x]])
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,38 @@
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from foxes.utils import nearest_dists
+
+
+def test():
+    rng = np.random.default_rng(42)
+    probes = rng.uniform(0.0, 1000.0, (300, 2))
+
+    for n_points in [20, 400]:
+        xy = rng.uniform(-100.0, 1100.0, (15, n_points, 2))
+        valid = rng.random((15, n_points)) < 0.7
+        valid[3] = False
+        valid[4, 1:] = False
+
+        d = nearest_dists(xy, probes, valid)
+        s = nearest_dists(xy, valid=valid)
+        for pi in range(len(xy)):
+            hxy = xy[pi, valid[pi]]
+            if len(hxy):
+                d0 = np.min(cdist(probes, hxy), axis=1)
+                assert np.allclose(d[pi], d0, rtol=0, atol=1e-8)
+            else:
+                assert np.all(np.isinf(d[pi]))
+
+            s0 = np.full(n_points, np.inf)
+            if len(hxy) > 1:
+                dists = cdist(hxy, hxy)
+                np.fill_diagonal(dists, np.inf)
+                s0[valid[pi]] = np.min(dists, axis=1)
+            assert np.allclose(s[pi], s0, rtol=0, atol=1e-8)
+
+        print(n_points, "points: OK")
+
+
+if __name__ == "__main__":
+    test()
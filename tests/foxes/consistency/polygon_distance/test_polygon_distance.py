@@ -0,0 +1,41 @@
+import numpy as np
+
+import foxes
+
+
+def test():
+    rng = np.random.default_rng(42)
+    a = np.sort(rng.uniform(0.0, 2 * np.pi, 500))
+    r = 1000.0 * (1 + 0.3 * np.sin(5 * a))
+    points = np.stack([r * np.cos(a), r * np.sin(a)], axis=-1)
+    probes = rng.uniform(-1500.0, 1500.0, (2000, 2))
+
+    g0 = foxes.utils.geom2d.ClosedPolygon(points, min_tree_segments=10**9)
+    g1 = foxes.utils.geom2d.ClosedPolygon(points, min_tree_segments=1)
+    assert g0._tree is None
+    assert g1._tree is not None
+
+    d0, p0 = g0.points_distance(probes, return_nearest=True)
+    d1, p1 = g1.points_distance(probes, return_nearest=True)
+
+    # nearest points are on the boundary, at the given distance:
+    assert np.allclose(np.linalg.norm(probes - p0, axis=-1), d0)
+    assert np.allclose(g0.points_distance(p0), 0.0, atol=1e-6)
+
+    print("max delta dist:", np.max(np.abs(d1 - d0)))
+    assert np.allclose(d0, d1, rtol=0, atol=1e-8)
+    assert np.allclose(p0, p1, rtol=0, atol=1e-6)
+
+    # unit square:
+    sq = foxes.utils.geom2d.ClosedPolygon(
+        np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    )
+    q = np.array([[0.5, 0.5], [0.5, -1.0], [2.0, 2.0], [0.2, 0.9]])
+    d, p = sq.points_distance(q, return_nearest=True)
+    assert np.allclose(d, [0.5, 1.0, np.sqrt(2), 0.1])
+    assert np.allclose(p[1:], [[0.5, 0.0], [1.0, 1.0], [0.2, 1.0]])
+    assert np.all(sq.points_inside(q) == [True, False, False, True])
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,91 @@
+from pathlib import Path
+import tempfile
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(n_states, cache, ambient=False):
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(n_states),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[500.0, 0.0], [0.0, 500.0]],
+        steps=[3, 3],
+        turbine_models=["NREL5MW"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="grid4",
+        wake_models=["Bastankhah2014_linear_k004"],
+        wake_frame="rotor_wd",
+        partial_wakes_model="auto",
+        results_cache=cache,
+        chunks={FC.STATE: 100},
+        verbosity=0,
+    )
+
+    farm_results = algo.calc_farm(ambient=ambient)
+
+    points = np.zeros((n_states, 4, 3))
+    points[:, :, 0] = np.linspace(-300.0, 1500.0, 4)[None, :]
+    points[:, :, 1] = 200.0
+    points[:, :, 2] = 100.0
+    point_results = algo.calc_points(farm_results, points, ambient=ambient)
+
+    return farm_results, point_results
+
+
+def test():
+    n0 = 120
+    n1 = 250
+
+    fres0, pres0 = calc(n1, None)
+
+    with tempfile.TemporaryDirectory() as tdir:
+        cache = foxes.utils.ResultsCache(tdir, verbosity=1)
+
+        for n in [n0, n1, n1]:
+            print(f"\nENTERING CASE {n}\n")
+            fres, pres = calc(n, cache)
+            assert len(list(Path(tdir).glob("*.nc"))) == 2
+
+            for res, res0 in [(fres, fres0), (pres, pres0)]:
+                assert list(res.data_vars) == list(res0.data_vars)
+                assert np.all(res[FC.STATE].values == res0[FC.STATE].values[:n])
+                for v in res0.data_vars:
+                    if v == FV.WEIGHT:
+                        assert np.allclose(res[v].values, 1 / n)
+                    elif FC.STATE in res0[v].dims:
+                        chk = np.abs(res[v].values - res0[v].values[:n])
+                        print(f"CASE {n}, {v}:", np.max(chk))
+                        assert np.max(chk) < 1e-12
+                    else:
+                        assert np.all(res[v].values == res0[v].values)
+
+        calc(n0, cache, ambient=True)
+        assert len(list(Path(tdir).glob("*.nc"))) == 4
+
+        cache.max_size = 0
+        cache.evict()
+        assert len(list(Path(tdir).glob("*.nc"))) == 0
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,102 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+from foxes.core import Data
+from foxes.utils import wd2uv
+
+
+def ref_points(rotor, txyh, yaw, D):
+    n = wd2uv(yaw, axis=-1)
+    m = np.stack([-n[..., 1], n[..., 0]], axis=-1)
+    dp = rotor.design_points()
+    points = np.repeat(txyh[:, :, None, :], len(dp), axis=2)
+    points[..., :2] += (
+        0.5 * D[:, :, None, None] * dp[None, None, :, 0, None] * n[:, :, None]
+    )
+    points[..., :2] += (
+        0.5 * D[:, :, None, None] * dp[None, None, :, 1, None] * m[:, :, None]
+    )
+    points[..., 2] += 0.5 * D[:, :, None] * dp[None, None, :, 2]
+    return points
+
+
+def test():
+    n_s = 6
+    n_t = 4
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(n_s),
+    )
+
+    farm = foxes.WindFarm()
+    for i in range(n_t):
+        farm.add_turbine(
+            foxes.Turbine(xy=[500.0 * i, 0.0], turbine_models=["NREL5MW"]),
+            verbosity=0,
+        )
+
+    algo = foxes.algorithms.Downwind(
+        foxes.models.ModelBook(),
+        farm,
+        states=states,
+        rotor_model="grid9",
+        wake_models=["Bastankhah2014_linear_k004"],
+        verbosity=0,
+    )
+    algo.calc_farm()
+    rotor = algo.rotor_model
+
+    mdata = Data(
+        {FC.STATE: algo.states.index()},
+        {FC.STATE: (FC.STATE,)},
+        loop_dims=[FC.STATE],
+    )
+    txyh = np.zeros((n_s, n_t, 3))
+    txyh[:] = [[500.0 * i, 0.0, 90.0] for i in range(n_t)]
+    yaw = np.full((n_s, n_t), 250.0)
+    D = np.full((n_s, n_t), 126.0)
+    fdata = Data(
+        {FV.TXYH: txyh, FV.YAW: yaw, FV.D: D},
+        {
+            FV.TXYH: (FC.STATE, FC.TURBINE, FC.XYH),
+            FV.YAW: (FC.STATE, FC.TURBINE),
+            FV.D: (FC.STATE, FC.TURBINE),
+        },
+        loop_dims=[FC.STATE],
+    )
+
+    # state-invariant geometry, stored once per turbine for broadcast data:
+    pts = []
+    for broadcast in [False, True]:
+        rotor.broadcast_data = broadcast
+        try:
+            p0 = rotor.get_rotor_points(algo, mdata, fdata)
+            pts.append(p0)
+            assert p0.shape == (n_s, n_t, rotor.n_rotor_points(), 3)
+            assert (p0.strides[0] == 0) == broadcast
+            assert not p0.flags.writeable
+            assert rotor.get_rotor_points(algo, mdata, fdata) is p0
+        finally:
+            rotor.broadcast_data = False
+        rotor._store = {}
+    assert np.array_equal(pts[0], pts[1])
+    assert np.allclose(p0, ref_points(rotor, txyh, yaw, D), rtol=0, atol=1e-10)
+
+    # changed yaw invalidates the cache:
+    yaw[2, 1] = 280.0
+    p1 = rotor.get_rotor_points(algo, mdata, fdata)
+    assert p1 is not p0
+    assert p1.strides[0] != 0
+    assert not p1.flags.writeable
+    assert np.allclose(p1, ref_points(rotor, txyh, yaw, D), rtol=0, atol=1e-10)
+    assert rotor.get_rotor_points(algo, mdata, fdata) is p1
+
+
+if __name__ == "__main__":
+    test()
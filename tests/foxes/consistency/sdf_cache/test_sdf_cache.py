@@ -0,0 +1,35 @@
+import numpy as np
+
+from foxes.utils.geom2d import ClosedPolygon, Circle
+
+
+def test():
+    geom = ClosedPolygon(
+        np.array([[0.0, 0.0], [0.0, 1200.0], [1000.0, 800.0], [900.0, -200.0]])
+    ) + ClosedPolygon(
+        np.array([[500.0, 0.0], [500.0, 1500.0], [1000.0, 1500.0], [1000.0, 0.0]])
+    )
+    geom = geom - Circle([-100.0, -100.0], 700.0)
+
+    rng = np.random.default_rng(42)
+    points = rng.uniform(-200.0, 1700.0, (20000, 2))
+    d0 = geom.points_distance(points)
+    i0 = geom.points_inside(points)
+
+    cache = geom.sdf_cache(25.0)
+    cache.initialize()
+    d = cache.points_distance(points)
+    i = cache.points_inside(points)
+
+    delta = np.max(np.abs(d - d0))
+    print("max delta:", delta, ", error bound:", cache.error_bound)
+    assert delta <= cache.error_bound
+    assert np.all(i == i0)
+
+    # exact within band:
+    sel = d0 <= cache.band - cache.error_bound
+    assert np.allclose(d[sel], d0[sel], rtol=0, atol=1e-10)
+
+
+if __name__ == "__main__":
+    test()
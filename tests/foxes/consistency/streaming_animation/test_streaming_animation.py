@@ -0,0 +1,121 @@
+import os
+import tempfile
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def test():
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(7),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[500.0, 0.0], [0.0, 500.0]],
+        steps=[2, 2],
+        turbine_models=["NREL5MW"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="centre",
+        wake_models=["Bastankhah2014_linear_k004"],
+        wake_frame="rotor_wd",
+        partial_wakes_model="auto",
+        chunks={FC.STATE: None, FC.POINT: None},
+        verbosity=0,
+    )
+    farm_results = algo.calc_farm()
+
+    o = foxes.output.FlowPlots2D(algo, farm_results)
+    pars = dict(
+        resolution=(20, 15),
+        variables=[FV.WS, FV.WD],
+        xmin=-300.0,
+        ymin=-300.0,
+        xmax=800.0,
+        ymax=800.0,
+        data_format="numpy",
+        ret_states=True,
+        states_isel=[0, 2, 3, 4, 5, 6],
+    )
+    data0, states0 = o.get_states_data_xy(**pars)
+    chunks = list(o.get_states_data_xy(chunk_states=4, **pars))
+    assert len(chunks) == 2
+    data1 = np.concatenate([d for d, __ in chunks], axis=0)
+    states1 = np.concatenate([s for __, s in chunks])
+    assert np.all(states1 == states0)
+    assert np.allclose(data1, data0, rtol=0, atol=1e-12)
+
+    # stopping early finalizes the algorithm:
+    gen = o.get_states_data_xy(chunk_states=2, **pars)
+    for __ in gen:
+        assert algo.initialized
+        break
+    del gen
+    assert not algo.initialized
+
+    # unknown state labels are rejected:
+    pars.pop("states_isel")
+    try:
+        list(o.get_states_data_xy(chunk_states=4, states_sel=[-1], **pars))
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("Expecting KeyError for unknown states_sel")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for writer, fname in [
+            (None, "frame_{:02d}.png"),
+            ("pillow", "ani.gif"),
+        ]:
+            fig, ax = plt.subplots()
+            anim = foxes.output.Animator(fig)
+            anim.add_generator(
+                o.gen_states_fig_xy(
+                    FV.WS,
+                    resolution=(20, 15),
+                    xmin=-300.0,
+                    ymin=-300.0,
+                    xmax=800.0,
+                    ymax=800.0,
+                    fig=fig,
+                    ax=ax,
+                    ret_im=True,
+                    animated=True,
+                    chunk_states=3,
+                )
+            )
+            n = anim.save(os.path.join(tmp, fname), writer=writer, fps=2, verbosity=0)
+            plt.close(fig)
+            assert n == 7
+
+            # previous frames are removed from the axes:
+            assert len(ax.collections) == 0
+
+        assert all(
+            os.path.isfile(os.path.join(tmp, f"frame_{i:02d}.png")) for i in range(7)
+        )
+        assert os.path.isfile(os.path.join(tmp, "ani.gif"))
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,61 @@
+import numpy as np
+from scipy.interpolate import interpn
+
+from foxes.utils import TableInterpolator
+
+
+def test():
+    rng = np.random.default_rng(42)
+    axes = [
+        np.linspace(0.0, 25.0, 11),
+        np.sort(rng.uniform(0.5, 1.5, 7)),
+        np.array([0.0, 0.05, 0.1, 0.2, 0.4]),
+    ]
+    data = rng.uniform(0.0, 1.0, (11, 7, 5, 2))
+
+    # points inside, outside and on the grid boundaries:
+    pts = np.stack(
+        [rng.uniform(a[0] - 0.2 * (a[-1] - a[0]), a[-1] * 1.2, 500) for a in axes],
+        axis=1,
+    )
+    pts[:4] = [a[0] for a in axes]
+    pts[4:8] = [a[-1] for a in axes]
+    pts[8] = [a[3] for a in axes]
+    pts[9, 1] = np.nan
+    inside = np.all([(p >= a[0]) & (p <= a[-1]) for p, a in zip(pts.T, axes)], axis=0)
+    assert not inside[9]
+    print(f"{np.sum(inside)} of {len(pts)} points inside")
+
+    for method in ["linear", "cubic"]:
+        for fill_value in [np.nan, 0.0, None]:
+            ipars = dict(method=method, bounds_error=False, fill_value=fill_value)
+            table = TableInterpolator(axes, data, **ipars)
+            results = table(pts)
+            ref = interpn(axes, data, pts, **ipars)
+
+            delta = np.abs(results - ref)
+            print(f"{method}, fill_value={fill_value}: max delta", np.nanmax(delta))
+            assert results.shape == (len(pts), 2)
+            assert np.all(np.isnan(results) == np.isnan(ref))
+            assert np.allclose(results, ref, rtol=0, atol=1e-12, equal_nan=True)
+
+        # out of bounds errors:
+        table = TableInterpolator(axes, data, method=method, bounds_error=True)
+        assert np.allclose(table(pts[inside]), interpn(axes, data, pts[inside], method))
+        try:
+            table(pts)
+        except ValueError as e:
+            print("Expected error:", e)
+        else:
+            raise AssertionError("Expected ValueError for points out of bounds")
+
+    # the precompiled cubic spline is close to interpn:
+    table = TableInterpolator(axes, data, method="cubic", cubic_spline=True)
+    results = table(pts[inside])
+    ref = interpn(axes, data, pts[inside], method="cubic")
+    print("cubic spline: max delta", np.max(np.abs(results - ref)))
+    assert np.allclose(results, ref, rtol=0, atol=1e-3)
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,76 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(tile_culling, wakes, prune_tol=None):
+    mbook = foxes.models.ModelBook()
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(20),
+    )
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=[0.0, 0.0],
+        step_vectors=[[600.0, 0.0], [0.0, 600.0]],
+        steps=[3, 3],
+        turbine_models=["NREL5MW"],
+        verbosity=0,
+    )
+
+    algo = foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="centre",
+        wake_models=wakes,
+        wake_frame="rotor_wd",
+        partial_wakes_model="auto",
+        prune_tol=prune_tol,
+        tile_culling=tile_culling,
+        chunks={FC.STATE: 10, FC.POINT: 5000},
+        verbosity=0,
+    )
+    farm_results = algo.calc_farm()
+
+    # a horizontal and a vertical plane:
+    x = np.linspace(-500.0, 2000.0, 80)
+    y = np.linspace(-500.0, 2000.0, 60)
+    z = np.linspace(10.0, 300.0, 30)
+    pxy = np.stack(np.meshgrid(x, y, [90.0], indexing="ij"), axis=-1)
+    pxz = np.stack(np.meshgrid(x, [600.0], z, indexing="ij"), axis=-1)
+    points = np.concatenate([pxy.reshape(-1, 3), pxz.reshape(-1, 3)], axis=0)
+    points = np.repeat(points[None], algo.n_states, axis=0)
+
+    return algo.calc_points(farm_results, points)
+
+
+def test():
+    cases = [
+        (["Jensen_linear_k007", "IECTI2019_max"], None, 1e-12),
+        (["Bastankhah2014_linear_k004", "CrespoHernandez_quadratic_k002"], None, 1e-12),
+        (["Bastankhah2014_linear_k004"], 1e-6, 1e-4),
+    ]
+
+    for wakes, tol, lim in cases:
+        print(f"\nENTERING CASE {(wakes, tol)}\n")
+
+        pres0 = calc(False, wakes)
+        pres = calc(True, wakes, tol)
+
+        for v in [FV.WS, FV.TI]:
+            chk = np.abs(pres[v].to_numpy() - pres0[v].to_numpy())
+            print(f"CASE {(wakes, tol, v)}:", np.max(chk))
+            assert np.max(chk) < lim
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,84 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+
+def calc(Algo, n_states, sels):
+    mbook = foxes.models.ModelBook()
+    mbook.turbine_models["half_P"] = foxes.models.turbine_models.Calculator(
+        in_vars=[FV.P],
+        out_vars=[FV.P],
+        func=lambda P, st_sel: (np.where(st_sel, 0.5 * P, P),),
+    )
+
+    states = foxes.input.states.Timeseries(
+        data_source="timeseries_3000.csv.gz",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "WS", FV.WD: "WD", FV.TI: "TI"},
+        fixed_vars={FV.RHO: 1.225},
+        states_sel=range(n_states),
+    )
+
+    farm = foxes.WindFarm()
+    for ti, ssel in enumerate(sels):
+        models = ["NREL5MW"]
+        if ssel is not False:
+            models.append("half_P")
+        farm.add_turbine(
+            foxes.Turbine(
+                xy=[500.0 * (ti % 3), 500.0 * (ti // 3)],
+                turbine_models=models,
+                models_state_sel=[None, ssel] if ssel is not False else None,
+            ),
+            verbosity=0,
+        )
+
+    algo = Algo(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="centre",
+        wake_models=["Bastankhah2014_linear_k004"],
+        wake_frame="rotor_wd",
+        partial_wakes_model="auto",
+        chunks={FC.STATE: 100},
+        verbosity=0,
+    )
+
+    farm_results = algo.calc_farm(finalize=False)
+    n_pats = algo.farm_controller.turbine_model_patterns.shape[1]
+    algo.finalize()
+
+    return n_pats, farm_results[FV.P].to_numpy()
+
+
+def test():
+    n_states = 250
+    n_turbines = 9
+    sel_a = np.arange(n_states) % 3 == 0
+    sel_b = np.arange(n_states) > 170
+    sels = [False, None, sel_a, sel_a, sel_b, sel_a, False, sel_b, None]
+
+    for Algo in [foxes.algorithms.Downwind, foxes.algorithms.Iterative]:
+        print(f"\nENTERING CASE {Algo.__name__}\n")
+
+        __, P0 = calc(Algo, n_states, [False] * n_turbines)
+        n_pats, P = calc(Algo, n_states, sels)
+        assert n_pats == 2
+
+        for ti, ssel in enumerate(sels):
+            if ssel is False:
+                expected = P0[:, ti]
+            elif ssel is None:
+                expected = 0.5 * P0[:, ti]
+            else:
+                expected = np.where(ssel, 0.5 * P0[:, ti], P0[:, ti])
+            chk = np.abs(P[:, ti] - expected)
+            print(f"Turbine {ti}: max delta P = {np.max(chk)}")
+            assert np.max(chk) < 1e-5
+
+
+if __name__ == "__main__":
+    test()
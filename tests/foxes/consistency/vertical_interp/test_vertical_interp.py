@@ -0,0 +1,50 @@
+import numpy as np
+from scipy.interpolate import interp1d
+
+from foxes.utils import vertical_coeffs
+
+
+def test():
+    rng = np.random.default_rng(42)
+    heights = np.sort(rng.uniform(20.0, 300.0, 12))
+    data = rng.uniform(3.0, 15.0, (7, 12))
+    s = np.arange(7)[:, None]
+
+    def _interp(z, **kwargs):
+        inds, weights = vertical_coeffs(heights, z, **kwargs)
+        return (
+            weights[..., 0] * data[s, inds[..., 0]]
+            + weights[..., 1] * data[s, inds[..., 1]]
+        )
+
+    z = rng.uniform(heights[0], heights[-1], (7, 50))
+    ref = np.stack([interp1d(heights, data[i])(z[i]) for i in range(7)])
+    assert np.allclose(_interp(z), ref, rtol=0, atol=1e-12)
+
+    z = rng.uniform(1.0, 500.0, (7, 50))
+    try:
+        _interp(z)
+        assert False
+    except ValueError:
+        pass
+
+    ref = np.stack([np.interp(z[i], heights, data[i]) for i in range(7)])
+    assert np.allclose(_interp(z, extrapolation="const"), ref, rtol=0, atol=1e-12)
+
+    ref = np.stack(
+        [interp1d(heights, data[i], fill_value="extrapolate")(z[i]) for i in range(7)]
+    )
+    assert np.allclose(_interp(z, extrapolation="linear"), ref, rtol=0, atol=1e-12)
+
+    z0 = 0.05
+    res = _interp(z, extrapolation="log", z0=z0)
+    lo = z < heights[0]
+    hi = z > heights[-1]
+    ref = data[:, 0, None] * np.log(z / z0) / np.log(heights[0] / z0)
+    assert np.allclose(res[lo], ref[lo], rtol=0, atol=1e-12)
+    ref = data[:, -1, None] * np.log(z / z0) / np.log(heights[-1] / z0)
+    assert np.allclose(res[hi], ref[hi], rtol=0, atol=1e-12)
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,88 @@
+from pathlib import Path
+import inspect
+
+import foxes
+import foxes.variables as FV
+import foxes.constants as FC
+
+thisdir = Path(inspect.getfile(inspect.currentframe())).parent
+
+
+def test():
+    c = 1000
+    ttype = "DTU10MW"
+    sfile = "wind_rose_bremen.csv"
+    lfile = thisdir / "test_farm.csv"
+    cases = [
+        (foxes.algorithms.Downwind, "centre", "auto", None),
+        (foxes.algorithms.Downwind, "centre", "auto", 0.0),
+        (foxes.algorithms.Downwind, "centre", "auto", 1e-6),
+        (foxes.algorithms.Downwind, "grid4", "rotor_points", 1e-6),
+        (foxes.algorithms.Iterative, "centre", "auto", 1e-6),
+    ]
+    lims = {FV.REWS: 1e-4, FV.P: 5e-2}
+
+    ck = {FC.STATE: c}
+
+    base_results = None
+    for Algo, rotor, pwakes, tol in cases:
+        print(f"\nENTERING CASE {(Algo.__name__, rotor, pwakes, tol)}\n")
+
+        mbook = foxes.models.ModelBook()
+
+        states = foxes.input.states.StatesTable(
+            data_source=sfile,
+            output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+            var2col={FV.WS: "ws", FV.WD: "wd", FV.WEIGHT: "weight"},
+            fixed_vars={FV.RHO: 1.225, FV.TI: 0.05},
+        )
+
+        farm = foxes.WindFarm()
+        foxes.input.farm_layout.add_from_file(
+            farm, lfile, turbine_models=[ttype], verbosity=1
+        )
+
+        algo = Algo(
+            mbook,
+            farm,
+            states=states,
+            rotor_model=rotor,
+            wake_models=["Bastankhah025_linear_k002", "IECTI2019_max"],
+            wake_frame="rotor_wd",
+            partial_wakes_model=pwakes,
+            prune_tol=tol,
+            chunks=ck,
+            verbosity=1,
+        )
+
+        with foxes.utils.runners.DaskRunner() as runner:
+            data = runner.run(algo.calc_farm)
+
+        df = data.to_dataframe()[[FV.AMB_REWS, FV.REWS, FV.AMB_P, FV.P]]
+
+        print()
+        print("TRESULTS\n")
+        print(df)
+
+        df = df.reset_index()
+
+        if base_results is None:
+            base_results = df
+
+        elif rotor == "centre":
+            print(f"CASE {(Algo.__name__, rotor, pwakes, tol)}")
+            delta = df - base_results
+            print(delta)
+            print(delta.min(), delta.max())
+
+            for v, lim in lims.items():
+                chk = delta[v].abs()
+                print(f"CASE {(Algo.__name__, rotor, pwakes, tol, v, lim)}:", chk.max())
+                if tol == 0.0:
+                    assert (chk < 1e-10).all()
+                else:
+                    assert (chk < lim).all()
+
+
+if __name__ == "__main__":
+    test()
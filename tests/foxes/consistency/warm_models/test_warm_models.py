@@ -0,0 +1,87 @@
+import numpy as np
+
+import foxes
+import foxes.variables as FV
+from foxes.opt.problems import OptFarmVars
+from foxes.opt.objectives import MaxFarmPower
+
+
+def create_algo(tmodels):
+    mbook = foxes.models.ModelBook()
+
+    farm = foxes.WindFarm()
+    foxes.input.farm_layout.add_grid(
+        farm,
+        xy_base=np.array([500.0, 500.0]),
+        step_vectors=np.array([[1300.0, 0], [200, 600.0]]),
+        steps=(3, 3),
+        turbine_models=tmodels + ["NREL5MW"],
+        verbosity=0,
+    )
+
+    states = foxes.input.states.StatesTable(
+        data_source="wind_rose_bremen.csv",
+        output_vars=[FV.WS, FV.WD, FV.TI, FV.RHO],
+        var2col={FV.WS: "ws", FV.WD: "wd", FV.WEIGHT: "weight"},
+        fixed_vars={FV.RHO: 1.225, FV.TI: 0.05},
+    )
+
+    return foxes.algorithms.Downwind(
+        mbook,
+        farm,
+        states=states,
+        rotor_model="grid4",
+        wake_models=["Bastankhah025_linear_k004"],
+        wake_frame="rotor_wd",
+        partial_wakes_model="rotor_points",
+        chunks=None,
+        verbosity=0,
+    )
+
+
+def calc_opt(keep_models, n_calls=4):
+    algo = create_algo(["opt_yawm", "yawm2yaw"])
+
+    problem = OptFarmVars("opt_yawm", algo, keep_models=keep_models)
+    problem.add_var(FV.YAWM, float, 0.0, -40.0, 40.0, level="turbine")
+    problem.add_objective(MaxFarmPower(problem))
+    problem.initialize(verbosity=0)
+
+    rng = np.random.default_rng(42)
+    vars_int = np.zeros(0, dtype=np.int32)
+    objs = []
+    for i in range(n_calls):
+        vars_float = rng.uniform(-40.0, 40.0, problem.n_vars_float)
+        objs.append(problem.evaluate_individual(vars_int, vars_float)[0])
+
+    if algo.initialized:
+        algo.finalize()
+
+    return np.array(objs)
+
+
+def test():
+    # warm optimization problem evaluations match cold ones:
+    objs0 = calc_opt(keep_models=False)
+    objs = calc_opt(keep_models=True)
+    delta = np.max(np.abs(objs - objs0))
+    print("Objectives:", objs0, objs)
+    print(f"Max delta objective = {delta:.3e}")
+    assert delta < 1e-8
+
+    # calculation parameters of warm calls are not outdated:
+    algo = create_algo([])
+    weights = np.array([0.7, 0.1, 0.1, 0.1])
+    cpars = [{}, {algo.rotor_model.name: {"weights": weights}}, {}]
+    results = [create_algo([]).calc_farm(calc_parameters=c) for c in cpars]
+    for i, c in enumerate(cpars):
+        res = algo.calc_farm(calc_parameters=c, finalize=i == len(cpars) - 1)
+        for v in [FV.REWS, FV.P]:
+            delta = np.max(np.abs(res[v].to_numpy() - results[i][v].to_numpy()))
+            print(f"Call {i}, {v}: max delta = {delta:.3e}")
+            assert delta < 1e-8
+    assert not np.allclose(results[0][FV.REWS], results[1][FV.REWS])
+
+
+if __name__ == "__main__":
+    test()